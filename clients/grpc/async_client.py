@@ -0,0 +1,27 @@
+# Импортируем асинхронный канал связи из grpc.aio
+from grpc.aio import Channel
+
+
+class AsyncGRPCClient:
+    """
+    Базовый класс асинхронного gRPC-клиента на grpc.aio.
+
+    В отличие от GRPCClient, этот модуль не инициализирует gevent: grpc.aio работает
+    в собственном event loop и несовместим с gevent-режимом gRPC.
+    От него наследуются все асинхронные специфические клиенты.
+    """
+
+    def __init__(self, channel: Channel):
+        """
+        Конструктор базового асинхронного клиента.
+
+        :param channel: Асинхронный gRPC-канал. Должен создаваться внутри запущенного event loop
+                        и может разделяться между несколькими клиентами.
+        """
+        self.channel = channel
+
+    async def close(self) -> None:
+        """
+        Закрывает gRPC-канал.
+        """
+        await self.channel.close()
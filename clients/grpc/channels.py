@@ -0,0 +1,105 @@
+import itertools
+from typing import Any, Callable
+
+from grpc import Channel
+
+
+class RoundRobinMultiCallable:
+    """
+    Вызываемый объект метода (multi-callable), который отправляет каждый вызов в следующий канал пула.
+
+    Объекты методов отдельных каналов создаются лениво, при первом вызове через соответствующий канал.
+    Очередной канал выбирается общим счётчиком RoundRobinChannel: интерцепторы (grpc.intercept_channel)
+    запрашивают объект метода заново на каждый вызов, и счётчик на уровне объекта метода всегда
+    выбирал бы первый канал.
+    """
+    __slots__ = ("pool", "factory", "multicallables")
+
+    def __init__(self, pool: "RoundRobinChannel", factory: Callable[[Channel], Any]):
+        """
+        :param pool: Пул каналов.
+        :param factory: Создаёт объект метода на заданном канале.
+        """
+        self.pool = pool
+        self.factory = factory
+        self.multicallables: list[Any | None] = [None] * len(pool.channels)
+
+    def next(self) -> Any:
+        index = next(self.pool.counter) % len(self.multicallables)
+        multicallable = self.multicallables[index]
+        if multicallable is None:
+            multicallable = self.multicallables[index] = self.factory(self.pool.channels[index])
+
+        return multicallable
+
+    def __call__(self, *args, **kwargs):
+        return self.next()(*args, **kwargs)
+
+    def with_call(self, *args, **kwargs):
+        return self.next().with_call(*args, **kwargs)
+
+    def future(self, *args, **kwargs):
+        return self.next().future(*args, **kwargs)
+
+
+class RoundRobinChannel(Channel):
+    """
+    gRPC-канал поверх пула каналов, распределяющий вызовы по ним по кругу (round-robin).
+
+    Для стабов это обычный канал: стабы создаются один раз, а каждый вызов уходит в следующий канал пула.
+    Пул нужен, когда одного HTTP/2-соединения мало: сервер ограничивает число одновременных потоков
+    на соединение (MAX_CONCURRENT_STREAMS), или одно соединение упирается в пропускную способность.
+    """
+
+    def __init__(self, channels: list[Channel]):
+        """
+        :param channels: Каналы пула. Чтобы каналы к одному адресу не делили одно соединение,
+                         они создаются с опцией grpc.use_local_subchannel_pool.
+        """
+        if not channels:
+            raise ValueError("Round-robin channel pool must not be empty")
+
+        self.channels = channels
+        self.counter = itertools.count()
+
+    def unary_unary(self, method, request_serializer=None, response_deserializer=None, _registered_method=False):
+        return RoundRobinMultiCallable(
+            self,
+            lambda channel: channel.unary_unary(method, request_serializer, response_deserializer, _registered_method)
+        )
+
+    def unary_stream(self, method, request_serializer=None, response_deserializer=None, _registered_method=False):
+        return RoundRobinMultiCallable(
+            self,
+            lambda channel: channel.unary_stream(method, request_serializer, response_deserializer, _registered_method)
+        )
+
+    def stream_unary(self, method, request_serializer=None, response_deserializer=None, _registered_method=False):
+        return RoundRobinMultiCallable(
+            self,
+            lambda channel: channel.stream_unary(method, request_serializer, response_deserializer, _registered_method)
+        )
+
+    def stream_stream(self, method, request_serializer=None, response_deserializer=None, _registered_method=False):
+        return RoundRobinMultiCallable(
+            self,
+            lambda channel: channel.stream_stream(method, request_serializer, response_deserializer, _registered_method)
+        )
+
+    def subscribe(self, callback, try_to_connect=False):
+        # Состояние связности отслеживается по первому каналу пула
+        self.channels[0].subscribe(callback, try_to_connect=try_to_connect)
+
+    def unsubscribe(self, callback):
+        self.channels[0].unsubscribe(callback)
+
+    def close(self):
+        for channel in self.channels:
+            channel.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+        return False
@@ -1,16 +1,31 @@
+import functools
+import queue
+from typing import Any
+
 # Импортируем поддержку работы gRPC с потоками (greenlets)
 import grpc.experimental.gevent as grpc_gevent
 
 # Импортируем тип канала связи (channel), через который будем общаться с сервером
-from grpc import Channel
+from grpc import Channel, FutureTimeoutError
+
+from clients.grpc.interceptors.retry_interceptor import HEDGED_METADATA_KEY
+from clients.retries import HedgingPolicy
+
+
+@functools.cache
+def init_grpc_gevent() -> None:
+    """
+    Инициализирует поддержку gevent в gRPC (один раз на процесс, повторные вызовы ничего не делают).
+
+    Это обязательно, если вы используете gevent-базированный фреймворк (например, Locust) или пул greenlet'ов
+    (сидинг). Без этой инициализации gRPC будет использовать потоковую модель (threading),
+    что приведёт к блокировке greenlet'ов и нарушит конкурентное выполнение.
 
-# Инициализируем поддержку gevent в gRPC.
-# Это обязательно, если вы используете gevent-базированный фреймворк (например, Locust).
-# Без этой инициализации gRPC будет использовать потоковую модель (threading),
-# что приведёт к блокировке greenlet'ов и нарушит конкурентное выполнение.
-# Инициализация позволяет gRPC использовать совместимую с gevent реализацию
-# для работы с сокетами, таймерами и I/O, даже если код написан в синхронном стиле.
-grpc_gevent.init_gevent()
+    Функция вызывается билдерами синхронных каналов перед созданием канала, а не при импорте модуля:
+    импорт клиентов не переключает процесс в gevent-режим, и инструменты на grpc.aio (AsyncGRPCClient)
+    могут использовать те же модули. В одном процессе используется только один из режимов.
+    """
+    grpc_gevent.init_gevent()
 
 
 class GRPCClient:
@@ -21,11 +36,48 @@ class GRPCClient:
     От него будут наследоваться все остальные специфические клиенты.
     """
 
-    def __init__(self, channel: Channel):
+    def __init__(self, channel: Channel, hedging: HedgingPolicy | None = None):
         """
         Конструктор базового клиента.
 
         :param channel: gRPC-канал, через который происходит подключение к серверу.
                         Обычно создаётся один раз и переиспользуется.
+        :param hedging: Политика хеджирования идемпотентных чтений через call_hedged (по умолчанию выключено).
         """
         self.channel = channel  # Сохраняем канал внутри объекта для последующего использования
+        self.hedging = hedging
+
+    def call_hedged(self, multicallable: Any, request: Any) -> Any:
+        """
+        Выполняет идемпотентный unary-вызов с хеджированием (аналог HTTPClient.send_hedged).
+
+        Вызов отправляется через .future(); если ответ не пришёл за hedging.delay, отправляется дублирующий
+        вызов с метаданными x-hedged (LocustInterceptor репортит его с типом "gRPC hedge"). Возвращается
+        первый успешный ответ, второй вызов отменяется. Без политики хеджирования вызов обычный, блокирующий.
+
+        :param multicallable: Метод стаба, например self.stub.GetAccounts.
+        :param request: Сообщение запроса.
+        :return: Сообщение ответа.
+        :raises grpc.RpcError: Оба вызова завершились ошибкой (пробрасывается ошибка исходного вызова).
+        """
+        if self.hedging is None:
+            return multicallable(request)
+
+        primary = multicallable.future(request)
+        try:
+            return primary.result(timeout=self.hedging.delay)
+        except FutureTimeoutError:
+            pass
+
+        hedge = multicallable.future(request, metadata=((HEDGED_METADATA_KEY, "1"),))
+        # Завершённые вызовы приходят из done-callback'ов; под gevent (Locust) очередь не блокирует воркер
+        done = queue.SimpleQueue()
+        primary.add_done_callback(done.put)
+        hedge.add_done_callback(done.put)
+        for _ in range(2):
+            future = done.get()
+            if (not future.cancelled()) and (future.exception() is None):
+                (hedge if future is primary else primary).cancel()
+                return future.result()
+
+        return primary.result()
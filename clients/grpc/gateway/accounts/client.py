@@ -1,7 +1,10 @@
-from grpc import Channel
-from locust.env import Environment  # Импорт окружения Locust
+from typing import TYPE_CHECKING
+
+from grpc import Channel, Future
 
 from clients.grpc.client import GRPCClient
+from clients.retries import RetryPolicy, HedgingPolicy
+from clients.validation import ValidationPolicy
 from clients.grpc.gateway.client import (
     build_gateway_grpc_client,
     build_gateway_locust_grpc_client  # Импорт билдера для нагрузочного тестирования
@@ -25,6 +28,10 @@ from contracts.services.gateway.accounts.rpc_open_savings_account_pb2 import (
     OpenSavingsAccountResponse
 )
 
+if TYPE_CHECKING:
+    # Только для аннотаций: импорт Locust патчит стандартную библиотеку через gevent
+    from locust.env import Environment
+
 
 class AccountsGatewayGRPCClient(GRPCClient):
     """
@@ -32,13 +39,14 @@ class AccountsGatewayGRPCClient(GRPCClient):
     Предоставляет высокоуровневые методы для работы со счетами.
     """
 
-    def __init__(self, channel: Channel):
+    def __init__(self, channel: Channel, hedging: HedgingPolicy | None = None):
         """
         Инициализация клиента с указанным gRPC-каналом.
 
         :param channel: gRPC-канал для подключения к AccountsGatewayService.
+        :param hedging: Политика хеджирования идемпотентных чтений (GetAccounts); по умолчанию выключено.
         """
-        super().__init__(channel)
+        super().__init__(channel, hedging)
 
         self.stub = AccountsGatewayServiceStub(channel)
 
@@ -49,7 +57,7 @@ class AccountsGatewayGRPCClient(GRPCClient):
         :param request: gRPC-запрос с ID пользователя.
         :return: Ответ от сервиса с данными счетов пользователя.
         """
-        return self.stub.GetAccounts(request)
+        return self.call_hedged(self.stub.GetAccounts, request)
 
     def open_deposit_account_api(self, request: OpenDepositAccountRequest) -> OpenDepositAccountResponse:
         """
@@ -91,6 +99,12 @@ class AccountsGatewayGRPCClient(GRPCClient):
         request = GetAccountsRequest(user_id=user_id)
         return self.get_accounts_api(request)
 
+    def get_accounts_future(self, user_id: str) -> Future:
+        """
+        Неблокирующий вызов GetAccounts: возвращает grpc.Future, ответ — future.result().
+        """
+        return self.stub.GetAccounts.future(GetAccountsRequest(user_id=user_id))
+
     def open_deposit_account(self, user_id: str) -> OpenDepositAccountResponse:
         request = OpenDepositAccountRequest(user_id=user_id)
         return self.open_deposit_account_api(request)
@@ -108,16 +122,23 @@ class AccountsGatewayGRPCClient(GRPCClient):
         return self.open_credit_card_account_api(request)
 
 
-def build_accounts_gateway_grpc_client() -> AccountsGatewayGRPCClient:
+def build_accounts_gateway_grpc_client(retry: RetryPolicy | None = None) -> AccountsGatewayGRPCClient:
     """
     Фабрика для создания экземпляра AccountsGatewayGRPCClient.
 
+    :param retry: Политика повторов вызовов (по умолчанию вызовы не повторяются).
     :return: Инициализированный клиент для AccountsGatewayService.
     """
-    return AccountsGatewayGRPCClient(channel=build_gateway_grpc_client())
+    return AccountsGatewayGRPCClient(channel=build_gateway_grpc_client(retry))
 
 # Новый билдер для нагрузочного тестирования
-def build_accounts_gateway_locust_grpc_client(environment: Environment) -> AccountsGatewayGRPCClient:
+def build_accounts_gateway_locust_grpc_client(
+        environment: "Environment",
+        validation: ValidationPolicy | None = None,
+        retry: RetryPolicy | None = None,
+        channel: Channel | None = None,
+        hedging: HedgingPolicy | None = None
+) -> AccountsGatewayGRPCClient:
     """
     Функция создаёт экземпляр AccountsGatewayGRPCClient адаптированного под Locust.
 
@@ -125,9 +146,17 @@ def build_accounts_gateway_locust_grpc_client(environment: Environment) -> Accou
     Используется исключительно в нагрузочных тестах.
 
     :param environment: объект окружения Locust.
+    :param validation: политика разбора ответов (по умолчанию каждый ответ разбирается сразу).
+    :param retry: политика повторов (по умолчанию вызовы не повторяются).
+    :param channel: общий канал с интерцепторами Locust, через который работают все стабы виртуального
+                    пользователя (validation и retry в нём уже учтены); если не задан, создаётся отдельный канал.
+    :param hedging: политика хеджирования GetAccounts (по умолчанию выключено).
     :return: экземпляр AccountsGatewayGRPCClient с хуками сбора метрик.
     """
-    return AccountsGatewayGRPCClient(channel=build_gateway_locust_grpc_client(environment))
+    return AccountsGatewayGRPCClient(
+        channel=channel or build_gateway_locust_grpc_client(environment, validation, retry),
+        hedging=hedging
+    )
 
 
 
@@ -0,0 +1,50 @@
+from typing import TYPE_CHECKING
+
+from grpc.aio import Channel, insecure_channel
+
+from clients.grpc.interceptors.async_locust_interceptor import AsyncLocustInterceptor
+from clients.grpc.options import GRPCChannelOptions, DEFAULT_GRPC_CHANNEL_OPTIONS
+
+if TYPE_CHECKING:
+    from locust.env import Environment
+
+
+def build_gateway_async_grpc_client(options: GRPCChannelOptions | None = None) -> Channel:
+    """
+    Фабричная функция (билдер) для создания асинхронного gRPC-канала к сервису grpc-gateway.
+
+    Канал привязывается к текущему event loop, поэтому функцию нужно вызывать внутри корутины.
+    Модуль намеренно не импортирует Locust и не инициализирует gevent.
+
+    :param options: Профиль настроек канала (keepalive, сжатие, лимиты сообщений, балансировка, окна HTTP/2).
+    :return: Асинхронный gRPC-канал (grpc.aio.Channel), настроенный на адрес localhost:9003.
+    """
+    options = options or DEFAULT_GRPC_CHANNEL_OPTIONS
+    return insecure_channel(
+        options.get_target("localhost:9003"),
+        options=options.to_channel_options(),
+        compression=options.get_compression()
+    )
+
+
+def build_gateway_async_locust_grpc_client(
+        environment: "Environment",
+        options: GRPCChannelOptions | None = None
+) -> Channel:
+    """
+    Асинхронный gRPC-канал, который репортит каждый вызов в статистику Locust
+    (аналог build_gateway_locust_grpc_client).
+
+    Окружение Locust передаётся готовым объектом, поэтому сам модуль Locust здесь не импортируется.
+
+    :param environment: Объект окружения Locust, необходим для генерации событий метрик.
+    :param options: Профиль настроек канала.
+    :return: grpc.aio.Channel с интерцептором AsyncLocustInterceptor.
+    """
+    options = options or DEFAULT_GRPC_CHANNEL_OPTIONS
+    return insecure_channel(
+        options.get_target("localhost:9003"),
+        options=options.to_channel_options(),
+        compression=options.get_compression(),
+        interceptors=[AsyncLocustInterceptor(environment)]
+    )
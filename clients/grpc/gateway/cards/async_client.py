@@ -0,0 +1,79 @@
+from typing import TYPE_CHECKING
+
+from grpc.aio import Channel
+
+from clients.grpc.async_client import AsyncGRPCClient
+from clients.grpc.gateway.async_client import (
+    build_gateway_async_grpc_client,
+    build_gateway_async_locust_grpc_client
+)
+from contracts.services.gateway.cards.cards_gateway_service_pb2_grpc import CardsGatewayServiceStub
+from contracts.services.gateway.cards.rpc_issue_physical_card_pb2 import (
+    IssuePhysicalCardRequest,
+    IssuePhysicalCardResponse
+)
+from contracts.services.gateway.cards.rpc_issue_virtual_card_pb2 import (
+    IssueVirtualCardRequest,
+    IssueVirtualCardResponse
+)
+
+if TYPE_CHECKING:
+    from locust.env import Environment
+
+
+class AsyncCardsGatewayGRPCClient(AsyncGRPCClient):
+    """
+    Асинхронный gRPC-клиент (grpc.aio) для взаимодействия с CardsGatewayService.
+    Предоставляет высокоуровневые методы для выпуска виртуальных и физических карт.
+    """
+    def __init__(self, channel: Channel):
+        """
+        Инициализация клиента с указанным gRPC-каналом.
+
+        :param channel: gRPC-канал для подключения к CardsGatewayService.
+        """
+        super().__init__(channel)
+
+        self.stub = CardsGatewayServiceStub(channel)  # gRPC-стаб, сгенерированный из .proto
+
+    async def issue_virtual_card_api(self, request: IssueVirtualCardRequest) -> IssueVirtualCardResponse:
+        """Низкоуровневый метод для отправки сырого gRPC-запроса на выпуск виртуальной карты"""
+        return await self.stub.IssueVirtualCard(request)
+
+    async def issue_physical_card_api(self, request: IssuePhysicalCardRequest) -> IssuePhysicalCardResponse:
+        """Низкоуровневый метод для отправки сырого gRPC-запроса на выпуск физической карты"""
+        return await self.stub.IssuePhysicalCard(request)
+
+    async def issue_virtual_card(self, user_id: str, account_id: str) -> IssueVirtualCardResponse:
+        """Высокоуровневый метод для выпуска виртуальной карты с заполнением обязательных полей"""
+        request = IssueVirtualCardRequest(user_id=user_id, account_id=account_id)
+        return await self.issue_virtual_card_api(request)
+
+    async def issue_physical_card(self, user_id: str, account_id: str) -> IssuePhysicalCardResponse:
+        """Высокоуровневый метод для выпуска физической карты с заполнением обязательных полей"""
+        request = IssuePhysicalCardRequest(user_id=user_id, account_id=account_id)
+        return await self.issue_physical_card_api(request)
+
+
+def build_cards_gateway_async_grpc_client() -> AsyncCardsGatewayGRPCClient:
+    """
+    Фабрика для создания экземпляра AsyncCardsGatewayGRPCClient.
+    Вызывается внутри корутины, так как канал привязывается к текущему event loop.
+
+    :return: Инициализированный асинхронный клиент для CardsGatewayService.
+    """
+    return AsyncCardsGatewayGRPCClient(channel=build_gateway_async_grpc_client())
+
+
+def build_cards_gateway_async_locust_grpc_client(
+        environment: "Environment",
+        channel: Channel | None = None
+) -> AsyncCardsGatewayGRPCClient:
+    """
+    Фабрика для создания экземпляра AsyncCardsGatewayGRPCClient, который репортит вызовы в статистику Locust.
+
+    :param environment: объект окружения Locust.
+    :param channel: общий асинхронный канал с AsyncLocustInterceptor; если не задан, создаётся отдельный канал.
+    :return: экземпляр AsyncCardsGatewayGRPCClient с интерцептором сбора метрик.
+    """
+    return AsyncCardsGatewayGRPCClient(channel=channel or build_gateway_async_locust_grpc_client(environment))
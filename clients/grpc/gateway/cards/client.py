@@ -1,7 +1,10 @@
+from typing import TYPE_CHECKING
+
 from grpc import Channel
-from locust.env import Environment  # Импорт окружения Locust
 
 from clients.grpc.client import GRPCClient
+from clients.retries import RetryPolicy
+from clients.validation import ValidationPolicy
 from clients.grpc.gateway.client import (
     build_gateway_grpc_client,
     build_gateway_locust_grpc_client  # Импорт билдера для нагрузочного тестирования
@@ -16,6 +19,10 @@ from contracts.services.gateway.cards.rpc_issue_virtual_card_pb2 import (
     IssueVirtualCardResponse
 )
 
+if TYPE_CHECKING:
+    # Только для аннотаций: импорт Locust патчит стандартную библиотеку через gevent
+    from locust.env import Environment
+
 
 class CardsGatewayGRPCClient(GRPCClient):
     """
@@ -50,16 +57,22 @@ class CardsGatewayGRPCClient(GRPCClient):
         request = IssuePhysicalCardRequest(user_id=user_id, account_id=account_id)
         return self.issue_physical_card_api(request)
 
-def build_cards_gateway_grpc_client() -> CardsGatewayGRPCClient:
+def build_cards_gateway_grpc_client(retry: RetryPolicy | None = None) -> CardsGatewayGRPCClient:
     """
     Фабрика для создания экземпляра CardsGatewayGRPCClient.
 
+    :param retry: Политика повторов вызовов (по умолчанию вызовы не повторяются).
     :return: Инициализированный клиент для CardsGatewayService.
     """
-    return CardsGatewayGRPCClient(channel=build_gateway_grpc_client())
+    return CardsGatewayGRPCClient(channel=build_gateway_grpc_client(retry))
 
 # Новый билдер для нагрузочного тестирования
-def build_cards_gateway_locust_grpc_client(environment: Environment) -> CardsGatewayGRPCClient:
+def build_cards_gateway_locust_grpc_client(
+        environment: "Environment",
+        validation: ValidationPolicy | None = None,
+        retry: RetryPolicy | None = None,
+        channel: Channel | None = None
+) -> CardsGatewayGRPCClient:
     """
     Функция создаёт экземпляр CardsGatewayGRPCClient адаптированного под Locust.
 
@@ -67,6 +80,12 @@ def build_cards_gateway_locust_grpc_client(environment: Environment) -> CardsGat
     Используется исключительно в нагрузочных тестах.
 
     :param environment: объект окружения Locust.
+    :param validation: политика разбора ответов (по умолчанию каждый ответ разбирается сразу).
+    :param retry: политика повторов (по умолчанию вызовы не повторяются).
+    :param channel: общий канал с интерцепторами Locust, через который работают все стабы виртуального
+                    пользователя (validation и retry в нём уже учтены); если не задан, создаётся отдельный канал.
     :return: экземпляр CardsGatewayGRPCClient с хуками сбора метрик.
     """
-    return CardsGatewayGRPCClient(channel=build_gateway_locust_grpc_client(environment))
\ No newline at end of file
+    return CardsGatewayGRPCClient(
+        channel=channel or build_gateway_locust_grpc_client(environment, validation, retry)
+    )
\ No newline at end of file
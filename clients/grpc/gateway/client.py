@@ -1,32 +1,173 @@
+from typing import TYPE_CHECKING
+
 from grpc import Channel, insecure_channel, intercept_channel
-from locust.env import Environment
 
+from clients.grpc.channels import RoundRobinChannel
+from clients.grpc.client import init_grpc_gevent
 from clients.grpc.interceptors.locust_interceptor import LocustInterceptor
+from clients.grpc.interceptors.retry_interceptor import RetryInterceptor
+from clients.grpc.options import GRPCChannelOptions, DEFAULT_GRPC_CHANNEL_OPTIONS
+from clients.grpc.validation import ValidationChannel
+from clients.retries import RetryPolicy
+from clients.validation import ValidationPolicy
+
+if TYPE_CHECKING:
+    # Только для аннотаций: импорт Locust патчит стандартную библиотеку через gevent
+    from locust.env import Environment
+
 
+def create_gateway_grpc_channel(
+        options: GRPCChannelOptions | None = None,
+        local_subchannel_pool: bool = False
+) -> Channel:
+    """
+    Создаёт gRPC-канал к grpc-gateway (по умолчанию localhost:9003) с настройками профиля.
 
-def build_gateway_grpc_client() -> Channel:
+    :param options: Профиль настроек канала; по умолчанию используются настройки gRPC.
+    :param local_subchannel_pool: Не делить соединения с другими каналами к тому же адресу.
+    :return: gRPC-канал без интерцепторов.
+    """
+    init_grpc_gevent()
+
+    options = options or DEFAULT_GRPC_CHANNEL_OPTIONS
+    channel_options = options.to_channel_options()
+    if local_subchannel_pool:
+        channel_options.append(("grpc.use_local_subchannel_pool", 1))
+
+    return insecure_channel(
+        options.get_target("localhost:9003"),
+        options=channel_options,
+        compression=options.get_compression()
+    )
+
+
+def build_gateway_grpc_client(
+        retry: RetryPolicy | None = None,
+        options: GRPCChannelOptions | None = None
+) -> Channel:
     """
     Фабричная функция (билдер) для создания gRPC-канала к сервису grpc-gateway.
 
+    :param retry: Политика повторов вызовов (RetryInterceptor); по умолчанию вызовы не повторяются.
+    :param options: Профиль настроек канала (keepalive, сжатие, лимиты сообщений, балансировка, окна HTTP/2).
     :return: gRPC-канал (Channel), настроенный на адрес localhost:9003.
     """
-    return insecure_channel("localhost:9003")
+    channel = create_gateway_grpc_channel(options)
+    if retry is None:
+        return channel
 
+    return intercept_channel(channel, RetryInterceptor(retry))
 
-def build_gateway_locust_grpc_client(environment: Environment) -> Channel:
+
+def build_gateway_grpc_channel_pool(pool_size: int = 1, options: GRPCChannelOptions | None = None) -> Channel:
     """
-    Фабричная функция для создания gRPC-канала, адаптированного для Locust.
-    В канал автоматически встраивается интерцептор LocustInterceptor,
-    который регистрирует вызовы в системе метрик Locust.
+    Создаёт gRPC-канал к grpc-gateway из pool_size соединений, вызовы распределяются по ним по кругу.
+
+    :param pool_size: Количество каналов (HTTP/2-соединений) в пуле.
+    :param options: Профиль настроек каналов пула.
+    :return: Обычный канал при pool_size=1, иначе RoundRobinChannel.
+    """
+    if pool_size < 1:
+        raise ValueError(f"gRPC channel pool size must be positive, got {pool_size}")
+
+    if pool_size == 1:
+        return create_gateway_grpc_channel(options)
+
+    # Без локального пула подканалов gRPC объединил бы каналы с одинаковыми настройками в одно соединение
+    return RoundRobinChannel([
+        create_gateway_grpc_channel(options, local_subchannel_pool=True) for _ in range(pool_size)
+    ])
+
+
+def intercept_gateway_locust_grpc_channel(
+        environment: "Environment",
+        channel: Channel,
+        validation: ValidationPolicy | None = None,
+        retry: RetryPolicy | None = None
+) -> Channel:
+    """
+    Встраивает в канал LocustInterceptor, а также (опционально) ValidationChannel и RetryInterceptor.
+    Обёртки не открывают соединений, поэтому один исходный канал можно оборачивать многократно.
 
     :param environment: Среда выполнения Locust (необходима для отправки событий).
-    :return: gRPC-канал с интерцептором, пригодный для нагрузочного тестирования.
+    :param channel: Исходный gRPC-канал.
+    :param validation: Политика разбора ответов (ValidationChannel); если не задана, каждый ответ разбирается сразу.
+    :param retry: Политика повторов; RetryInterceptor встраивается перед LocustInterceptor,
+                  поэтому каждая попытка репортится отдельно.
+    :return: gRPC-канал с интерцепторами.
     """
     # Создаём экземпляр интерцептора, передаём в него окружение Locust
     locust_interceptor = LocustInterceptor(environment=environment)
 
-    # Создаём обычный канал
-    channel = insecure_channel("localhost:9003")
+    if validation is not None:
+        channel = ValidationChannel(channel, validation)
+
+    if retry is not None:
+        # Первый интерцептор внешний: повторы проходят через LocustInterceptor как отдельные вызовы
+        return intercept_channel(channel, RetryInterceptor(retry), locust_interceptor)
 
     # Оборачиваем канал интерцептором, чтобы все запросы проходили через него
     return intercept_channel(channel, locust_interceptor)
+
+
+def build_gateway_locust_grpc_client(
+        environment: "Environment",
+        validation: ValidationPolicy | None = None,
+        retry: RetryPolicy | None = None,
+        options: GRPCChannelOptions | None = None
+) -> Channel:
+    """
+    Фабричная функция для создания gRPC-канала, адаптированного для Locust.
+    В канал автоматически встраивается интерцептор LocustInterceptor,
+    который регистрирует вызовы в системе метрик Locust.
+
+    :param environment: Среда выполнения Locust (необходима для отправки событий).
+    :param validation: Политика разбора ответов (ValidationChannel); если не задана, каждый ответ разбирается сразу.
+    :param retry: Политика повторов; RetryInterceptor встраивается перед LocustInterceptor,
+                  поэтому каждая попытка репортится отдельно.
+    :param options: Профиль настроек канала.
+    :return: gRPC-канал с интерцептором, пригодный для нагрузочного тестирования.
+    """
+    return intercept_gateway_locust_grpc_channel(environment, create_gateway_grpc_channel(options), validation, retry)
+
+
+def build_shared_gateway_locust_grpc_client(
+        environment: "Environment",
+        validation: ValidationPolicy | None = None,
+        retry: RetryPolicy | None = None,
+        pool_size: int = 1,
+        options: GRPCChannelOptions | None = None
+) -> Channel:
+    """
+    Возвращает gRPC-канал с интерцепторами Locust поверх одного на процесс воркера пула соединений.
+
+    Пул каналов (build_gateway_grpc_channel_pool) создаётся при первом вызове и сохраняется в окружении
+    Locust. Все стабы всех виртуальных пользователей процесса мультиплексируют вызовы в его HTTP/2-соединениях,
+    поэтому количество соединений определяется pool_size, а не числом пользователей и стабов.
+
+    :param environment: Среда выполнения Locust.
+    :param validation: Политика разбора ответов.
+    :param retry: Политика повторов.
+    :param pool_size: Количество соединений в пуле.
+    :param options: Профиль настроек каналов пула.
+    :return: gRPC-канал с интерцепторами поверх общего пула.
+    """
+    # Пулы кэшируются по своим параметрам, а каналы с интерцепторами — ещё и по политикам: вызов с другим
+    # размером пула или профилем получает отдельный пул, а не молча переиспользует первый созданный
+    pool_key = (pool_size, options)
+    pools: dict[tuple, Channel] | None = getattr(environment, "gateway_grpc_channel_pools", None)
+    if pools is None:
+        pools = environment.gateway_grpc_channel_pools = {}
+
+    if pool_key not in pools:
+        pools[pool_key] = build_gateway_grpc_channel_pool(pool_size, options)
+
+    key = (pool_size, options, validation, retry)
+    channels: dict[tuple, Channel] | None = getattr(environment, "gateway_grpc_channels", None)
+    if channels is None:
+        channels = environment.gateway_grpc_channels = {}
+
+    if key not in channels:
+        channels[key] = intercept_gateway_locust_grpc_channel(environment, pools[pool_key], validation, retry)
+
+    return channels[key]
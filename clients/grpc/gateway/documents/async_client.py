@@ -0,0 +1,88 @@
+from typing import TYPE_CHECKING
+
+from grpc.aio import Channel
+
+from clients.grpc.async_client import AsyncGRPCClient
+from clients.grpc.gateway.async_client import (
+    build_gateway_async_grpc_client,
+    build_gateway_async_locust_grpc_client
+)
+from contracts.services.gateway.documents.documents_gateway_service_pb2_grpc import DocumentsGatewayServiceStub
+from contracts.services.gateway.documents.rpc_get_contract_document_pb2 import (
+    GetContractDocumentRequest,
+    GetContractDocumentResponse
+)
+from contracts.services.gateway.documents.rpc_get_tariff_document_pb2 import (
+    GetTariffDocumentRequest,
+    GetTariffDocumentResponse
+)
+
+if TYPE_CHECKING:
+    from locust.env import Environment
+
+
+class AsyncDocumentsGatewayGRPCClient(AsyncGRPCClient):
+    """
+    Асинхронный gRPC-клиент (grpc.aio) для взаимодействия с DocumentsGatewayService.
+    Предоставляет высокоуровневые методы для работы с документами.
+    """
+
+    def __init__(self, channel: Channel):
+        """
+        Инициализация клиента с указанным gRPC-каналом.
+
+        :param channel: gRPC-канал для подключения к DocumentsGatewayService.
+        """
+        super().__init__(channel)
+
+        self.stub = DocumentsGatewayServiceStub(channel)
+
+    async def get_tariff_document_api(self, request: GetTariffDocumentRequest) -> GetTariffDocumentResponse:
+        """
+        Низкоуровневый вызов метода GetTariffDocument через gRPC.
+
+        :param request: gRPC-запрос с ID счета.
+        :return: Ответ от сервиса с данными документа тарифа.
+        """
+        return await self.stub.GetTariffDocument(request)
+
+    async def get_contract_document_api(self, request: GetContractDocumentRequest) -> GetContractDocumentResponse:
+        """
+        Низкоуровневый вызов метода GetContractDocument через gRPC.
+
+        :param request: gRPC-запрос с ID счета.
+        :return: Ответ от сервиса с данными документа контракта.
+        """
+        return await self.stub.GetContractDocument(request)
+
+    async def get_tariff_document(self, account_id: str) -> GetTariffDocumentResponse:
+        request = GetTariffDocumentRequest(account_id=account_id)
+        return await self.get_tariff_document_api(request)
+
+    async def get_contract_document(self, account_id: str) -> GetContractDocumentResponse:
+        request = GetContractDocumentRequest(account_id=account_id)
+        return await self.get_contract_document_api(request)
+
+
+def build_documents_gateway_async_grpc_client() -> AsyncDocumentsGatewayGRPCClient:
+    """
+    Фабрика для создания экземпляра AsyncDocumentsGatewayGRPCClient.
+    Вызывается внутри корутины, так как канал привязывается к текущему event loop.
+
+    :return: Инициализированный асинхронный клиент для DocumentsGatewayService.
+    """
+    return AsyncDocumentsGatewayGRPCClient(channel=build_gateway_async_grpc_client())
+
+
+def build_documents_gateway_async_locust_grpc_client(
+        environment: "Environment",
+        channel: Channel | None = None
+) -> AsyncDocumentsGatewayGRPCClient:
+    """
+    Фабрика для создания экземпляра AsyncDocumentsGatewayGRPCClient, который репортит вызовы в статистику Locust.
+
+    :param environment: объект окружения Locust.
+    :param channel: общий асинхронный канал с AsyncLocustInterceptor; если не задан, создаётся отдельный канал.
+    :return: экземпляр AsyncDocumentsGatewayGRPCClient с интерцептором сбора метрик.
+    """
+    return AsyncDocumentsGatewayGRPCClient(channel=channel or build_gateway_async_locust_grpc_client(environment))
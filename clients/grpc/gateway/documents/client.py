@@ -1,7 +1,10 @@
+from typing import TYPE_CHECKING
+
 from grpc import Channel
-from locust.env import Environment  # Импорт окружения Locust
 
 from clients.grpc.client import GRPCClient
+from clients.retries import RetryPolicy
+from clients.validation import ValidationPolicy
 from clients.grpc.gateway.client import (
     build_gateway_grpc_client,
     build_gateway_locust_grpc_client  # Импорт билдера для нагрузочного тестирования
@@ -16,6 +19,10 @@ from contracts.services.gateway.documents.rpc_get_tariff_document_pb2 import (
     GetTariffDocumentResponse
 )
 
+if TYPE_CHECKING:
+    # Только для аннотаций: импорт Locust патчит стандартную библиотеку через gevent
+    from locust.env import Environment
+
 
 class DocumentsGatewayGRPCClient(GRPCClient):
     """
@@ -60,16 +67,22 @@ class DocumentsGatewayGRPCClient(GRPCClient):
         return self.get_contract_document_api(request)
 
 
-def build_documents_gateway_grpc_client() -> DocumentsGatewayGRPCClient:
+def build_documents_gateway_grpc_client(retry: RetryPolicy | None = None) -> DocumentsGatewayGRPCClient:
     """
     Фабрика для создания экземпляра DocumentsGatewayGRPCClient.
 
+    :param retry: Политика повторов вызовов (по умолчанию вызовы не повторяются).
     :return: Инициализированный клиент для DocumentsGatewayService.
     """
-    return DocumentsGatewayGRPCClient(channel=build_gateway_grpc_client())
+    return DocumentsGatewayGRPCClient(channel=build_gateway_grpc_client(retry))
 
 # Новый билдер для нагрузочного тестирования
-def build_documents_gateway_locust_grpc_client(environment: Environment) -> DocumentsGatewayGRPCClient:
+def build_documents_gateway_locust_grpc_client(
+        environment: "Environment",
+        validation: ValidationPolicy | None = None,
+        retry: RetryPolicy | None = None,
+        channel: Channel | None = None
+) -> DocumentsGatewayGRPCClient:
     """
     Функция создаёт экземпляр DocumentsGatewayGRPCClient адаптированного под Locust.
 
@@ -77,9 +90,15 @@ def build_documents_gateway_locust_grpc_client(environment: Environment) -> Docu
     Используется исключительно в нагрузочных тестах.
 
     :param environment: объект окружения Locust.
+    :param validation: политика разбора ответов (по умолчанию каждый ответ разбирается сразу).
+    :param retry: политика повторов (по умолчанию вызовы не повторяются).
+    :param channel: общий канал с интерцепторами Locust, через который работают все стабы виртуального
+                    пользователя (validation и retry в нём уже учтены); если не задан, создаётся отдельный канал.
     :return: экземпляр DocumentsGatewayGRPCClient с хуками сбора метрик.
     """
-    return DocumentsGatewayGRPCClient(channel=build_gateway_locust_grpc_client(environment))
+    return DocumentsGatewayGRPCClient(
+        channel=channel or build_gateway_locust_grpc_client(environment, validation, retry)
+    )
 
 
 
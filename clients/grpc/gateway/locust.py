@@ -1,4 +1,6 @@
+from grpc import Channel
 from locust import TaskSet, SequentialTaskSet
+from locust.env import Environment
 
 # Импортируем типы и билдеры для построения GRPC API клиентов
 from clients.grpc.gateway.accounts.client import AccountsGatewayGRPCClient, build_accounts_gateway_locust_grpc_client
@@ -11,7 +13,37 @@ from clients.grpc.gateway.operations.client import (
     OperationsGatewayGRPCClient,
     build_operations_gateway_locust_grpc_client
 )
+from clients.grpc.gateway.client import build_gateway_locust_grpc_client, build_shared_gateway_locust_grpc_client
 from clients.grpc.gateway.users.client import UsersGatewayGRPCClient, build_users_gateway_locust_grpc_client
+from clients.grpc.options import GRPCChannelOptions, DEFAULT_GRPC_CHANNEL_OPTIONS
+from clients.retries import RetryPolicy, HedgingPolicy
+from clients.validation import ValidationPolicy, FULL_VALIDATION
+
+
+def build_gateway_locust_task_set_grpc_channel(
+        environment: Environment,
+        shared_grpc_channel: bool,
+        pool_size: int = 1,
+        validation: ValidationPolicy | None = None,
+        retry: RetryPolicy | None = None,
+        options: GRPCChannelOptions | None = None
+) -> Channel:
+    """
+    Создаёт gRPC-канал с интерцепторами Locust, через который работают все стабы одного таск-сета.
+
+    :param environment: Объект окружения Locust.
+    :param shared_grpc_channel: Использовать общий на процесс воркера пул соединений
+                                вместо отдельного соединения на каждого виртуального пользователя.
+    :param pool_size: Количество соединений в общем пуле (build_shared_gateway_locust_grpc_client).
+    :param validation: Политика разбора ответов.
+    :param retry: Политика повторов.
+    :param options: Профиль настроек gRPC-канала.
+    :return: gRPC-канал с интерцепторами.
+    """
+    if shared_grpc_channel:
+        return build_shared_gateway_locust_grpc_client(environment, validation, retry, pool_size, options)
+
+    return build_gateway_locust_grpc_client(environment, validation, retry, options)
 
 
 class GatewayGRPCTaskSet(TaskSet):
@@ -29,16 +61,58 @@ class GatewayGRPCTaskSet(TaskSet):
     documents_gateway_client: DocumentsGatewayGRPCClient
     operations_gateway_client: OperationsGatewayGRPCClient
 
+    # Политика разбора ответов; под нагрузкой можно задать ValidationPolicy(ValidationMode.SAMPLED)
+    validation: ValidationPolicy = FULL_VALIDATION
+    # Политика повторов вызовов (RetryPolicy); по умолчанию вызовы не повторяются
+    retry: RetryPolicy | None = None
+    # Хеджирование идемпотентных чтений GetAccounts и GetOperations (HedgingPolicy); по умолчанию выключено
+    hedging: HedgingPolicy | None = None
+    # Общий на процесс воркера пул gRPC-соединений (build_shared_gateway_locust_grpc_client): gRPC мультиплексирует
+    # вызовы в HTTP/2-соединении, поэтому отдельные соединения на пользователя и стаб не нужны
+    shared_grpc_channel: bool = True
+    # Количество соединений в общем пуле, вызовы распределяются по ним по кругу
+    grpc_channel_pool_size: int = 1
+    # Профиль настроек gRPC-канала; для сравнения под нагрузкой — get_grpc_channel_profile("keepalive") и т.п.
+    grpc_channel_options: GRPCChannelOptions = DEFAULT_GRPC_CHANNEL_OPTIONS
+    grpc_channel: Channel
+
     def on_start(self) -> None:
         """
         Метод вызывается перед запуском задач TaskSet.
         Здесь создаются API клиенты с использованием контекста окружения Locust.
         """
-        self.users_gateway_client = build_users_gateway_locust_grpc_client(self.user.environment)
-        self.cards_gateway_client = build_cards_gateway_locust_grpc_client(self.user.environment)
-        self.accounts_gateway_client = build_accounts_gateway_locust_grpc_client(self.user.environment)
-        self.documents_gateway_client = build_documents_gateway_locust_grpc_client(self.user.environment)
-        self.operations_gateway_client = build_operations_gateway_locust_grpc_client(self.user.environment)
+        # Один канал на все стабы таск-сета вместо пяти — по одному на клиент
+        self.grpc_channel = build_gateway_locust_task_set_grpc_channel(
+            self.user.environment,
+            self.shared_grpc_channel,
+            self.grpc_channel_pool_size,
+            self.validation,
+            self.retry,
+            self.grpc_channel_options
+        )
+
+        self.users_gateway_client = build_users_gateway_locust_grpc_client(
+            self.user.environment, channel=self.grpc_channel
+        )
+        self.cards_gateway_client = build_cards_gateway_locust_grpc_client(
+            self.user.environment, channel=self.grpc_channel
+        )
+        self.accounts_gateway_client = build_accounts_gateway_locust_grpc_client(
+            self.user.environment, channel=self.grpc_channel, hedging=self.hedging
+        )
+        self.documents_gateway_client = build_documents_gateway_locust_grpc_client(
+            self.user.environment, channel=self.grpc_channel
+        )
+        self.operations_gateway_client = build_operations_gateway_locust_grpc_client(
+            self.user.environment, channel=self.grpc_channel, hedging=self.hedging
+        )
+
+    def on_stop(self) -> None:
+        """
+        Закрывает собственный канал виртуального пользователя. Общий пул процесса не закрывается.
+        """
+        if not self.shared_grpc_channel:
+            self.grpc_channel.close()
 
 
 class GatewayGRPCSequentialTaskSet(SequentialTaskSet):
@@ -54,12 +128,54 @@ class GatewayGRPCSequentialTaskSet(SequentialTaskSet):
     documents_gateway_client: DocumentsGatewayGRPCClient
     operations_gateway_client: OperationsGatewayGRPCClient
 
+    # Политика разбора ответов; под нагрузкой можно задать ValidationPolicy(ValidationMode.SAMPLED)
+    validation: ValidationPolicy = FULL_VALIDATION
+    # Политика повторов вызовов (RetryPolicy); по умолчанию вызовы не повторяются
+    retry: RetryPolicy | None = None
+    # Хеджирование идемпотентных чтений GetAccounts и GetOperations (HedgingPolicy); по умолчанию выключено
+    hedging: HedgingPolicy | None = None
+    # Общий на процесс воркера пул gRPC-соединений (build_shared_gateway_locust_grpc_client): gRPC мультиплексирует
+    # вызовы в HTTP/2-соединении, поэтому отдельные соединения на пользователя и стаб не нужны
+    shared_grpc_channel: bool = True
+    # Количество соединений в общем пуле, вызовы распределяются по ним по кругу
+    grpc_channel_pool_size: int = 1
+    # Профиль настроек gRPC-канала; для сравнения под нагрузкой — get_grpc_channel_profile("keepalive") и т.п.
+    grpc_channel_options: GRPCChannelOptions = DEFAULT_GRPC_CHANNEL_OPTIONS
+    grpc_channel: Channel
+
     def on_start(self) -> None:
         """
         Создание API клиентов для последовательного сценария.
         """
-        self.users_gateway_client = build_users_gateway_locust_grpc_client(self.user.environment)
-        self.cards_gateway_client = build_cards_gateway_locust_grpc_client(self.user.environment)
-        self.accounts_gateway_client = build_accounts_gateway_locust_grpc_client(self.user.environment)
-        self.documents_gateway_client = build_documents_gateway_locust_grpc_client(self.user.environment)
-        self.operations_gateway_client = build_operations_gateway_locust_grpc_client(self.user.environment)
+        # Один канал на все стабы таск-сета вместо пяти — по одному на клиент
+        self.grpc_channel = build_gateway_locust_task_set_grpc_channel(
+            self.user.environment,
+            self.shared_grpc_channel,
+            self.grpc_channel_pool_size,
+            self.validation,
+            self.retry,
+            self.grpc_channel_options
+        )
+
+        self.users_gateway_client = build_users_gateway_locust_grpc_client(
+            self.user.environment, channel=self.grpc_channel
+        )
+        self.cards_gateway_client = build_cards_gateway_locust_grpc_client(
+            self.user.environment, channel=self.grpc_channel
+        )
+        self.accounts_gateway_client = build_accounts_gateway_locust_grpc_client(
+            self.user.environment, channel=self.grpc_channel, hedging=self.hedging
+        )
+        self.documents_gateway_client = build_documents_gateway_locust_grpc_client(
+            self.user.environment, channel=self.grpc_channel
+        )
+        self.operations_gateway_client = build_operations_gateway_locust_grpc_client(
+            self.user.environment, channel=self.grpc_channel, hedging=self.hedging
+        )
+
+    def on_stop(self) -> None:
+        """
+        Закрывает собственный канал виртуального пользователя. Общий пул процесса не закрывается.
+        """
+        if not self.shared_grpc_channel:
+            self.grpc_channel.close()
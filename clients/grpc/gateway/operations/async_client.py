@@ -0,0 +1,222 @@
+from typing import TYPE_CHECKING
+
+from grpc.aio import Channel
+
+from clients.grpc.async_client import AsyncGRPCClient
+from clients.grpc.gateway.async_client import (
+    build_gateway_async_grpc_client,
+    build_gateway_async_locust_grpc_client
+)
+from contracts.services.gateway.operations.operations_gateway_service_pb2_grpc import OperationsGatewayServiceStub
+from contracts.services.gateway.operations.rpc_get_operation_pb2 import (GetOperationRequest, GetOperationResponse)
+from contracts.services.gateway.operations.rpc_get_operation_receipt_pb2 import (GetOperationReceiptRequest,
+                                                                                 GetOperationReceiptResponse)
+from contracts.services.gateway.operations.rpc_get_operations_pb2 import (GetOperationsRequest, GetOperationsResponse)
+from contracts.services.gateway.operations.rpc_get_operations_summary_pb2 import (GetOperationsSummaryRequest,
+                                                                                  GetOperationsSummaryResponse)
+from contracts.services.gateway.operations.rpc_make_fee_operation_pb2 import (MakeFeeOperationRequest,
+                                                                              MakeFeeOperationResponse)
+from contracts.services.gateway.operations.rpc_make_top_up_operation_pb2 import (MakeTopUpOperationRequest,
+                                                                                 MakeTopUpOperationResponse)
+from contracts.services.gateway.operations.rpc_make_cashback_operation_pb2 import (MakeCashbackOperationRequest,
+                                                                                   MakeCashbackOperationResponse)
+from contracts.services.gateway.operations.rpc_make_transfer_operation_pb2 import (MakeTransferOperationRequest,
+                                                                                   MakeTransferOperationResponse)
+from contracts.services.gateway.operations.rpc_make_purchase_operation_pb2 import (MakePurchaseOperationRequest,
+                                                                                   MakePurchaseOperationResponse)
+from contracts.services.gateway.operations.rpc_make_bill_payment_operation_pb2 import (
+    MakeBillPaymentOperationRequest,
+    MakeBillPaymentOperationResponse
+)
+from contracts.services.gateway.operations.rpc_make_cash_withdrawal_operation_pb2 import (
+    MakeCashWithdrawalOperationRequest, MakeCashWithdrawalOperationResponse)
+
+from contracts.services.operations.operation_pb2 import OperationStatus
+from tools.fakers import fake
+
+if TYPE_CHECKING:
+    from locust.env import Environment
+
+
+class AsyncOperationsGatewayGRPCClient(AsyncGRPCClient):
+    """
+    Асинхронный gRPC-клиент (grpc.aio) для взаимодействия с OperationsGatewayService.
+    Предоставляет высокоуровневые методы для работы с операциями.
+    """
+
+    def __init__(self, channel: Channel):
+        """
+        Инициализация клиента с указанным gRPC-каналом.
+
+        :param channel: gRPC-канал для подключения к OperationsGatewayService.
+        """
+        super().__init__(channel)
+
+        self.stub = OperationsGatewayServiceStub(channel)
+
+    # Низкоуровневые API методы
+    async def get_operation_api(self, request: GetOperationRequest) -> GetOperationResponse:
+        """Получение информации об операции по ID"""
+        return await self.stub.GetOperation(request)
+
+    async def get_operation_receipt_api(self, request: GetOperationReceiptRequest) -> GetOperationReceiptResponse:
+        """Получение чека операции по ID"""
+        return await self.stub.GetOperationReceipt(request)
+
+    async def get_operations_api(self, request: GetOperationsRequest) -> GetOperationsResponse:
+        """Получение списка операций по фильтрам"""
+        return await self.stub.GetOperations(request)
+
+    async def get_operations_summary_api(self, request: GetOperationsSummaryRequest) -> GetOperationsSummaryResponse:
+        """Получение сводной статистики по операциям"""
+        return await self.stub.GetOperationsSummary(request)
+
+    async def make_fee_operation_api(self, request: MakeFeeOperationRequest) -> MakeFeeOperationResponse:
+        """Создание операции комиссии"""
+        return await self.stub.MakeFeeOperation(request)
+
+    async def make_top_up_operation_api(self, request: MakeTopUpOperationRequest) -> MakeTopUpOperationResponse:
+        """Создание операции пополнения"""
+        return await self.stub.MakeTopUpOperation(request)
+
+    async def make_cashback_operation_api(self, request: MakeCashbackOperationRequest) -> MakeCashbackOperationResponse:
+        """Создание операции кэшбэка"""
+        return await self.stub.MakeCashbackOperation(request)
+
+    async def make_transfer_operation_api(self, request: MakeTransferOperationRequest) -> MakeTransferOperationResponse:
+        """Создание операции перевода"""
+        return await self.stub.MakeTransferOperation(request)
+
+    async def make_purchase_operation_api(self, request: MakePurchaseOperationRequest) -> MakePurchaseOperationResponse:
+        """Создание операции покупки"""
+        return await self.stub.MakePurchaseOperation(request)
+
+    async def make_bill_payment_operation_api(
+            self,
+            request: MakeBillPaymentOperationRequest
+    ) -> MakeBillPaymentOperationResponse:
+        """Создание операции оплаты счета"""
+        return await self.stub.MakeBillPaymentOperation(request)
+
+    async def make_cash_withdrawal_operation_api(
+            self,
+            request: MakeCashWithdrawalOperationRequest
+    ) -> MakeCashWithdrawalOperationResponse:
+        """Создание операции снятия наличных"""
+        return await self.stub.MakeCashWithdrawalOperation(request)
+
+    # Высокоуровневые методы
+    async def get_operation(self, operation_id: str) -> GetOperationResponse:
+        """Получение операции по ID"""
+        request = GetOperationRequest(id=operation_id)
+        return await self.get_operation_api(request)
+
+    async def get_operation_receipt(self, operation_id: str) -> GetOperationReceiptResponse:
+        """Получение чека операции по ID"""
+        request = GetOperationReceiptRequest(operation_id=operation_id)
+        return await self.get_operation_receipt_api(request)
+
+    async def get_operations(self, account_id: str) -> GetOperationsResponse:
+        """Получение списка операций по account_id"""
+        request = GetOperationsRequest(account_id=account_id)
+        return await self.get_operations_api(request)
+
+    async def get_operations_summary(self, account_id: str) -> GetOperationsSummaryResponse:
+        """Получение статистики операций по account_id"""
+        request = GetOperationsSummaryRequest(account_id=account_id)
+        return await self.get_operations_summary_api(request)
+
+    async def make_fee_operation(self, card_id: str, account_id: str) -> MakeFeeOperationResponse:
+        """Создание операции комиссии"""
+        request = MakeFeeOperationRequest(
+            card_id=card_id,
+            account_id=account_id,
+            status=fake.proto_enum(OperationStatus),
+            amount=fake.amount()
+        )
+        return await self.make_fee_operation_api(request)
+
+    async def make_top_up_operation(self, card_id: str, account_id: str) -> MakeTopUpOperationResponse:
+        """Создание операции пополнения"""
+        request = MakeTopUpOperationRequest(
+            card_id=card_id,
+            account_id=account_id,
+            status=fake.proto_enum(OperationStatus),
+            amount=fake.amount()
+        )
+        return await self.make_top_up_operation_api(request)
+
+    async def make_cashback_operation(self, card_id: str, account_id: str) -> MakeCashbackOperationResponse:
+        """Создание операции кэшбэка"""
+        request = MakeCashbackOperationRequest(
+            card_id=card_id,
+            account_id=account_id,
+            status=fake.proto_enum(OperationStatus),
+            amount=fake.amount()
+        )
+        return await self.make_cashback_operation_api(request)
+
+    async def make_transfer_operation(self, card_id: str, account_id: str) -> MakeTransferOperationResponse:
+        """Создание операции перевода"""
+        request = MakeTransferOperationRequest(
+            card_id=card_id,
+            account_id=account_id,
+            status=fake.proto_enum(OperationStatus),
+            amount=fake.amount()
+        )
+        return await self.make_transfer_operation_api(request)
+
+    async def make_purchase_operation(self, card_id: str, account_id: str) -> MakePurchaseOperationResponse:
+        """Создание операции покупки"""
+        request = MakePurchaseOperationRequest(
+            card_id=card_id,
+            account_id=account_id,
+            status=fake.proto_enum(OperationStatus),
+            amount=fake.amount(),
+            category=fake.category()
+        )
+        return await self.make_purchase_operation_api(request)
+
+    async def make_bill_payment_operation(self, card_id: str, account_id: str) -> MakeBillPaymentOperationResponse:
+        """Создание операции оплаты счета"""
+        request = MakeBillPaymentOperationRequest(
+            card_id=card_id,
+            account_id=account_id,
+            status=fake.proto_enum(OperationStatus),
+            amount=fake.amount()
+        )
+        return await self.make_bill_payment_operation_api(request)
+
+    async def make_cash_withdrawal_operation(self, card_id: str, account_id: str) -> MakeCashWithdrawalOperationResponse:
+        """Создание операции снятия наличных"""
+        request = MakeCashWithdrawalOperationRequest(
+            card_id=card_id,
+            account_id=account_id,
+            status=fake.proto_enum(OperationStatus),
+            amount=fake.amount()
+        )
+        return await self.make_cash_withdrawal_operation_api(request)
+
+
+def build_operations_gateway_async_grpc_client() -> AsyncOperationsGatewayGRPCClient:
+    """
+    Фабрика для создания экземпляра AsyncOperationsGatewayGRPCClient.
+    Вызывается внутри корутины, так как канал привязывается к текущему event loop.
+
+    :return: Инициализированный асинхронный клиент для OperationsGatewayService.
+    """
+    return AsyncOperationsGatewayGRPCClient(channel=build_gateway_async_grpc_client())
+
+
+def build_operations_gateway_async_locust_grpc_client(
+        environment: "Environment",
+        channel: Channel | None = None
+) -> AsyncOperationsGatewayGRPCClient:
+    """
+    Фабрика для создания экземпляра AsyncOperationsGatewayGRPCClient, который репортит вызовы в статистику Locust.
+
+    :param environment: объект окружения Locust.
+    :param channel: общий асинхронный канал с AsyncLocustInterceptor; если не задан, создаётся отдельный канал.
+    :return: экземпляр AsyncOperationsGatewayGRPCClient с интерцептором сбора метрик.
+    """
+    return AsyncOperationsGatewayGRPCClient(channel=channel or build_gateway_async_locust_grpc_client(environment))
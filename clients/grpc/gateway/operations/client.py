@@ -1,7 +1,10 @@
-from grpc import Channel
-from locust.env import Environment  # Импорт окружения Locust
+from typing import TYPE_CHECKING
+
+from grpc import Channel, Future
 
 from clients.grpc.client import GRPCClient
+from clients.retries import RetryPolicy, HedgingPolicy
+from clients.validation import ValidationPolicy
 from clients.grpc.gateway.client import (
     build_gateway_grpc_client,
     build_gateway_locust_grpc_client  # Импорт билдера для нагрузочного тестирования
@@ -33,6 +36,10 @@ from contracts.services.gateway.operations.rpc_make_cash_withdrawal_operation_pb
 from contracts.services.operations.operation_pb2 import OperationStatus
 from tools.fakers import fake
 
+if TYPE_CHECKING:
+    # Только для аннотаций: импорт Locust патчит стандартную библиотеку через gevent
+    from locust.env import Environment
+
 
 class OperationsGatewayGRPCClient(GRPCClient):
     """
@@ -40,13 +47,14 @@ class OperationsGatewayGRPCClient(GRPCClient):
     Предоставляет высокоуровневые методы для работы с операциями.
     """
 
-    def __init__(self, channel: Channel):
+    def __init__(self, channel: Channel, hedging: HedgingPolicy | None = None):
         """
         Инициализация клиента с указанным gRPC-каналом.
 
         :param channel: gRPC-канал для подключения к OperationsGatewayService.
+        :param hedging: Политика хеджирования идемпотентных чтений (GetOperations); по умолчанию выключено.
         """
-        super().__init__(channel)
+        super().__init__(channel, hedging)
 
         self.stub = OperationsGatewayServiceStub(channel)
 
@@ -61,7 +69,7 @@ class OperationsGatewayGRPCClient(GRPCClient):
 
     def get_operations_api(self, request: GetOperationsRequest) -> GetOperationsResponse:
         """Получение списка операций по фильтрам"""
-        return self.stub.GetOperations(request)
+        return self.call_hedged(self.stub.GetOperations, request)
 
     def get_operations_summary_api(self, request: GetOperationsSummaryRequest) -> GetOperationsSummaryResponse:
         """Получение сводной статистики по операциям"""
@@ -118,6 +126,14 @@ class OperationsGatewayGRPCClient(GRPCClient):
         request = GetOperationsSummaryRequest(account_id=account_id)
         return self.get_operations_summary_api(request)
 
+    def get_operations_future(self, account_id: str) -> Future:
+        """Неблокирующее получение списка операций: возвращает grpc.Future"""
+        return self.stub.GetOperations.future(GetOperationsRequest(account_id=account_id))
+
+    def get_operations_summary_future(self, account_id: str) -> Future:
+        """Неблокирующее получение статистики операций: возвращает grpc.Future"""
+        return self.stub.GetOperationsSummary.future(GetOperationsSummaryRequest(account_id=account_id))
+
     def make_fee_operation(self, card_id: str, account_id: str) -> MakeFeeOperationResponse:
         """Создание операции комиссии"""
         request = MakeFeeOperationRequest(
@@ -190,16 +206,23 @@ class OperationsGatewayGRPCClient(GRPCClient):
         return self.make_cash_withdrawal_operation_api(request)
 
 
-def build_operations_gateway_grpc_client() -> OperationsGatewayGRPCClient:
+def build_operations_gateway_grpc_client(retry: RetryPolicy | None = None) -> OperationsGatewayGRPCClient:
     """
     Фабрика для создания экземпляра OperationsGatewayGRPCClient.
 
+    :param retry: Политика повторов вызовов (по умолчанию вызовы не повторяются).
     :return: Инициализированный клиент для OperationsGatewayService.
     """
-    return OperationsGatewayGRPCClient(channel=build_gateway_grpc_client())
+    return OperationsGatewayGRPCClient(channel=build_gateway_grpc_client(retry))
 
 # Новый билдер для нагрузочного тестирования
-def build_operations_gateway_locust_grpc_client(environment: Environment) -> OperationsGatewayGRPCClient:
+def build_operations_gateway_locust_grpc_client(
+        environment: "Environment",
+        validation: ValidationPolicy | None = None,
+        retry: RetryPolicy | None = None,
+        channel: Channel | None = None,
+        hedging: HedgingPolicy | None = None
+) -> OperationsGatewayGRPCClient:
     """
     Функция создаёт экземпляр OperationsGatewayGRPCClient адаптированного под Locust.
 
@@ -207,6 +230,14 @@ def build_operations_gateway_locust_grpc_client(environment: Environment) -> Ope
     Используется исключительно в нагрузочных тестах.
 
     :param environment: объект окружения Locust.
+    :param validation: политика разбора ответов (по умолчанию каждый ответ разбирается сразу).
+    :param retry: политика повторов (по умолчанию вызовы не повторяются).
+    :param channel: общий канал с интерцепторами Locust, через который работают все стабы виртуального
+                    пользователя (validation и retry в нём уже учтены); если не задан, создаётся отдельный канал.
+    :param hedging: политика хеджирования GetOperations (по умолчанию выключено).
     :return: экземпляр OperationsGatewayGRPCClient с хуками сбора метрик.
     """
-    return OperationsGatewayGRPCClient(channel=build_gateway_locust_grpc_client(environment))
\ No newline at end of file
+    return OperationsGatewayGRPCClient(
+        channel=channel or build_gateway_locust_grpc_client(environment, validation, retry),
+        hedging=hedging
+    )
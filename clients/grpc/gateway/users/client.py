@@ -1,12 +1,19 @@
+from typing import TYPE_CHECKING
+
 from grpc import Channel
 
 from clients.grpc.client import GRPCClient
+from clients.retries import RetryPolicy
+from clients.validation import ValidationPolicy
 from clients.grpc.gateway.client import build_gateway_grpc_client, build_gateway_locust_grpc_client
 from contracts.services.gateway.users.rpc_create_user_pb2 import CreateUserRequest, CreateUserResponse
 from contracts.services.gateway.users.rpc_get_user_pb2 import GetUserRequest, GetUserResponse
 from contracts.services.gateway.users.users_gateway_service_pb2_grpc import UsersGatewayServiceStub
 from tools.fakers import fake
-from locust.env import Environment
+
+if TYPE_CHECKING:
+    # Только для аннотаций: импорт Locust патчит стандартную библиотеку через gevent
+    from locust.env import Environment
 
 
 class UsersGatewayGRPCClient(GRPCClient):
@@ -69,17 +76,23 @@ class UsersGatewayGRPCClient(GRPCClient):
         return self.create_user_api(request)
 
 
-def build_users_gateway_grpc_client() -> UsersGatewayGRPCClient:
+def build_users_gateway_grpc_client(retry: RetryPolicy | None = None) -> UsersGatewayGRPCClient:
     """
     Фабрика для создания экземпляра UsersGatewayGRPCClient.
 
+    :param retry: Политика повторов вызовов (по умолчанию вызовы не повторяются).
     :return: Инициализированный клиент для UsersGatewayService.
     """
-    return UsersGatewayGRPCClient(channel=build_gateway_grpc_client())
+    return UsersGatewayGRPCClient(channel=build_gateway_grpc_client(retry))
 
 
 # Новый билдер для нагрузочного тестирования
-def build_users_gateway_locust_grpc_client(environment: Environment) -> UsersGatewayGRPCClient:
+def build_users_gateway_locust_grpc_client(
+        environment: "Environment",
+        validation: ValidationPolicy | None = None,
+        retry: RetryPolicy | None = None,
+        channel: Channel | None = None
+) -> UsersGatewayGRPCClient:
     """
     Функция создаёт экземпляр UsersGatewayGRPCClient адаптированного под Locust.
 
@@ -87,6 +100,12 @@ def build_users_gateway_locust_grpc_client(environment: Environment) -> UsersGat
     Используется исключительно в нагрузочных тестах.
 
     :param environment: объект окружения Locust.
+    :param validation: политика разбора ответов (по умолчанию каждый ответ разбирается сразу).
+    :param retry: политика повторов (по умолчанию вызовы не повторяются).
+    :param channel: общий канал с интерцепторами Locust, через который работают все стабы виртуального
+                    пользователя (validation и retry в нём уже учтены); если не задан, создаётся отдельный канал.
     :return: экземпляр UsersGatewayGRPCClient с хуками сбора метрик.
     """
-    return UsersGatewayGRPCClient(channel=build_gateway_locust_grpc_client(environment))
\ No newline at end of file
+    return UsersGatewayGRPCClient(
+        channel=channel or build_gateway_locust_grpc_client(environment, validation, retry)
+    )
\ No newline at end of file
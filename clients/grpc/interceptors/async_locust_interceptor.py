@@ -0,0 +1,59 @@
+import time
+from typing import TYPE_CHECKING
+
+from grpc.aio import AioRpcError, UnaryUnaryClientInterceptor
+
+from clients.grpc.interceptors.retry_interceptor import get_locust_request_type
+
+if TYPE_CHECKING:
+    # Только для аннотаций: импорт Locust патчит стандартную библиотеку через gevent,
+    # что несовместимо с grpc.aio
+    from locust.env import Environment
+
+
+class AsyncLocustInterceptor(UnaryUnaryClientInterceptor):
+    """
+    Интерцептор grpc.aio для сбора метрик Locust (аналог LocustInterceptor).
+
+    Отправляет в `environment.events.request` те же события, что и LocustInterceptor, поэтому вызовы
+    асинхронных клиентов попадают в ту же статистику. Ожидание ответа внутри интерцептора
+    не блокирует другие корутины event loop.
+    """
+
+    def __init__(self, environment: "Environment"):
+        """
+        :param environment: Экземпляр среды Locust, содержащий события сбора метрик.
+        """
+        self.environment = environment
+
+    async def intercept_unary_unary(self, continuation, client_call_details, request):
+        """
+        Метод-перехватчик для unary-unary вызовов grpc.aio.
+
+        :param continuation: Корутина, выполняющая фактический gRPC вызов.
+        :param client_call_details: Детали запроса (метод, метаданные, таймаут и т.д.).
+        :param request: Объект запроса, отправляемый на сервер.
+        :return: Объект вызова grpc.aio.UnaryUnaryCall (результат сохраняется, повторное ожидание не нужно).
+        """
+        exception: AioRpcError | None = None
+        start_time = time.perf_counter()
+        response_length = 0
+
+        call = await continuation(client_call_details, request)
+        try:
+            response_length = (await call).ByteSize()
+        except AioRpcError as error:
+            exception = error
+
+        self.environment.events.request.fire(
+            # В grpc.aio имя метода передаётся байтами; в статистике оно совпадает с именем из LocustInterceptor
+            name=client_call_details.method.decode(),
+            context=None,
+            response=call,
+            exception=exception,
+            request_type=get_locust_request_type(client_call_details),
+            response_time=(time.perf_counter() - start_time) * 1000,
+            response_length=response_length,
+        )
+
+        return call
@@ -1,16 +1,179 @@
 import time
+from typing import TYPE_CHECKING, Any, Iterator
 
-from grpc import RpcError, UnaryUnaryClientInterceptor
-from locust.env import Environment
+from grpc import (
+    Future,
+    FutureCancelledError,
+    RpcError,
+    StreamStreamClientInterceptor,
+    StreamUnaryClientInterceptor,
+    UnaryStreamClientInterceptor,
+    UnaryUnaryClientInterceptor
+)
 
+from clients.grpc.interceptors.retry_interceptor import get_locust_request_type
 
-class LocustInterceptor(UnaryUnaryClientInterceptor):
+if TYPE_CHECKING:
+    # Только для аннотаций: окружение Locust передаётся готовым объектом
+    from locust.env import Environment
+
+
+class LocustRequestStream:
+    """
+    Итератор потока запросов (stream-unary, stream-stream), который считает отправленные сообщения и их размер.
+    """
+    __slots__ = ("requests", "messages", "request_length")
+
+    def __init__(self, requests: Iterator[Any]):
+        """
+        :param requests: Исходный итератор сообщений запроса.
+        """
+        self.requests = iter(requests)
+        self.messages = 0
+        self.request_length = 0
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        message = next(self.requests)
+        self.messages += 1
+        self.request_length += message.ByteSize()
+        return message
+
+
+class LocustResponseStream:
+    """
+    Обёртка над потоком ответов (unary-stream, stream-stream), которая репортит поток в Locust.
+
+    При получении первого сообщения отправляется событие "gRPC stream first message" со временем до первого
+    сообщения. Когда поток завершится (сервер закрыл поток, произошла ошибка или клиент вызвал cancel()),
+    отправляется событие "gRPC stream": общая длительность потока и суммарный размер сообщений, а в context —
+    количество сообщений, время до первого сообщения и темп сообщений в секунду. Поток, который бросили,
+    не дочитав и не отменив, репортится так же, как отменённый, когда обёртку удаляет сборщик мусора.
+    Остальные методы grpc.Call (code(), details(), ...) берутся из исходного вызова.
+    """
+    __slots__ = (
+        "call",
+        "interceptor",
+        "name",
+        "requests",
+        "start_time",
+        "time_to_first_message",
+        "messages",
+        "response_length",
+        "reported"
+    )
+
+    def __init__(
+            self,
+            call: Any,
+            interceptor: "LocustInterceptor",
+            name: str,
+            start_time: float,
+            requests: LocustRequestStream | None = None
+    ):
+        """
+        :param call: Поток ответов, возвращённый gRPC (итератор и grpc.Call одновременно).
+        :param interceptor: Интерцептор, через окружение которого отправляются события.
+        :param name: Имя метода.
+        :param start_time: Время начала вызова (time.perf_counter()).
+        :param requests: Поток запросов для stream-stream вызовов.
+        """
+        self.call = call
+        self.interceptor = interceptor
+        self.name = name
+        self.requests = requests
+        self.start_time = start_time
+        self.time_to_first_message: float | None = None
+        self.messages = 0
+        self.response_length = 0
+        self.reported = False
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        try:
+            message = next(self.call)
+        except StopIteration:
+            self.report(None)
+            raise
+        except RpcError as error:
+            self.report(error)
+            raise
+
+        if self.time_to_first_message is None:
+            self.time_to_first_message = (time.perf_counter() - self.start_time) * 1000
+            self.interceptor.environment.events.request.fire(
+                name=self.name,
+                context=None,
+                response=self.call,
+                exception=None,
+                request_type="gRPC stream first message",
+                response_time=self.time_to_first_message,
+                response_length=message.ByteSize(),
+            )
+
+        self.messages += 1
+        self.response_length += message.ByteSize()
+        return message
+
+    def cancel(self) -> bool:
+        # Отмена клиентом — штатное завершение чтения потока, а не ошибка
+        self.report(None)
+        return self.call.cancel()
+
+    def __del__(self):
+        # Брошенный поток: без этого он пропал бы из статистики вместе со временем, которое занял
+        self.report(None)
+
+    def report(self, exception: RpcError | None) -> None:
+        """
+        Отправляет итоговое событие потока (один раз).
+
+        :param exception: Ошибка, которой завершился поток.
+        """
+        if self.reported:
+            return
+        self.reported = True
+
+        duration = time.perf_counter() - self.start_time
+        context = {
+            "messages": self.messages,
+            "time_to_first_message": self.time_to_first_message,
+            "messages_per_second": self.messages / duration if duration > 0 else 0.0
+        }
+        if self.requests is not None:
+            context.update(request_messages=self.requests.messages, request_length=self.requests.request_length)
+
+        self.interceptor.environment.events.request.fire(
+            name=self.name,
+            context=context,
+            response=self.call,
+            exception=exception,
+            request_type="gRPC stream",
+            response_time=duration * 1000,
+            response_length=self.response_length,
+        )
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.call, name)
+
+
+class LocustInterceptor(
+    UnaryUnaryClientInterceptor,
+    UnaryStreamClientInterceptor,
+    StreamUnaryClientInterceptor,
+    StreamStreamClientInterceptor
+):
     """
     gRPC-интерцептор для сбора метрик Locust.
     Используется для измерения времени выполнения вызовов и регистрации успехов/ошибок.
+    Потоковые вызовы репортятся с типом "gRPC stream" (см. LocustResponseStream).
     """
 
-    def __init__(self, environment: Environment):
+    def __init__(self, environment: "Environment"):
         """
         :param environment: Экземпляр среды Locust, содержащий события сбора метрик.
         """
@@ -20,36 +183,100 @@ class LocustInterceptor(UnaryUnaryClientInterceptor):
         """
         Метод-перехватчик для unary-unary gRPC вызовов.
 
+        Интерцептор не ждёт результата вызова: метрики отправляются из done-callback'а, когда вызов
+        завершится. Поэтому вызовы через stub.Method.future(...) остаются асинхронными, и виртуальный
+        пользователь может выполнять несколько вызовов одновременно с корректным временем каждого.
+
         :param continuation: Функция, вызывающая фактический gRPC метод.
         :param client_call_details: Детали запроса (метод, метаданные, таймаут и т.д.).
         :param request: Объект запроса, отправляемый на сервер.
         :return: gRPC response (future объект).
         """
-        response = None
-        exception: RpcError | None = None
         start_time = time.perf_counter()  # Засекаем время начала запроса
+        # Тип запроса: повторы RetryInterceptor и дублирующие вызовы хеджирования попадают в отдельные строки
+        request_type = get_locust_request_type(client_call_details)
+
+        # Выполняем gRPC вызов и получаем response future
+        response = continuation(client_call_details, request)
+        # Для блокирующих вызовов future уже завершён, и callback вызывается сразу
+        response.add_done_callback(
+            lambda future: self.fire_request_event(future, client_call_details.method, request_type, start_time)
+        )
+
+        # Возвращаем результат вызова (future-объект)
+        return response
+
+    def intercept_unary_stream(self, continuation, client_call_details, request):
+        """
+        Метод-перехватчик для unary-stream вызовов: поток ответов оборачивается в LocustResponseStream.
+        """
+        start_time = time.perf_counter()
+        call = continuation(client_call_details, request)
+        return LocustResponseStream(call, self, client_call_details.method, start_time)
+
+    def intercept_stream_unary(self, continuation, client_call_details, request_iterator):
+        """
+        Метод-перехватчик для stream-unary вызовов: считает отправленные сообщения и репортит вызов
+        по его завершении, как unary-unary.
+        """
+        start_time = time.perf_counter()
+        requests = LocustRequestStream(request_iterator)
+        response = continuation(client_call_details, requests)
+        response.add_done_callback(
+            lambda future: self.fire_request_event(
+                future,
+                client_call_details.method,
+                "gRPC stream",
+                start_time,
+                {"request_messages": requests.messages, "request_length": requests.request_length}
+            )
+        )
+        return response
+
+    def intercept_stream_stream(self, continuation, client_call_details, request_iterator):
+        """
+        Метод-перехватчик для stream-stream вызовов: считает отправленные сообщения,
+        поток ответов оборачивается в LocustResponseStream.
+        """
+        start_time = time.perf_counter()
+        requests = LocustRequestStream(request_iterator)
+        call = continuation(client_call_details, requests)
+        return LocustResponseStream(call, self, client_call_details.method, start_time, requests)
+
+    def fire_request_event(
+            self,
+            future: Future,
+            name: str,
+            request_type: str,
+            start_time: float,
+            context: dict | None = None
+    ) -> None:
+        """
+        Регистрирует завершённый вызов в системе метрик Locust.
+
+        :param future: Завершённый gRPC вызов.
+        :param name: Имя метода (например, "/users.UsersService/CreateUser").
+        :param request_type: Тип запроса в статистике Locust.
+        :param start_time: Время начала вызова (time.perf_counter()).
+        :param context: Дополнительные данные события (для stream-unary — количество и размер отправленных сообщений).
+        """
+        response_time = (time.perf_counter() - start_time) * 1000  # Время выполнения в миллисекундах
+        exception: RpcError | FutureCancelledError | None = None
         response_length = 0
 
         try:
-            # Выполняем gRPC вызов и получаем response future
-            response = continuation(client_call_details, request)
-
-            # Получаем размер ответа, если он уже доступен (для метрик)
-            response_length = response.result().ByteSize()
-        except RpcError as error:
-            # В случае ошибки сохраняем исключение для метрик
+            # Получаем размер ответа (для метрик)
+            response_length = future.result().ByteSize()
+        except (RpcError, FutureCancelledError) as error:
+            # В случае ошибки или отмены вызова сохраняем исключение для метрик
             exception = error
 
-        # Регистрируем вызов в системе метрик Locust
         self.environment.events.request.fire(
-            name=client_call_details.method,  # Имя метода (например, "/users.UsersService/CreateUser")
-            context=None,  # Можно использовать для передачи кастомных данных
-            response=response,  # Объект ответа (если нужен для контекста)
+            name=name,
+            context=context,  # Можно использовать для передачи кастомных данных
+            response=future,  # Объект ответа (если нужен для контекста)
             exception=exception,  # Если произошла ошибка — передаём её сюда
-            request_type="gRPC",  # Тип запроса (например, "HTTP", "gRPC")
-            response_time=(time.perf_counter() - start_time) * 1000,  # Время выполнения в миллисекундах
+            request_type=request_type,
+            response_time=response_time,
             response_length=response_length,  # Размер ответа в байтах
         )
-
-        # Возвращаем результат вызова (future-объект)
-        return response
@@ -0,0 +1,231 @@
+from collections import namedtuple
+
+import gevent
+import gevent.event
+from grpc import Call, ClientCallDetails, Future, FutureCancelledError, FutureTimeoutError, UnaryUnaryClientInterceptor
+
+from clients.retries import RetryPolicy
+
+# Ключ метаданных с номером повтора: по нему LocustInterceptor репортит повторы отдельно,
+# а сервер может отличить повтор от исходного вызова
+RETRY_ATTEMPT_METADATA_KEY = "x-retry-attempt"
+# Ключ метаданных дублирующего вызова хеджирования (GRPCClient.call_hedged)
+HEDGED_METADATA_KEY = "x-hedged"
+
+
+class RetryClientCallDetails(
+    namedtuple(
+        "RetryClientCallDetails",
+        ("method", "timeout", "metadata", "credentials", "wait_for_ready", "compression")
+    ),
+    ClientCallDetails
+):
+    """
+    Детали вызова для повторной попытки (ClientCallDetails с изменёнными метаданными).
+    """
+    pass
+
+
+def get_retry_attempt(client_call_details: ClientCallDetails) -> int:
+    """
+    Возвращает номер повтора из метаданных вызова (0 — исходный вызов).
+    """
+    for key, value in client_call_details.metadata or ():
+        if key == RETRY_ATTEMPT_METADATA_KEY:
+            return int(value)
+
+    return 0
+
+
+def get_locust_request_type(client_call_details: ClientCallDetails) -> str:
+    """
+    Возвращает тип вызова для статистики Locust: повторы и дублирующие вызовы хеджирования попадают
+    в отдельные строки статистики (аналог get_locust_request_type HTTP-клиента).
+
+    :return: "gRPC", "gRPC retry" или "gRPC hedge".
+    """
+    for key, _ in client_call_details.metadata or ():
+        if key == HEDGED_METADATA_KEY:
+            return "gRPC hedge"
+
+    return "gRPC retry" if get_retry_attempt(client_call_details) else "gRPC"
+
+
+def build_retry_call_details(client_call_details: ClientCallDetails, attempt: int) -> RetryClientCallDetails:
+    """
+    Возвращает детали вызова для повтора номер attempt: метаданные x-retry-attempt заменяются, остальные сохраняются.
+    """
+    metadata = [item for item in client_call_details.metadata or () if item[0] != RETRY_ATTEMPT_METADATA_KEY]
+    return RetryClientCallDetails(
+        method=client_call_details.method,
+        timeout=client_call_details.timeout,
+        metadata=(*metadata, (RETRY_ATTEMPT_METADATA_KEY, str(attempt))),
+        credentials=client_call_details.credentials,
+        wait_for_ready=client_call_details.wait_for_ready,
+        compression=client_call_details.compression
+    )
+
+
+class RetryFuture(Future, Call):
+    """
+    Результат unary-вызова с повторами, который не блокирует вызывающий код.
+
+    Каждая попытка отправляется продолжением интерцептора, а решение о повторе принимается в done-callback'е
+    попытки; повтор запускается отдельным greenlet'ом после задержки политики (gevent.spawn_later).
+    Поэтому вызов через stub.Method.future(...) сразу возвращает этот объект, и виртуальный пользователь может
+    выполнять несколько вызовов одновременно. Блокирующий вызов stub.Method(...) ждёт result() — ожидание
+    кооперативное, как и сами вызовы синхронных каналов (см. init_grpc_gevent).
+
+    Методы grpc.Call (code(), details(), ...) ждут завершения и берутся из последней попытки.
+    """
+
+    def __init__(self, retry: RetryPolicy, continuation, client_call_details: ClientCallDetails, request):
+        """
+        :param retry: Политика повторов.
+        :param continuation: Продолжение интерцептора, отправляющее одну попытку.
+        :param client_call_details: Детали исходного вызова.
+        :param request: Сообщение запроса.
+        """
+        self.retry = retry
+        self.continuation = continuation
+        self.client_call_details = client_call_details
+        self.request = request
+        self.attempt = 0
+        self.call = None
+        self.pending_retry: gevent.Greenlet | None = None
+        self.is_cancelled = False
+        self.finished = gevent.event.Event()
+        self.callbacks = []
+        self.send(client_call_details)
+
+    def send(self, client_call_details: ClientCallDetails) -> None:
+        self.pending_retry = None
+        self.call = self.continuation(client_call_details, self.request)
+        self.call.add_done_callback(self.on_call_done)
+
+    def on_call_done(self, call) -> None:
+        if self.is_cancelled:
+            self.finish()
+            return
+
+        code = call.code()
+        if (code is None) or (code.name not in self.retry.retry_codes):
+            self.retry.on_success()
+            self.finish()
+            return
+
+        if not self.retry.can_retry(self.attempt):
+            self.finish()
+            return
+
+        self.attempt += 1
+        self.pending_retry = gevent.spawn_later(
+            self.retry.get_delay(self.attempt),
+            self.send,
+            build_retry_call_details(self.client_call_details, self.attempt)
+        )
+
+    def finish(self) -> None:
+        if self.finished.is_set():
+            return
+
+        self.finished.set()
+        for callback in self.callbacks:
+            callback(self)
+
+    def wait(self, timeout: float | None = None) -> None:
+        if not self.finished.wait(timeout):
+            raise FutureTimeoutError()
+
+    def cancel(self) -> bool:
+        if self.finished.is_set():
+            return False
+
+        self.is_cancelled = True
+        if self.pending_retry is not None:
+            # Отмена между попытками: повтор не отправляется, результатом остаётся отменённый вызов
+            self.pending_retry.kill(block=False)
+            self.finish()
+            return True
+
+        return self.call.cancel()
+
+    def cancelled(self) -> bool:
+        return self.is_cancelled
+
+    def running(self) -> bool:
+        return not self.finished.is_set()
+
+    def done(self) -> bool:
+        return self.finished.is_set()
+
+    def result(self, timeout: float | None = None):
+        self.wait(timeout)
+        if self.is_cancelled:
+            raise FutureCancelledError()
+        return self.call.result()
+
+    def exception(self, timeout: float | None = None):
+        self.wait(timeout)
+        if self.is_cancelled:
+            raise FutureCancelledError()
+        return self.call.exception()
+
+    def traceback(self, timeout: float | None = None):
+        self.wait(timeout)
+        if self.is_cancelled:
+            raise FutureCancelledError()
+        return self.call.traceback()
+
+    def add_done_callback(self, fn) -> None:
+        if self.finished.is_set():
+            fn(self)
+        else:
+            self.callbacks.append(fn)
+
+    def is_active(self) -> bool:
+        return not self.finished.is_set()
+
+    def time_remaining(self):
+        return self.call.time_remaining()
+
+    def add_callback(self, callback) -> bool:
+        self.add_done_callback(lambda future: callback())
+        return True
+
+    def initial_metadata(self):
+        self.wait()
+        return self.call.initial_metadata()
+
+    def trailing_metadata(self):
+        self.wait()
+        return self.call.trailing_metadata()
+
+    def code(self):
+        self.wait()
+        return self.call.code()
+
+    def details(self):
+        self.wait()
+        return self.call.details()
+
+
+class RetryInterceptor(UnaryUnaryClientInterceptor):
+    """
+    gRPC-интерцептор, повторяющий unary-unary вызовы по политике RetryPolicy
+    (по умолчанию — только после UNAVAILABLE).
+
+    Встраивается в канал перед LocustInterceptor, поэтому каждая попытка проходит через LocustInterceptor
+    и репортится отдельно; повторы получают метаданные x-retry-attempt и тип запроса "gRPC retry".
+    Интерцептор не ждёт результата попытки и не спит между попытками: повторы выполняет RetryFuture,
+    поэтому вызовы через stub.Method.future(...) остаются асинхронными и с включёнными повторами.
+    """
+
+    def __init__(self, retry: RetryPolicy):
+        """
+        :param retry: Политика повторов.
+        """
+        self.retry = retry
+
+    def intercept_unary_unary(self, continuation, client_call_details, request):
+        return RetryFuture(self.retry, continuation, client_call_details, request)
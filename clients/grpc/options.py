@@ -0,0 +1,151 @@
+from enum import StrEnum
+from typing import Any
+
+from grpc import Compression
+from pydantic import BaseModel, ConfigDict, Field
+
+
+class GRPCCompression(StrEnum):
+    NONE = "none"
+    GZIP = "gzip"
+    DEFLATE = "deflate"
+
+
+class GRPCLoadBalancing(StrEnum):
+    PICK_FIRST = "pick_first"
+    ROUND_ROBIN = "round_robin"
+
+
+GRPC_COMPRESSIONS = {
+    GRPCCompression.NONE: Compression.NoCompression,
+    GRPCCompression.GZIP: Compression.Gzip,
+    GRPCCompression.DEFLATE: Compression.Deflate
+}
+
+
+class GRPCChannelOptions(BaseModel):
+    """
+    Профиль настроек gRPC-канала к gateway.
+
+    Профили сравниваются под нагрузкой при настройке gateway и генератора нагрузки: keepalive-пинги,
+    сжатие сообщений, лимиты размера сообщений, балансировка между несколькими адресами gateway
+    и упреждающее чтение потоков HTTP/2. Незаданные (None) параметры остаются значениями gRPC по умолчанию.
+    """
+    model_config = ConfigDict(frozen=True)
+
+    # Адреса gateway (host:port). Несколько адресов объединяются в цель "ipv4:a,b" — адреса должны быть IP;
+    # для DNS-имени с несколькими записями передаётся один адрес "dns:///host:port".
+    # Если не заданы, используется адрес по умолчанию из билдера канала
+    addresses: list[str] | None = None
+    # Балансировка между адресами цели: pick_first — одно соединение, round_robin — соединение на каждый адрес
+    load_balancing: GRPCLoadBalancing | None = None
+    # Сжатие всех вызовов канала (по умолчанию без сжатия)
+    compression: GRPCCompression = GRPCCompression.NONE
+
+    # Keepalive: интервал пингов, ожидание ответа на пинг, пинги без активных вызовов
+    keepalive_time_ms: int | None = Field(default=None, gt=0)
+    keepalive_timeout_ms: int | None = Field(default=None, gt=0)
+    keepalive_permit_without_calls: bool | None = None
+    # Сколько пингов можно отправить без данных (0 — без ограничения)
+    http2_max_pings_without_data: int | None = Field(default=None, ge=0)
+
+    # Лимиты размера сообщений в байтах (-1 — без ограничения)
+    max_send_message_length: int | None = Field(default=None, ge=-1)
+    max_receive_message_length: int | None = Field(default=None, ge=-1)
+
+    # Упреждающее чтение по каждому потоку (grpc.http2.lookahead_bytes, GRPC_ARG_HTTP2_STREAM_LOOKAHEAD_BYTES):
+    # сколько байт gRPC читает вперёд по потоку, по умолчанию 64 КБ. Это подсказка управлению потоком (flow control)
+    # получателя, а не прямая настройка окна HTTP/2 (SETTINGS_INITIAL_WINDOW_SIZE). По документации gRPC большие
+    # значения помогают пропускной способности на соединениях с большой задержкой, а с развитием автоподстройки
+    # окон опция может перестать действовать — эффект профиля нужно подтверждать замером
+    stream_lookahead_bytes: int | None = Field(default=None, gt=0)
+    # Автоподстройка окон управления потоком по оценке пропускной способности канала (BDP-пинги), по умолчанию
+    # включена; для сравнения фиксированного упреждающего чтения её выключают (False)
+    http2_bdp_probe: bool | None = None
+
+    def get_target(self, default_address: str) -> str:
+        """
+        Возвращает цель (target) канала.
+
+        :param default_address: Адрес, если addresses не заданы.
+        :return: Строка цели для insecure_channel.
+        """
+        if not self.addresses:
+            return default_address
+
+        if len(self.addresses) == 1:
+            return self.addresses[0]
+
+        return "ipv4:" + ",".join(self.addresses)
+
+    def get_compression(self) -> Compression:
+        """
+        Возвращает сжатие канала в виде grpc.Compression.
+        """
+        return GRPC_COMPRESSIONS[self.compression]
+
+    def to_channel_options(self) -> list[tuple[str, Any]]:
+        """
+        Преобразует профиль в опции канала gRPC (channel arguments).
+
+        :return: Список пар (имя опции, значение) только для заданных параметров.
+        """
+        options = {
+            "grpc.lb_policy_name": self.load_balancing,
+            "grpc.keepalive_time_ms": self.keepalive_time_ms,
+            "grpc.keepalive_timeout_ms": self.keepalive_timeout_ms,
+            "grpc.keepalive_permit_without_calls": self.keepalive_permit_without_calls,
+            "grpc.http2.max_pings_without_data": self.http2_max_pings_without_data,
+            "grpc.max_send_message_length": self.max_send_message_length,
+            "grpc.max_receive_message_length": self.max_receive_message_length,
+            "grpc.http2.lookahead_bytes": self.stream_lookahead_bytes,
+            "grpc.http2.bdp_probe": self.http2_bdp_probe
+        }
+
+        channel_options = []
+        for name, value in options.items():
+            if value is None:
+                continue
+            if isinstance(value, bool):
+                value = int(value)
+            elif isinstance(value, StrEnum):
+                value = value.value
+            channel_options.append((name, value))
+
+        return channel_options
+
+
+# Настройки gRPC по умолчанию: канал создаётся так же, как без профиля
+DEFAULT_GRPC_CHANNEL_OPTIONS = GRPCChannelOptions()
+
+GRPC_CHANNEL_PROFILES: dict[str, GRPCChannelOptions] = {
+    "default": DEFAULT_GRPC_CHANNEL_OPTIONS,
+    # Долгие прогоны через балансировщики и NAT: соединения не закрываются по простою
+    "keepalive": GRPCChannelOptions(
+        keepalive_time_ms=30_000,
+        keepalive_timeout_ms=10_000,
+        keepalive_permit_without_calls=True,
+        http2_max_pings_without_data=0
+    ),
+    # Большие ответы (списки операций, документы): крупное фиксированное упреждающее чтение и увеличенный лимит ответа
+    "throughput": GRPCChannelOptions(
+        max_receive_message_length=16 * 1024 * 1024,
+        stream_lookahead_bytes=4 * 1024 * 1024,
+        http2_bdp_probe=False
+    ),
+    # Сжатие сообщений: меньше трафика ценой процессора генератора и gateway
+    "gzip": GRPCChannelOptions(compression=GRPCCompression.GZIP)
+}
+
+
+def get_grpc_channel_profile(name: str) -> GRPCChannelOptions:
+    """
+    Возвращает профиль настроек канала по имени: "default", "keepalive", "throughput" или "gzip".
+
+    :param name: Имя профиля.
+    :return: Экземпляр GRPCChannelOptions.
+    """
+    if name not in GRPC_CHANNEL_PROFILES:
+        raise ValueError(f"Unknown gRPC channel profile {name!r}, expected one of {sorted(GRPC_CHANNEL_PROFILES)}")
+
+    return GRPC_CHANNEL_PROFILES[name]
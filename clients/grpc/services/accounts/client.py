@@ -0,0 +1,136 @@
+from grpc import Channel
+
+from clients.grpc.client import GRPCClient
+from clients.grpc.services.cards.client import CardsServiceGRPCClient
+from clients.grpc.services.client import build_service_grpc_client
+from clients.retries import RetryPolicy
+from contracts.services.accounts.account_pb2 import Account, AccountType, AccountStatus
+from contracts.services.accounts.accounts_service_pb2_grpc import AccountsServiceStub
+from contracts.services.accounts.rpc_create_account_pb2 import CreateAccountRequest, CreateAccountResponse
+from contracts.services.cards.card_pb2 import CardType
+from contracts.services.gateway.accounts.account_pb2 import AccountView
+from contracts.services.gateway.accounts.rpc_open_credit_card_account_pb2 import OpenCreditCardAccountResponse
+from contracts.services.gateway.accounts.rpc_open_debit_card_account_pb2 import OpenDebitCardAccountResponse
+
+
+class AccountsServiceGRPCClient(GRPCClient):
+    """
+    gRPC-клиент для взаимодействия с внутренним AccountsService.
+    Методы open_*_account совпадают с AccountsGatewayGRPCClient, поэтому клиент подходит для SeedsBuilder.
+
+    Карточный счёт в gateway открывается вместе с картой, поэтому для open_debit_card_account
+    и open_credit_card_account клиенту нужен CardsServiceGRPCClient: счёт создаётся в AccountsService,
+    карта — в CardsService, а ответ собирается в том же виде, что возвращает gateway.
+    """
+
+    def __init__(self, channel: Channel, cards_service_client: CardsServiceGRPCClient):
+        """
+        Инициализация клиента с указанным gRPC-каналом.
+
+        :param channel: gRPC-канал для подключения к AccountsService.
+        :param cards_service_client: Клиент CardsService для выпуска карты карточного счёта.
+        """
+        super().__init__(channel)
+
+        self.stub = AccountsServiceStub(channel)
+        self.cards_service_client = cards_service_client
+
+    def create_account_api(self, request: CreateAccountRequest) -> CreateAccountResponse:
+        """
+        Низкоуровневый вызов метода CreateAccount через gRPC.
+
+        :param request: gRPC-запрос с данными нового счёта.
+        :return: Ответ от сервиса с данными созданного счёта.
+        """
+        return self.stub.CreateAccount(request)
+
+    def create_account(self, user_id: str, account_type: AccountType.ValueType) -> CreateAccountResponse:
+        """
+        Создание активного счёта заданного типа с нулевым балансом.
+
+        :param user_id: Идентификатор пользователя.
+        :param account_type: Тип счёта.
+        :return: Ответ с информацией о созданном счёте.
+        """
+        request = CreateAccountRequest(
+            type=account_type,
+            status=AccountStatus.ACCOUNT_STATUS_ACTIVE,
+            user_id=user_id,
+            balance=0
+        )
+        return self.create_account_api(request)
+
+    def create_card_account(self, user_id: str, account_type: AccountType.ValueType) -> AccountView:
+        """
+        Создание карточного счёта вместе с виртуальной картой, как это делает gateway.
+
+        :param user_id: Идентификатор пользователя.
+        :param account_type: Тип карточного счёта (дебетовый или кредитный).
+        :return: Счёт с выпущенной картой в формате gateway.
+        """
+        account: Account = self.create_account(user_id=user_id, account_type=account_type).account
+        card = self.cards_service_client.create_card(account_id=account.id, card_type=CardType.CARD_TYPE_VIRTUAL).card
+        return AccountView(
+            id=account.id,
+            type=account.type,
+            cards=[card],
+            status=account.status,
+            balance=account.balance
+        )
+
+    def open_deposit_account(self, user_id: str) -> CreateAccountResponse:
+        """
+        Открытие депозитного счёта.
+
+        :param user_id: Идентификатор пользователя.
+        :return: Ответ с информацией о созданном счёте.
+        """
+        return self.create_account(user_id=user_id, account_type=AccountType.ACCOUNT_TYPE_DEPOSIT)
+
+    def open_savings_account(self, user_id: str) -> CreateAccountResponse:
+        """
+        Открытие сберегательного счёта.
+
+        :param user_id: Идентификатор пользователя.
+        :return: Ответ с информацией о созданном счёте.
+        """
+        return self.create_account(user_id=user_id, account_type=AccountType.ACCOUNT_TYPE_SAVINGS)
+
+    def open_debit_card_account(self, user_id: str) -> OpenDebitCardAccountResponse:
+        """
+        Открытие дебетового счёта с картой.
+
+        :param user_id: Идентификатор пользователя.
+        :return: Ответ в формате gateway со счётом и картой.
+        """
+        account = self.create_card_account(user_id=user_id, account_type=AccountType.ACCOUNT_TYPE_DEBIT_CARD)
+        return OpenDebitCardAccountResponse(account=account)
+
+    def open_credit_card_account(self, user_id: str) -> OpenCreditCardAccountResponse:
+        """
+        Открытие кредитного счёта с картой.
+
+        :param user_id: Идентификатор пользователя.
+        :return: Ответ в формате gateway со счётом и картой.
+        """
+        account = self.create_card_account(user_id=user_id, account_type=AccountType.ACCOUNT_TYPE_CREDIT_CARD)
+        return OpenCreditCardAccountResponse(account=account)
+
+
+def build_accounts_service_grpc_client(
+        address: str,
+        cards_service_client: CardsServiceGRPCClient,
+        retry: RetryPolicy | None = None
+) -> AccountsServiceGRPCClient:
+    """
+    Фабрика для создания экземпляра AccountsServiceGRPCClient.
+
+    :param address: Адрес AccountsService в формате host:port.
+    :param cards_service_client: Клиент CardsService для выпуска карт карточных счетов.
+    :param retry: Политика повторов вызовов (по умолчанию вызовы не повторяются).
+    :return: Инициализированный клиент для AccountsService.
+    """
+    return AccountsServiceGRPCClient(
+        channel=build_service_grpc_client(address, retry),
+        cards_service_client=cards_service_client
+    )
@@ -0,0 +1,87 @@
+from grpc import Channel
+
+from clients.grpc.client import GRPCClient
+from clients.grpc.services.client import build_service_grpc_client
+from clients.retries import RetryPolicy
+from contracts.services.cards.card_pb2 import CardType, CardStatus, CardPaymentSystem
+from contracts.services.cards.cards_service_pb2_grpc import CardsServiceStub
+from contracts.services.cards.rpc_create_card_pb2 import CreateCardRequest, CreateCardResponse
+from tools.fakers import fake
+
+
+class CardsServiceGRPCClient(GRPCClient):
+    """
+    gRPC-клиент для взаимодействия с внутренним CardsService.
+    Методы issue_*_card совпадают с CardsGatewayGRPCClient, поэтому клиент подходит для SeedsBuilder.
+    """
+
+    def __init__(self, channel: Channel):
+        """
+        Инициализация клиента с указанным gRPC-каналом.
+
+        :param channel: gRPC-канал для подключения к CardsService.
+        """
+        super().__init__(channel)
+
+        self.stub = CardsServiceStub(channel)
+
+    def create_card_api(self, request: CreateCardRequest) -> CreateCardResponse:
+        """
+        Низкоуровневый вызов метода CreateCard через gRPC.
+
+        :param request: gRPC-запрос с данными новой карты.
+        :return: Ответ от сервиса с данными созданной карты.
+        """
+        return self.stub.CreateCard(request)
+
+    def create_card(self, account_id: str, card_type: CardType.ValueType) -> CreateCardResponse:
+        """
+        Создание активной карты заданного типа с фейковыми реквизитами.
+
+        :param account_id: Идентификатор счёта.
+        :param card_type: Тип карты (виртуальная или физическая).
+        :return: Ответ с информацией о созданной карте.
+        """
+        request = CreateCardRequest(
+            pin=fake.pin(),
+            cvv=fake.cvv(),
+            type=card_type,
+            status=CardStatus.CARD_STATUS_ACTIVE,
+            account_id=account_id,
+            card_number=fake.card_number(),
+            card_holder=fake.card_holder(),
+            expiry_date=fake.expiry_date(),
+            payment_system=fake.proto_enum(CardPaymentSystem)
+        )
+        return self.create_card_api(request)
+
+    def issue_virtual_card(self, user_id: str, account_id: str) -> CreateCardResponse:
+        """
+        Создание виртуальной карты (аналог CardsGatewayGRPCClient.issue_virtual_card).
+
+        :param user_id: Идентификатор пользователя (сервису карт не нужен, оставлен для совместимости с gateway).
+        :param account_id: Идентификатор счёта.
+        :return: Ответ с информацией о созданной карте.
+        """
+        return self.create_card(account_id=account_id, card_type=CardType.CARD_TYPE_VIRTUAL)
+
+    def issue_physical_card(self, user_id: str, account_id: str) -> CreateCardResponse:
+        """
+        Создание физической карты (аналог CardsGatewayGRPCClient.issue_physical_card).
+
+        :param user_id: Идентификатор пользователя (сервису карт не нужен, оставлен для совместимости с gateway).
+        :param account_id: Идентификатор счёта.
+        :return: Ответ с информацией о созданной карте.
+        """
+        return self.create_card(account_id=account_id, card_type=CardType.CARD_TYPE_PHYSICAL)
+
+
+def build_cards_service_grpc_client(address: str, retry: RetryPolicy | None = None) -> CardsServiceGRPCClient:
+    """
+    Фабрика для создания экземпляра CardsServiceGRPCClient.
+
+    :param address: Адрес CardsService в формате host:port.
+    :param retry: Политика повторов вызовов (по умолчанию вызовы не повторяются).
+    :return: Инициализированный клиент для CardsService.
+    """
+    return CardsServiceGRPCClient(channel=build_service_grpc_client(address, retry))
@@ -0,0 +1,26 @@
+from grpc import Channel, insecure_channel, intercept_channel
+
+from clients.grpc.client import init_grpc_gevent
+from clients.grpc.interceptors.retry_interceptor import RetryInterceptor
+from clients.retries import RetryPolicy
+
+
+def build_service_grpc_client(address: str, retry: RetryPolicy | None = None) -> Channel:
+    """
+    Фабричная функция (билдер) для создания gRPC-канала к внутреннему сервису системы
+    (users, accounts, cards, operations) в обход grpc-gateway.
+
+    Используется сидингом: данные создаются напрямую во внутренних сервисах и не нагружают gateway,
+    который затем измеряется нагрузочным тестом.
+
+    :param address: Адрес внутреннего сервиса в формате host:port.
+    :param retry: Политика повторов вызовов (RetryInterceptor); по умолчанию вызовы не повторяются.
+    :return: gRPC-канал (Channel) к сервису.
+    """
+    init_grpc_gevent()
+
+    channel = insecure_channel(address)
+    if retry is None:
+        return channel
+
+    return intercept_channel(channel, RetryInterceptor(retry))
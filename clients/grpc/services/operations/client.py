@@ -0,0 +1,93 @@
+from datetime import datetime
+
+from grpc import Channel
+
+from clients.grpc.client import GRPCClient
+from clients.grpc.services.client import build_service_grpc_client
+from clients.retries import RetryPolicy
+from contracts.services.operations.operation_pb2 import OperationType, OperationStatus
+from contracts.services.operations.operations_service_pb2_grpc import OperationsServiceStub
+from contracts.services.operations.rpc_create_operation_pb2 import CreateOperationRequest, CreateOperationResponse
+from tools.fakers import fake
+
+
+class OperationsServiceGRPCClient(GRPCClient):
+    """
+    gRPC-клиент для взаимодействия с внутренним OperationsService.
+    Методы make_*_operation совпадают с OperationsGatewayGRPCClient, поэтому клиент подходит для SeedsBuilder.
+
+    Операции записываются в историю напрямую: в отличие от gateway, баланс счёта при этом не меняется.
+    """
+
+    def __init__(self, channel: Channel):
+        """
+        Инициализация клиента с указанным gRPC-каналом.
+
+        :param channel: gRPC-канал для подключения к OperationsService.
+        """
+        super().__init__(channel)
+
+        self.stub = OperationsServiceStub(channel)
+
+    def create_operation_api(self, request: CreateOperationRequest) -> CreateOperationResponse:
+        """
+        Низкоуровневый вызов метода CreateOperation через gRPC.
+
+        :param request: gRPC-запрос с данными новой операции.
+        :return: Ответ от сервиса с данными созданной операции.
+        """
+        return self.stub.CreateOperation(request)
+
+    def create_operation(
+            self,
+            card_id: str,
+            account_id: str,
+            operation_type: OperationType.ValueType,
+            category: str = ""
+    ) -> CreateOperationResponse:
+        """
+        Создание операции заданного типа со случайными статусом и суммой.
+
+        :param card_id: Идентификатор карты.
+        :param account_id: Идентификатор счёта.
+        :param operation_type: Тип операции.
+        :param category: Категория (для покупок).
+        :return: Ответ с информацией о созданной операции.
+        """
+        request = CreateOperationRequest(
+            type=operation_type,
+            status=fake.proto_enum(OperationStatus),
+            amount=fake.amount(),
+            card_id=card_id,
+            category=category,
+            created_at=datetime.now().isoformat(),
+            account_id=account_id
+        )
+        return self.create_operation_api(request)
+
+    def make_top_up_operation(self, card_id: str, account_id: str) -> CreateOperationResponse:
+        """Создание операции пополнения"""
+        return self.create_operation(card_id, account_id, OperationType.OPERATION_TYPE_TOP_UP)
+
+    def make_purchase_operation(self, card_id: str, account_id: str) -> CreateOperationResponse:
+        """Создание операции покупки"""
+        return self.create_operation(card_id, account_id, OperationType.OPERATION_TYPE_PURCHASE, fake.category())
+
+    def make_transfer_operation(self, card_id: str, account_id: str) -> CreateOperationResponse:
+        """Создание операции перевода"""
+        return self.create_operation(card_id, account_id, OperationType.OPERATION_TYPE_TRANSFER)
+
+    def make_cash_withdrawal_operation(self, card_id: str, account_id: str) -> CreateOperationResponse:
+        """Создание операции снятия наличных"""
+        return self.create_operation(card_id, account_id, OperationType.OPERATION_TYPE_CASH_WITHDRAWAL)
+
+
+def build_operations_service_grpc_client(address: str, retry: RetryPolicy | None = None) -> OperationsServiceGRPCClient:
+    """
+    Фабрика для создания экземпляра OperationsServiceGRPCClient.
+
+    :param address: Адрес OperationsService в формате host:port.
+    :param retry: Политика повторов вызовов (по умолчанию вызовы не повторяются).
+    :return: Инициализированный клиент для OperationsService.
+    """
+    return OperationsServiceGRPCClient(channel=build_service_grpc_client(address, retry))
@@ -0,0 +1,54 @@
+from grpc import Channel
+
+from clients.validation import ValidationPolicy
+
+
+class ValidationChannel(Channel):
+    """
+    Обёртка над gRPC-каналом, которая разбирает ответы unary-unary вызовов по политике ValidationPolicy.
+
+    Канал подменяет response_deserializer заглушки (Message.FromString): в режимах SAMPLED и OFF
+    вместо разобранного protobuf-сообщения возвращается LazyResponse с сырыми байтами, который
+    разбирается только при обращении к полям. LocustInterceptor получает размер ответа через
+    ByteSize() без разбора. Потоковые вызовы передаются во внутренний канал без изменений.
+    """
+
+    def __init__(self, channel: Channel, validation: ValidationPolicy):
+        """
+        :param channel: Исходный gRPC-канал.
+        :param validation: Политика валидации ответов.
+        """
+        self.channel = channel
+        self.validation = validation
+
+    def unary_unary(self, method, request_serializer=None, response_deserializer=None, _registered_method=False):
+        if response_deserializer is not None:
+            deserializer = response_deserializer
+            response_deserializer = lambda raw: self.validation.parse(raw, deserializer)
+
+        return self.channel.unary_unary(method, request_serializer, response_deserializer, _registered_method)
+
+    def unary_stream(self, method, request_serializer=None, response_deserializer=None, _registered_method=False):
+        return self.channel.unary_stream(method, request_serializer, response_deserializer, _registered_method)
+
+    def stream_unary(self, method, request_serializer=None, response_deserializer=None, _registered_method=False):
+        return self.channel.stream_unary(method, request_serializer, response_deserializer, _registered_method)
+
+    def stream_stream(self, method, request_serializer=None, response_deserializer=None, _registered_method=False):
+        return self.channel.stream_stream(method, request_serializer, response_deserializer, _registered_method)
+
+    def subscribe(self, callback, try_to_connect=False):
+        self.channel.subscribe(callback, try_to_connect=try_to_connect)
+
+    def unsubscribe(self, callback):
+        self.channel.unsubscribe(callback)
+
+    def close(self):
+        self.channel.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+        return False
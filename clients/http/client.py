@@ -1,12 +1,178 @@
-from typing import Any, TypedDict
+import asyncio
+import time
+from enum import Enum
+from typing import Any, Callable, TypedDict, TypeVar
+from urllib.parse import quote, urlencode
 
-from httpx import Client, Response, QueryParams, URL
+import gevent
+from httpx import AsyncClient, Client, Request, Response, QueryParams, TransportError, URL
+from pydantic import BaseModel
+
+from clients.http.codecs import JSONCodec, PYDANTIC_JSON_CODEC
+from clients.retries import RetryPolicy, HedgingPolicy, NO_RETRIES
+from clients.validation import ValidationPolicy, ValidationMode, LazyResponse, FULL_VALIDATION
+
+SchemaT = TypeVar("SchemaT", bound=BaseModel)
+
+
+class HTTPBodyMode(str, Enum):
+    """
+    Как хуки Locust определяют размер тела ответа (response_length).
+
+    BUFFER — тело читается в память целиком, размер — длина прочитанных байтов (поведение по умолчанию).
+    DISCARD — ответ запрашивается потоком, хук вычитывает тело по частям, считая байты, и отбрасывает его.
+    Режим для чистых тестов пропускной способности: тело ответа вызывающему коду недоступно, поэтому
+    совместим только с выключенной валидацией (NO_VALIDATION), см. check_body_mode.
+    """
+    BUFFER = "buffer"
+    DISCARD = "discard"
+
+
+def check_body_mode(body_mode: HTTPBodyMode, validation: ValidationPolicy) -> None:
+    """
+    Проверяет, что режим чтения тела совместим с политикой валидации: в режиме DISCARD тело отбрасывается,
+    и валидировать (в том числе выборочно) нечего.
+
+    :raises ValueError: Режим DISCARD задан вместе с валидацией ответов.
+    """
+    if (body_mode is HTTPBodyMode.DISCARD) and (validation.mode != ValidationMode.OFF):
+        raise ValueError(
+            f"HTTPBodyMode.DISCARD drops response bodies and cannot be combined with {validation.mode.value} "
+            f"validation, use NO_VALIDATION or another body mode"
+        )
 
 
 # Тип расширений, которые можно передать в запрос
 # В нашем случае мы используем только параметр "route", но можно добавить и другие
 class HTTPClientExtensions(TypedDict, total=False):
     route: str
+    retry_attempt: int  # Номер повтора запроса (выставляется HTTPClient при повторах)
+    hedged: bool  # Дублирующий запрос хеджирования (выставляется HTTPClient)
+    body_mode: HTTPBodyMode  # Режим чтения тела ответа в хуках Locust (выставляется HTTPClient)
+    # Репорт попытки, завершившейся ошибкой транспорта (выставляется хуком запроса Locust)
+    on_transport_error: Callable[[Request, TransportError], None]
+
+
+# Идемпотентные методы, которые повторяются по умолчанию
+IDEMPOTENT_HTTP_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+
+
+def get_locust_request_type(request: Request) -> str:
+    """
+    Возвращает тип запроса для статистики Locust. Повторы и хеджирующие запросы попадают
+    в отдельные строки статистики, поэтому не смешиваются с исходными запросами.
+
+    :param request: Отправленный запрос.
+    :return: "HTTP", "HTTP retry" или "HTTP hedge".
+    """
+    if request.extensions.get("hedged"):
+        return "HTTP hedge"
+
+    if request.extensions.get("retry_attempt"):
+        return "HTTP retry"
+
+    return "HTTP"
+
+
+def close_hedge_loser(greenlet: gevent.Greenlet) -> None:
+    """
+    Закрывает ответ проигравшего запроса хеджирования, если он успел прийти до прерывания greenlet'а.
+    """
+    if isinstance(greenlet.value, Response):
+        greenlet.value.close()
+
+
+async def aclose_hedge_loser(task: asyncio.Task) -> None:
+    """
+    Асинхронный вариант close_hedge_loser для задачи asyncio, которая уже завершилась.
+    """
+    if (not task.cancelled()) and (task.exception() is None):
+        await task.result().aclose()
+
+
+def report_transport_error(request: Request, error: TransportError) -> None:
+    """
+    Репортит попытку, завершившуюся ошибкой транспорта (соединение, таймаут): ответа нет, поэтому
+    хуки ответа не срабатывают, и без этого попытка со своей задержкой пропала бы из статистики.
+    Функцию репорта кладёт в request.extensions["on_transport_error"] хук запроса Locust.
+    """
+    on_transport_error = request.extensions.get("on_transport_error")
+    if on_transport_error is not None:
+        on_transport_error(request, error)
+
+
+def build_hedge_request(request: Request) -> Request:
+    """
+    Создаёт дублирующий запрос хеджирования с теми же URL, заголовками и телом.
+    """
+    return Request(
+        request.method,
+        request.url,
+        headers=request.headers,
+        stream=request.stream,
+        extensions={**request.extensions, "hedged": True}
+    )
+
+
+class HTTPPreparedRequest:
+    """
+    Подготовленный запрос к одному эндпоинту.
+
+    Итоговый URL клиента (base_url), заголовки, таймаут, route для метрик Locust и имена query-параметров
+    из алиасов схемы запроса вычисляются один раз при подготовке. На каждый запрос подставляются только
+    значения параметров пути и query-параметров, без построения схемы, QueryParams и слияния настроек клиента.
+    """
+
+    def __init__(
+            self,
+            client: Client | AsyncClient,
+            method: str,
+            path: str,
+            route: str | None = None,
+            query_schema: type[BaseModel] | None = None
+    ):
+        """
+        :param client: httpx.Client или httpx.AsyncClient, настройки которого используются в запросе.
+        :param method: HTTP-метод.
+        :param path: Путь эндпоинта, параметры пути задаются в фигурных скобках: "/api/v1/users/{user_id}".
+        :param route: Логическое имя маршрута для метрик; по умолчанию совпадает с шаблоном пути.
+        :param query_schema: Схема query-параметров; имена параметров в запросе берутся из алиасов её полей.
+        """
+        base = client.build_request(method, "", extensions=HTTPClientExtensions(route=route or path))
+        self.method = method
+        self.path = base.url.raw_path.decode("ascii").rstrip("/") + path
+        self.has_path_params = "{" in path
+        self.url = base.url
+        self.headers = base.headers
+        self.extensions = base.extensions
+        self.query_aliases: dict[str, str] = {}
+        if query_schema is not None:
+            self.query_aliases = {
+                name: field.alias or name for name, field in query_schema.model_fields.items()
+            }
+
+    def build(self, query: dict[str, str] | None = None, **path_params: str) -> Request:
+        """
+        Собирает запрос, подставляя переменные части в подготовленный шаблон.
+
+        :param query: Значения query-параметров по именам полей схемы запроса (account_id, а не accountId).
+        :param path_params: Значения параметров пути.
+        :return: Готовый к отправке httpx.Request.
+        """
+        raw_path = self.path
+        if self.has_path_params:
+            raw_path = raw_path.format_map({name: quote(value, safe="") for name, value in path_params.items()})
+        if query:
+            query_string = urlencode([(self.query_aliases.get(name, name), value) for name, value in query.items()])
+            raw_path = f"{raw_path}?{query_string}"
+
+        # extensions копируются: хуки Locust записывают в них время начала конкретного запроса
+        return Request(
+            self.method,
+            self.url.copy_with(raw_path=raw_path.encode("ascii")),
+            headers=self.headers,
+            extensions=dict(self.extensions)
+        )
 
 
 class HTTPClient:
@@ -14,10 +180,146 @@ class HTTPClient:
     Базовый HTTP API клиент, принимающий объект httpx.Client.
 
     :param client: экземпляр httpx.Client для выполнения HTTP-запросов
+    :param validation: политика валидации ответов (по умолчанию каждый ответ валидируется полностью)
+    :param codec: кодек тел запросов и ответов (по умолчанию PydanticJSONCodec)
+    :param retry: политика повторов (по умолчанию запрос не повторяется)
+    :param hedging: политика хеджирования идемпотентных чтений через get_prepared (по умолчанию выключено)
+    :param body_mode: режим чтения тела ответа в хуках Locust (по умолчанию тело читается целиком);
+                      DISCARD требует выключенной валидации (NO_VALIDATION)
     """
 
-    def __init__(self, client: Client) -> None:
+    def __init__(
+            self,
+            client: Client,
+            validation: ValidationPolicy | None = None,
+            codec: JSONCodec | None = None,
+            retry: RetryPolicy | None = None,
+            hedging: HedgingPolicy | None = None,
+            body_mode: HTTPBodyMode = HTTPBodyMode.BUFFER
+    ) -> None:
         self.client = client
+        self.validation = validation or FULL_VALIDATION
+        self.codec = codec or PYDANTIC_JSON_CODEC
+        self.retry = retry or NO_RETRIES
+        self.hedging = hedging
+        self.body_mode = body_mode
+        check_body_mode(self.body_mode, self.validation)
+        self.prepared_requests: dict[tuple[str, str, type[BaseModel] | None], HTTPPreparedRequest] = {}
+
+    def prepare(self, method: str, path: str, query_schema: type[BaseModel] | None = None) -> HTTPPreparedRequest:
+        """
+        Возвращает подготовленный запрос к эндпоинту, создавая его при первом обращении.
+
+        :param method: HTTP-метод.
+        :param path: Шаблон пути эндпоинта (он же route в метриках Locust).
+        :param query_schema: Схема query-параметров эндпоинта.
+        :return: Объект HTTPPreparedRequest.
+        """
+        key = (method, path, query_schema)
+        prepared = self.prepared_requests.get(key)
+        if prepared is None:
+            prepared = self.prepared_requests[key] = HTTPPreparedRequest(
+                self.client, method, path, query_schema=query_schema
+            )
+
+        return prepared
+
+    def can_retry(self, request: Request, attempt: int) -> bool:
+        """
+        Решает, повторять ли запрос после неудачной попытки.
+        """
+        if (request.method not in IDEMPOTENT_HTTP_METHODS) and not self.retry.retry_non_idempotent:
+            return False
+
+        return self.retry.can_retry(attempt)
+
+    def send(self, request: Request, hedge: bool = False) -> Response:
+        """
+        Отправляет запрос с учётом политик повторов и хеджирования.
+
+        Каждая попытка проходит через хуки клиента и репортится в Locust отдельно: повторы помечаются
+        в extensions["retry_attempt"] и попадают в статистику с типом "HTTP retry". Попытки, завершившиеся
+        ошибкой транспорта, репортятся с этой ошибкой (см. report_transport_error).
+        Режим чтения тела передаётся хукам в extensions["body_mode"]; в режиме DISCARD ответ запрашивается
+        потоком, чтобы хук мог отбросить тело, не загружая его в память.
+
+        :param request: Запрос httpx.Request.
+        :param hedge: Запрос идемпотентный, его можно хеджировать.
+        :return: Объект Response с данными ответа.
+        """
+        stream = request.extensions.setdefault("body_mode", self.body_mode) is HTTPBodyMode.DISCARD
+        attempt = 0
+        while True:
+            try:
+                if hedge and self.hedging is not None:
+                    response = self.send_hedged(request, stream)
+                else:
+                    response = self.send_attempt(request, stream)
+            except TransportError:
+                if not self.can_retry(request, attempt):
+                    raise
+            else:
+                if response.status_code not in self.retry.retry_statuses:
+                    self.retry.on_success()
+                    return response
+
+                if not self.can_retry(request, attempt):
+                    return response
+
+            attempt += 1
+            request.extensions["retry_attempt"] = attempt
+            time.sleep(self.retry.get_delay(attempt))
+
+    def send_attempt(self, request: Request, stream: bool = False) -> Response:
+        """
+        Отправляет одну попытку запроса и репортит её ошибку транспорта, если ответа нет.
+        """
+        try:
+            return self.client.send(request, stream=stream)
+        except TransportError as error:
+            report_transport_error(request, error)
+            raise
+
+    def send_hedged(self, request: Request, stream: bool = False) -> Response:
+        """
+        Отправляет запрос, а если ответ не пришёл за hedging.delay, — дублирующий запрос.
+        Возвращается первый успешно полученный ответ; второй запрос прерывается, а его ответ, если он
+        всё же успел прийти, закрывается, чтобы потоковый ответ не держал соединение пула.
+        Запросы выполняются в greenlet'ах, поэтому хеджирование работает под gevent (Locust, сидинг).
+        """
+        primary = gevent.spawn(self.send_attempt, request, stream)
+        primary.join(timeout=self.hedging.delay)
+        if primary.ready():
+            return primary.get()
+
+        hedge = gevent.spawn(self.send_attempt, build_hedge_request(request), stream)
+        for greenlet in gevent.iwait([primary, hedge]):
+            if greenlet.successful():
+                loser = hedge if greenlet is primary else primary
+                loser.link_value(close_hedge_loser)
+                loser.kill(block=False)
+                return greenlet.value
+
+        return primary.get()
+
+    def validate_response(self, response: Response, schema: type[SchemaT]) -> SchemaT | LazyResponse:
+        """
+        Валидирует тело ответа схемой с учётом политики валидации клиента.
+
+        В режиме DISCARD тело ответа отброшено хуком, поэтому при выключенной валидации возвращается
+        LazyResponse без тела: размер ответа доступен, а обращение к полям завершится ошибкой валидации.
+
+        :param response: Ответ, тело которого уже прочитано.
+        :param schema: Pydantic-схема ответа.
+        :return: Валидированная схема или LazyResponse, если политика отложила валидацию.
+        :raises ValueError: Режим DISCARD задан для запроса через extensions при включённой валидации.
+        """
+        body_mode = response.request.extensions.get("body_mode", self.body_mode)
+        if body_mode is HTTPBodyMode.DISCARD:
+            check_body_mode(body_mode, self.validation)
+            return LazyResponse(b"", self.codec.get_decoder(schema))
+
+        return self.validation.parse(response.content, self.codec.get_decoder(schema))
 
     def get(
             self,
@@ -33,7 +335,28 @@ class HTTPClient:
         :param extensions: Дополнительные данные, передаваемые через HTTPX extensions.
         :return: Объект Response с данными ответа.
         """
-        return self.client.get(url=url, params=params, extensions=extensions)  # Передаём extensions в httpx.Client
+        return self.send(self.client.build_request("GET", url, params=params, extensions=extensions))
+
+    def get_prepared(
+            self,
+            path: str,
+            query: dict[str, str] | None = None,
+            query_schema: type[BaseModel] | None = None,
+            **path_params: str
+    ) -> Response:
+        """
+        Выполняет GET-запрос через подготовленный шаблон эндпоинта (см. HTTPPreparedRequest).
+        Предназначен для горячих эндпоинтов в нагрузочных сценариях; такие чтения идемпотентны
+        и хеджируются, если у клиента задана политика хеджирования.
+
+        :param path: Шаблон пути эндпоинта, например "/api/v1/users/{user_id}".
+        :param query: Значения query-параметров по именам полей query_schema.
+        :param query_schema: Схема query-параметров, алиасы которой задают имена параметров в запросе.
+        :param path_params: Значения параметров пути.
+        :return: Объект Response с данными ответа.
+        """
+        prepared = self.prepare("GET", path, query_schema)
+        return self.send(prepared.build(query, **path_params), hedge=True)
 
     def post(
             self,
@@ -49,4 +372,244 @@ class HTTPClient:
         :param extensions: Дополнительные данные, передаваемые через HTTPX extensions.
         :return: Объект Response с данными ответа.
         """
-        return self.client.post(url=url, json=json, extensions=extensions)  # extensions передаётся в httpx.Client
+        return self.send(self.client.build_request("POST", url, json=json, extensions=extensions))
+
+    def post_schema(
+            self,
+            url: str | URL,
+            request: BaseModel,
+            extensions: HTTPClientExtensions | None = None
+    ) -> Response:
+        """
+        Выполняет POST-запрос, тело которого сериализуется из схемы кодеком клиента сразу в байты.
+
+        :param url: URL-адрес эндпоинта.
+        :param request: Pydantic-схема запроса.
+        :param extensions: Дополнительные данные, передаваемые через HTTPX extensions.
+        :return: Объект Response с данными ответа.
+        """
+        return self.send(self.client.build_request(
+            "POST", url, content=self.codec.encode(request), headers=self.codec.headers, extensions=extensions
+        ))
+
+
+class AsyncHTTPClient:
+    """
+    Асинхронный базовый HTTP API клиент, принимающий объект httpx.AsyncClient.
+    Повторяет интерфейс HTTPClient, но все методы являются корутинами.
+
+    :param client: экземпляр httpx.AsyncClient для выполнения HTTP-запросов
+    :param validation: политика валидации ответов (по умолчанию каждый ответ валидируется полностью)
+    :param codec: кодек тел запросов и ответов (по умолчанию PydanticJSONCodec)
+    :param retry: политика повторов (по умолчанию запрос не повторяется)
+    :param hedging: политика хеджирования идемпотентных чтений через get_prepared (по умолчанию выключено)
+    :param body_mode: режим чтения тела ответа в хуках Locust (по умолчанию тело читается целиком);
+                      DISCARD требует выключенной валидации (NO_VALIDATION)
+    """
+
+    def __init__(
+            self,
+            client: AsyncClient,
+            validation: ValidationPolicy | None = None,
+            codec: JSONCodec | None = None,
+            retry: RetryPolicy | None = None,
+            hedging: HedgingPolicy | None = None,
+            body_mode: HTTPBodyMode = HTTPBodyMode.BUFFER
+    ) -> None:
+        self.client = client
+        self.validation = validation or FULL_VALIDATION
+        self.codec = codec or PYDANTIC_JSON_CODEC
+        self.retry = retry or NO_RETRIES
+        self.hedging = hedging
+        self.body_mode = body_mode
+        check_body_mode(self.body_mode, self.validation)
+        self.prepared_requests: dict[tuple[str, str, type[BaseModel] | None], HTTPPreparedRequest] = {}
+
+    def prepare(self, method: str, path: str, query_schema: type[BaseModel] | None = None) -> HTTPPreparedRequest:
+        """
+        Возвращает подготовленный запрос к эндпоинту, создавая его при первом обращении.
+
+        :param method: HTTP-метод.
+        :param path: Шаблон пути эндпоинта (он же route в метриках Locust).
+        :param query_schema: Схема query-параметров эндпоинта.
+        :return: Объект HTTPPreparedRequest.
+        """
+        key = (method, path, query_schema)
+        prepared = self.prepared_requests.get(key)
+        if prepared is None:
+            prepared = self.prepared_requests[key] = HTTPPreparedRequest(
+                self.client, method, path, query_schema=query_schema
+            )
+
+        return prepared
+
+    def can_retry(self, request: Request, attempt: int) -> bool:
+        """
+        Решает, повторять ли запрос после неудачной попытки.
+        """
+        if (request.method not in IDEMPOTENT_HTTP_METHODS) and not self.retry.retry_non_idempotent:
+            return False
+
+        return self.retry.can_retry(attempt)
+
+    async def send(self, request: Request, hedge: bool = False) -> Response:
+        """
+        Асинхронно отправляет запрос с учётом политик повторов и хеджирования (аналог HTTPClient.send).
+
+        :param request: Запрос httpx.Request.
+        :param hedge: Запрос идемпотентный, его можно хеджировать.
+        :return: Объект Response с данными ответа.
+        """
+        stream = request.extensions.setdefault("body_mode", self.body_mode) is HTTPBodyMode.DISCARD
+        attempt = 0
+        while True:
+            try:
+                if hedge and self.hedging is not None:
+                    response = await self.send_hedged(request, stream)
+                else:
+                    response = await self.send_attempt(request, stream)
+            except TransportError:
+                if not self.can_retry(request, attempt):
+                    raise
+            else:
+                if response.status_code not in self.retry.retry_statuses:
+                    self.retry.on_success()
+                    return response
+
+                if not self.can_retry(request, attempt):
+                    return response
+
+            attempt += 1
+            request.extensions["retry_attempt"] = attempt
+            await asyncio.sleep(self.retry.get_delay(attempt))
+
+    async def send_attempt(self, request: Request, stream: bool = False) -> Response:
+        """
+        Асинхронно отправляет одну попытку запроса и репортит её ошибку транспорта, если ответа нет.
+        """
+        try:
+            return await self.client.send(request, stream=stream)
+        except TransportError as error:
+            report_transport_error(request, error)
+            raise
+
+    async def send_hedged(self, request: Request, stream: bool = False) -> Response:
+        """
+        Асинхронный вариант HTTPClient.send_hedged на задачах asyncio: проигравший запрос отменяется,
+        а его ответ, если он успел прийти, закрывается.
+        """
+        primary = asyncio.ensure_future(self.send_attempt(request, stream))
+        done, _ = await asyncio.wait({primary}, timeout=self.hedging.delay)
+        if done:
+            return primary.result()
+
+        hedge = asyncio.ensure_future(self.send_attempt(build_hedge_request(request), stream))
+        pending = {primary, hedge}
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                if task.exception() is None:
+                    losers = (pending | done) - {task}
+                    for loser in losers:
+                        loser.cancel()
+                    # Дожидаемся отмены, чтобы закрыть ответ, пришедший до неё, и забрать ошибку задачи
+                    await asyncio.wait(losers)
+                    for loser in losers:
+                        await aclose_hedge_loser(loser)
+                    return task.result()
+
+        return primary.result()
+
+    def validate_response(self, response: Response, schema: type[SchemaT]) -> SchemaT | LazyResponse:
+        """
+        Валидирует тело ответа схемой с учётом политики валидации клиента.
+
+        В режиме DISCARD тело ответа отброшено хуком, поэтому при выключенной валидации возвращается
+        LazyResponse без тела: размер ответа доступен, а обращение к полям завершится ошибкой валидации.
+
+        :param response: Ответ, тело которого уже прочитано.
+        :param schema: Pydantic-схема ответа.
+        :return: Валидированная схема или LazyResponse, если политика отложила валидацию.
+        :raises ValueError: Режим DISCARD задан для запроса через extensions при включённой валидации.
+        """
+        body_mode = response.request.extensions.get("body_mode", self.body_mode)
+        if body_mode is HTTPBodyMode.DISCARD:
+            check_body_mode(body_mode, self.validation)
+            return LazyResponse(b"", self.codec.get_decoder(schema))
+
+        return self.validation.parse(response.content, self.codec.get_decoder(schema))
+
+    async def get(
+            self,
+            url: str | URL,
+            params: QueryParams | None = None,
+            extensions: HTTPClientExtensions | None = None
+    ) -> Response:
+        """
+        Выполняет асинхронный GET-запрос.
+
+        :param url: URL-адрес эндпоинта.
+        :param params: GET-параметры запроса (например, ?key=value).
+        :param extensions: Дополнительные данные, передаваемые через HTTPX extensions.
+        :return: Объект Response с данными ответа.
+        """
+        return await self.send(self.client.build_request("GET", url, params=params, extensions=extensions))
+
+    async def get_prepared(
+            self,
+            path: str,
+            query: dict[str, str] | None = None,
+            query_schema: type[BaseModel] | None = None,
+            **path_params: str
+    ) -> Response:
+        """
+        Выполняет асинхронный GET-запрос через подготовленный шаблон эндпоинта (см. HTTPPreparedRequest).
+
+        :param path: Шаблон пути эндпоинта, например "/api/v1/users/{user_id}".
+        :param query: Значения query-параметров по именам полей query_schema.
+        :param query_schema: Схема query-параметров, алиасы которой задают имена параметров в запросе.
+        :param path_params: Значения параметров пути.
+        :return: Объект Response с данными ответа.
+        """
+        prepared = self.prepare("GET", path, query_schema)
+        return await self.send(prepared.build(query, **path_params), hedge=True)
+
+    async def post(
+            self,
+            url: str | URL,
+            json: Any | None = None,
+            extensions: HTTPClientExtensions | None = None
+    ) -> Response:
+        """
+        Выполняет асинхронный POST-запрос.
+
+        :param url: URL-адрес эндпоинта.
+        :param json: Данные в формате JSON.
+        :param extensions: Дополнительные данные, передаваемые через HTTPX extensions.
+        :return: Объект Response с данными ответа.
+        """
+        return await self.send(self.client.build_request("POST", url, json=json, extensions=extensions))
+
+    async def post_schema(
+            self,
+            url: str | URL,
+            request: BaseModel,
+            extensions: HTTPClientExtensions | None = None
+    ) -> Response:
+        """
+        Выполняет асинхронный POST-запрос, тело которого сериализуется из схемы кодеком клиента.
+
+        :param url: URL-адрес эндпоинта.
+        :param request: Pydantic-схема запроса.
+        :param extensions: Дополнительные данные, передаваемые через HTTPX extensions.
+        :return: Объект Response с данными ответа.
+        """
+        return await self.send(self.client.build_request(
+            "POST", url, content=self.codec.encode(request), headers=self.codec.headers, extensions=extensions
+        ))
+
+    async def close(self) -> None:
+        """
+        Закрывает пул соединений httpx.AsyncClient.
+        """
+        await self.client.aclose()
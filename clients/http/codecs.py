@@ -0,0 +1,103 @@
+import json
+from abc import ABC, abstractmethod
+from typing import Callable, TypeVar
+
+from pydantic import BaseModel
+
+SchemaT = TypeVar("SchemaT", bound=BaseModel)
+
+
+class JSONCodec(ABC):
+    """
+    Кодек тел запросов и ответов HTTP-клиентов gateway.
+
+    Кодек сериализует pydantic-схему запроса сразу в байты (без промежуточного dict, который httpx
+    сериализовал бы стандартным json) и возвращает функцию разбора тела ответа в схему.
+    Кодеки взаимозаменяемы, поэтому их можно сравнивать под нагрузкой в одном и том же сценарии.
+    """
+    name: str
+    headers = {"Content-Type": "application/json"}
+
+    @abstractmethod
+    def encode(self, request: BaseModel) -> bytes:
+        """
+        Сериализует схему запроса в тело запроса (ключи — по alias, как ожидает API).
+        """
+        ...
+
+    @abstractmethod
+    def get_decoder(self, schema: type[SchemaT]) -> Callable[[bytes], SchemaT]:
+        """
+        Возвращает функцию, которая разбирает тело ответа в схему.
+        """
+        ...
+
+
+class PydanticJSONCodec(JSONCodec):
+    """
+    Кодек на pydantic-core: запрос сериализуется в байты сериализатором схемы,
+    ответ валидируется прямо из байтов (model_validate_json). Используется по умолчанию.
+    """
+    name = "pydantic"
+
+    def encode(self, request: BaseModel) -> bytes:
+        return request.__pydantic_serializer__.to_json(request, by_alias=True)
+
+    def get_decoder(self, schema: type[SchemaT]) -> Callable[[bytes], SchemaT]:
+        return schema.model_validate_json
+
+
+class ORJSONCodec(JSONCodec):
+    """
+    Кодек на orjson: JSON разбирается и собирается orjson, а pydantic только проверяет готовые объекты.
+    Пакет orjson нужен только для этого кодека и импортируется при создании.
+    """
+    name = "orjson"
+
+    def __init__(self):
+        import orjson
+
+        self.orjson = orjson
+
+    def encode(self, request: BaseModel) -> bytes:
+        return self.orjson.dumps(request.model_dump(mode="json", by_alias=True))
+
+    def get_decoder(self, schema: type[SchemaT]) -> Callable[[bytes], SchemaT]:
+        return lambda raw: schema.model_validate(self.orjson.loads(raw))
+
+
+class StdlibJSONCodec(JSONCodec):
+    """
+    Кодек на стандартном модуле json — повторяет прежнее поведение клиентов (httpx json=...)
+    и служит точкой отсчёта при сравнении кодеков.
+    """
+    name = "json"
+
+    def encode(self, request: BaseModel) -> bytes:
+        return json.dumps(request.model_dump(mode="json", by_alias=True)).encode("utf-8")
+
+    def get_decoder(self, schema: type[SchemaT]) -> Callable[[bytes], SchemaT]:
+        return lambda raw: schema.model_validate(json.loads(raw))
+
+
+# Кодек по умолчанию для всех HTTP-клиентов gateway
+PYDANTIC_JSON_CODEC = PydanticJSONCodec()
+
+JSON_CODECS: dict[str, type[JSONCodec]] = {
+    PydanticJSONCodec.name: PydanticJSONCodec,
+    ORJSONCodec.name: ORJSONCodec,
+    StdlibJSONCodec.name: StdlibJSONCodec
+}
+
+
+def build_json_codec(name: str) -> JSONCodec:
+    """
+    Создаёт кодек по имени: "pydantic", "orjson" или "json".
+
+    :param name: Имя кодека.
+    :return: Экземпляр JSONCodec.
+    """
+    if name not in JSON_CODECS:
+        raise ValueError(f"Unknown JSON codec {name!r}, expected one of {sorted(JSON_CODECS)}")
+
+    return JSON_CODECS[name]()
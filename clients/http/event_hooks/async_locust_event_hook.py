@@ -0,0 +1,112 @@
+import time
+from typing import TYPE_CHECKING, Awaitable, Callable
+
+from httpx import Request, Response, HTTPStatusError, HTTPError, TransportError
+
+from clients.http.client import HTTPBodyMode, get_locust_request_type
+from clients.http.event_hooks.phases import AsyncHTTPPhaseTimer
+
+if TYPE_CHECKING:
+    # Только для аннотаций: импорт Locust патчит стандартную библиотеку через gevent,
+    # что несовместимо с asyncio-инструментами, использующими эти хуки
+    from locust.env import Environment
+
+
+async def async_locust_request_event_hook(request: Request) -> None:
+    """
+    Асинхронный HTTPX event hook, вызываемый перед отправкой запроса (аналог locust_request_event_hook).
+
+    Сохраняет время по монотонным часам в `request.extensions["start_time"]` и подключает
+    трассировку фаз запроса (AsyncHTTPPhaseTimer).
+    """
+    request.extensions["start_time"] = time.perf_counter()
+    request.extensions["trace"] = AsyncHTTPPhaseTimer()
+
+
+def async_locust_transport_error_event_hook(environment: "Environment") -> Callable[[Request], Awaitable[None]]:
+    """
+    Возвращает асинхронный HTTPX event hook запроса, который передаёт AsyncHTTPClient функцию репорта
+    ошибок транспорта (аналог locust_transport_error_event_hook).
+
+    :param environment: Объект окружения Locust, через который отправляются метрики.
+    :return: Корутина-хук для HTTPX request event hook.
+    """
+
+    def on_transport_error(request: Request, error: TransportError) -> None:
+        route = request.extensions.get("route", request.url.path)
+        start_time = request.extensions.get("start_time", time.perf_counter())
+
+        environment.events.request.fire(
+            name=f"{request.method} {route}",
+            context={},
+            response=None,
+            exception=error,
+            request_type=get_locust_request_type(request),
+            response_time=(time.perf_counter() - start_time) * 1000,
+            response_length=0,
+        )
+
+    async def inner(request: Request) -> None:
+        request.extensions["on_transport_error"] = on_transport_error
+
+    return inner
+
+
+async def async_get_response_length(response: Response) -> int:
+    """
+    Асинхронный вариант get_response_length: размер тела ответа в режиме request.extensions["body_mode"].
+
+    :param response: Ответ, заголовки которого уже получены.
+    :return: Размер тела ответа в байтах.
+    """
+    body_mode = response.request.extensions.get("body_mode", HTTPBodyMode.BUFFER)
+
+    if (body_mode is HTTPBodyMode.DISCARD) and not response.is_stream_consumed:
+        async for _ in response.aiter_raw():
+            pass
+        return response.num_bytes_downloaded
+
+    # В AsyncClient тело ответа дочитывается асинхронно
+    return len(await response.aread())
+
+
+def async_locust_response_event_hook(environment: "Environment") -> Callable[[Response], Awaitable[None]]:
+    """
+    Возвращает асинхронный HTTPX event hook, вызываемый после получения ответа (аналог locust_response_event_hook).
+
+    Отправляет метрики запроса в `environment.events.request` в том же формате, что и синхронный хук,
+    поэтому запросы асинхронных клиентов попадают в ту же статистику Locust.
+
+    :param environment: Объект окружения Locust, через который отправляются метрики.
+    :return: Корутина-хук для HTTPX response event hook.
+    """
+
+    async def inner(response: Response) -> None:
+        exception: HTTPError | HTTPStatusError | None = None
+
+        try:
+            response = response.raise_for_status()
+        except (HTTPError, HTTPStatusError) as error:
+            exception = error
+
+        request = response.request
+
+        route = request.extensions.get("route", request.url.path)
+        start_time = request.extensions.get("start_time", time.perf_counter())
+        response_time = (time.perf_counter() - start_time) * 1000
+        response_length = await async_get_response_length(response)
+
+        timer: AsyncHTTPPhaseTimer | None = request.extensions.get("trace")
+        phases = timer.get_phases() if isinstance(timer, AsyncHTTPPhaseTimer) else {}
+
+        environment.events.request.fire(
+            name=f"{request.method} {route}",
+            context={"http_version": response.http_version, "phases": phases},
+            response=response,
+            exception=exception,
+            request_type=get_locust_request_type(request),
+            response_time=response_time,
+            response_length=response_length,
+        )
+
+    return inner
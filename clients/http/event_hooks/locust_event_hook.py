@@ -1,20 +1,163 @@
 import time
+from typing import Callable
 
-from httpx import Request, Response, HTTPStatusError, HTTPError
+from httpx import Request, Response, HTTPStatusError, HTTPError, TransportError
 from locust.env import Environment
 
+from clients.http.client import HTTPBodyMode, get_locust_request_type
+from clients.http.event_hooks.phases import HTTPPhaseTimer
+
+
+class HTTPStreamsTracker:
+    """
+    Считает потоки (streams), одновременно открытые клиентом в его HTTP/2-соединениях.
+
+    Поток считается открытым с отправки заголовков запроса (соединение уже взято из пула) до закрытия
+    потока ответа — после чтения тела или при ошибке. События берутся из трассировки httpcore: хук запроса
+    request_event_hook оборачивает колбэк request.extensions["trace"]. httpx мультиплексирует запросы
+    в одном HTTP/2-соединении, пока сервер не ограничит число потоков (MAX_CONCURRENT_STREAMS), поэтому
+    счётчик клиента — это число потоков на соединении. Если время ответа растёт вместе с ним, задержка
+    вызвана конкуренцией потоков внутри соединения (head-of-line), а не медленной обработкой запроса сервером.
+    """
+
+    def __init__(self):
+        self.streams = 0
+
+    def open(self) -> None:
+        """
+        Отмечает открытие потока: заголовки запроса отправляются по соединению.
+        """
+        self.streams += 1
+
+    def close(self) -> None:
+        """
+        Отмечает закрытие потока ответа.
+        """
+        self.streams -= 1
+
+    def request_event_hook(self, request: Request) -> None:
+        """
+        HTTPX event hook запроса, подключаемый после locust_request_event_hook: оборачивает трассировку запроса,
+        чтобы открывать и закрывать его поток в счётчике.
+        """
+        request.extensions["trace"] = HTTPStreamsTrace(self, request.extensions.get("trace"))
+
+
+class HTTPStreamsTrace:
+    """
+    Колбэк трассировки httpcore, отмечающий в HTTPStreamsTracker открытие и закрытие потока одного запроса
+    и передающий события исходному колбэку (HTTPPhaseTimer).
+    """
+    __slots__ = ("tracker", "trace", "opened")
+
+    def __init__(self, tracker: HTTPStreamsTracker, trace: Callable[[str, dict], None] | None):
+        self.tracker = tracker
+        self.trace = trace
+        self.opened = False
+
+    def __call__(self, name: str, info: dict) -> None:
+        if self.trace is not None:
+            self.trace(name, info)
+
+        # Имя события: "{connection|http11|http2}.{шаг}.{started|complete|failed}"
+        if name.endswith(".send_request_headers.started") and not self.opened:
+            self.opened = True
+            self.tracker.open()
+        elif name.endswith(".response_closed.started") and self.opened:
+            # Поток ответа закрывается один раз: после чтения тела, при закрытии ответа или при ошибке
+            self.opened = False
+            self.tracker.close()
+
 
 def locust_request_event_hook(request: Request) -> None:
     """
     HTTPX event hook, вызываемый перед отправкой запроса.
 
-    Сохраняет текущее время в `request.extensions["start_time"]`,
-    чтобы потом использовать его для расчёта времени ответа.
+    Сохраняет время по монотонным часам в `request.extensions["start_time"]`,
+    чтобы потом использовать его для расчёта времени ответа, и подключает трассировку httpcore
+    (`request.extensions["trace"]`), которая засекает фазы запроса. Таймер фаз дополнительно сохраняется
+    в `request.extensions["phase_timer"]`: следующие хуки могут обернуть колбэк трассировки.
+    """
+    request.extensions["start_time"] = time.perf_counter()
+    request.extensions["trace"] = request.extensions["phase_timer"] = HTTPPhaseTimer()
+
+
+def locust_transport_error_event_hook(environment: Environment) -> Callable[[Request], None]:
     """
-    request.extensions["start_time"] = time.time()
+    Возвращает HTTPX event hook запроса, который передаёт HTTPClient функцию репорта ошибок транспорта
+    через `request.extensions["on_transport_error"]` (см. report_transport_error).
 
+    Попытка, завершившаяся ошибкой соединения или таймаутом, не получает ответа, и хук ответа для неё
+    не срабатывает. Такая попытка репортится с ошибкой, временем до ошибки и тем же типом запроса
+    ("HTTP" или "HTTP retry"), поэтому повторы после неё не скрывают её задержку.
 
-def locust_response_event_hook(environment: Environment):
+    :param environment: Объект окружения Locust, через который отправляются метрики.
+    :return: Функция-хук для HTTPX request event hook.
+    """
+
+    def on_transport_error(request: Request, error: TransportError) -> None:
+        route = request.extensions.get("route", request.url.path)
+        start_time = request.extensions.get("start_time", time.perf_counter())
+
+        environment.events.request.fire(
+            name=f"{request.method} {route}",
+            context={},
+            response=None,
+            exception=error,
+            request_type=get_locust_request_type(request),
+            response_time=(time.perf_counter() - start_time) * 1000,
+            response_length=0,
+        )
+
+    def inner(request: Request) -> None:
+        request.extensions["on_transport_error"] = on_transport_error
+
+    return inner
+
+
+def get_response_length(response: Response) -> int:
+    """
+    Возвращает размер тела ответа в режиме, заданном в request.extensions["body_mode"] (см. HTTPBodyMode).
+
+    В режиме DISCARD тело вычитывается по частям без сохранения (считаются байты, пришедшие по сети,
+    без распаковки), после чего ответ закрывается.
+
+    :param response: Ответ, заголовки которого уже получены.
+    :return: Размер тела ответа в байтах.
+    """
+    body_mode = response.request.extensions.get("body_mode", HTTPBodyMode.BUFFER)
+
+    if (body_mode is HTTPBodyMode.DISCARD) and not response.is_stream_consumed:
+        for _ in response.iter_raw():
+            pass
+        return response.num_bytes_downloaded
+
+    return len(response.read())
+
+
+def fire_locust_phase_events(environment: Environment, name: str, phases: dict[str, float]) -> None:
+    """
+    Отправляет фазы запроса в Locust отдельными записями статистики с типом "HTTP phase"
+    и именем "{запрос} [{фаза}]". Такие записи увеличивают общий счётчик запросов Locust,
+    поэтому включаются явно и предназначены для разбора причин роста перцентилей.
+    """
+    for phase, phase_time in phases.items():
+        environment.events.request.fire(
+            name=f"{name} [{phase}]",
+            context=None,
+            response=None,
+            exception=None,
+            request_type="HTTP phase",
+            response_time=phase_time,
+            response_length=0,
+        )
+
+
+def locust_response_event_hook(
+        environment: Environment,
+        streams_tracker: HTTPStreamsTracker | None = None,
+        phase_stats: bool = False
+):
     """
     Возвращает HTTPX event hook, вызываемый после получения ответа.
 
@@ -22,7 +165,16 @@ def locust_response_event_hook(environment: Environment):
     Извлекает route из `request.extensions["route"]`, если задан.
     Отправляет собранные метрики в `environment.events.request`, чтобы Locust мог агрегировать статистику.
 
+    Повторы и хеджирующие запросы HTTPClient репортятся с типами "HTTP retry" и "HTTP hedge".
+    В context события передаётся версия протокола ответа, а при заданном streams_tracker — также
+    номер потока HTTP/2, идентификатор соединения и количество потоков, открытых к моменту получения ответа.
+    В context также передаются длительности фаз запроса в миллисекундах (phases): ожидание соединения
+    в пуле, установка соединения и TLS, запись запроса, ожидание ответа сервера и загрузка тела.
+
     :param environment: Объект окружения Locust, через который отправляются метрики.
+    :param streams_tracker: Счётчик потоков на соединениях (используется в режиме HTTP/2); его хук
+                            request_event_hook должен быть подключён к клиенту после locust_request_event_hook.
+    :param phase_stats: Дополнительно отправлять фазы отдельными записями статистики (fire_locust_phase_events).
     :return: Функция-хук для HTTPX response event hook.
     """
 
@@ -40,19 +192,36 @@ def locust_response_event_hook(environment: Environment):
         # Получаем route, если он был передан через extensions, иначе используем raw path
         route = request.extensions.get("route", request.url.path)
         # Время начала запроса, установленное в request event hook
-        start_time = request.extensions.get("start_time", time.time())
+        start_time = request.extensions.get("start_time", time.perf_counter())
         # Вычисляем длительность запроса в миллисекундах
-        response_time = (time.time() - start_time) * 1000
-        # Определяем размер тела ответа (можно заменить на 0, если не нужно)
-        response_length = len(response.read())
+        response_time = (time.perf_counter() - start_time) * 1000
+        context = {"http_version": response.http_version}
+
+        if streams_tracker is not None:
+            # Поток этого ответа ещё открыт и учтён в счётчике вместе с параллельными запросами клиента
+            context.update(
+                stream_id=response.extensions.get("stream_id"),
+                connection_id=id(response.extensions.get("network_stream")),
+                connection_streams=streams_tracker.streams
+            )
+
+        # Определяем размер тела ответа (читая или отбрасывая тело — см. HTTPBodyMode)
+        response_length = get_response_length(response)
+
+        # Фазы считаются после чтения тела, чтобы в них попала загрузка (download)
+        timer: HTTPPhaseTimer | None = request.extensions.get("phase_timer")
+        phases = timer.get_phases() if isinstance(timer, HTTPPhaseTimer) else {}
+        context["phases"] = phases
+        if phase_stats:
+            fire_locust_phase_events(environment, f"{request.method} {route}", phases)
 
         # Отправляем событие в Locust
         environment.events.request.fire(
             name=f"{request.method} {route}",  # Имя запроса (метод + логическое имя маршрута)
-            context=None,  # Контекст (опционально, можно использовать для расширений)
+            context=context,  # Версия протокола, фазы запроса и, для HTTP/2, параллельность потоков на соединении
             response=response,  # Объект ответа (опционально)
             exception=exception,  # Исключение, если оно произошло
-            request_type="HTTP",  # Тип запроса (может быть любым: HTTP, gRPC, DB и т.д.)
+            request_type=get_locust_request_type(request),  # HTTP, а для повторов и хеджирования — отдельный тип
             response_time=response_time,  # Время выполнения запроса в мс
             response_length=response_length,  # Размер тела ответа
         )
@@ -0,0 +1,64 @@
+import time
+
+# Соответствие шагов трассировки httpcore (extensions["trace"]) фазам HTTP-запроса
+HTTP_TRACE_PHASES = {
+    "connect_tcp": "connect",  # Установка TCP-соединения (0, если соединение взято из пула)
+    "start_tls": "tls",  # TLS-рукопожатие
+    "send_request_headers": "send",  # Запись запроса: заголовки...
+    "send_request_body": "send",  # ...и тело
+    "receive_response_headers": "wait",  # Ожидание заголовков ответа (time to first byte, «время сервера»)
+    "receive_response_body": "download"  # Загрузка тела ответа
+}
+
+
+class HTTPPhaseTimer:
+    """
+    Колбэк трассировки httpcore, который засекает фазы одного HTTP-запроса по монотонным часам.
+
+    Устанавливается хуком запроса в request.extensions["trace"]. По фазам видно, из-за чего растёт
+    время ответа: ожидание свободного соединения (pool), переустановка соединений (connect, tls)
+    или время обработки запроса сервером (wait).
+    """
+    __slots__ = ("started", "events")
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.events: dict[str, list[float]] = {}
+
+    def __call__(self, name: str, info: dict) -> None:
+        # Имя события: "{connection|http11|http2}.{шаг}.{started|complete|failed}"
+        step, _, stage = name.partition(".")[2].rpartition(".")
+        phase = HTTP_TRACE_PHASES.get(step)
+        if phase is None:
+            return
+
+        now = time.perf_counter()
+        if stage == "started":
+            # Фаза из нескольких шагов (send) начинается с первого из них
+            self.events.setdefault(phase, [now, now])
+        elif phase in self.events:
+            self.events[phase][1] = now
+
+    def get_phases(self) -> dict[str, float]:
+        """
+        Возвращает длительности фаз в миллисекундах. Фаза pool — время от хука запроса
+        до первого сетевого события (ожидание свободного соединения в пуле).
+        """
+        if not self.events:
+            return {}
+
+        phases = {"pool": (min(start for start, _ in self.events.values()) - self.started) * 1000}
+        for phase, (start, end) in self.events.items():
+            phases[phase] = (end - start) * 1000
+
+        return phases
+
+
+class AsyncHTTPPhaseTimer(HTTPPhaseTimer):
+    """
+    Вариант HTTPPhaseTimer для httpx.AsyncClient: асинхронный httpcore ожидает колбэк-корутину.
+    """
+    __slots__ = ()
+
+    async def __call__(self, name: str, info: dict) -> None:
+        HTTPPhaseTimer.__call__(self, name, info)
@@ -0,0 +1,174 @@
+from typing import TYPE_CHECKING
+
+from httpx import AsyncClient, Response, QueryParams
+
+from clients.http.codecs import JSONCodec
+from clients.retries import RetryPolicy, HedgingPolicy
+from clients.validation import ValidationPolicy
+from clients.http.client import AsyncHTTPClient, HTTPClientExtensions, HTTPBodyMode
+from clients.http.gateway.async_client import (
+    build_gateway_async_http_client,
+    build_gateway_async_locust_http_client
+)
+from clients.http.gateway.accounts.schema import (
+    ACCOUNTS_ROUTE,
+    GetAccountsResponseSchema,
+    GetAccountsQuerySchema,
+    OpenDepositAccountRequestSchema,
+    OpenDepositAccountResponseSchema,
+    OpenSavingsAccountRequestSchema,
+    OpenSavingsAccountResponseSchema,
+    OpenDebitCardAccountRequestSchema,
+    OpenDebitCardAccountResponseSchema,
+    OpenCreditCardAccountRequestSchema,
+    OpenCreditCardAccountResponseSchema
+)
+
+if TYPE_CHECKING:
+    from locust.env import Environment
+
+
+class AsyncAccountsGatewayHTTPClient(AsyncHTTPClient):
+    """
+    Асинхронный клиент для взаимодействия с /api/v1/accounts сервиса http-gateway.
+    """
+
+    async def get_accounts_api(self, query: GetAccountsQuerySchema) -> Response:
+        """
+        Выполняет GET-запрос на получение списка счетов пользователя.
+
+        :param query: Параметры запроса.
+        :return: Объект httpx.Response с данными о счетах.
+        """
+        return await self.get(
+            ACCOUNTS_ROUTE,
+            params=QueryParams(**query.model_dump(by_alias=True)),
+            extensions=HTTPClientExtensions(route=ACCOUNTS_ROUTE)
+        )
+
+    async def open_deposit_account_api(self, request: OpenDepositAccountRequestSchema) -> Response:
+        """
+        Выполняет POST-запрос для открытия депозитного счёта.
+
+        :param request: Данные для открытия счёта.
+        :return: Объект httpx.Response с результатом операции.
+        """
+        return await self.post_schema("/api/v1/accounts/open-deposit-account", request)
+
+    async def open_savings_account_api(self, request: OpenSavingsAccountRequestSchema) -> Response:
+        """
+        Выполняет POST-запрос для открытия сберегательного счёта.
+
+        :param request: Данные для открытия счёта.
+        :return: Объект httpx.Response.
+        """
+        return await self.post_schema("/api/v1/accounts/open-savings-account", request)
+
+    async def open_debit_card_account_api(self, request: OpenDebitCardAccountRequestSchema) -> Response:
+        """
+        Выполняет POST-запрос для открытия дебетовой карты.
+
+        :param request: Данные для открытия счёта.
+        :return: Объект httpx.Response.
+        """
+        return await self.post_schema("/api/v1/accounts/open-debit-card-account", request)
+
+    async def open_credit_card_account_api(self, request: OpenCreditCardAccountRequestSchema) -> Response:
+        """
+        Выполняет POST-запрос для открытия кредитной карты.
+
+        :param request: Данные для открытия счёта.
+        :return: Объект httpx.Response.
+        """
+        return await self.post_schema("/api/v1/accounts/open-credit-card-account", request)
+
+    async def get_accounts(self, user_id: str) -> GetAccountsResponseSchema:
+        """
+        Получить список счетов пользователя.
+
+        :param user_id: ID пользователя
+        :return: Схема ответа со списком счетов
+        """
+        response = await self.get_prepared(
+            ACCOUNTS_ROUTE, query={"user_id": user_id}, query_schema=GetAccountsQuerySchema
+        )
+        return self.validate_response(response, GetAccountsResponseSchema)
+
+    async def open_deposit_account(self, user_id: str) -> OpenDepositAccountResponseSchema:
+        """
+        Открыть депозитный счёт.
+
+        :param user_id: ID пользователя
+        :return: Схема ответа с данными счёта
+        """
+        request = OpenDepositAccountRequestSchema(user_id=user_id)
+        response = await self.open_deposit_account_api(request)
+        return self.validate_response(response, OpenDepositAccountResponseSchema)
+
+    async def open_savings_account(self, user_id: str) -> OpenSavingsAccountResponseSchema:
+        """
+        Открыть сберегательный счёт.
+
+        :param user_id: ID пользователя
+        :return: Схема ответа с данными счёта
+        """
+        request = OpenSavingsAccountRequestSchema(user_id=user_id)
+        response = await self.open_savings_account_api(request)
+        return self.validate_response(response, OpenSavingsAccountResponseSchema)
+
+    async def open_debit_card_account(self, user_id: str) -> OpenDebitCardAccountResponseSchema:
+        """
+        Открыть дебетовый карточный счёт.
+
+        :param user_id: ID пользователя
+        :return: Схема ответа с данными счёта
+        """
+        request = OpenDebitCardAccountRequestSchema(user_id=user_id)
+        response = await self.open_debit_card_account_api(request)
+        return self.validate_response(response, OpenDebitCardAccountResponseSchema)
+
+    async def open_credit_card_account(self, user_id: str) -> OpenCreditCardAccountResponseSchema:
+        """
+        Открыть кредитный карточный счёт.
+
+        :param user_id: ID пользователя
+        :return: Схема ответа с данными счёта
+        """
+        request = OpenCreditCardAccountRequestSchema(user_id=user_id)
+        response = await self.open_credit_card_account_api(request)
+        return self.validate_response(response, OpenCreditCardAccountResponseSchema)
+
+
+def build_accounts_gateway_async_http_client(retry: RetryPolicy | None = None) -> AsyncAccountsGatewayHTTPClient:
+    return AsyncAccountsGatewayHTTPClient(client=build_gateway_async_http_client(), retry=retry)
+
+
+def build_accounts_gateway_async_locust_http_client(
+        environment: "Environment",
+        client: AsyncClient | None = None,
+        validation: ValidationPolicy | None = None,
+        codec: JSONCodec | None = None,
+        retry: RetryPolicy | None = None,
+        hedging: HedgingPolicy | None = None,
+        body_mode: HTTPBodyMode = HTTPBodyMode.BUFFER
+) -> AsyncAccountsGatewayHTTPClient:
+    """
+    Функция создаёт экземпляр AsyncAccountsGatewayHTTPClient, который репортит запросы в статистику Locust.
+
+    :param environment: объект окружения Locust.
+    :param client: общий httpx.AsyncClient с хуками Locust; если не задан, создаётся отдельный клиент.
+    :param validation: политика валидации ответов (по умолчанию каждый ответ валидируется полностью).
+    :param codec: кодек тел запросов и ответов (по умолчанию PydanticJSONCodec).
+    :param retry: политика повторов (по умолчанию запросы не повторяются).
+    :param hedging: политика хеджирования идемпотентных чтений (по умолчанию выключено).
+    :param body_mode: режим чтения тела ответа в хуках Locust (по умолчанию тело читается целиком).
+    :return: экземпляр AsyncAccountsGatewayHTTPClient с хуками сбора метрик.
+    """
+    return AsyncAccountsGatewayHTTPClient(
+        client=client or build_gateway_async_locust_http_client(environment),
+        validation=validation,
+        codec=codec,
+        retry=retry,
+        hedging=hedging,
+        body_mode=body_mode
+    )
@@ -1,12 +1,16 @@
-from httpx import Response, QueryParams
+from httpx import Client, Response, QueryParams
 from locust.env import Environment
 
-from clients.http.client import HTTPClient, HTTPClientExtensions
+from clients.http.codecs import JSONCodec
+from clients.retries import RetryPolicy, HedgingPolicy
+from clients.validation import ValidationPolicy
+from clients.http.client import HTTPClient, HTTPClientExtensions, HTTPBodyMode
 from clients.http.gateway.client import (
     build_gateway_http_client,
     build_gateway_locust_http_client  # Импорт билдера для нагрузочного тестирования
 )
 from clients.http.gateway.accounts.schema import (
+    ACCOUNTS_ROUTE,
     GetAccountsResponseSchema,
     GetAccountsQuerySchema,
     OpenDepositAccountRequestSchema,
@@ -32,7 +36,11 @@ class AccountsGatewayHTTPClient(HTTPClient):
         :param query: Параметры запроса.
         :return: Объект httpx.Response с данными о счетах.
         """
-        return self.get("/api/v1/accounts", params=QueryParams(**query.model_dump(by_alias=True)), extensions=HTTPClientExtensions(route="/api/v1/accounts"))
+        return self.get(
+            ACCOUNTS_ROUTE,
+            params=QueryParams(**query.model_dump(by_alias=True)),
+            extensions=HTTPClientExtensions(route=ACCOUNTS_ROUTE)
+        )
 
     def open_deposit_account_api(self, request: OpenDepositAccountRequestSchema) -> Response:
         """
@@ -41,7 +49,7 @@ class AccountsGatewayHTTPClient(HTTPClient):
         :param request: Данные для открытия счёта.
         :return: Объект httpx.Response с результатом операции.
         """
-        return self.post("/api/v1/accounts/open-deposit-account", json=request.model_dump(by_alias=True))
+        return self.post_schema("/api/v1/accounts/open-deposit-account", request)
 
     def open_savings_account_api(self, request: OpenSavingsAccountRequestSchema) -> Response:
         """
@@ -50,7 +58,7 @@ class AccountsGatewayHTTPClient(HTTPClient):
         :param request: Данные для открытия счёта.
         :return: Объект httpx.Response.
         """
-        return self.post("/api/v1/accounts/open-savings-account", json=request.model_dump(by_alias=True))
+        return self.post_schema("/api/v1/accounts/open-savings-account", request)
 
     def open_debit_card_account_api(self, request: OpenDebitCardAccountRequestSchema) -> Response:
         """
@@ -59,7 +67,7 @@ class AccountsGatewayHTTPClient(HTTPClient):
         :param request: Данные для открытия счёта.
         :return: Объект httpx.Response.
         """
-        return self.post("/api/v1/accounts/open-debit-card-account", json=request.model_dump(by_alias=True))
+        return self.post_schema("/api/v1/accounts/open-debit-card-account", request)
 
     def open_credit_card_account_api(self, request: OpenCreditCardAccountRequestSchema) -> Response:
         """
@@ -68,7 +76,7 @@ class AccountsGatewayHTTPClient(HTTPClient):
         :param request: Данные для открытия счёта.
         :return: Объект httpx.Response.
         """
-        return self.post("/api/v1/accounts/open-credit-card-account", json=request.model_dump(by_alias=True))
+        return self.post_schema("/api/v1/accounts/open-credit-card-account", request)
 
     def get_accounts(self, user_id: str) -> GetAccountsResponseSchema:
         """
@@ -77,9 +85,10 @@ class AccountsGatewayHTTPClient(HTTPClient):
         :param user_id: ID пользователя
         :return: Схема ответа со списком счетов
         """
-        query = GetAccountsQuerySchema(user_id=user_id)
-        response = self.get_accounts_api(query)
-        return GetAccountsResponseSchema.model_validate_json(response.text)
+        response = self.get_prepared(
+            ACCOUNTS_ROUTE, query={"user_id": user_id}, query_schema=GetAccountsQuerySchema
+        )
+        return self.validate_response(response, GetAccountsResponseSchema)
 
     def open_deposit_account(self, user_id: str) -> OpenDepositAccountResponseSchema:
         """
@@ -90,7 +99,7 @@ class AccountsGatewayHTTPClient(HTTPClient):
         """
         request = OpenDepositAccountRequestSchema(user_id=user_id)
         response = self.open_deposit_account_api(request)
-        return OpenDepositAccountResponseSchema.model_validate_json(response.text)
+        return self.validate_response(response, OpenDepositAccountResponseSchema)
 
     def open_savings_account(self, user_id: str) -> OpenSavingsAccountResponseSchema:
         """
@@ -101,7 +110,7 @@ class AccountsGatewayHTTPClient(HTTPClient):
         """
         request = OpenSavingsAccountRequestSchema(user_id=user_id)
         response = self.open_savings_account_api(request)
-        return OpenSavingsAccountResponseSchema.model_validate_json(response.text)
+        return self.validate_response(response, OpenSavingsAccountResponseSchema)
 
     def open_debit_card_account(self, user_id: str) -> OpenDebitCardAccountResponseSchema:
         """
@@ -112,7 +121,7 @@ class AccountsGatewayHTTPClient(HTTPClient):
         """
         request = OpenDebitCardAccountRequestSchema(user_id=user_id)
         response = self.open_debit_card_account_api(request)
-        return OpenDebitCardAccountResponseSchema.model_validate_json(response.text)
+        return self.validate_response(response, OpenDebitCardAccountResponseSchema)
 
     def open_credit_card_account(self, user_id: str) -> OpenCreditCardAccountResponseSchema:
         """
@@ -123,15 +132,23 @@ class AccountsGatewayHTTPClient(HTTPClient):
         """
         request = OpenCreditCardAccountRequestSchema(user_id=user_id)
         response = self.open_credit_card_account_api(request)
-        return OpenCreditCardAccountResponseSchema.model_validate_json(response.text)
+        return self.validate_response(response, OpenCreditCardAccountResponseSchema)
 
 
 # Добавляем builder для AccountsGatewayHTTPClient
-def build_accounts_gateway_http_client() -> AccountsGatewayHTTPClient:
-    return AccountsGatewayHTTPClient(client=build_gateway_http_client())
+def build_accounts_gateway_http_client(retry: RetryPolicy | None = None) -> AccountsGatewayHTTPClient:
+    return AccountsGatewayHTTPClient(client=build_gateway_http_client(), retry=retry)
 
 # Новый билдер для нагрузочного тестирования
-def build_accounts_gateway_locust_http_client(environment: Environment) -> AccountsGatewayHTTPClient:
+def build_accounts_gateway_locust_http_client(
+        environment: Environment,
+        client: Client | None = None,
+        validation: ValidationPolicy | None = None,
+        codec: JSONCodec | None = None,
+        retry: RetryPolicy | None = None,
+        hedging: HedgingPolicy | None = None,
+        body_mode: HTTPBodyMode = HTTPBodyMode.BUFFER
+) -> AccountsGatewayHTTPClient:
     """
     Функция создаёт экземпляр AccountsGatewayHTTPClient адаптированного под Locust.
 
@@ -139,6 +156,21 @@ def build_accounts_gateway_locust_http_client(environment: Environment) -> Accou
     Используется исключительно в нагрузочных тестах.
 
     :param environment: объект окружения Locust.
+    :param client: общий httpx.Client с хуками Locust. Передаётся, чтобы все доменные клиенты
+                   виртуального пользователя работали через один пул соединений;
+                   если не задан, создаётся отдельный клиент.
+    :param validation: политика валидации ответов (по умолчанию каждый ответ валидируется полностью).
+    :param codec: кодек тел запросов и ответов (по умолчанию PydanticJSONCodec).
+    :param retry: политика повторов (по умолчанию запросы не повторяются).
+    :param hedging: политика хеджирования идемпотентных чтений (по умолчанию выключено).
+    :param body_mode: режим чтения тела ответа в хуках Locust (по умолчанию тело читается целиком).
     :return: экземпляр AccountsGatewayHTTPClient с хуками сбора метрик.
     """
-    return AccountsGatewayHTTPClient(client=build_gateway_locust_http_client(environment))
\ No newline at end of file
+    return AccountsGatewayHTTPClient(
+        client=client or build_gateway_locust_http_client(environment),
+        validation=validation,
+        codec=codec,
+        retry=retry,
+        hedging=hedging,
+        body_mode=body_mode
+    )
\ No newline at end of file
@@ -2,6 +2,9 @@ from pydantic import BaseModel, Field, ConfigDict, EmailStr
 from enum import StrEnum
 from clients.http.gateway.cards.schema import CardSchema
 
+# Маршрут чтения счетов: общий для API-метода и подготовленного запроса бизнес-метода клиентов
+ACCOUNTS_ROUTE = "/api/v1/accounts"
+
 
 class AccountType(StrEnum):
     DEPOSIT = "DEPOSIT"
@@ -0,0 +1,54 @@
+import logging
+from typing import TYPE_CHECKING
+
+from httpx import AsyncClient, Limits
+
+from clients.http.event_hooks.async_locust_event_hook import (
+    async_locust_request_event_hook,
+    async_locust_response_event_hook,
+    async_locust_transport_error_event_hook
+)
+
+if TYPE_CHECKING:
+    from locust.env import Environment
+
+
+def build_gateway_async_http_client(max_connections: int = 100) -> AsyncClient:
+    """
+    Функция создаёт экземпляр httpx.AsyncClient с базовыми настройками для сервиса http-gateway.
+
+    Модуль намеренно не импортирует Locust: Locust при импорте патчит стандартную библиотеку через gevent,
+    что несовместимо с asyncio-инструментами (сидинг, replay, soak-пробы), которые используют этот клиент.
+
+    :param max_connections: Максимальное количество одновременно открытых соединений в пуле.
+    :return: Готовый к использованию объект httpx.AsyncClient.
+    """
+    return AsyncClient(
+        timeout=100,
+        base_url="http://localhost:8003",
+        limits=Limits(max_connections=max_connections, max_keepalive_connections=max_connections)
+    )
+
+
+def build_gateway_async_locust_http_client(environment: "Environment", max_connections: int = 100) -> AsyncClient:
+    """
+    Асинхронный HTTP-клиент, который репортит каждый запрос в статистику Locust
+    (аналог build_gateway_locust_http_client).
+
+    Окружение Locust передаётся готовым объектом, поэтому сам модуль Locust здесь не импортируется.
+
+    :param environment: Объект окружения Locust, необходим для генерации событий метрик.
+    :param max_connections: Максимальное количество одновременно открытых соединений в пуле.
+    :return: httpx.AsyncClient с подключёнными асинхронными хуками под нагрузочное тестирование.
+    """
+    logging.getLogger("httpx").setLevel(logging.WARNING)
+
+    return AsyncClient(
+        timeout=100,
+        base_url="http://localhost:8003",
+        limits=Limits(max_connections=max_connections, max_keepalive_connections=max_connections),
+        event_hooks={
+            "request": [async_locust_request_event_hook, async_locust_transport_error_event_hook(environment)],
+            "response": [async_locust_response_event_hook(environment)]
+        }
+    )
@@ -0,0 +1,110 @@
+from typing import TYPE_CHECKING
+
+from httpx import AsyncClient, Response
+
+from clients.http.codecs import JSONCodec
+from clients.retries import RetryPolicy, HedgingPolicy
+from clients.validation import ValidationPolicy
+from clients.http.client import AsyncHTTPClient, HTTPBodyMode
+from clients.http.gateway.async_client import (
+    build_gateway_async_http_client,
+    build_gateway_async_locust_http_client
+)
+from clients.http.gateway.cards.schema import (
+    IssuePhysicalCardResponseSchema,
+    IssueVirtualCardResponseSchema,
+    IssuePhysicalCardRequestSchema,
+    IssueVirtualCardRequestSchema
+)
+
+if TYPE_CHECKING:
+    from locust.env import Environment
+
+
+class AsyncCardsGatewayHTTPClient(AsyncHTTPClient):
+    """
+    Асинхронный клиент для взаимодействия с /api/v1/cards сервиса http-gateway.
+    """
+
+    async def issue_virtual_card_api(self, request: IssueVirtualCardRequestSchema) -> Response:
+        """
+        Создание виртуальной карты.
+
+        :param request: Данные для создания виртуальной карты.
+        :return: Ответ от сервера (объект httpx.Response).
+        """
+        return await self.post_schema("/api/v1/cards/issue-virtual-card", request)
+
+    async def issue_physical_card_api(self, request: IssuePhysicalCardRequestSchema) -> Response:
+        """
+        Создание физической карты.
+
+        :param request: Данные для создания физической карты.
+        :return: Ответ от сервера (объект httpx.Response).
+        """
+        return await self.post_schema("/api/v1/cards/issue-physical-card", request)
+
+    async def issue_virtual_card(self, user_id: str, account_id: str) -> IssueVirtualCardResponseSchema:
+        """
+        Создание виртуальной карты.
+
+        :param user_id: ID пользователя
+        :param account_id: ID аккаунта
+        :return: Схема ответа с данными карты
+        """
+        request = IssueVirtualCardRequestSchema(
+            user_id=user_id,
+            account_id=account_id
+        )
+        response = await self.issue_virtual_card_api(request)
+        return self.validate_response(response, IssueVirtualCardResponseSchema)
+
+    async def issue_physical_card(self, user_id: str, account_id: str) -> IssuePhysicalCardResponseSchema:
+        """
+        Создание физической карты.
+
+        :param user_id: ID пользователя
+        :param account_id: ID аккаунта
+        :return: Схема ответа с данными карты
+        """
+        request = IssuePhysicalCardRequestSchema(
+            user_id=user_id,
+            account_id=account_id
+        )
+        response = await self.issue_physical_card_api(request)
+        return self.validate_response(response, IssuePhysicalCardResponseSchema)
+
+
+def build_cards_gateway_async_http_client(retry: RetryPolicy | None = None) -> AsyncCardsGatewayHTTPClient:
+    return AsyncCardsGatewayHTTPClient(client=build_gateway_async_http_client(), retry=retry)
+
+
+def build_cards_gateway_async_locust_http_client(
+        environment: "Environment",
+        client: AsyncClient | None = None,
+        validation: ValidationPolicy | None = None,
+        codec: JSONCodec | None = None,
+        retry: RetryPolicy | None = None,
+        hedging: HedgingPolicy | None = None,
+        body_mode: HTTPBodyMode = HTTPBodyMode.BUFFER
+) -> AsyncCardsGatewayHTTPClient:
+    """
+    Функция создаёт экземпляр AsyncCardsGatewayHTTPClient, который репортит запросы в статистику Locust.
+
+    :param environment: объект окружения Locust.
+    :param client: общий httpx.AsyncClient с хуками Locust; если не задан, создаётся отдельный клиент.
+    :param validation: политика валидации ответов (по умолчанию каждый ответ валидируется полностью).
+    :param codec: кодек тел запросов и ответов (по умолчанию PydanticJSONCodec).
+    :param retry: политика повторов (по умолчанию запросы не повторяются).
+    :param hedging: политика хеджирования идемпотентных чтений (по умолчанию выключено).
+    :param body_mode: режим чтения тела ответа в хуках Locust (по умолчанию тело читается целиком).
+    :return: экземпляр AsyncCardsGatewayHTTPClient с хуками сбора метрик.
+    """
+    return AsyncCardsGatewayHTTPClient(
+        client=client or build_gateway_async_locust_http_client(environment),
+        validation=validation,
+        codec=codec,
+        retry=retry,
+        hedging=hedging,
+        body_mode=body_mode
+    )
@@ -1,7 +1,10 @@
-from httpx import Response
+from httpx import Client, Response
 from locust.env import Environment
 
-from clients.http.client import HTTPClient
+from clients.http.codecs import JSONCodec
+from clients.retries import RetryPolicy, HedgingPolicy
+from clients.validation import ValidationPolicy
+from clients.http.client import HTTPClient, HTTPBodyMode
 from clients.http.gateway.client import (
     build_gateway_http_client,
     build_gateway_locust_http_client  # Импорт билдера для нагрузочного тестирования
@@ -26,7 +29,7 @@ class CardsGatewayHTTPClient(HTTPClient):
         :param request: Данные для создания виртуальной карты.
         :return: Ответ от сервера (объект httpx.Response).
         """
-        return self.post("/api/v1/cards/issue-virtual-card", json=request.model_dump(by_alias=True))
+        return self.post_schema("/api/v1/cards/issue-virtual-card", request)
 
     def issue_physical_card_api(self, request: IssuePhysicalCardRequestSchema) -> Response:
         """
@@ -35,7 +38,7 @@ class CardsGatewayHTTPClient(HTTPClient):
         :param request: Данные для создания физической карты.
         :return: Ответ от сервера (объект httpx.Response).
         """
-        return self.post("/api/v1/cards/issue-physical-card", json=request.model_dump(by_alias=True))
+        return self.post_schema("/api/v1/cards/issue-physical-card", request)
 
     def issue_virtual_card(self, user_id: str, account_id: str) -> IssueVirtualCardResponseSchema:
         """
@@ -50,7 +53,7 @@ class CardsGatewayHTTPClient(HTTPClient):
             account_id=account_id
         )
         response = self.issue_virtual_card_api(request)
-        return IssueVirtualCardResponseSchema.model_validate_json(response.text)
+        return self.validate_response(response, IssueVirtualCardResponseSchema)
 
     def issue_physical_card(self, user_id: str, account_id: str) -> IssuePhysicalCardResponseSchema:
         """
@@ -65,15 +68,23 @@ class CardsGatewayHTTPClient(HTTPClient):
             account_id=account_id
         )
         response = self.issue_physical_card_api(request)
-        return IssuePhysicalCardResponseSchema.model_validate_json(response.text)
+        return self.validate_response(response, IssuePhysicalCardResponseSchema)
 
 
 # Добавляем builder для CardsGatewayHTTPClient
-def build_cards_gateway_http_client() -> CardsGatewayHTTPClient:
-    return CardsGatewayHTTPClient(client=build_gateway_http_client())
+def build_cards_gateway_http_client(retry: RetryPolicy | None = None) -> CardsGatewayHTTPClient:
+    return CardsGatewayHTTPClient(client=build_gateway_http_client(), retry=retry)
 
 # Новый билдер для нагрузочного тестирования
-def build_cards_gateway_locust_http_client(environment: Environment) -> CardsGatewayHTTPClient:
+def build_cards_gateway_locust_http_client(
+        environment: Environment,
+        client: Client | None = None,
+        validation: ValidationPolicy | None = None,
+        codec: JSONCodec | None = None,
+        retry: RetryPolicy | None = None,
+        hedging: HedgingPolicy | None = None,
+        body_mode: HTTPBodyMode = HTTPBodyMode.BUFFER
+) -> CardsGatewayHTTPClient:
     """
     Функция создаёт экземпляр CardsGatewayHTTPClient адаптированного под Locust.
 
@@ -81,6 +92,21 @@ def build_cards_gateway_locust_http_client(environment: Environment) -> CardsGat
     Используется исключительно в нагрузочных тестах.
 
     :param environment: объект окружения Locust.
+    :param client: общий httpx.Client с хуками Locust. Передаётся, чтобы все доменные клиенты
+                   виртуального пользователя работали через один пул соединений;
+                   если не задан, создаётся отдельный клиент.
+    :param validation: политика валидации ответов (по умолчанию каждый ответ валидируется полностью).
+    :param codec: кодек тел запросов и ответов (по умолчанию PydanticJSONCodec).
+    :param retry: политика повторов (по умолчанию запросы не повторяются).
+    :param hedging: политика хеджирования идемпотентных чтений (по умолчанию выключено).
+    :param body_mode: режим чтения тела ответа в хуках Locust (по умолчанию тело читается целиком).
     :return: экземпляр CardsGatewayHTTPClient с хуками сбора метрик.
     """
-    return CardsGatewayHTTPClient(client=build_gateway_locust_http_client(environment))
\ No newline at end of file
+    return CardsGatewayHTTPClient(
+        client=client or build_gateway_locust_http_client(environment),
+        validation=validation,
+        codec=codec,
+        retry=retry,
+        hedging=hedging,
+        body_mode=body_mode
+    )
\ No newline at end of file
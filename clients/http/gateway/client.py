@@ -1,24 +1,59 @@
 import logging
 
-from httpx import Client
+from httpx import Client, Limits
 from locust.env import Environment  # Импорт окружения Locust для передачи в хуки
 
 from clients.http.event_hooks.locust_event_hook import (
+    HTTPStreamsTracker,  # Счётчик параллельных потоков на соединениях для режима HTTP/2
     locust_request_event_hook,  # Хук для отслеживания начала запроса
+    locust_transport_error_event_hook,  # Хук для репорта попыток, завершившихся ошибкой транспорта
     locust_response_event_hook  # Хук для сбора метрик по завершении запроса
 )
 
 
-def build_gateway_http_client() -> Client:
+def build_gateway_http_client(http2: bool = False) -> Client:
     """
     Функция создаёт экземпляр httpx.Client с базовыми настройками для сервиса http-gateway.
 
+    :param http2: Работать по HTTP/2 (см. build_gateway_locust_http_client).
     :return: Готовый к использованию объект httpx.Client.
     """
-    return Client(timeout=100, base_url="http://localhost:8003")
+    return Client(timeout=100, base_url="http://localhost:8003", http1=not http2, http2=http2)
 
 
-def build_gateway_locust_http_client(environment: Environment) -> Client:
+def build_gateway_locust_event_hooks(environment: Environment, http2: bool, phase_stats: bool) -> dict[str, list]:
+    """
+    Собирает event hooks httpx для клиентов gateway под Locust.
+
+    В режиме HTTP/2 к хукам подключается счётчик потоков HTTPStreamsTracker: его хук запроса идёт после
+    locust_request_event_hook, чтобы обернуть уже установленную трассировку фаз.
+
+    :param environment: Объект окружения Locust, необходим для генерации событий метрик.
+    :param http2: Клиент работает по HTTP/2.
+    :param phase_stats: Репортить фазы запросов отдельными записями статистики Locust.
+    :return: Словарь хуков для параметра event_hooks клиента httpx.
+    """
+    streams_tracker = HTTPStreamsTracker() if http2 else None
+
+    request_hooks = [
+        locust_request_event_hook,  # Отмечаем время начала запроса
+        locust_transport_error_event_hook(environment)  # Репортим попытки без ответа (ошибки соединения)
+    ]
+    if streams_tracker is not None:
+        request_hooks.append(streams_tracker.request_event_hook)  # Считаем открытые потоки HTTP/2
+
+    return {
+        "request": request_hooks,
+        # Собираем метрики и передаём их в Locust
+        "response": [locust_response_event_hook(environment, streams_tracker, phase_stats)]
+    }
+
+
+def build_gateway_locust_http_client(
+        environment: Environment,
+        http2: bool = False,
+        phase_stats: bool = False
+) -> Client:
     """
     HTTP-клиент, предназначенный специально для нагрузочного тестирования с помощью Locust.
 
@@ -26,11 +61,20 @@ def build_gateway_locust_http_client(environment: Environment) -> Client:
     - добавляет хук `locust_request_event_hook` для фиксации времени начала запроса,
     - добавляет хук `locust_response_event_hook`, который вычисляет метрики
     (время ответа, длину ответа и т.д.) и отправляет их в Locust через `environment.events.request`.
+    - добавляет хук `locust_transport_error_event_hook`, через который HTTPClient репортит попытки,
+    завершившиеся ошибкой соединения или таймаутом (ответа нет, и хук ответа для них не срабатывает).
 
     Таким образом, данный клиент автоматически репортит статистику в Locust
     при каждом выполненном HTTP-запросе.
 
+    При http2=True клиент сразу говорит с gateway по HTTP/2 без TLS (prior knowledge, h2c), и запросы
+    мультиплексируются потоками в общих соединениях. В context событий Locust тогда попадают номер потока
+    и количество одновременно передаваемых по соединению ответов. Для режима нужен пакет h2 (httpx[http2]).
+
     :param environment: Объект окружения Locust, необходим для генерации событий метрик.
+    :param http2: Работать по HTTP/2 вместо HTTP/1.1.
+    :param phase_stats: Репортить фазы запросов (pool, connect, tls, send, wait, download) отдельными записями
+                        статистики Locust; в context событий фазы попадают всегда.
     :return: httpx.Client с подключёнными хуками под нагрузочное тестирование.
     """
     # Подавляем INFO-логи httpx (например: "HTTP Request: GET ... 200 OK")
@@ -40,8 +84,51 @@ def build_gateway_locust_http_client(environment: Environment) -> Client:
     return Client(
         timeout=100,
         base_url="http://localhost:8003",
-        event_hooks={
-            "request": [locust_request_event_hook],  # Отмечаем время начала запроса
-            "response": [locust_response_event_hook(environment)]  # Собираем метрики и передаём их в Locust
-        }
-    )
\ No newline at end of file
+        http1=not http2,
+        http2=http2,
+        event_hooks=build_gateway_locust_event_hooks(environment, http2, phase_stats)
+    )
+
+
+def build_shared_gateway_locust_http_client(
+        environment: Environment,
+        max_connections: int = 100,
+        max_keepalive_connections: int = 20,
+        http2: bool = False,
+        phase_stats: bool = False
+) -> Client:
+    """
+    Возвращает один на процесс воркера httpx.Client с хуками Locust и ограниченным пулом соединений.
+
+    Клиент создаётся при первом вызове и сохраняется в окружении Locust, все последующие вызовы с теми же
+    параметрами (от любых виртуальных пользователей этого процесса) получают тот же клиент. Так количество
+    сокетов на генераторе нагрузки определяется лимитами пула, а не числом виртуальных пользователей:
+    при занятом пуле запрос ждёт свободное соединение.
+
+    :param environment: Объект окружения Locust, необходим для генерации событий метрик.
+    :param max_connections: Максимальное количество одновременно открытых соединений.
+    :param max_keepalive_connections: Сколько простаивающих соединений держать открытыми для переиспользования.
+    :param http2: Работать по HTTP/2: виртуальные пользователи процесса делят несколько мультиплексируемых соединений.
+    :param phase_stats: Репортить фазы запросов отдельными записями статистики Locust.
+    :return: Общий httpx.Client с подключёнными хуками под нагрузочное тестирование.
+    """
+    # Клиенты кэшируются по своим параметрам: вызов с другими лимитами, протоколом или phase_stats
+    # получает отдельный клиент, а не молча переиспользует первый созданный
+    key = (max_connections, max_keepalive_connections, http2, phase_stats)
+    clients: dict[tuple, Client] | None = getattr(environment, "gateway_http_clients", None)
+    if clients is None:
+        clients = environment.gateway_http_clients = {}
+
+    if key not in clients:
+        logging.getLogger("httpx").setLevel(logging.WARNING)
+
+        clients[key] = Client(
+            timeout=100,
+            base_url="http://localhost:8003",
+            limits=Limits(max_connections=max_connections, max_keepalive_connections=max_keepalive_connections),
+            http1=not http2,
+            http2=http2,
+            event_hooks=build_gateway_locust_event_hooks(environment, http2, phase_stats)
+        )
+
+    return clients[key]
@@ -0,0 +1,87 @@
+from typing import TYPE_CHECKING
+
+from httpx import AsyncClient, Response
+
+from clients.http.codecs import JSONCodec
+from clients.retries import RetryPolicy, HedgingPolicy
+from clients.validation import ValidationPolicy
+from clients.http.client import AsyncHTTPClient, HTTPClientExtensions, HTTPBodyMode
+from clients.http.gateway.async_client import (
+    build_gateway_async_http_client,
+    build_gateway_async_locust_http_client
+)
+from clients.http.gateway.documents.schema import GetTariffDocumentResponseSchema, GetContractDocumentResponseSchema
+
+if TYPE_CHECKING:
+    from locust.env import Environment
+
+
+class AsyncDocumentsGatewayHTTPClient(AsyncHTTPClient):
+    """
+    Асинхронный клиент для взаимодействия с /api/v1/documents сервиса http-gateway.
+    """
+
+    async def get_tariff_document_api(self, account_id: str) -> Response:
+        """
+        Получить документ тарифа по счету.
+        :param account_id: Идентификатор счета.
+        :return: Ответ от сервера (объект httpx.Response).
+        """
+        return await self.get(
+            f"/api/v1/documents/tariff-document/{account_id}",
+            extensions=HTTPClientExtensions(route="/api/v1/documents/tariff-document/{account_id}")
+        )
+
+    async def get_contract_document_api(self, account_id: str) -> Response:
+        """
+        Получить документ контракта по счету.
+        :param account_id: Идентификатор счета.
+        :return: Ответ от сервера (объект httpx.Response).
+        """
+        return await self.get(
+            f"/api/v1/documents/contract-document/{account_id}",
+            extensions=HTTPClientExtensions(route="/api/v1/documents/contract-document/{account_id}")
+        )
+
+    async def get_tariff_document(self, account_id: str) -> GetTariffDocumentResponseSchema:
+        response = await self.get_prepared("/api/v1/documents/tariff-document/{account_id}", account_id=account_id)
+        return self.validate_response(response, GetTariffDocumentResponseSchema)
+
+    async def get_contract_document(self, account_id: str) -> GetContractDocumentResponseSchema:
+        response = await self.get_prepared("/api/v1/documents/contract-document/{account_id}", account_id=account_id)
+        return self.validate_response(response, GetContractDocumentResponseSchema)
+
+
+def build_documents_gateway_async_http_client(retry: RetryPolicy | None = None) -> AsyncDocumentsGatewayHTTPClient:
+    return AsyncDocumentsGatewayHTTPClient(client=build_gateway_async_http_client(), retry=retry)
+
+
+def build_documents_gateway_async_locust_http_client(
+        environment: "Environment",
+        client: AsyncClient | None = None,
+        validation: ValidationPolicy | None = None,
+        codec: JSONCodec | None = None,
+        retry: RetryPolicy | None = None,
+        hedging: HedgingPolicy | None = None,
+        body_mode: HTTPBodyMode = HTTPBodyMode.BUFFER
+) -> AsyncDocumentsGatewayHTTPClient:
+    """
+    Функция создаёт экземпляр AsyncDocumentsGatewayHTTPClient, который репортит запросы в статистику Locust.
+
+    :param environment: объект окружения Locust.
+    :param client: общий httpx.AsyncClient с хуками Locust; если не задан, создаётся отдельный клиент.
+    :param validation: политика валидации ответов (по умолчанию каждый ответ валидируется полностью).
+    :param codec: кодек тел запросов и ответов (по умолчанию PydanticJSONCodec).
+    :param retry: политика повторов (по умолчанию запросы не повторяются).
+    :param hedging: политика хеджирования идемпотентных чтений (по умолчанию выключено).
+    :param body_mode: режим чтения тела ответа в хуках Locust (по умолчанию тело читается целиком).
+    :return: экземпляр AsyncDocumentsGatewayHTTPClient с хуками сбора метрик.
+    """
+    return AsyncDocumentsGatewayHTTPClient(
+        client=client or build_gateway_async_locust_http_client(environment),
+        validation=validation,
+        codec=codec,
+        retry=retry,
+        hedging=hedging,
+        body_mode=body_mode
+    )
@@ -1,7 +1,10 @@
-from httpx import Response
+from httpx import Client, Response
 from locust.env import Environment
 
-from clients.http.client import HTTPClient, HTTPClientExtensions
+from clients.http.codecs import JSONCodec
+from clients.retries import RetryPolicy, HedgingPolicy
+from clients.validation import ValidationPolicy
+from clients.http.client import HTTPClient, HTTPClientExtensions, HTTPBodyMode
 from clients.http.gateway.client import (
     build_gateway_http_client,
     build_gateway_locust_http_client  # Импорт билдера для нагрузочного тестирования
@@ -36,8 +39,8 @@ class DocumentsGatewayHTTPClient(HTTPClient):
         :param account_id: Идентификатор счета.
         :return: Распарсенный ответ от сервера.
         """
-        response = self.get_tariff_document_api(account_id)
-        return GetTariffDocumentResponseSchema.model_validate_json(response.text)
+        response = self.get_prepared("/api/v1/documents/tariff-document/{account_id}", account_id=account_id)
+        return self.validate_response(response, GetTariffDocumentResponseSchema)
 
     def get_contract_document(self, account_id: str) -> GetContractDocumentResponseSchema:
         """
@@ -45,16 +48,24 @@ class DocumentsGatewayHTTPClient(HTTPClient):
         :param account_id: Идентификатор счета.
         :return: Распарсенный ответ от сервера.
         """
-        response = self.get_contract_document_api(account_id)
-        return GetContractDocumentResponseSchema.model_validate_json(response.text)
+        response = self.get_prepared("/api/v1/documents/contract-document/{account_id}", account_id=account_id)
+        return self.validate_response(response, GetContractDocumentResponseSchema)
 
 
 # Добавляем builder для DocumentsGatewayHTTPClient
-def build_documents_gateway_http_client() -> DocumentsGatewayHTTPClient:
-    return DocumentsGatewayHTTPClient(client=build_gateway_http_client())
+def build_documents_gateway_http_client(retry: RetryPolicy | None = None) -> DocumentsGatewayHTTPClient:
+    return DocumentsGatewayHTTPClient(client=build_gateway_http_client(), retry=retry)
 
 # Новый билдер для нагрузочного тестирования
-def build_documents_gateway_locust_http_client(environment: Environment) -> DocumentsGatewayHTTPClient:
+def build_documents_gateway_locust_http_client(
+        environment: Environment,
+        client: Client | None = None,
+        validation: ValidationPolicy | None = None,
+        codec: JSONCodec | None = None,
+        retry: RetryPolicy | None = None,
+        hedging: HedgingPolicy | None = None,
+        body_mode: HTTPBodyMode = HTTPBodyMode.BUFFER
+) -> DocumentsGatewayHTTPClient:
     """
     Функция создаёт экземпляр DocumentsGatewayHTTPClient адаптированного под Locust.
 
@@ -62,6 +73,21 @@ def build_documents_gateway_locust_http_client(environment: Environment) -> Docu
     Используется исключительно в нагрузочных тестах.
 
     :param environment: объект окружения Locust.
+    :param client: общий httpx.Client с хуками Locust. Передаётся, чтобы все доменные клиенты
+                   виртуального пользователя работали через один пул соединений;
+                   если не задан, создаётся отдельный клиент.
+    :param validation: политика валидации ответов (по умолчанию каждый ответ валидируется полностью).
+    :param codec: кодек тел запросов и ответов (по умолчанию PydanticJSONCodec).
+    :param retry: политика повторов (по умолчанию запросы не повторяются).
+    :param hedging: политика хеджирования идемпотентных чтений (по умолчанию выключено).
+    :param body_mode: режим чтения тела ответа в хуках Locust (по умолчанию тело читается целиком).
     :return: экземпляр DocumentsGatewayHTTPClient с хуками сбора метрик.
     """
-    return DocumentsGatewayHTTPClient(client=build_gateway_locust_http_client(environment))
\ No newline at end of file
+    return DocumentsGatewayHTTPClient(
+        client=client or build_gateway_locust_http_client(environment),
+        validation=validation,
+        codec=codec,
+        retry=retry,
+        hedging=hedging,
+        body_mode=body_mode
+    )
\ No newline at end of file
@@ -1,4 +1,6 @@
+from httpx import Client
 from locust import TaskSet, SequentialTaskSet
+from locust.env import Environment
 
 # Импортируем типы и билдеры для построения HTTP API клиентов
 from clients.http.gateway.accounts.client import AccountsGatewayHTTPClient, build_accounts_gateway_locust_http_client
@@ -11,15 +13,41 @@ from clients.http.gateway.operations.client import (
     OperationsGatewayHTTPClient,
     build_operations_gateway_locust_http_client
 )
+from clients.http.gateway.client import build_gateway_locust_http_client, build_shared_gateway_locust_http_client
 from clients.http.gateway.users.client import UsersGatewayHTTPClient, build_users_gateway_locust_http_client
+from clients.http.client import HTTPBodyMode
+from clients.http.codecs import JSONCodec, PYDANTIC_JSON_CODEC
+from clients.retries import RetryPolicy, HedgingPolicy
+from clients.validation import ValidationPolicy, FULL_VALIDATION
 
 
-class GatewayHTTPTaskSet(TaskSet):
+def build_gateway_locust_task_set_http_client(
+        environment: Environment,
+        shared_http_client: bool,
+        http2: bool = False,
+        phase_stats: bool = False
+) -> Client:
     """
-    Базовый TaskSet для HTTP-сценариев, работающих с http-gateway.
+    Создаёт httpx.Client, через который работают все доменные клиенты одного таск-сета.
 
-    Здесь создаются все необходимые API клиенты, которые будут доступны в последующих задачах (task).
-    Используется, если порядок выполнения задач внутри таск-сета не имеет значения.
+    :param environment: Объект окружения Locust.
+    :param shared_http_client: Использовать общий на процесс воркера пул соединений
+                               вместо отдельного пула на каждого виртуального пользователя.
+    :param http2: Работать с gateway по HTTP/2.
+    :param phase_stats: Репортить фазы запросов отдельными записями статистики Locust.
+    :return: httpx.Client с хуками Locust.
+    """
+    if shared_http_client:
+        return build_shared_gateway_locust_http_client(environment, http2=http2, phase_stats=phase_stats)
+
+    return build_gateway_locust_http_client(environment, http2=http2, phase_stats=phase_stats)
+
+
+class GatewayHTTPClientsMixin:
+    """
+    Общая часть таск-сетов http-gateway: настройки клиентов и создание API клиентов в on_start.
+
+    Все доменные клиенты работают через один httpx.Client таск-сета и получают одни и те же политики.
     """
 
     # Аннотации полей с клиентами (появятся в self после on_start)
@@ -29,38 +57,73 @@ class GatewayHTTPTaskSet(TaskSet):
     documents_gateway_client: DocumentsGatewayHTTPClient
     operations_gateway_client: OperationsGatewayHTTPClient
 
+    # Использовать общий на процесс воркера пул соединений (build_shared_gateway_locust_http_client)
+    shared_http_client: bool = False
+    # Работать с gateway по HTTP/2 с мультиплексированием запросов в соединении
+    http2: bool = False
+    # Репортить фазы запросов (pool, connect, tls, send, wait, download) отдельными записями статистики Locust
+    http_phase_stats: bool = False
+    # Политика валидации ответов; под нагрузкой можно задать ValidationPolicy(ValidationMode.SAMPLED)
+    validation: ValidationPolicy = FULL_VALIDATION
+    # Кодек тел запросов и ответов; для сравнения под нагрузкой — build_json_codec("orjson") и т.п.
+    codec: JSONCodec = PYDANTIC_JSON_CODEC
+    # Повторы (RetryPolicy) и хеджирование идемпотентных чтений (HedgingPolicy); по умолчанию выключены
+    retry: RetryPolicy | None = None
+    hedging: HedgingPolicy | None = None
+    # Режим чтения тел ответов в хуках Locust: HTTPBodyMode.DISCARD — для чистых тестов пропускной способности,
+    # только вместе с validation = NO_VALIDATION
+    http_body_mode: HTTPBodyMode = HTTPBodyMode.BUFFER
+    http_client: Client
+
     def on_start(self) -> None:
         """
-        Метод вызывается перед запуском задач TaskSet.
+        Метод вызывается перед запуском задач таск-сета.
         Здесь создаются API клиенты с использованием контекста окружения Locust.
         """
-        self.users_gateway_client = build_users_gateway_locust_http_client(self.user.environment)
-        self.cards_gateway_client = build_cards_gateway_locust_http_client(self.user.environment)
-        self.accounts_gateway_client = build_accounts_gateway_locust_http_client(self.user.environment)
-        self.documents_gateway_client = build_documents_gateway_locust_http_client(self.user.environment)
-        self.operations_gateway_client = build_operations_gateway_locust_http_client(self.user.environment)
+        environment = self.user.environment
+        # Один пул соединений на виртуального пользователя (или на процесс) вместо пяти — по одному на клиент
+        self.http_client = build_gateway_locust_task_set_http_client(
+            environment,
+            shared_http_client=self.shared_http_client,
+            http2=self.http2,
+            phase_stats=self.http_phase_stats
+        )
+
+        options = dict(
+            client=self.http_client,
+            validation=self.validation,
+            codec=self.codec,
+            retry=self.retry,
+            hedging=self.hedging,
+            body_mode=self.http_body_mode
+        )
+        self.users_gateway_client = build_users_gateway_locust_http_client(environment, **options)
+        self.cards_gateway_client = build_cards_gateway_locust_http_client(environment, **options)
+        self.accounts_gateway_client = build_accounts_gateway_locust_http_client(environment, **options)
+        self.documents_gateway_client = build_documents_gateway_locust_http_client(environment, **options)
+        self.operations_gateway_client = build_operations_gateway_locust_http_client(environment, **options)
+
+    def on_stop(self) -> None:
+        """
+        Закрывает собственный пул соединений виртуального пользователя. Общий пул процесса не закрывается.
+        """
+        if not self.shared_http_client:
+            self.http_client.close()
+
+
+class GatewayHTTPTaskSet(GatewayHTTPClientsMixin, TaskSet):
+    """
+    Базовый TaskSet для HTTP-сценариев, работающих с http-gateway.
+
+    Здесь создаются все необходимые API клиенты, которые будут доступны в последующих задачах (task).
+    Используется, если порядок выполнения задач внутри таск-сета не имеет значения.
+    """
 
 
-class GatewayHTTPSequentialTaskSet(SequentialTaskSet):
+class GatewayHTTPSequentialTaskSet(GatewayHTTPClientsMixin, SequentialTaskSet):
     """
     Базовый SequentialTaskSet для HTTP-сценариев, где важен порядок выполнения задач.
 
     Задачи внутри такого таск-сета будут выполняться строго по очереди — сверху вниз.
     Также здесь инициализируются те же API клиенты, что и в обычном TaskSet.
     """
-
-    users_gateway_client: UsersGatewayHTTPClient
-    cards_gateway_client: CardsGatewayHTTPClient
-    accounts_gateway_client: AccountsGatewayHTTPClient
-    documents_gateway_client: DocumentsGatewayHTTPClient
-    operations_gateway_client: OperationsGatewayHTTPClient
-
-    def on_start(self) -> None:
-        """
-        Создание API клиентов для последовательного сценария.
-        """
-        self.users_gateway_client = build_users_gateway_locust_http_client(self.user.environment)
-        self.cards_gateway_client = build_cards_gateway_locust_http_client(self.user.environment)
-        self.accounts_gateway_client = build_accounts_gateway_locust_http_client(self.user.environment)
-        self.documents_gateway_client = build_documents_gateway_locust_http_client(self.user.environment)
-        self.operations_gateway_client = build_operations_gateway_locust_http_client(self.user.environment)
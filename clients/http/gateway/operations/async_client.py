@@ -0,0 +1,333 @@
+from typing import TYPE_CHECKING
+
+from httpx import AsyncClient, Response, QueryParams
+
+from clients.http.codecs import JSONCodec
+from clients.retries import RetryPolicy, HedgingPolicy
+from clients.validation import ValidationPolicy
+from clients.http.client import AsyncHTTPClient, HTTPClientExtensions, HTTPBodyMode
+from clients.http.gateway.async_client import (
+    build_gateway_async_http_client,
+    build_gateway_async_locust_http_client
+)
+from clients.http.gateway.operations.schema import (
+    OPERATIONS_ROUTE, OPERATION_RECEIPT_ROUTE, OPERATIONS_SUMMARY_ROUTE,
+    GetOperationsQuerySchema, GetOperationsResponseSchema,
+    GetOperationQuerySchema, GetOperationResponseSchema,
+    GetOperationsReceiptQuerySchema, GetOperationReceiptResponseSchema,
+    GetOperationsSummaryQuerySchema, GetOperationsSummaryResponseSchema,
+    MakeFeeOperationRequestSchema, MakeFeeOperationResponseSchema,
+    MakeTopUpOperationRequestSchema, MakeTopUpOperationResponseSchema,
+    MakeCashbackOperationRequestSchema, MakeCashbackOperationResponseSchema,
+    MakeTransferOperationRequestSchema, MakeTransferOperationResponseSchema,
+    MakePurchaseOperationRequestSchema, MakePurchaseOperationResponseSchema,
+    MakeBillPaymentOperationRequestSchema, MakeBillPaymentOperationResponseSchema,
+    MakeCashWithdrawalOperationRequestSchema, MakeCashWithdrawalOperationResponseSchema
+)
+
+if TYPE_CHECKING:
+    from locust.env import Environment
+
+
+class AsyncOperationsGatewayHTTPClient(AsyncHTTPClient):
+    """
+    Асинхронный клиент для взаимодействия с /api/v1/operations сервиса http-gateway.
+    """
+
+    # НИЗКОУРОВНЕВЫЕ API-МЕТОДЫ (работа с сырыми HTTP-ответами)
+
+    async def get_operation_api(self, query: GetOperationQuerySchema) -> Response:
+        """
+        Получить информацию об операции через query-параметры.
+        Согласно схеме, operation_id передается как query-параметр.
+        """
+        return await self.get(
+            OPERATIONS_ROUTE,
+            params=QueryParams(**query.model_dump(by_alias=True)),
+            extensions=HTTPClientExtensions(route=OPERATIONS_ROUTE)
+        )
+
+    async def get_operation_receipt_api(self, query: GetOperationsReceiptQuerySchema) -> Response:
+        """
+        Получить чек операции через query-параметры.
+        Согласно схеме, operation_id передается как query-параметр.
+        """
+        return await self.get(
+            OPERATION_RECEIPT_ROUTE,
+            params=QueryParams(**query.model_dump(by_alias=True)),
+            extensions=HTTPClientExtensions(route=OPERATION_RECEIPT_ROUTE)
+        )
+
+    async def get_operations_api(self, query: GetOperationsQuerySchema) -> Response:
+        """
+        Получить список операций для конкретного счёта.
+        Согласно схеме, принимает только account_id.
+        """
+        return await self.get(
+            OPERATIONS_ROUTE,
+            params=QueryParams(**query.model_dump(by_alias=True)),
+            extensions=HTTPClientExtensions(route=OPERATIONS_ROUTE)
+        )
+
+    async def get_operations_summary_api(self, query: GetOperationsSummaryQuerySchema) -> Response:
+        """
+        Получить сводную информацию по операциям счёта.
+        Согласно схеме, принимает только account_id.
+        """
+        return await self.get(
+            OPERATIONS_SUMMARY_ROUTE,
+            params=QueryParams(**query.model_dump(by_alias=True)),
+            extensions=HTTPClientExtensions(route=OPERATIONS_SUMMARY_ROUTE)
+        )
+
+    async def make_fee_operation_api(self, request: MakeFeeOperationRequestSchema) -> Response:
+        return await self.post_schema("/api/v1/operations/make-fee-operation", request)
+
+    async def make_top_up_operation_api(self, request: MakeTopUpOperationRequestSchema) -> Response:
+        return await self.post_schema("/api/v1/operations/make-top-up-operation", request)
+
+    async def make_cashback_operation_api(self, request: MakeCashbackOperationRequestSchema) -> Response:
+        return await self.post_schema("/api/v1/operations/make-cashback-operation", request)
+
+    async def make_transfer_operation_api(self, request: MakeTransferOperationRequestSchema) -> Response:
+        return await self.post_schema("/api/v1/operations/make-transfer-operation", request)
+
+    async def make_purchase_operation_api(self, request: MakePurchaseOperationRequestSchema) -> Response:
+        return await self.post_schema("/api/v1/operations/make-purchase-operation", request)
+
+    async def make_bill_payment_operation_api(self, request: MakeBillPaymentOperationRequestSchema) -> Response:
+        return await self.post_schema("/api/v1/operations/make-bill-payment-operation", request)
+
+    async def make_cash_withdrawal_operation_api(self, request: MakeCashWithdrawalOperationRequestSchema) -> Response:
+        return await self.post_schema("/api/v1/operations/make-cash-withdrawal-operation", request)
+
+    # БИЗНЕС-МЕТОДЫ (высокоуровневые, возвращают валидированные схемы)
+
+    async def get_operation(self, operation_id: str) -> GetOperationResponseSchema:
+        """
+        Получить информацию об операции по её идентификатору.
+
+        Args:
+            operation_id: Идентификатор операции
+
+        Returns:
+            Валидированная схема с информацией об операции
+        """
+        response = await self.get_prepared(
+            OPERATIONS_ROUTE, query={"operation_id": operation_id}, query_schema=GetOperationQuerySchema
+        )
+        return self.validate_response(response, GetOperationResponseSchema)
+
+    async def get_operation_receipt(self, operation_id: str) -> GetOperationReceiptResponseSchema:
+        """
+        Получить чек операции по её идентификатору.
+
+        Args:
+            operation_id: Идентификатор операции
+
+        Returns:
+            Валидированная схема с информацией о чеке операции
+        """
+        response = await self.get_prepared(
+            OPERATION_RECEIPT_ROUTE, query={"operation_id": operation_id}, query_schema=GetOperationsReceiptQuerySchema
+        )
+        return self.validate_response(response, GetOperationReceiptResponseSchema)
+
+    async def get_operations(self, account_id: str) -> GetOperationsResponseSchema:
+        """
+        Получить список операций для конкретного счёта.
+
+        Args:
+            account_id: Идентификатор счёта
+
+        Returns:
+            Валидированная схема со списком операций
+        """
+        response = await self.get_prepared(
+            OPERATIONS_ROUTE, query={"account_id": account_id}, query_schema=GetOperationsQuerySchema
+        )
+        return self.validate_response(response, GetOperationsResponseSchema)
+
+    async def get_operations_summary(self, account_id: str) -> GetOperationsSummaryResponseSchema:
+        """
+        Получить сводную информацию по операциям счёта.
+
+        Args:
+            account_id: Идентификатор счёта
+
+        Returns:
+            Валидированная схема со сводной информацией об операциях
+        """
+        response = await self.get_prepared(
+            OPERATIONS_SUMMARY_ROUTE, query={"account_id": account_id}, query_schema=GetOperationsSummaryQuerySchema
+        )
+        return self.validate_response(response, GetOperationsSummaryResponseSchema)
+
+    async def make_fee_operation(self, card_id: str, account_id: str) -> MakeFeeOperationResponseSchema:
+        """
+        Создать операцию комиссии.
+
+        Args:
+            card_id: Идентификатор карты
+            account_id: Идентификатор счёта
+
+        Returns:
+            Валидированная схема с информацией о созданной операции комиссии
+        """
+        request = MakeFeeOperationRequestSchema(
+            card_id=card_id,
+            account_id=account_id
+        )
+        response = await self.make_fee_operation_api(request)
+        return self.validate_response(response, MakeFeeOperationResponseSchema)
+
+    async def make_top_up_operation(self, card_id: str, account_id: str) -> MakeTopUpOperationResponseSchema:
+        """
+        Создать операцию пополнения.
+
+        Args:
+            card_id: Идентификатор карты
+            account_id: Идентификатор счёта
+
+        Returns:
+            Валидированная схема с информацией о созданной операции пополнения
+        """
+        request = MakeTopUpOperationRequestSchema(
+            card_id=card_id,
+            account_id=account_id
+        )
+        response = await self.make_top_up_operation_api(request)
+        return self.validate_response(response, MakeTopUpOperationResponseSchema)
+
+    async def make_cashback_operation(self, card_id: str, account_id: str) -> MakeCashbackOperationResponseSchema:
+        """
+        Создать операцию кэшбэка.
+
+        Args:
+            card_id: Идентификатор карты
+            account_id: Идентификатор счёта
+
+        Returns:
+            Валидированная схема с информацией о созданной операции кэшбэка
+        """
+        request = MakeCashbackOperationRequestSchema(
+            card_id=card_id,
+            account_id=account_id
+        )
+        response = await self.make_cashback_operation_api(request)
+        return self.validate_response(response, MakeCashbackOperationResponseSchema)
+
+    async def make_transfer_operation(self, card_id: str, account_id: str) -> MakeTransferOperationResponseSchema:
+        """
+        Создать операцию перевода.
+
+        Args:
+            card_id: Идентификатор карты
+            account_id: Идентификатор счёта
+
+        Returns:
+            Валидированная схема с информацией о созданной операции перевода
+        """
+        request = MakeTransferOperationRequestSchema(
+            card_id=card_id,
+            account_id=account_id
+        )
+        response = await self.make_transfer_operation_api(request)
+        return self.validate_response(response, MakeTransferOperationResponseSchema)
+
+    async def make_purchase_operation(self, card_id: str, account_id: str) -> MakePurchaseOperationResponseSchema:
+        """
+        Создать операцию покупки.
+
+        Args:
+            card_id: Идентификатор карты
+            account_id: Идентификатор счёта
+
+        Returns:
+            Валидированная схема с информацией о созданной операции покупки
+        """
+        request = MakePurchaseOperationRequestSchema(
+            card_id=card_id,
+            account_id=account_id
+        )
+        response = await self.make_purchase_operation_api(request)
+        return self.validate_response(response, MakePurchaseOperationResponseSchema)
+
+    async def make_bill_payment_operation(
+            self,
+            card_id: str,
+            account_id: str
+    ) -> MakeBillPaymentOperationResponseSchema:
+        """
+        Создать операцию оплаты счёта.
+
+        Args:
+            card_id: Идентификатор карты
+            account_id: Идентификатор счёта
+
+        Returns:
+            Валидированная схема с информацией о созданной операции оплаты счёта
+        """
+        request = MakeBillPaymentOperationRequestSchema(
+            card_id=card_id,
+            account_id=account_id
+        )
+        response = await self.make_bill_payment_operation_api(request)
+        return self.validate_response(response, MakeBillPaymentOperationResponseSchema)
+
+    async def make_cash_withdrawal_operation(
+            self,
+            card_id: str,
+            account_id: str
+    ) -> MakeCashWithdrawalOperationResponseSchema:
+        """
+        Создать операцию снятия наличных.
+
+        Args:
+            card_id: Идентификатор карты
+            account_id: Идентификатор счёта
+
+        Returns:
+            Валидированная схема с информацией о созданной операции снятия наличных
+        """
+        request = MakeCashWithdrawalOperationRequestSchema(
+            card_id=card_id,
+            account_id=account_id
+        )
+        response = await self.make_cash_withdrawal_operation_api(request)
+        return self.validate_response(response, MakeCashWithdrawalOperationResponseSchema)
+
+
+def build_operations_gateway_async_http_client(retry: RetryPolicy | None = None) -> AsyncOperationsGatewayHTTPClient:
+    return AsyncOperationsGatewayHTTPClient(client=build_gateway_async_http_client(), retry=retry)
+
+
+def build_operations_gateway_async_locust_http_client(
+        environment: "Environment",
+        client: AsyncClient | None = None,
+        validation: ValidationPolicy | None = None,
+        codec: JSONCodec | None = None,
+        retry: RetryPolicy | None = None,
+        hedging: HedgingPolicy | None = None,
+        body_mode: HTTPBodyMode = HTTPBodyMode.BUFFER
+) -> AsyncOperationsGatewayHTTPClient:
+    """
+    Функция создаёт экземпляр AsyncOperationsGatewayHTTPClient, который репортит запросы в статистику Locust.
+
+    :param environment: объект окружения Locust.
+    :param client: общий httpx.AsyncClient с хуками Locust; если не задан, создаётся отдельный клиент.
+    :param validation: политика валидации ответов (по умолчанию каждый ответ валидируется полностью).
+    :param codec: кодек тел запросов и ответов (по умолчанию PydanticJSONCodec).
+    :param retry: политика повторов (по умолчанию запросы не повторяются).
+    :param hedging: политика хеджирования идемпотентных чтений (по умолчанию выключено).
+    :param body_mode: режим чтения тела ответа в хуках Locust (по умолчанию тело читается целиком).
+    :return: экземпляр AsyncOperationsGatewayHTTPClient с хуками сбора метрик.
+    """
+    return AsyncOperationsGatewayHTTPClient(
+        client=client or build_gateway_async_locust_http_client(environment),
+        validation=validation,
+        codec=codec,
+        retry=retry,
+        hedging=hedging,
+        body_mode=body_mode
+    )
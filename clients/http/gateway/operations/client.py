@@ -1,11 +1,15 @@
-from httpx import Response, QueryParams
+from httpx import Client, Response, QueryParams
 from locust.env import Environment
 
-from clients.http.client import HTTPClient, HTTPClientExtensions
+from clients.http.codecs import JSONCodec
+from clients.retries import RetryPolicy, HedgingPolicy
+from clients.validation import ValidationPolicy
+from clients.http.client import HTTPClient, HTTPClientExtensions, HTTPBodyMode
 from clients.http.gateway.client import (build_gateway_http_client,
                                          build_gateway_locust_http_client)
 
 from clients.http.gateway.operations.schema import (
+    OPERATIONS_ROUTE, OPERATION_RECEIPT_ROUTE, OPERATIONS_SUMMARY_ROUTE,
     GetOperationsQuerySchema, GetOperationsResponseSchema,
     GetOperationQuerySchema, GetOperationResponseSchema,
     GetOperationsReceiptQuerySchema, GetOperationReceiptResponseSchema,
@@ -29,9 +33,9 @@ class OperationsGatewayHTTPClient(HTTPClient):
         Согласно схеме, operation_id передается как query-параметр.
         """
         return self.get(
-            "/api/v1/operations",
+            OPERATIONS_ROUTE,
             params=QueryParams(**query.model_dump(by_alias=True)),
-            extensions=HTTPClientExtensions(route="/api/v1/operations")
+            extensions=HTTPClientExtensions(route=OPERATIONS_ROUTE)
         )
 
     def get_operation_receipt_api(self, query: GetOperationsReceiptQuerySchema) -> Response:
@@ -40,9 +44,9 @@ class OperationsGatewayHTTPClient(HTTPClient):
         Согласно схеме, operation_id передается как query-параметр.
         """
         return self.get(
-            "/api/v1/operations/operation-receipt",
+            OPERATION_RECEIPT_ROUTE,
             params=QueryParams(**query.model_dump(by_alias=True)),
-            extensions=HTTPClientExtensions(route="/api/v1/operations/operation-receipt")
+            extensions=HTTPClientExtensions(route=OPERATION_RECEIPT_ROUTE)
         )
 
     def get_operations_api(self, query: GetOperationsQuerySchema) -> Response:
@@ -51,9 +55,9 @@ class OperationsGatewayHTTPClient(HTTPClient):
         Согласно схеме, принимает только account_id.
         """
         return self.get(
-            "/api/v1/operations",
+            OPERATIONS_ROUTE,
             params=QueryParams(**query.model_dump(by_alias=True)),
-            extensions=HTTPClientExtensions(route="/api/v1/operations")
+            extensions=HTTPClientExtensions(route=OPERATIONS_ROUTE)
         )
 
     def get_operations_summary_api(self, query: GetOperationsSummaryQuerySchema) -> Response:
@@ -62,31 +66,31 @@ class OperationsGatewayHTTPClient(HTTPClient):
         Согласно схеме, принимает только account_id.
         """
         return self.get(
-            "/api/v1/operations/operations-summary",
+            OPERATIONS_SUMMARY_ROUTE,
             params=QueryParams(**query.model_dump(by_alias=True)),
-            extensions=HTTPClientExtensions(route="/api/v1/operations/operations-summary")
+            extensions=HTTPClientExtensions(route=OPERATIONS_SUMMARY_ROUTE)
         )
 
     def make_fee_operation_api(self, request: MakeFeeOperationRequestSchema) -> Response:
-        return self.post("/api/v1/operations/make-fee-operation", json=request.model_dump(by_alias=True))
+        return self.post_schema("/api/v1/operations/make-fee-operation", request)
 
     def make_top_up_operation_api(self, request: MakeTopUpOperationRequestSchema) -> Response:
-        return self.post("/api/v1/operations/make-top-up-operation", json=request.model_dump(by_alias=True))
+        return self.post_schema("/api/v1/operations/make-top-up-operation", request)
 
     def make_cashback_operation_api(self, request: MakeCashbackOperationRequestSchema) -> Response:
-        return self.post("/api/v1/operations/make-cashback-operation", json=request.model_dump(by_alias=True))
+        return self.post_schema("/api/v1/operations/make-cashback-operation", request)
 
     def make_transfer_operation_api(self, request: MakeTransferOperationRequestSchema) -> Response:
-        return self.post("/api/v1/operations/make-transfer-operation", json=request.model_dump(by_alias=True))
+        return self.post_schema("/api/v1/operations/make-transfer-operation", request)
 
     def make_purchase_operation_api(self, request: MakePurchaseOperationRequestSchema) -> Response:
-        return self.post("/api/v1/operations/make-purchase-operation", json=request.model_dump(by_alias=True))
+        return self.post_schema("/api/v1/operations/make-purchase-operation", request)
 
     def make_bill_payment_operation_api(self, request: MakeBillPaymentOperationRequestSchema) -> Response:
-        return self.post("/api/v1/operations/make-bill-payment-operation", json=request.model_dump(by_alias=True))
+        return self.post_schema("/api/v1/operations/make-bill-payment-operation", request)
 
     def make_cash_withdrawal_operation_api(self, request: MakeCashWithdrawalOperationRequestSchema) -> Response:
-        return self.post("/api/v1/operations/make-cash-withdrawal-operation", json=request.model_dump(by_alias=True))
+        return self.post_schema("/api/v1/operations/make-cash-withdrawal-operation", request)
 
     # БИЗНЕС-МЕТОДЫ (высокоуровневые, возвращают валидированные схемы)
 
@@ -100,9 +104,10 @@ class OperationsGatewayHTTPClient(HTTPClient):
         Returns:
             Валидированная схема с информацией об операции
         """
-        query = GetOperationQuerySchema(operation_id=operation_id)
-        response = self.get_operation_api(query)
-        return GetOperationResponseSchema.model_validate_json(response.text)
+        response = self.get_prepared(
+            OPERATIONS_ROUTE, query={"operation_id": operation_id}, query_schema=GetOperationQuerySchema
+        )
+        return self.validate_response(response, GetOperationResponseSchema)
 
     def get_operation_receipt(self, operation_id: str) -> GetOperationReceiptResponseSchema:
         """
@@ -114,9 +119,10 @@ class OperationsGatewayHTTPClient(HTTPClient):
         Returns:
             Валидированная схема с информацией о чеке операции
         """
-        query = GetOperationsReceiptQuerySchema(operation_id=operation_id)
-        response = self.get_operation_receipt_api(query)
-        return GetOperationReceiptResponseSchema.model_validate_json(response.text)
+        response = self.get_prepared(
+            OPERATION_RECEIPT_ROUTE, query={"operation_id": operation_id}, query_schema=GetOperationsReceiptQuerySchema
+        )
+        return self.validate_response(response, GetOperationReceiptResponseSchema)
 
     def get_operations(self, account_id: str) -> GetOperationsResponseSchema:
         """
@@ -128,9 +134,10 @@ class OperationsGatewayHTTPClient(HTTPClient):
         Returns:
             Валидированная схема со списком операций
         """
-        query = GetOperationsQuerySchema(account_id=account_id)
-        response = self.get_operations_api(query)
-        return GetOperationsResponseSchema.model_validate_json(response.text)
+        response = self.get_prepared(
+            OPERATIONS_ROUTE, query={"account_id": account_id}, query_schema=GetOperationsQuerySchema
+        )
+        return self.validate_response(response, GetOperationsResponseSchema)
 
     def get_operations_summary(self, account_id: str) -> GetOperationsSummaryResponseSchema:
         """
@@ -142,9 +149,10 @@ class OperationsGatewayHTTPClient(HTTPClient):
         Returns:
             Валидированная схема со сводной информацией об операциях
         """
-        query = GetOperationsSummaryQuerySchema(account_id=account_id)
-        response = self.get_operations_summary_api(query)
-        return GetOperationsSummaryResponseSchema.model_validate_json(response.text)
+        response = self.get_prepared(
+            OPERATIONS_SUMMARY_ROUTE, query={"account_id": account_id}, query_schema=GetOperationsSummaryQuerySchema
+        )
+        return self.validate_response(response, GetOperationsSummaryResponseSchema)
 
     def make_fee_operation(self, card_id: str, account_id: str) -> MakeFeeOperationResponseSchema:
         """
@@ -162,7 +170,7 @@ class OperationsGatewayHTTPClient(HTTPClient):
             account_id=account_id
         )
         response = self.make_fee_operation_api(request)
-        return MakeFeeOperationResponseSchema.model_validate_json(response.text)
+        return self.validate_response(response, MakeFeeOperationResponseSchema)
 
     def make_top_up_operation(self, card_id: str, account_id: str) -> MakeTopUpOperationResponseSchema:
         """
@@ -180,7 +188,7 @@ class OperationsGatewayHTTPClient(HTTPClient):
             account_id=account_id
         )
         response = self.make_top_up_operation_api(request)
-        return MakeTopUpOperationResponseSchema.model_validate_json(response.text)
+        return self.validate_response(response, MakeTopUpOperationResponseSchema)
 
     def make_cashback_operation(self, card_id: str, account_id: str) -> MakeCashbackOperationResponseSchema:
         """
@@ -198,7 +206,7 @@ class OperationsGatewayHTTPClient(HTTPClient):
             account_id=account_id
         )
         response = self.make_cashback_operation_api(request)
-        return MakeCashbackOperationResponseSchema.model_validate_json(response.text)
+        return self.validate_response(response, MakeCashbackOperationResponseSchema)
 
     def make_transfer_operation(self, card_id: str, account_id: str) -> MakeTransferOperationResponseSchema:
         """
@@ -216,7 +224,7 @@ class OperationsGatewayHTTPClient(HTTPClient):
             account_id=account_id
         )
         response = self.make_transfer_operation_api(request)
-        return MakeTransferOperationResponseSchema.model_validate_json(response.text)
+        return self.validate_response(response, MakeTransferOperationResponseSchema)
 
     def make_purchase_operation(self, card_id: str, account_id: str) -> MakePurchaseOperationResponseSchema:
         """
@@ -234,7 +242,7 @@ class OperationsGatewayHTTPClient(HTTPClient):
             account_id=account_id
         )
         response = self.make_purchase_operation_api(request)
-        return MakePurchaseOperationResponseSchema.model_validate_json(response.text)
+        return self.validate_response(response, MakePurchaseOperationResponseSchema)
 
     def make_bill_payment_operation(self, card_id: str, account_id: str) -> MakeBillPaymentOperationResponseSchema:
         """
@@ -252,7 +260,7 @@ class OperationsGatewayHTTPClient(HTTPClient):
             account_id=account_id
         )
         response = self.make_bill_payment_operation_api(request)
-        return MakeBillPaymentOperationResponseSchema.model_validate_json(response.text)
+        return self.validate_response(response, MakeBillPaymentOperationResponseSchema)
 
     def make_cash_withdrawal_operation(self, card_id: str,
                                        account_id: str) -> MakeCashWithdrawalOperationResponseSchema:
@@ -271,16 +279,24 @@ class OperationsGatewayHTTPClient(HTTPClient):
             account_id=account_id
         )
         response = self.make_cash_withdrawal_operation_api(request)
-        return MakeCashWithdrawalOperationResponseSchema.model_validate_json(response.text)
+        return self.validate_response(response, MakeCashWithdrawalOperationResponseSchema)
 
 
 # Добавляем builder для OperationsGatewayHTTPClient
-def build_operations_gateway_http_client() -> OperationsGatewayHTTPClient:
-    return OperationsGatewayHTTPClient(client=build_gateway_http_client())
+def build_operations_gateway_http_client(retry: RetryPolicy | None = None) -> OperationsGatewayHTTPClient:
+    return OperationsGatewayHTTPClient(client=build_gateway_http_client(), retry=retry)
 
 
 # Новый билдер для нагрузочного тестирования
-def build_operations_gateway_locust_http_client(environment: Environment) -> OperationsGatewayHTTPClient:
+def build_operations_gateway_locust_http_client(
+        environment: Environment,
+        client: Client | None = None,
+        validation: ValidationPolicy | None = None,
+        codec: JSONCodec | None = None,
+        retry: RetryPolicy | None = None,
+        hedging: HedgingPolicy | None = None,
+        body_mode: HTTPBodyMode = HTTPBodyMode.BUFFER
+) -> OperationsGatewayHTTPClient:
     """
     Функция создаёт экземпляр OperationsGatewayHTTPClient адаптированного под Locust.
 
@@ -288,6 +304,21 @@ def build_operations_gateway_locust_http_client(environment: Environment) -> Ope
     Используется исключительно в нагрузочных тестах.
 
     :param environment: объект окружения Locust.
+    :param client: общий httpx.Client с хуками Locust. Передаётся, чтобы все доменные клиенты
+                   виртуального пользователя работали через один пул соединений;
+                   если не задан, создаётся отдельный клиент.
+    :param validation: политика валидации ответов (по умолчанию каждый ответ валидируется полностью).
+    :param codec: кодек тел запросов и ответов (по умолчанию PydanticJSONCodec).
+    :param retry: политика повторов (по умолчанию запросы не повторяются).
+    :param hedging: политика хеджирования идемпотентных чтений (по умолчанию выключено).
+    :param body_mode: режим чтения тела ответа в хуках Locust (по умолчанию тело читается целиком).
     :return: экземпляр OperationsGatewayHTTPClient с хуками сбора метрик.
     """
-    return OperationsGatewayHTTPClient(client=build_gateway_locust_http_client(environment))
\ No newline at end of file
+    return OperationsGatewayHTTPClient(
+        client=client or build_gateway_locust_http_client(environment),
+        validation=validation,
+        codec=codec,
+        retry=retry,
+        hedging=hedging,
+        body_mode=body_mode
+    )
\ No newline at end of file
@@ -2,6 +2,11 @@ from pydantic import BaseModel, Field, ConfigDict, EmailStr, HttpUrl
 from enum import StrEnum
 from tools.fakers import fake
 
+# Маршруты эндпоинтов чтения: общие для API-методов и подготовленных запросов бизнес-методов клиентов
+OPERATIONS_ROUTE = "/api/v1/operations"
+OPERATION_RECEIPT_ROUTE = "/api/v1/operations/operation-receipt"
+OPERATIONS_SUMMARY_ROUTE = "/api/v1/operations/operations-summary"
+
 
 class OperationType(StrEnum):
     FEE = "FEE"
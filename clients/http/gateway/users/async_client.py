@@ -0,0 +1,89 @@
+from typing import TYPE_CHECKING
+
+from httpx import AsyncClient, Response
+
+from clients.http.codecs import JSONCodec
+from clients.retries import RetryPolicy, HedgingPolicy
+from clients.validation import ValidationPolicy
+from clients.http.client import AsyncHTTPClient, HTTPClientExtensions, HTTPBodyMode
+from clients.http.gateway.async_client import (
+    build_gateway_async_http_client,
+    build_gateway_async_locust_http_client
+)
+from clients.http.gateway.users.schema import (
+    GetUserResponseSchema, CreateUserRequestSchema, CreateUserResponseSchema)
+
+if TYPE_CHECKING:
+    from locust.env import Environment
+
+
+class AsyncUsersGatewayHTTPClient(AsyncHTTPClient):
+    """
+    Асинхронный клиент для взаимодействия с /api/v1/users сервиса http-gateway.
+    """
+
+    async def get_user_api(self, user_id: str) -> Response:
+        """
+        Получить данные пользователя по его user_id.
+
+        :param user_id: Идентификатор пользователя.
+        :return: Ответ от сервера (объект httpx.Response).
+        """
+        return await self.get(
+            f"/api/v1/users/{user_id}",
+            extensions=HTTPClientExtensions(route="/api/v1/users/{user_id}")
+        )
+
+    async def create_user_api(self, request: CreateUserRequestSchema) -> Response:
+        """
+        Создание нового пользователя.
+
+        :param request: Данные нового пользователя.
+        :return: Ответ от сервера (объект httpx.Response).
+        """
+        return await self.post_schema("/api/v1/users", request)
+
+    async def get_user(self, user_id: str) -> GetUserResponseSchema:
+        response = await self.get_prepared("/api/v1/users/{user_id}", user_id=user_id)
+        return self.validate_response(response, GetUserResponseSchema)
+
+    async def create_user(self) -> CreateUserResponseSchema:
+        # Генерация данных происходит внутри схемы запроса
+        request = CreateUserRequestSchema()
+        response = await self.create_user_api(request)
+        return self.validate_response(response, CreateUserResponseSchema)
+
+
+def build_users_gateway_async_http_client(retry: RetryPolicy | None = None) -> AsyncUsersGatewayHTTPClient:
+    return AsyncUsersGatewayHTTPClient(client=build_gateway_async_http_client(), retry=retry)
+
+
+def build_users_gateway_async_locust_http_client(
+        environment: "Environment",
+        client: AsyncClient | None = None,
+        validation: ValidationPolicy | None = None,
+        codec: JSONCodec | None = None,
+        retry: RetryPolicy | None = None,
+        hedging: HedgingPolicy | None = None,
+        body_mode: HTTPBodyMode = HTTPBodyMode.BUFFER
+) -> AsyncUsersGatewayHTTPClient:
+    """
+    Функция создаёт экземпляр AsyncUsersGatewayHTTPClient, который репортит запросы в статистику Locust.
+
+    :param environment: объект окружения Locust.
+    :param client: общий httpx.AsyncClient с хуками Locust; если не задан, создаётся отдельный клиент.
+    :param validation: политика валидации ответов (по умолчанию каждый ответ валидируется полностью).
+    :param codec: кодек тел запросов и ответов (по умолчанию PydanticJSONCodec).
+    :param retry: политика повторов (по умолчанию запросы не повторяются).
+    :param hedging: политика хеджирования идемпотентных чтений (по умолчанию выключено).
+    :param body_mode: режим чтения тела ответа в хуках Locust (по умолчанию тело читается целиком).
+    :return: экземпляр AsyncUsersGatewayHTTPClient с хуками сбора метрик.
+    """
+    return AsyncUsersGatewayHTTPClient(
+        client=client or build_gateway_async_locust_http_client(environment),
+        validation=validation,
+        codec=codec,
+        retry=retry,
+        hedging=hedging,
+        body_mode=body_mode
+    )
@@ -1,8 +1,11 @@
 import time
-from httpx import Response
+from httpx import Client, Response
 from locust.env import Environment
 
-from clients.http.client import HTTPClient, HTTPClientExtensions
+from clients.http.codecs import JSONCodec
+from clients.retries import RetryPolicy, HedgingPolicy
+from clients.validation import ValidationPolicy
+from clients.http.client import HTTPClient, HTTPClientExtensions, HTTPBodyMode
 from clients.http.gateway.client import (
     build_gateway_http_client,
     build_gateway_locust_http_client  # Импорт билдера для нагрузочного тестирования
@@ -32,25 +35,33 @@ class UsersGatewayHTTPClient(HTTPClient):
         :param request: Словарь с данными нового пользователя.
         :return: Ответ от сервера (объект httpx.Response).
         """
-        return self.post("/api/v1/users", json=request.model_dump(by_alias=True))
+        return self.post_schema("/api/v1/users", request)
 
     def get_user(self, user_id: str) -> GetUserResponseSchema:
-        response = self.get_user_api(user_id)
-        return GetUserResponseSchema.model_validate_json(response.text)
+        response = self.get_prepared("/api/v1/users/{user_id}", user_id=user_id)
+        return self.validate_response(response, GetUserResponseSchema)
 
     def create_user(self) -> CreateUserResponseSchema:
         # Генерация данных происходит внутри схемы запроса
         request = CreateUserRequestSchema()
         response = self.create_user_api(request)
-        return CreateUserResponseSchema.model_validate_json(response.text)
+        return self.validate_response(response, CreateUserResponseSchema)
 
 
 # Добавляем builder для UsersGatewayHTTPClient
-def build_users_gateway_http_client() -> UsersGatewayHTTPClient:
-    return UsersGatewayHTTPClient(client=build_gateway_http_client())
+def build_users_gateway_http_client(retry: RetryPolicy | None = None) -> UsersGatewayHTTPClient:
+    return UsersGatewayHTTPClient(client=build_gateway_http_client(), retry=retry)
 
 # Новый билдер для нагрузочного тестирования
-def build_users_gateway_locust_http_client(environment: Environment) -> UsersGatewayHTTPClient:
+def build_users_gateway_locust_http_client(
+        environment: Environment,
+        client: Client | None = None,
+        validation: ValidationPolicy | None = None,
+        codec: JSONCodec | None = None,
+        retry: RetryPolicy | None = None,
+        hedging: HedgingPolicy | None = None,
+        body_mode: HTTPBodyMode = HTTPBodyMode.BUFFER
+) -> UsersGatewayHTTPClient:
     """
     Функция создаёт экземпляр UsersGatewayHTTPClient адаптированного под Locust.
 
@@ -58,6 +69,21 @@ def build_users_gateway_locust_http_client(environment: Environment) -> UsersGat
     Используется исключительно в нагрузочных тестах.
 
     :param environment: объект окружения Locust.
+    :param client: общий httpx.Client с хуками Locust. Передаётся, чтобы все доменные клиенты
+                   виртуального пользователя работали через один пул соединений;
+                   если не задан, создаётся отдельный клиент.
+    :param validation: политика валидации ответов (по умолчанию каждый ответ валидируется полностью).
+    :param codec: кодек тел запросов и ответов (по умолчанию PydanticJSONCodec).
+    :param retry: политика повторов (по умолчанию запросы не повторяются).
+    :param hedging: политика хеджирования идемпотентных чтений (по умолчанию выключено).
+    :param body_mode: режим чтения тела ответа в хуках Locust (по умолчанию тело читается целиком).
     :return: экземпляр UsersGatewayHTTPClient с хуками сбора метрик.
     """
-    return UsersGatewayHTTPClient(client=build_gateway_locust_http_client(environment))
\ No newline at end of file
+    return UsersGatewayHTTPClient(
+        client=client or build_gateway_locust_http_client(environment),
+        validation=validation,
+        codec=codec,
+        retry=retry,
+        hedging=hedging,
+        body_mode=body_mode
+    )
\ No newline at end of file
@@ -0,0 +1,152 @@
+import random
+import threading
+
+
+class RetryBudget:
+    """
+    Бюджет повторов в духе retry throttling из gRPC.
+
+    Бюджет хранит токены: каждая неудачная попытка снимает токен, каждая успешная возвращает token_ratio.
+    Пока токенов больше половины max_tokens, повторы разрешены. Когда сервис массово отвечает ошибками,
+    бюджет быстро исчерпывается, и клиент перестаёт умножать нагрузку повторами.
+    """
+
+    def __init__(self, max_tokens: float = 100, token_ratio: float = 0.1):
+        """
+        :param max_tokens: Ёмкость бюджета.
+        :param token_ratio: Сколько токенов возвращает успешная попытка.
+        """
+        self.max_tokens = max_tokens
+        self.token_ratio = token_ratio
+        self.tokens = max_tokens
+        self.lock = threading.Lock()
+
+    def can_retry(self) -> bool:
+        """
+        Проверяет, разрешён ли ещё один повтор.
+        """
+        return self.tokens > self.max_tokens / 2
+
+    def on_success(self) -> None:
+        """
+        Учитывает успешную попытку.
+        """
+        with self.lock:
+            self.tokens = min(self.tokens + self.token_ratio, self.max_tokens)
+
+    def on_failure(self) -> None:
+        """
+        Учитывает неудачную попытку, после которой можно было бы повторить запрос.
+        """
+        with self.lock:
+            self.tokens = max(self.tokens - 1, 0)
+
+
+class RetryPolicy:
+    """
+    Политика повторов с экспоненциальной задержкой, джиттером и (опционально) бюджетом повторов.
+
+    Задержка перед повтором номер attempt выбирается случайно
+    из [0, min(max_backoff, backoff * multiplier ** (attempt - 1))] (full jitter), чтобы повторы
+    множества виртуальных пользователей не приходили на сервис синхронной волной.
+    Каждая попытка репортится в Locust отдельно, повторы — с отдельным типом запроса, поэтому
+    повторы не скрывают задержку и ошибки исходных запросов.
+    """
+
+    def __init__(
+            self,
+            attempts: int = 3,
+            backoff: float = 0.05,
+            multiplier: float = 2.0,
+            max_backoff: float = 1.0,
+            jitter: bool = True,
+            budget: RetryBudget | None = None,
+            retry_statuses: frozenset[int] = frozenset({429, 502, 503, 504}),
+            retry_codes: frozenset[str] = frozenset({"UNAVAILABLE"}),
+            retry_non_idempotent: bool = False
+    ):
+        """
+        :param attempts: Максимальное количество попыток, включая первую.
+        :param backoff: Базовая задержка перед первым повтором (секунды).
+        :param multiplier: Множитель задержки для каждого следующего повтора.
+        :param max_backoff: Верхняя граница задержки (секунды).
+        :param jitter: Выбирать задержку случайно в пределах вычисленной.
+        :param budget: Общий бюджет повторов; без него повторы ограничены только attempts.
+        :param retry_statuses: HTTP-статусы, после которых запрос повторяется.
+        :param retry_codes: Имена кодов gRPC (grpc.StatusCode), после которых вызов повторяется.
+        :param retry_non_idempotent: Повторять и неидемпотентные HTTP-запросы (POST). Включается там,
+                                     где дубликат безопасен, например при сидинге.
+        """
+        if attempts < 1:
+            raise ValueError(f"Retry attempts must be positive, got {attempts}")
+
+        self.attempts = attempts
+        self.backoff = backoff
+        self.multiplier = multiplier
+        self.max_backoff = max_backoff
+        self.jitter = jitter
+        self.budget = budget
+        self.retry_statuses = retry_statuses
+        self.retry_codes = retry_codes
+        self.retry_non_idempotent = retry_non_idempotent
+
+    def get_delay(self, attempt: int) -> float:
+        """
+        Возвращает задержку перед повтором.
+
+        :param attempt: Номер повтора (1 — первый повтор).
+        :return: Задержка в секундах.
+        """
+        delay = min(self.max_backoff, self.backoff * self.multiplier ** (attempt - 1))
+        return random.uniform(0, delay) if self.jitter else delay
+
+    def can_retry(self, attempt: int) -> bool:
+        """
+        Учитывает неудачную попытку и решает, можно ли повторить запрос.
+
+        :param attempt: Номер неудачной попытки (0 — исходный запрос).
+        :return: True, если попытки и бюджет ещё не исчерпаны.
+        """
+        if self.budget is not None:
+            self.budget.on_failure()
+
+        if attempt + 1 >= self.attempts:
+            return False
+
+        return (self.budget is None) or self.budget.can_retry()
+
+    def on_success(self) -> None:
+        """
+        Учитывает попытку, которая не требует повтора.
+        """
+        if self.budget is not None:
+            self.budget.on_success()
+
+
+class HedgingPolicy:
+    """
+    Политика хеджирования идемпотентных чтений: если ответ не пришёл за delay секунд,
+    отправляется дублирующий запрос и используется тот ответ, который придёт первым.
+    Дублирующие запросы репортятся в Locust с отдельным типом запроса.
+    """
+
+    def __init__(self, delay: float = 0.1):
+        """
+        :param delay: Через сколько секунд без ответа отправлять дублирующий запрос
+                      (обычно около p95 времени ответа эндпоинта).
+        """
+        self.delay = delay
+
+
+# Повторы по умолчанию отключены: клиент выполняет ровно одну попытку
+NO_RETRIES = RetryPolicy(attempts=1)
+
+
+def build_seeds_retry_policy() -> RetryPolicy:
+    """
+    Политика повторов для сидинга: временные 503 и UNAVAILABLE не должны прерывать весь сидинг.
+    Повторяются и создающие запросы — лишний созданный объект сидингу не мешает.
+
+    :return: Экземпляр RetryPolicy.
+    """
+    return RetryPolicy(attempts=5, backoff=0.2, max_backoff=5.0, retry_non_idempotent=True)
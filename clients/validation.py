@@ -0,0 +1,112 @@
+import itertools
+from enum import Enum
+from typing import Any, Callable, TypeVar
+
+T = TypeVar("T")
+
+
+class ValidationMode(str, Enum):
+    """
+    Режим разбора ответов gateway-клиентами.
+
+    - FULL: каждый ответ сразу разбирается и валидируется (поведение по умолчанию).
+    - SAMPLED: сразу валидируется только каждый N-й ответ, остальные возвращаются ленивыми.
+    - OFF: ответы не валидируются, а возвращаются ленивыми.
+    """
+    FULL = "full"
+    SAMPLED = "sampled"
+    OFF = "off"
+
+
+class LazyResponse:
+    """
+    Ленивый ответ: хранит сырые байты тела и разбирает их только при первом обращении к полям.
+
+    Если сценарий результат не читает (типичная задача Locust), разбор не выполняется вовсе.
+    При обращении к любому атрибуту ответ разбирается один раз, и дальше прокси ведёт себя
+    как разобранный объект (pydantic-схема или protobuf-сообщение). isinstance для прокси не работает.
+    """
+    __slots__ = ("raw", "parser", "parsed")
+
+    def __init__(self, raw: bytes, parser: Callable[[bytes], Any]):
+        """
+        :param raw: Сырые байты тела ответа.
+        :param parser: Функция разбора, например Schema.model_validate_json или Message.FromString.
+        """
+        self.raw = raw
+        self.parser = parser
+        self.parsed = None
+
+    def get_value(self) -> Any:
+        """
+        Возвращает разобранный ответ, выполняя разбор при первом вызове.
+        """
+        if self.parsed is None:
+            self.parsed = self.parser(self.raw)
+
+        return self.parsed
+
+    def ByteSize(self) -> int:  # noqa: N802 — имя совпадает с методом protobuf-сообщения
+        """
+        Размер ответа в байтах без разбора (его запрашивает LocustInterceptor для метрик).
+        """
+        return len(self.raw)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.get_value(), name)
+
+    def __repr__(self) -> str:
+        return f"LazyResponse({self.get_value()!r})"
+
+
+class ValidationPolicy:
+    """
+    Политика валидации ответов, общая для HTTP- и gRPC-клиентов gateway.
+
+    Под нагрузкой полная валидация больших ответов (GetOperationsResponseSchema, GetAccountsResponseSchema)
+    может стать узким местом генератора нагрузки. Режим SAMPLED валидирует 1 ответ из sample_rate,
+    поэтому расхождения контракта по-прежнему ловятся, а остальные ответы не тратят процессор воркера.
+    """
+
+    def __init__(self, mode: ValidationMode = ValidationMode.FULL, sample_rate: int = 100):
+        """
+        :param mode: Режим валидации.
+        :param sample_rate: Для режима SAMPLED — валидировать каждый sample_rate-й ответ.
+        """
+        if sample_rate < 1:
+            raise ValueError(f"Validation sample rate must be positive, got {sample_rate}")
+
+        self.mode = mode
+        self.sample_rate = sample_rate
+        self.counter = itertools.count()
+
+    def should_validate(self) -> bool:
+        """
+        Решает, валидировать ли очередной ответ.
+        """
+        if self.mode == ValidationMode.FULL:
+            return True
+
+        if self.mode == ValidationMode.OFF:
+            return False
+
+        return next(self.counter) % self.sample_rate == 0
+
+    def parse(self, raw: bytes, parser: Callable[[bytes], T]) -> T | LazyResponse:
+        """
+        Разбирает ответ сразу или откладывает разбор в соответствии с политикой.
+
+        :param raw: Сырые байты тела ответа.
+        :param parser: Функция разбора и валидации.
+        :return: Разобранный ответ или LazyResponse.
+        """
+        if self.should_validate():
+            return parser(raw)
+
+        return LazyResponse(raw, parser)
+
+
+# Политика по умолчанию: каждый ответ валидируется полностью
+FULL_VALIDATION = ValidationPolicy()
+# Ответы не валидируются (например, вместе с HTTPBodyMode.DISCARD, когда тело ответа отбрасывается)
+NO_VALIDATION = ValidationPolicy(ValidationMode.OFF)
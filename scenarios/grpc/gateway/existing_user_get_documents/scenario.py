@@ -4,6 +4,7 @@ from locust.env import Environment
 from clients.grpc.gateway.locust import GatewayGRPCTaskSet
 from seeds.scenarios.existing_user_get_documents import ExistingUserGetDocumentsSeedsScenario
 from seeds.schema.result import SeedUserResult
+from tools.locust.seeds import init_locust_seeds
 from tools.locust.user import LocustBaseUser
 
 
@@ -11,14 +12,10 @@ from tools.locust.user import LocustBaseUser
 # Мы используем его, чтобы заранее прогнать сидинг и загрузить пользователей в память.
 @events.init.add_listener
 def init(environment: Environment, **kwargs):
-    # Создаем экземпляр сидинг-сценария
-    seeds_scenario = ExistingUserGetDocumentsSeedsScenario()
-
-    # Выполняем генерацию данных, если они ещё не созданы
-    seeds_scenario.build()
-
-    # Загружаем сгенерированных пользователей в окружение Locust
-    environment.seeds = seeds_scenario.load()
+    # Выполняем сидинг один раз (на мастере при распределённом запуске) и загружаем пользователей в окружение Locust.
+    # Каждый воркер получает от мастера свою непересекающуюся часть пользователей и раздаёт их в аренду:
+    # если виртуальных пользователей больше, чем засиженных, пользователи выдаются повторно по кругу
+    init_locust_seeds(environment, ExistingUserGetDocumentsSeedsScenario(), lease=True)
 
 
 # Набор задач (TaskSet), который будет выполняться виртуальными пользователями.
@@ -30,8 +27,13 @@ class GetDocumentsTaskSet(GatewayGRPCTaskSet):
     def on_start(self) -> None:
         super().on_start()
 
-        # Получаем следующего пользователя из списка (по порядку!)
-        self.seed_user = self.user.environment.seeds.get_next_user()
+        # Арендуем следующего свободного пользователя из списка
+        self.seed_user = self.user.environment.seeds.lease()
+
+    def on_stop(self) -> None:
+        super().on_stop()
+        # Возвращаем пользователя в пул, чтобы его мог взять следующий виртуальный пользователь
+        self.user.environment.seeds.release(self.seed_user)
 
     @task(1)
     def get_accounts(self):
@@ -4,6 +4,7 @@ from locust.env import Environment
 from clients.grpc.gateway.locust import GatewayGRPCTaskSet
 from seeds.scenarios.existing_user_issue_virtual_card import ExistingUserIssueVirtualCardSeedsScenario
 from seeds.schema.result import SeedUserResult
+from tools.locust.seeds import init_locust_seeds
 from tools.locust.user import LocustBaseUser
 
 
@@ -11,21 +12,16 @@ from tools.locust.user import LocustBaseUser
 # Мы используем его, чтобы заранее прогнать сидинг и загрузить пользователей в память.
 @events.init.add_listener
 def init(environment: Environment, **kwargs):
-    # Создаем экземпляр сидинг-сценария
-    seeds_scenario = ExistingUserIssueVirtualCardSeedsScenario()
+    # Выполняем сидинг один раз (на мастере при распределённом запуске) и загружаем пользователей в окружение Locust.
+    # Каждый воркер получает от мастера свою непересекающуюся часть пользователей
+    init_locust_seeds(environment, ExistingUserIssueVirtualCardSeedsScenario())
 
-    # Выполняем генерацию данных, если они ещё не созданы
-    seeds_scenario.build()
-
-    # Загружаем сгенерированных пользователей в окружение Locust
-    environment.seeds = seeds_scenario.load()
 
 # Набор задач (TaskSet), который будет выполняться виртуальными пользователями.
 class IssueVirtualCardTaskSet(GatewayGRPCTaskSet):
     # Типизируем объект пользователя из сидинга
     seed_user: SeedUserResult
 
-
     # Метод вызывается при запуске каждой сессии пользователя (до начала задач)
     def on_start(self) -> None:
         super().on_start()
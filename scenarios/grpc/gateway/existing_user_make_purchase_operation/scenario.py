@@ -1,21 +1,28 @@
 from locust import task, events
+from locust.argument_parser import LocustArgumentParser
 from locust.env import Environment
 
 from clients.grpc.gateway.locust import GatewayGRPCTaskSet
 from seeds.scenarios.existing_user_make_purchase_operation import ExistingUserMakePurchaseOperationSeedsScenario
 from seeds.schema.result import SeedUserResult
+from tools.locust.seeds import add_locust_seeds_arguments, init_locust_leased_seeds
 from tools.locust.user import LocustBaseUser
 
 
+# Параметры сидинга: общий пул в Redis (--seeds-redis-host) и сидинг напрямую во внутренних сервисах
+# (--seeds-users-service, --seeds-accounts-service, --seeds-cards-service, --seeds-operations-service)
+@events.init_command_line_parser.add_listener
+def init_parser(parser: LocustArgumentParser, **kwargs):
+    add_locust_seeds_arguments(parser)
+
+
 # Хук инициализации — вызывается перед началом запуска нагрузки
 @events.init.add_listener
 def init(environment: Environment, **kwargs):
-    # Выполняем сидинг
-    seeds_scenario = ExistingUserMakePurchaseOperationSeedsScenario()
-    seeds_scenario.build()  # создаём пользователей, счета, карты и операции
-
-    # Загружаем результат сидинга (из файла JSON)
-    environment.seeds = seeds_scenario.load()
+    # Выполняем сидинг один раз (на мастере при распределённом запуске) и раздаём пользователей
+    # в эксклюзивную аренду, чтобы покупки разных виртуальных пользователей не конкурировали за одни и те же счета.
+    # С --seeds-redis-host пользователи арендуются из общего пула в Redis, и аренды упавших воркеров возвращаются в пул
+    init_locust_leased_seeds(environment, ExistingUserMakePurchaseOperationSeedsScenario())
 
 
 # TaskSet — сценарий пользователя. Каждый виртуальный пользователь выполняет эти задачи
@@ -24,8 +31,12 @@ class MakePurchaseOperationTaskSet(GatewayGRPCTaskSet):
 
     def on_start(self) -> None:
         super().on_start()
-        # Получаем случайного пользователя из подготовленного списка
-        self.seed_user = self.user.environment.seeds.get_random_user()
+        # Арендуем свободного пользователя из подготовленного списка
+        self.seed_user = self.user.environment.seeds.lease()
+
+    def on_stop(self) -> None:
+        # Возвращаем пользователя в пул, чтобы его мог взять следующий виртуальный пользователь
+        self.user.environment.seeds.release(self.seed_user)
 
     @task(1)
     def make_purchase_operation(self):
@@ -2,26 +2,27 @@ from locust import task, events
 from locust.env import Environment
 
 from clients.http.gateway.locust import GatewayHTTPTaskSet
+from clients.validation import ValidationPolicy, ValidationMode
 from seeds.scenarios.existing_user_get_operations import ExistingUserGetOperationsSeedsScenario
 
 from seeds.schema.result import SeedUserResult
+from tools.locust.seeds import init_locust_seeds
 from tools.locust.user import LocustBaseUser
 
 
 # Хук инициализации — вызывается перед началом запуска нагрузки
 @events.init.add_listener
 def init(environment: Environment, **kwargs):
-    # Выполняем сидинг
-    seeds_scenario = ExistingUserGetOperationsSeedsScenario()
-    seeds_scenario.build()  # создаём пользователей, счета, карты и операции
-
-    # Загружаем результат сидинга (из файла JSON)
-    environment.seeds = seeds_scenario.load()
+    # Выполняем сидинг один раз (на мастере при распределённом запуске) и загружаем пользователей в окружение Locust.
+    # Каждый воркер получает от мастера свою непересекающуюся часть пользователей
+    init_locust_seeds(environment, ExistingUserGetOperationsSeedsScenario())
 
 
 # TaskSet — сценарий пользователя. Каждый виртуальный пользователь выполняет эти задачи
 class GetOperationsTaskSet(GatewayHTTPTaskSet):
     seed_user: SeedUserResult  # Типизированная ссылка на данные из сидинга
+    # Ответы задач не читаются, поэтому полностью валидируется только каждый сотый (контроль контракта)
+    validation = ValidationPolicy(ValidationMode.SAMPLED, sample_rate=100)
 
     def on_start(self) -> None:
         super().on_start()
@@ -0,0 +1,479 @@
+import asyncio
+from typing import Any, Awaitable, Callable
+
+from clients.grpc.gateway.accounts.async_client import AsyncAccountsGatewayGRPCClient
+from clients.grpc.gateway.async_client import build_gateway_async_grpc_client
+from clients.grpc.gateway.cards.async_client import AsyncCardsGatewayGRPCClient
+from clients.grpc.gateway.operations.async_client import AsyncOperationsGatewayGRPCClient
+from clients.grpc.gateway.users.async_client import AsyncUsersGatewayGRPCClient
+from clients.http.gateway.accounts.async_client import AsyncAccountsGatewayHTTPClient
+from clients.http.gateway.async_client import build_gateway_async_http_client
+from clients.http.gateway.cards.async_client import AsyncCardsGatewayHTTPClient
+from clients.http.gateway.operations.async_client import AsyncOperationsGatewayHTTPClient
+from clients.http.gateway.users.async_client import AsyncUsersGatewayHTTPClient
+from seeds.schema.plan import (
+    SeedsPlan,
+    SeedUsersPlan,
+    SeedAccountsPlan,
+)
+from seeds.schema.result import (
+    SeedsResult,
+    SeedUserResult,
+    SeedCardResult,
+    SeedAccountResult,
+    SeedOperationResult
+)
+
+
+class AsyncSeedsBuilder:
+    """
+    AsyncSeedsBuilder — асинхронный аналог SeedsBuilder на httpx.AsyncClient или grpc.aio.
+
+    Все независимые вызовы плана запускаются одновременно, а количество запросов, находящихся
+    в полёте, ограничивается окном max_in_flight. Так длительность сидинга определяется пропускной
+    способностью gateway, а не суммой задержек всех вызовов. Пользователей одновременно создаётся
+    не больше max_users_in_flight: остальные ждут в очереди и не держат в памяти незавершённые корутины.
+
+    Вызовы запускаются в asyncio.TaskGroup: ошибка одного вызова отменяет все остальные, и к выходу
+    из build() (а значит, и к закрытию клиентов в __aexit__) незавершённых запросов не остаётся.
+
+    Модуль не импортирует Locust и SeedsBuilder, поэтому пригоден для запуска в обычном asyncio-процессе:
+
+        async with build_async_grpc_seeds_builder(max_in_flight=200) as builder:
+            result = await builder.build(plan)
+
+    Attributes:
+        users_gateway_client: Асинхронный клиент для работы с пользователями (HTTP или gRPC)
+        cards_gateway_client: Асинхронный клиент для выпуска карт
+        accounts_gateway_client: Асинхронный клиент для открытия счетов
+        operations_gateway_client: Асинхронный клиент для операций
+        max_in_flight: Максимальное количество одновременно выполняющихся запросов к gateway
+        max_users_in_flight: Максимальное количество одновременно создаваемых пользователей
+    """
+
+    def __init__(
+            self,
+            users_gateway_client: AsyncUsersGatewayGRPCClient | AsyncUsersGatewayHTTPClient,
+            cards_gateway_client: AsyncCardsGatewayGRPCClient | AsyncCardsGatewayHTTPClient,
+            accounts_gateway_client: AsyncAccountsGatewayGRPCClient | AsyncAccountsGatewayHTTPClient,
+            operations_gateway_client: AsyncOperationsGatewayGRPCClient | AsyncOperationsGatewayHTTPClient,
+            max_in_flight: int = 100,
+            max_users_in_flight: int | None = None
+    ):
+        self.users_gateway_client = users_gateway_client
+        self.cards_gateway_client = cards_gateway_client
+        self.accounts_gateway_client = accounts_gateway_client
+        self.operations_gateway_client = operations_gateway_client
+        self.max_in_flight = max(max_in_flight, 1)
+        self.window = asyncio.Semaphore(self.max_in_flight)
+        # По умолчанию пользователей в работе столько же, сколько слотов окна: каждый занят хотя бы одним запросом
+        self.max_users_in_flight = max(max_users_in_flight or self.max_in_flight, 1)
+
+    async def __aenter__(self) -> "AsyncSeedsBuilder":
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        """
+        Закрывает соединения всех клиентов (каналы и пулы можно закрывать повторно).
+        """
+        await asyncio.gather(
+            self.users_gateway_client.close(),
+            self.cards_gateway_client.close(),
+            self.accounts_gateway_client.close(),
+            self.operations_gateway_client.close()
+        )
+
+    async def call(self, func: Callable[..., Awaitable[Any]], **kwargs: Any) -> Any:
+        """
+        Выполняет один запрос к gateway внутри окна max_in_flight.
+
+        Окно ограничивает только листовые вызовы, поэтому вложенные gather не могут
+        занять все слоты и заблокировать друг друга.
+
+        Args:
+            func: Асинхронный метод клиента
+            **kwargs: Аргументы вызова
+
+        Returns:
+            Any: Ответ клиента
+        """
+        async with self.window:
+            return await func(**kwargs)
+
+    @staticmethod
+    async def gather(**jobs: list[Awaitable[Any]]) -> dict[str, list[Any]]:
+        """
+        Одновременно выполняет именованные группы корутин и возвращает их результаты с сохранением порядка.
+        Ошибка любой корутины отменяет остальные и пробрасывается как есть, без ExceptionGroup.
+
+        Args:
+            **jobs: Именованные группы корутин (например, physical_cards=[...])
+
+        Returns:
+            dict[str, list[Any]]: Результаты, сгруппированные по тем же именам
+        """
+        try:
+            async with asyncio.TaskGroup() as group:
+                tasks = {name: [group.create_task(job) for job in group_jobs] for name, group_jobs in jobs.items()}
+        except ExceptionGroup as error:
+            raise get_first_exception(error) from None
+
+        return {name: [task.result() for task in group_tasks] for name, group_tasks in tasks.items()}
+
+    async def build_physical_card_result(self, user_id: str, account_id: str) -> SeedCardResult:
+        """
+        Выпускает физическую карту для заданного пользователя и счёта.
+
+        Args:
+            user_id: Идентификатор пользователя
+            account_id: Идентификатор счёта
+
+        Returns:
+            SeedCardResult: Результат с ID выпущенной карты
+        """
+        response = await self.call(
+            self.cards_gateway_client.issue_physical_card,
+            user_id=user_id,
+            account_id=account_id
+        )
+        return SeedCardResult(card_id=response.card.id)
+
+    async def build_virtual_card_result(self, user_id: str, account_id: str) -> SeedCardResult:
+        """
+        Выпускает виртуальную карту для заданного пользователя и счёта.
+
+        Args:
+            user_id: Идентификатор пользователя
+            account_id: Идентификатор счёта
+
+        Returns:
+            SeedCardResult: Результат с ID выпущенной карты
+        """
+        response = await self.call(
+            self.cards_gateway_client.issue_virtual_card,
+            user_id=user_id,
+            account_id=account_id
+        )
+        return SeedCardResult(card_id=response.card.id)
+
+    async def build_top_up_operation_result(self, card_id: str, account_id: str) -> SeedOperationResult:
+        """
+        Выполняет операцию пополнения на карту.
+
+        Args:
+            card_id: Идентификатор карты
+            account_id: Идентификатор счёта
+
+        Returns:
+            SeedOperationResult: Результат с ID выполненной операции
+        """
+        response = await self.call(
+            self.operations_gateway_client.make_top_up_operation,
+            card_id=card_id,
+            account_id=account_id
+        )
+        return SeedOperationResult(operation_id=response.operation.id)
+
+    async def build_purchase_operation_result(self, card_id: str, account_id: str) -> SeedOperationResult:
+        """
+        Выполняет операцию покупки по карте.
+
+        Args:
+            card_id: Идентификатор карты
+            account_id: Идентификатор счёта
+
+        Returns:
+            SeedOperationResult: Результат с ID выполненной операции
+        """
+        response = await self.call(
+            self.operations_gateway_client.make_purchase_operation,
+            card_id=card_id,
+            account_id=account_id
+        )
+        return SeedOperationResult(operation_id=response.operation.id)
+
+    async def build_transfer_operation_result(self, card_id: str, account_id: str) -> SeedOperationResult:
+        """
+        Выполняет операции перевода.
+
+        Args:
+            card_id: Идентификатор карты
+            account_id: Идентификатор счёта
+
+        Returns:
+            SeedOperationResult: Результат с ID выполненной операции
+        """
+        response = await self.call(
+            self.operations_gateway_client.make_transfer_operation,
+            card_id=card_id,
+            account_id=account_id
+        )
+        return SeedOperationResult(operation_id=response.operation.id)
+
+    async def build_cash_withdrawal_operation_result(self, card_id: str, account_id: str) -> SeedOperationResult:
+        """
+        Выполняет операции снятия наличных.
+
+        Args:
+            card_id: Идентификатор карты
+            account_id: Идентификатор счёта
+
+        Returns:
+            SeedOperationResult: Результат с ID выполненной операции
+        """
+        response = await self.call(
+            self.operations_gateway_client.make_cash_withdrawal_operation,
+            card_id=card_id,
+            account_id=account_id
+        )
+        return SeedOperationResult(operation_id=response.operation.id)
+
+    async def build_savings_account_result(self, user_id: str) -> SeedAccountResult:
+        """
+        Открывает сберегательный счёт для пользователя.
+
+        Args:
+            user_id: Идентификатор пользователя
+
+        Returns:
+            SeedAccountResult: Результат с ID созданного счёта
+        """
+        response = await self.call(self.accounts_gateway_client.open_savings_account, user_id=user_id)
+        return SeedAccountResult(account_id=response.account.id)
+
+    async def build_deposit_account_result(self, user_id: str) -> SeedAccountResult:
+        """
+        Открывает депозитный счёт для пользователя.
+
+        Args:
+            user_id: Идентификатор пользователя
+
+        Returns:
+            SeedAccountResult: Результат с ID созданного счёта
+        """
+        response = await self.call(self.accounts_gateway_client.open_deposit_account, user_id=user_id)
+        return SeedAccountResult(account_id=response.account.id)
+
+    async def build_card_account_result(
+            self,
+            plan: SeedAccountsPlan,
+            user_id: str,
+            card_id: str,
+            account_id: str
+    ) -> SeedAccountResult:
+        """
+        Выпускает карты и выполняет операции по уже открытому карточному счёту согласно плану.
+
+        Args:
+            plan: План создания карточного счёта (кол-во карт, операций и т.п.)
+            user_id: Идентификатор пользователя
+            card_id: Идентификатор карты, выпущенной вместе со счётом
+            account_id: Идентификатор счёта
+
+        Returns:
+            SeedAccountResult: Результат с ID счёта и дополнительными действиями (карты, операции)
+        """
+        results = await self.gather(
+            physical_cards=[
+                self.build_physical_card_result(user_id=user_id, account_id=account_id)
+                for _ in range(plan.physical_cards.count)
+            ],
+            virtual_cards=[
+                self.build_virtual_card_result(user_id=user_id, account_id=account_id)
+                for _ in range(plan.virtual_cards.count)
+            ],
+            top_up_operations=[
+                self.build_top_up_operation_result(card_id=card_id, account_id=account_id)
+                for _ in range(plan.top_up_operations.count)
+            ],
+            purchase_operations=[
+                self.build_purchase_operation_result(card_id=card_id, account_id=account_id)
+                for _ in range(plan.purchase_operations.count)
+            ],
+            transfer_operations=[
+                self.build_transfer_operation_result(card_id=card_id, account_id=account_id)
+                for _ in range(plan.transfer_operations.count)
+            ],
+            cash_withdrawal_operations=[
+                self.build_cash_withdrawal_operation_result(card_id=card_id, account_id=account_id)
+                for _ in range(plan.cash_withdrawal_operations.count)
+            ]
+        )
+        return SeedAccountResult(account_id=account_id, **results)
+
+    async def build_debit_card_account_result(self, plan: SeedAccountsPlan, user_id: str) -> SeedAccountResult:
+        """
+        Открывает дебетовый счёт для пользователя и выполняет действия согласно плану.
+
+        Args:
+            plan: План создания дебетового счёта (кол-во карт, операций и т.п.)
+            user_id: Идентификатор пользователя
+
+        Returns:
+            SeedAccountResult: Результат с ID счёта и дополнительными действиями (карты, операции)
+        """
+        response = await self.call(self.accounts_gateway_client.open_debit_card_account, user_id=user_id)
+        return await self.build_card_account_result(
+            plan=plan,
+            user_id=user_id,
+            card_id=response.account.cards[0].id,
+            account_id=response.account.id
+        )
+
+    async def build_credit_card_account_result(self, plan: SeedAccountsPlan, user_id: str) -> SeedAccountResult:
+        """
+        Открывает кредитный счёт и выполняет действия согласно плану.
+
+        Args:
+            plan: План создания кредитного счёта
+            user_id: Идентификатор пользователя
+
+        Returns:
+            SeedAccountResult: Результат с ID счёта и деталями операций
+        """
+        response = await self.call(self.accounts_gateway_client.open_credit_card_account, user_id=user_id)
+        return await self.build_card_account_result(
+            plan=plan,
+            user_id=user_id,
+            card_id=response.account.cards[0].id,
+            account_id=response.account.id
+        )
+
+    async def build_user(self, plan: SeedUsersPlan) -> SeedUserResult:
+        """
+        Создаёт пользователя и согласно переданному плану открывает счета с картами и операциями.
+
+        Args:
+            plan: План генерации пользователя
+
+        Returns:
+            SeedUserResult: Результат с ID пользователя и всеми созданными сущностями
+        """
+        response = await self.call(self.users_gateway_client.create_user)
+        user_id = response.user.id
+
+        results = await self.gather(
+            savings_accounts=[
+                self.build_savings_account_result(user_id=user_id)
+                for _ in range(plan.savings_accounts.count)
+            ],
+            deposit_accounts=[
+                self.build_deposit_account_result(user_id=user_id)
+                for _ in range(plan.deposit_accounts.count)
+            ],
+            debit_card_accounts=[
+                self.build_debit_card_account_result(plan=plan.debit_card_accounts, user_id=user_id)
+                for _ in range(plan.debit_card_accounts.count)
+            ],
+            credit_card_accounts=[
+                self.build_credit_card_account_result(plan=plan.credit_card_accounts, user_id=user_id)
+                for _ in range(plan.credit_card_accounts.count)
+            ]
+        )
+        return SeedUserResult(user_id=user_id, **results)
+
+    async def build(
+            self,
+            plan: SeedsPlan,
+            completed: list[SeedUserResult] | None = None,
+            on_user: Callable[[SeedUserResult], None] | None = None
+    ) -> SeedsResult:
+        """
+        Генерирует полную структуру данных на основе плана. Порядок пользователей в результате
+        совпадает с порядком, который дал бы последовательный SeedsBuilder.
+
+        Args:
+            plan: Полный план генерации данных
+            completed: Пользователи, созданные в прерванном ранее запуске; создаются только недостающие
+            on_user: Вызывается для каждого нового пользователя сразу после его создания
+
+        Returns:
+            SeedsResult: Результат с данными всех созданных пользователей
+        """
+        users = list(completed or [])
+        remaining = max(plan.users.count - len(users), 0)
+        created: list[SeedUserResult | None] = [None] * remaining
+        # Общая очередь номеров пользователей: каждый воркер берёт следующий номер, закончив предыдущего
+        indexes = iter(range(remaining))
+
+        async def worker() -> None:
+            for index in indexes:
+                user = await self.build_user(plan=plan.users)
+                if on_user is not None:
+                    on_user(user)
+                created[index] = user
+
+        try:
+            async with asyncio.TaskGroup() as group:
+                for _ in range(min(self.max_users_in_flight, remaining)):
+                    group.create_task(worker())
+        except ExceptionGroup as error:
+            raise get_first_exception(error) from None
+
+        return SeedsResult(users=users + created)
+
+
+def get_first_exception(error: BaseExceptionGroup) -> BaseException:
+    """
+    Возвращает первое исключение из группы (с учётом вложенных групп вложенных TaskGroup),
+    чтобы вызывающий код получал исходную ошибку клиента (RpcError, HTTPError), а не ExceptionGroup.
+    """
+    while isinstance(error, BaseExceptionGroup):
+        error = error.exceptions[0]
+
+    return error
+
+
+def build_async_grpc_seeds_builder(
+        max_in_flight: int = 100,
+        max_users_in_flight: int | None = None
+) -> AsyncSeedsBuilder:
+    """
+    Фабрика для создания асинхронного сидера на grpc.aio. Все клиенты разделяют один канал,
+    по которому HTTP/2 мультиплексирует запросы. Вызывается внутри корутины.
+
+    Args:
+        max_in_flight: Максимальное количество одновременно выполняющихся запросов
+        max_users_in_flight: Максимальное количество одновременно создаваемых пользователей (по умолчанию max_in_flight)
+
+    Returns:
+        AsyncSeedsBuilder: Инициализированный сидер с асинхронными gRPC-клиентами
+    """
+    channel = build_gateway_async_grpc_client()
+    return AsyncSeedsBuilder(
+        users_gateway_client=AsyncUsersGatewayGRPCClient(channel=channel),
+        cards_gateway_client=AsyncCardsGatewayGRPCClient(channel=channel),
+        accounts_gateway_client=AsyncAccountsGatewayGRPCClient(channel=channel),
+        operations_gateway_client=AsyncOperationsGatewayGRPCClient(channel=channel),
+        max_in_flight=max_in_flight,
+        max_users_in_flight=max_users_in_flight
+    )
+
+
+def build_async_http_seeds_builder(
+        max_in_flight: int = 100,
+        max_users_in_flight: int | None = None
+) -> AsyncSeedsBuilder:
+    """
+    Фабрика для создания асинхронного сидера на httpx.AsyncClient. Все клиенты разделяют один пул
+    соединений, размер которого совпадает с окном max_in_flight.
+
+    Args:
+        max_in_flight: Максимальное количество одновременно выполняющихся запросов
+        max_users_in_flight: Максимальное количество одновременно создаваемых пользователей (по умолчанию max_in_flight)
+
+    Returns:
+        AsyncSeedsBuilder: Инициализированный сидер с асинхронными HTTP-клиентами
+    """
+    client = build_gateway_async_http_client(max_connections=max_in_flight)
+    return AsyncSeedsBuilder(
+        users_gateway_client=AsyncUsersGatewayHTTPClient(client=client),
+        cards_gateway_client=AsyncCardsGatewayHTTPClient(client=client),
+        accounts_gateway_client=AsyncAccountsGatewayHTTPClient(client=client),
+        operations_gateway_client=AsyncOperationsGatewayHTTPClient(client=client),
+        max_in_flight=max_in_flight,
+        max_users_in_flight=max_users_in_flight
+    )
@@ -1,11 +1,23 @@
+from functools import partial
+from typing import Any, Callable
+
+from gevent import Greenlet, iwait
+from gevent.lock import BoundedSemaphore
+from gevent.pool import Group, Pool
+
 from clients.grpc.gateway.accounts.client import build_accounts_gateway_grpc_client, AccountsGatewayGRPCClient
 from clients.grpc.gateway.cards.client import build_cards_gateway_grpc_client, CardsGatewayGRPCClient
 from clients.grpc.gateway.operations.client import build_operations_gateway_grpc_client, OperationsGatewayGRPCClient
 from clients.grpc.gateway.users.client import build_users_gateway_grpc_client, UsersGatewayGRPCClient
+from clients.grpc.services.accounts.client import build_accounts_service_grpc_client, AccountsServiceGRPCClient
+from clients.grpc.services.cards.client import build_cards_service_grpc_client, CardsServiceGRPCClient
+from clients.grpc.services.operations.client import build_operations_service_grpc_client, OperationsServiceGRPCClient
+from clients.grpc.services.users.client import build_users_service_grpc_client, UsersServiceGRPCClient
 from clients.http.gateway.accounts.client import build_accounts_gateway_http_client, AccountsGatewayHTTPClient
 from clients.http.gateway.cards.client import build_cards_gateway_http_client, CardsGatewayHTTPClient
 from clients.http.gateway.operations.client import build_operations_gateway_http_client, OperationsGatewayHTTPClient
 from clients.http.gateway.users.client import build_users_gateway_http_client, UsersGatewayHTTPClient
+from clients.retries import build_seeds_retry_policy
 from seeds.schema.plan import (
     SeedsPlan,
     SeedUsersPlan,
@@ -23,26 +35,108 @@ from seeds.schema.result import (
 class SeedsBuilder:
     """
     SeedsBuilder — генератор (сидер), формирующий необходимые тестовые или демонстрационные данные
-    на основании входного плана. Работает одинаково как с HTTP, так и с gRPC клиентами.
+    на основании входного плана. Работает одинаково как с HTTP, так и с gRPC клиентами gateway,
+    а также с клиентами внутренних сервисов (у них те же методы создания сущностей).
 
     Attributes:
         users_gateway_client: Клиент для работы с пользователями (HTTP или gRPC)
         cards_gateway_client: Клиент для выпуска карт
         accounts_gateway_client: Клиент для открытия счетов
         operations_gateway_client: Клиент для операций (топ-ап, покупки и т.д.)
+        workers: Количество пользователей, создаваемых параллельно. При значении 1 сидинг
+            выполняется строго последовательно, при большем значении пользователи создаются
+            в пуле greenlet'ов, а независимые вызовы внутри пользователя и счёта — одновременно.
+        max_in_flight: Общий на все уровни вложенности предел greenlet'ов, одновременно выполняющих
+            вызовы билдера: workers greenlet'ов пользователей и не больше max_in_flight - workers
+            greenlet'ов вложенных gather (счетов, карт, операций).
     """
 
     def __init__(
             self,
-            users_gateway_client: UsersGatewayGRPCClient | UsersGatewayHTTPClient,
-            cards_gateway_client: CardsGatewayGRPCClient | CardsGatewayHTTPClient,
-            accounts_gateway_client: AccountsGatewayGRPCClient | AccountsGatewayHTTPClient,
-            operations_gateway_client: OperationsGatewayGRPCClient | OperationsGatewayHTTPClient
+            users_gateway_client: UsersGatewayGRPCClient | UsersGatewayHTTPClient | UsersServiceGRPCClient,
+            cards_gateway_client: CardsGatewayGRPCClient | CardsGatewayHTTPClient | CardsServiceGRPCClient,
+            accounts_gateway_client: AccountsGatewayGRPCClient | AccountsGatewayHTTPClient | AccountsServiceGRPCClient,
+            operations_gateway_client: (
+                    OperationsGatewayGRPCClient | OperationsGatewayHTTPClient | OperationsServiceGRPCClient
+            ),
+            workers: int = 1,
+            max_in_flight: int = 100
     ):
         self.users_gateway_client = users_gateway_client
         self.cards_gateway_client = cards_gateway_client
         self.accounts_gateway_client = accounts_gateway_client
         self.operations_gateway_client = operations_gateway_client
+        self.workers = max(workers, 1)
+        self.max_in_flight = max(max_in_flight, self.workers)
+        # Слоты вложенных gather, общие для всех пользователей и уровней (пользователь → счёт → карты и операции)
+        self.slots = BoundedSemaphore(self.max_in_flight - self.workers)
+
+    @staticmethod
+    def repeat(count: int, func: Callable[..., Any], **kwargs: Any) -> list[Callable[[], Any]]:
+        """
+        Формирует список из count одинаковых отложенных вызовов func(**kwargs).
+
+        Args:
+            count: Количество вызовов
+            func: Вызываемый метод билдера
+            **kwargs: Аргументы вызова
+
+        Returns:
+            list[Callable[[], Any]]: Список вызовов для передачи в gather
+        """
+        return [partial(func, **kwargs) for _ in range(count)]
+
+    def gather(self, **jobs: list[Callable[[], Any]]) -> dict[str, list[Any]]:
+        """
+        Выполняет независимые группы вызовов и возвращает их результаты с сохранением порядка.
+
+        В последовательном режиме (workers == 1) вызовы выполняются по очереди.
+        В конкурентном режиме вызов запускается в отдельном greenlet'е, если свободен общий слот (см. max_in_flight),
+        иначе выполняется сразу в текущем greenlet'е. Слоты не ожидаются, поэтому вложенные gather не могут
+        занять все слоты и заблокировать друг друга, а число greenlet'ов не растёт с размером плана.
+        При ошибке любого вызова остальные останавливаются, а исключение пробрасывается выше.
+
+        Args:
+            **jobs: Именованные группы вызовов (например, physical_cards=[...])
+
+        Returns:
+            dict[str, list[Any]]: Результаты вызовов, сгруппированные по тем же именам
+        """
+        if self.workers == 1:
+            return {name: [job() for job in group] for name, group in jobs.items()}
+
+        group = Group()
+        results: dict[str, list[Any]] = {name: [None] * len(items) for name, items in jobs.items()}
+        greenlets: list[tuple[str, int, Greenlet]] = []
+        try:
+            for name, items in jobs.items():
+                for index, job in enumerate(items):
+                    if self.slots.acquire(blocking=False):
+                        greenlet = group.spawn(job)
+                        # Ссылка срабатывает и для greenlet'а, остановленного до старта, поэтому слот не теряется
+                        greenlet.rawlink(self.release_slot)
+                        greenlets.append((name, index, greenlet))
+                    else:
+                        results[name][index] = job()
+
+            for greenlet in iwait([greenlet for _, _, greenlet in greenlets]):
+                if not greenlet.successful():
+                    # get() пробрасывает исключение вызова с его исходным traceback
+                    greenlet.get()
+        except Exception:
+            group.kill()
+            raise
+
+        for name, index, greenlet in greenlets:
+            results[name][index] = greenlet.value
+
+        return results
+
+    def release_slot(self, greenlet: Greenlet) -> None:
+        """
+        Освобождает слот, занятый greenlet'ом gather, когда тот завершился, упал или был остановлен.
+        """
+        self.slots.release()
 
     def build_physical_card_result(self, user_id: str, account_id: str) -> SeedCardResult:
         """
@@ -174,6 +268,57 @@ class SeedsBuilder:
         return SeedOperationResult(operation_id=response.operation.id)
 
 
+    def build_card_account_result(
+            self,
+            plan: SeedAccountsPlan,
+            user_id: str,
+            card_id: str,
+            account_id: str
+    ) -> SeedAccountResult:
+        """
+        Выпускает карты и выполняет операции по уже открытому карточному счёту согласно плану.
+        Все вызовы независимы друг от друга, поэтому в конкурентном режиме выполняются одновременно.
+
+        Args:
+            plan: План создания карточного счёта (кол-во карт, операций и т.п.)
+            user_id: Идентификатор пользователя
+            card_id: Идентификатор карты, выпущенной вместе со счётом
+            account_id: Идентификатор счёта
+
+        Returns:
+            SeedAccountResult: Результат с ID счёта и дополнительными действиями (карты, операции)
+        """
+        results = self.gather(
+            physical_cards=self.repeat(
+                plan.physical_cards.count, self.build_physical_card_result, user_id=user_id, account_id=account_id
+            ),
+            virtual_cards=self.repeat(
+                plan.virtual_cards.count, self.build_virtual_card_result, user_id=user_id, account_id=account_id
+            ),
+            top_up_operations=self.repeat(
+                plan.top_up_operations.count, self.build_top_up_operation_result, card_id=card_id, account_id=account_id
+            ),
+            purchase_operations=self.repeat(
+                plan.purchase_operations.count,
+                self.build_purchase_operation_result,
+                card_id=card_id,
+                account_id=account_id
+            ),
+            transfer_operations=self.repeat(
+                plan.transfer_operations.count,
+                self.build_transfer_operation_result,
+                card_id=card_id,
+                account_id=account_id
+            ),
+            cash_withdrawal_operations=self.repeat(
+                plan.cash_withdrawal_operations.count,
+                self.build_cash_withdrawal_operation_result,
+                card_id=card_id,
+                account_id=account_id
+            )
+        )
+        return SeedAccountResult(account_id=account_id, **results)
+
     def build_debit_card_account_result(self, plan: SeedAccountsPlan, user_id: str) -> SeedAccountResult:
         """
         Открывает дебетовый счёт для пользователя и при необходимости:
@@ -192,35 +337,11 @@ class SeedsBuilder:
             SeedAccountResult: Результат с ID счёта и дополнительными действиями (карты, операции)
         """
         response = self.accounts_gateway_client.open_debit_card_account(user_id=user_id)
-        card_id = response.account.cards[0].id
-        account_id = response.account.id
-
-        return SeedAccountResult(
-            account_id=response.account.id,
-            physical_cards=[
-                self.build_physical_card_result(user_id=user_id, account_id=response.account.id)
-                for _ in range(plan.physical_cards.count)
-            ],
-            virtual_cards=[
-                self.build_virtual_card_result(user_id=user_id, account_id=response.account.id)
-                for _ in range(plan.virtual_cards.count)
-            ],
-            top_up_operations=[
-                self.build_top_up_operation_result(card_id=card_id, account_id=account_id)
-                for _ in range(plan.top_up_operations.count)
-            ],
-            purchase_operations=[
-                self.build_purchase_operation_result(card_id=card_id, account_id=account_id)
-                for _ in range(plan.purchase_operations.count)
-            ],
-            transfer_operations=[
-                self.build_transfer_operation_result(card_id=card_id, account_id=account_id)
-                for _ in range(plan.transfer_operations.count)
-            ],
-            cash_withdrawal_operations=[
-                self.build_cash_withdrawal_operation_result(card_id=card_id, account_id=account_id)
-                for _ in range(plan.cash_withdrawal_operations.count)
-            ]
+        return self.build_card_account_result(
+            plan=plan,
+            user_id=user_id,
+            card_id=response.account.cards[0].id,
+            account_id=response.account.id
         )
 
     def build_credit_card_account_result(self, plan: SeedAccountsPlan, user_id: str) -> SeedAccountResult:
@@ -241,34 +362,11 @@ class SeedsBuilder:
             SeedAccountResult: Результат с ID счёта и деталями операций
         """
         response = self.accounts_gateway_client.open_credit_card_account(user_id=user_id)
-        card_id = response.account.cards[0].id
-        account_id = response.account.id
-
-        return SeedAccountResult(
-            account_id=response.account.id,
-            physical_cards=[
-                self.build_physical_card_result(user_id=user_id, account_id=account_id)
-                for _ in range(plan.physical_cards.count)
-            ],
-            virtual_cards=[
-                self.build_virtual_card_result(user_id=user_id, account_id=account_id)
-                for _ in range(plan.virtual_cards.count)
-            ],
-            top_up_operations=[
-                self.build_top_up_operation_result(card_id=card_id, account_id=account_id)
-                for _ in range(plan.top_up_operations.count)
-            ],
-            purchase_operations=[
-                self.build_purchase_operation_result(card_id=card_id, account_id=account_id)
-                for _ in range(plan.purchase_operations.count)
-            ],
-            transfer_operations=[
-                self.build_transfer_operation_result(card_id=card_id, account_id=account_id)
-                for _ in range(plan.transfer_operations.count)
-            ],
-            cash_withdrawal_operations=[
-                self.build_cash_withdrawal_operation_result(card_id=card_id, account_id=account_id)
-                for _ in range(plan.cash_withdrawal_operations.count)]
+        return self.build_card_account_result(
+            plan=plan,
+            user_id=user_id,
+            card_id=response.account.cards[0].id,
+            account_id=response.account.id
         )
 
     def build_user(self, plan: SeedUsersPlan) -> SeedUserResult:
@@ -284,68 +382,170 @@ class SeedsBuilder:
             SeedUserResult: Результат с ID пользователя и всеми созданными сущностями
         """
         response = self.users_gateway_client.create_user()
-
-        return SeedUserResult(
-            user_id=response.user.id,
-            savings_accounts=[
-                self.build_savings_account_result(user_id=response.user.id)
-                for _ in range(plan.savings_accounts.count)
-            ],
-            deposit_accounts=[
-                self.build_deposit_account_result(user_id=response.user.id)
-                for _ in range(plan.deposit_accounts.count)
-            ],
-            debit_card_accounts=[
-                self.build_debit_card_account_result(plan=plan.debit_card_accounts, user_id=response.user.id)
-                for _ in range(plan.debit_card_accounts.count)
-            ],
-            credit_card_accounts=[
-                self.build_credit_card_account_result(plan=plan.credit_card_accounts, user_id=response.user.id)
-                for _ in range(plan.credit_card_accounts.count)
-            ]
+        user_id = response.user.id
+
+        results = self.gather(
+            savings_accounts=self.repeat(
+                plan.savings_accounts.count, self.build_savings_account_result, user_id=user_id
+            ),
+            deposit_accounts=self.repeat(
+                plan.deposit_accounts.count, self.build_deposit_account_result, user_id=user_id
+            ),
+            debit_card_accounts=self.repeat(
+                plan.debit_card_accounts.count,
+                self.build_debit_card_account_result,
+                plan=plan.debit_card_accounts,
+                user_id=user_id
+            ),
+            credit_card_accounts=self.repeat(
+                plan.credit_card_accounts.count,
+                self.build_credit_card_account_result,
+                plan=plan.credit_card_accounts,
+                user_id=user_id
+            )
         )
+        return SeedUserResult(user_id=user_id, **results)
 
-    def build(self, plan: SeedsPlan) -> SeedsResult:
+    def build(
+            self,
+            plan: SeedsPlan,
+            completed: list[SeedUserResult] | None = None,
+            on_user: Callable[[SeedUserResult], None] | None = None
+    ) -> SeedsResult:
         """
         Генерирует полную структуру данных на основе плана:
         - создаёт указанное количество пользователей
         - каждому пользователю присваиваются счета, карты и операции
 
+        В конкурентном режиме одновременно создаётся не более workers пользователей,
+        порядок пользователей в результате совпадает с последовательным режимом.
+
         Args:
             plan: Полный план генерации данных
+            completed: Пользователи, созданные в прерванном ранее запуске; создаются только недостающие
+            on_user: Вызывается для каждого нового пользователя сразу после его создания
+                (например, чтобы дописать его в контрольную точку)
 
         Returns:
             SeedsResult: Результат с данными всех созданных пользователей
         """
-        return SeedsResult(users=[self.build_user(plan=plan.users) for _ in range(plan.users.count)])
-
-
-def build_grpc_seeds_builder() -> SeedsBuilder:
+        users = list(completed or [])
+        remaining = max(plan.users.count - len(users), 0)
+
+        def build_user(_: int) -> SeedUserResult:
+            user = self.build_user(plan=plan.users)
+            if on_user is not None:
+                on_user(user)
+            return user
+
+        if self.workers == 1:
+            return SeedsResult(users=users + [build_user(index) for index in range(remaining)])
+
+        # Пул ограничивает количество одновременно создаваемых пользователей (spawn ждёт свободного места).
+        # При первой ошибке новые пользователи больше не запускаются: уже запущенные дозавершаются
+        # (и попадают в контрольную точку через on_user), после чего ошибка пробрасывается выше
+        pool = Pool(self.workers)
+        failed: list[Greenlet] = []
+        greenlets: list[Greenlet] = []
+        for index in range(remaining):
+            if failed:
+                break
+
+            greenlet = pool.spawn(build_user, index)
+            greenlet.link_exception(failed.append)
+            greenlets.append(greenlet)
+
+        pool.join()
+        if failed:
+            # get() пробрасывает исключение с исходным traceback из greenlet'а пользователя
+            failed[0].get()
+
+        users.extend(greenlet.value for greenlet in greenlets)
+        return SeedsResult(users=users)
+
+
+def build_grpc_seeds_builder(workers: int = 1, max_in_flight: int = 100) -> SeedsBuilder:
     """
     Фабрика для создания сидера с использованием gRPC-клиентов.
 
+    Args:
+        workers: Количество пользователей, создаваемых параллельно
+        max_in_flight: Общий предел greenlet'ов, одновременно выполняющих вызовы (см. SeedsBuilder)
+
     Returns:
         SeedsBuilder: Инициализированный сидер с gRPC-клиентами
     """
+    # Временные UNAVAILABLE повторяются, а не прерывают весь сидинг
+    retry = build_seeds_retry_policy()
     return SeedsBuilder(
-        users_gateway_client=build_users_gateway_grpc_client(),
-        cards_gateway_client=build_cards_gateway_grpc_client(),
-        accounts_gateway_client=build_accounts_gateway_grpc_client(),
-        operations_gateway_client=build_operations_gateway_grpc_client()
+        users_gateway_client=build_users_gateway_grpc_client(retry),
+        cards_gateway_client=build_cards_gateway_grpc_client(retry),
+        accounts_gateway_client=build_accounts_gateway_grpc_client(retry),
+        operations_gateway_client=build_operations_gateway_grpc_client(retry),
+        workers=workers,
+        max_in_flight=max_in_flight
     )
 
 
-def build_http_seeds_builder():
+def build_http_seeds_builder(workers: int = 1, max_in_flight: int = 100) -> SeedsBuilder:
     """
     Фабрика для создания сидера с использованием HTTP-клиентов.
 
+    Args:
+        workers: Количество пользователей, создаваемых параллельно
+        max_in_flight: Общий предел greenlet'ов, одновременно выполняющих вызовы (см. SeedsBuilder)
+
     Returns:
         SeedsBuilder: Инициализированный сидер с HTTP-клиентами
     """
+    # Временные 503 и сетевые ошибки повторяются, а не прерывают весь сидинг
+    retry = build_seeds_retry_policy()
     return SeedsBuilder(
-        users_gateway_client=build_users_gateway_http_client(),
-        cards_gateway_client=build_cards_gateway_http_client(),
-        accounts_gateway_client=build_accounts_gateway_http_client(),
-        operations_gateway_client=build_operations_gateway_http_client()
+        users_gateway_client=build_users_gateway_http_client(retry),
+        cards_gateway_client=build_cards_gateway_http_client(retry),
+        accounts_gateway_client=build_accounts_gateway_http_client(retry),
+        operations_gateway_client=build_operations_gateway_http_client(retry),
+        workers=workers,
+        max_in_flight=max_in_flight
     )
 
+
+def build_services_grpc_seeds_builder(
+        users_address: str,
+        accounts_address: str,
+        cards_address: str,
+        operations_address: str,
+        workers: int = 10,
+        max_in_flight: int = 100
+) -> SeedsBuilder:
+    """
+    Фабрика для создания сидера, который создаёт данные напрямую во внутренних сервисах
+    (users, accounts, cards, operations) в обход gateway.
+
+    Gateway, который затем измеряется нагрузочным тестом, во время сидинга не нагружается.
+    На каждый сервис открывается один канал, а конкурентные вызовы билдера идут по нему
+    параллельными потоками HTTP/2, поэтому по умолчанию сидинг выполняется конкурентно.
+
+    Args:
+        users_address: Адрес UsersService (host:port)
+        accounts_address: Адрес AccountsService (host:port)
+        cards_address: Адрес CardsService (host:port)
+        operations_address: Адрес OperationsService (host:port)
+        workers: Количество пользователей, создаваемых параллельно
+        max_in_flight: Общий предел greenlet'ов, одновременно выполняющих вызовы (см. SeedsBuilder)
+
+    Returns:
+        SeedsBuilder: Инициализированный сидер с клиентами внутренних сервисов
+    """
+    retry = build_seeds_retry_policy()
+    cards_service_client = build_cards_service_grpc_client(cards_address, retry)
+    return SeedsBuilder(
+        users_gateway_client=build_users_service_grpc_client(users_address, retry),
+        cards_gateway_client=cards_service_client,
+        accounts_gateway_client=build_accounts_service_grpc_client(
+            accounts_address, cards_service_client=cards_service_client, retry=retry
+        ),
+        operations_gateway_client=build_operations_service_grpc_client(operations_address, retry),
+        workers=workers,
+        max_in_flight=max_in_flight
+    )
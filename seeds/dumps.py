@@ -1,16 +1,51 @@
 import os
+from array import array
+from typing import Iterable
 
-from seeds.schema.result import SeedsResult
+from pydantic import ValidationError
 
+from seeds.readers import (
+    JSONLinesSeedsResult, BinarySeedsResult, BINARY_SEEDS_HEADER, BINARY_SEEDS_MAGIC, BINARY_SEEDS_VERSION,
+    USER_ACCOUNTS_FIELDS, ACCOUNT_CARDS_FIELDS, ACCOUNT_OPERATIONS_FIELDS
+)
+from seeds.schema.meta import SeedsMeta, SeedsCheckpointHeader, SeedsDumpFormat
+from seeds.schema.result import SeedsResult, SeedUserResult, SeedAccountResult, SeedCardResult, SeedOperationResult
 
-def save_seeds_result(result: SeedsResult, scenario: str):
+
+def get_seeds_result_paths(scenario: str, dump_format: SeedsDumpFormat) -> list[str]:
+    """
+    Возвращает пути ко всем файлам дампа сидинга в заданном формате.
+
+    :param scenario: Название сценария нагрузки.
+    :param dump_format: Формат дампа.
+    :return: Список путей (для JSONL — сам дамп и индекс смещений строк).
     """
-    Сохраняет результат сидинга (SeedsResult) в JSON-файл.
+    if dump_format == SeedsDumpFormat.JSONL:
+        return [f"./dumps/{scenario}_seeds.jsonl", f"./dumps/{scenario}_seeds.jsonl.idx"]
+
+    if dump_format == SeedsDumpFormat.BINARY:
+        return [f"./dumps/{scenario}_seeds.bin"]
+
+    return [f"./dumps/{scenario}_seeds.json"]
+
+
+def save_seeds_result(result: SeedsResult, scenario: str, dump_format: SeedsDumpFormat = SeedsDumpFormat.JSON):
+    """
+    Сохраняет результат сидинга (SeedsResult) в JSON-файл, построчно в JSONL-файл или в бинарный дамп.
 
     :param result: Результат сидинга, сгенерированный билдером.
     :param scenario: Название сценария нагрузки, для которого создаются данные.
                      Используется для генерации имени файла (например, "credit_card_test").
+    :param dump_format: Формат дампа.
     """
+    if dump_format == SeedsDumpFormat.JSONL:
+        write_seeds_users(users=result.users, scenario=scenario)
+        return
+
+    if dump_format == SeedsDumpFormat.BINARY:
+        write_seeds_binary(users=result.users, scenario=scenario)
+        return
+
     # Убедимся, что папка dumps существует
     if not os.path.exists("dumps"):
         os.mkdir("dumps")
@@ -20,13 +55,250 @@ def save_seeds_result(result: SeedsResult, scenario: str):
         file.write(result.model_dump_json())
 
 
-def load_seeds_result(scenario: str) -> SeedsResult:
+def write_seeds_users(users: Iterable[SeedUserResult], scenario: str) -> int:
+    """
+    Потоково записывает пользователей в JSONL-дамп {scenario}_seeds.jsonl — по одному на строку,
+    не собирая весь результат в одну строку в памяти. Параллельно пишется индекс смещений
+    начала строк {scenario}_seeds.jsonl.idx (uint64, последним идёт смещение конца файла),
+    по которому ленивый загрузчик читает любого пользователя за O(1).
+
+    :param users: Пользователи (список или генератор).
+    :param scenario: Название сценария нагрузки.
+    :return: Количество записанных пользователей.
     """
-    Загружает результат сидинга из JSON-файла.
+    if not os.path.exists("dumps"):
+        os.mkdir("dumps")
+
+    path, index_path = get_seeds_result_paths(scenario, SeedsDumpFormat.JSONL)
+    offsets = array("Q", [0])
+    with open(path, 'wb') as file:
+        for user in users:
+            line = user.model_dump_json().encode("utf-8") + b"\n"
+            file.write(line)
+            offsets.append(offsets[-1] + len(line))
+
+    with open(index_path, 'wb') as file:
+        offsets.tofile(file)
+
+    return len(offsets) - 1
+
+
+def write_seeds_binary(users: Iterable[SeedUserResult], scenario: str) -> int:
+    """
+    Записывает пользователей в компактный бинарный дамп {scenario}_seeds.bin.
+
+    Все идентификаторы складываются в общую таблицу строк (каждый уникальный — один раз),
+    а пользователи кодируются массивом номеров строк и длин списков. Структура файла
+    описана в BinarySeedsResult.
+
+    :param users: Пользователи (список или генератор).
+    :param scenario: Название сценария нагрузки.
+    :return: Количество записанных пользователей.
+    """
+    if not os.path.exists("dumps"):
+        os.mkdir("dumps")
+
+    strings: dict[str, int] = {}
+    string_offsets = array("Q", [0])
+    blob = bytearray()
+
+    def intern(value: str) -> int:
+        if value not in strings:
+            strings[value] = len(strings)
+            blob.extend(value.encode("utf-8"))
+            string_offsets.append(len(blob))
+
+        return strings[value]
+
+    words = array("I")
+    user_offsets = array("Q", [0])
+    for user in users:
+        words.append(intern(user.user_id))
+        for accounts_field in USER_ACCOUNTS_FIELDS:
+            accounts: list[SeedAccountResult] = getattr(user, accounts_field)
+            words.append(len(accounts))
+            for account in accounts:
+                words.append(intern(account.account_id))
+                for cards_field in ACCOUNT_CARDS_FIELDS:
+                    cards: list[SeedCardResult] = getattr(account, cards_field)
+                    words.append(len(cards))
+                    words.extend(intern(card.card_id) for card in cards)
+                for operations_field in ACCOUNT_OPERATIONS_FIELDS:
+                    operations: list[SeedOperationResult] = getattr(account, operations_field)
+                    words.append(len(operations))
+                    words.extend(intern(operation.operation_id) for operation in operations)
+
+        user_offsets.append(len(words))
+
+    users_count = len(user_offsets) - 1
+    with open(get_seeds_result_paths(scenario, SeedsDumpFormat.BINARY)[0], 'wb') as file:
+        file.write(BINARY_SEEDS_HEADER.pack(
+            BINARY_SEEDS_MAGIC, BINARY_SEEDS_VERSION, 0, users_count, len(strings), len(words)
+        ))
+        string_offsets.tofile(file)
+        user_offsets.tofile(file)
+        words.tofile(file)
+        file.write(blob)
+
+    return users_count
+
+
+def load_seeds_result(
+        scenario: str,
+        dump_format: SeedsDumpFormat = SeedsDumpFormat.JSON
+) -> SeedsResult | JSONLinesSeedsResult | BinarySeedsResult:
+    """
+    Загружает результат сидинга из файла.
+
+    JSON-дамп читается и валидируется целиком. JSONL-дамп отображается в память без разбора,
+    а пользователи валидируются по одному в момент выдачи. Бинарный дамп также отображается в память,
+    а пользователь собирается из записи по индексу за O(1).
 
     :param scenario: Название сценария нагрузки, данные которого нужно загрузить.
-    :return: Объект SeedsResult, восстановленный из файла.
+    :param dump_format: Формат дампа.
+    :return: Объект SeedsResult, JSONLinesSeedsResult или BinarySeedsResult с тем же интерфейсом выдачи пользователей.
     """
+    if dump_format == SeedsDumpFormat.JSONL:
+        return JSONLinesSeedsResult(*get_seeds_result_paths(scenario, SeedsDumpFormat.JSONL))
+
+    if dump_format == SeedsDumpFormat.BINARY:
+        return BinarySeedsResult(*get_seeds_result_paths(scenario, SeedsDumpFormat.BINARY))
+
     # Открываем файл и валидируем его как объект SeedsResult
     with open(f'./dumps/{scenario}_seeds.json', 'r', encoding="utf-8") as file:
         return SeedsResult.model_validate_json(file.read())
+
+
+def seeds_result_exists(scenario: str, dump_format: SeedsDumpFormat = SeedsDumpFormat.JSON) -> bool:
+    """
+    Проверяет, сохранён ли дамп сидинга для сценария.
+
+    :param scenario: Название сценария нагрузки.
+    :param dump_format: Формат дампа.
+    :return: True, если все файлы дампа существуют.
+    """
+    return all(os.path.exists(path) for path in get_seeds_result_paths(scenario, dump_format))
+
+
+def save_seeds_meta(meta: SeedsMeta, scenario: str):
+    """
+    Сохраняет метаданные дампа сидинга в файл {scenario}_seeds.meta.json.
+    Вызывается после сохранения самого дампа, поэтому наличие метаданных гарантирует, что дамп записан целиком.
+
+    :param meta: Метаданные дампа (отпечаток плана, количество пользователей).
+    :param scenario: Название сценария нагрузки.
+    """
+    if not os.path.exists("dumps"):
+        os.mkdir("dumps")
+
+    with open(f"./dumps/{scenario}_seeds.meta.json", 'w+', encoding="utf-8") as file:
+        file.write(meta.model_dump_json())
+
+
+def load_seeds_meta(scenario: str) -> SeedsMeta | None:
+    """
+    Загружает метаданные дампа сидинга.
+
+    :param scenario: Название сценария нагрузки.
+    :return: Объект SeedsMeta или None, если дамп ещё не сохранялся или метаданные повреждены.
+    """
+    try:
+        with open(f"./dumps/{scenario}_seeds.meta.json", 'r', encoding="utf-8") as file:
+            return SeedsMeta.model_validate_json(file.read())
+    except (OSError, ValidationError):
+        return None
+
+
+def remove_seeds_result(scenario: str):
+    """
+    Удаляет дамп сидинга (во всех форматах) и его метаданные, чтобы при следующем запуске
+    данные были сгенерированы заново. Метаданные удаляются первыми: дамп без метаданных считается недействительным.
+
+    :param scenario: Название сценария нагрузки.
+    """
+    paths = [f"./dumps/{scenario}_seeds.meta.json"]
+    for dump_format in SeedsDumpFormat:
+        paths.extend(get_seeds_result_paths(scenario, dump_format))
+
+    for path in paths:
+        if os.path.exists(path):
+            os.remove(path)
+
+
+def append_seeds_checkpoint(user: SeedUserResult, scenario: str, plan_fingerprint: str):
+    """
+    Дописывает готового пользователя в файл контрольной точки {scenario}_seeds.checkpoint.jsonl.
+
+    Первая строка файла — заголовок с отпечатком плана, далее по одному пользователю на строку.
+    Каждая строка сбрасывается на диск (flush и fsync) сразу, поэтому при падении сидинга или узла
+    теряется не больше одного незаписанного пользователя.
+
+    :param user: Полностью созданный пользователь со всеми счетами, картами и операциями.
+    :param scenario: Название сценария нагрузки.
+    :param plan_fingerprint: Отпечаток плана, по которому выполняется сидинг.
+    """
+    if not os.path.exists("dumps"):
+        os.mkdir("dumps")
+
+    path = f"./dumps/{scenario}_seeds.checkpoint.jsonl"
+    # Пустой файл остаётся после того, как load_seeds_checkpoint отбросил контрольную точку другого плана
+    is_new = (not os.path.exists(path)) or (os.path.getsize(path) == 0)
+    with open(path, 'a', encoding="utf-8") as file:
+        if is_new:
+            file.write(SeedsCheckpointHeader(plan_fingerprint=plan_fingerprint).model_dump_json() + "\n")
+        file.write(user.model_dump_json() + "\n")
+        file.flush()
+        os.fsync(file.fileno())
+
+
+def load_seeds_checkpoint(scenario: str, plan_fingerprint: str) -> list[SeedUserResult]:
+    """
+    Загружает пользователей, созданных до прерывания сидинга.
+
+    Файл обрезается по концу последней целой строки: недописанная последняя строка (сидинг упал
+    во время записи) удаляется, и следующие пользователи дописываются с новой строки, а не склеиваются
+    с обрывком. Контрольная точка другого плана или с повреждённым заголовком очищается целиком.
+
+    :param scenario: Название сценария нагрузки.
+    :param plan_fingerprint: Отпечаток текущего плана.
+    :return: Список уже созданных пользователей (пустой, если продолжать нечего).
+    """
+    try:
+        file = open(f"./dumps/{scenario}_seeds.checkpoint.jsonl", 'r+b')
+    except OSError:
+        return []
+
+    with file:
+        users: list[SeedUserResult] = []
+        # Смещение конца последней целой строки: всё после него отбрасывается
+        valid_end = 0
+
+        header: SeedsCheckpointHeader | None = None
+        if (header_line := file.readline()).endswith(b"\n"):
+            try:
+                header = SeedsCheckpointHeader.model_validate_json(header_line)
+            except ValidationError:
+                pass
+
+        if (header is not None) and (header.plan_fingerprint == plan_fingerprint):
+            valid_end = file.tell()
+            while (line := file.readline()).endswith(b"\n"):
+                try:
+                    users.append(SeedUserResult.model_validate_json(line))
+                except ValidationError:
+                    break
+                valid_end = file.tell()
+
+        file.truncate(valid_end)
+        return users
+
+
+def remove_seeds_checkpoint(scenario: str):
+    """
+    Удаляет файл контрольной точки после успешного сохранения полного дампа.
+
+    :param scenario: Название сценария нагрузки.
+    """
+    path = f"./dumps/{scenario}_seeds.checkpoint.jsonl"
+    if os.path.exists(path):
+        os.remove(path)
@@ -0,0 +1,123 @@
+import threading
+import time
+from collections import deque
+
+from seeds.readers import MappedSeedsResult
+from seeds.schema.result import SeedsResult, SeedUserResult
+
+
+class SeedsExhaustedError(IndexError):
+    """
+    Исключение, выбрасываемое, когда в результате сидинга не осталось свободных пользователей.
+    Наследуется от IndexError для совместимости с прежним поведением get_next_user.
+    """
+    pass
+
+
+class SeedsLeasePool:
+    """
+    Пул эксклюзивной аренды пользователей из результата сидинга.
+
+    Пользователь, выданный через lease(), не выдаётся другим виртуальным пользователям, пока его
+    не вернут через release(). Пул хранит только порядковые номера пользователей: ещё ни разу
+    не выданные раздаются курсором, возвращённые — из очереди, поэтому lease() и release()
+    выполняются за O(1) и работают поверх любого результата с get_user/get_users_count
+    (SeedsResult, JSONLinesSeedsResult, BinarySeedsResult).
+
+    Когда свободных пользователей нет, lease() ждёт возврата не дольше timeout, а затем
+    либо выдаёт уже арендованного пользователя повторно по кругу (recycle=True),
+    либо выбрасывает SeedsExhaustedError.
+    """
+
+    def __init__(self, result: SeedsResult | MappedSeedsResult, recycle: bool = False):
+        """
+        :param result: Результат сидинга, пользователи которого сдаются в аренду.
+        :param recycle: Выдавать уже арендованных пользователей повторно, когда свободные закончились.
+        """
+        self.result = result
+        self.recycle = recycle
+        self.cursor = 0
+        self.recycle_cursor = 0
+        self.released: deque[int] = deque()
+        self.leased: dict[str, tuple[int, int]] = {}
+        self.condition = threading.Condition()
+
+    def get_free_count(self) -> int:
+        """
+        Возвращает количество пользователей, которых можно арендовать эксклюзивно прямо сейчас.
+        """
+        return (self.result.get_users_count() - self.cursor) + len(self.released)
+
+    def take_free_index(self) -> int | None:
+        """
+        Забирает номер свободного пользователя: сначала из возвращённых, затем ещё не выданных.
+        """
+        if self.released:
+            return self.released.popleft()
+
+        if self.cursor < self.result.get_users_count():
+            self.cursor += 1
+            return self.cursor - 1
+
+        return None
+
+    def take_recycled_index(self) -> int:
+        """
+        Выбирает по кругу номер уже арендованного пользователя для повторной выдачи.
+        """
+        users_count = self.result.get_users_count()
+        if users_count == 0:
+            raise SeedsExhaustedError("Seeds result is empty, there are no users to lease")
+
+        index = self.recycle_cursor % users_count
+        self.recycle_cursor += 1
+        return index
+
+    def lease(self, timeout: float | None = None) -> SeedUserResult:
+        """
+        Арендует пользователя.
+
+        :param timeout: Сколько секунд ждать возврата пользователя, если свободных нет (None — не ждать).
+        :return: Арендованный пользователь.
+        :raises SeedsExhaustedError: Свободных пользователей нет, ожидание не помогло и recycle выключен.
+        """
+        with self.condition:
+            index = self.take_free_index()
+            if (index is None) and timeout:
+                deadline = time.monotonic() + timeout
+                while (index is None) and (remaining := deadline - time.monotonic()) > 0:
+                    self.condition.wait(remaining)
+                    index = self.take_free_index()
+
+            if index is None:
+                if not self.recycle:
+                    raise SeedsExhaustedError(
+                        f"All {self.result.get_users_count()} seeded users are leased, increase the seeds plan"
+                    )
+
+                index = self.take_recycled_index()
+
+            user = self.result.get_user(index)
+            _, holders = self.leased.get(user.user_id, (index, 0))
+            self.leased[user.user_id] = (index, holders + 1)
+            return user
+
+    def release(self, user: SeedUserResult) -> None:
+        """
+        Возвращает арендованного пользователя в пул. Повторно выданный (recycle) пользователь
+        становится свободным, только когда его вернут все арендаторы. Возврат неарендованного
+        пользователя игнорируется.
+
+        :param user: Пользователь, полученный через lease().
+        """
+        with self.condition:
+            if user.user_id not in self.leased:
+                return
+
+            index, holders = self.leased.pop(user.user_id)
+            if holders > 1:
+                self.leased[user.user_id] = (index, holders - 1)
+                return
+
+            self.released.append(index)
+            self.condition.notify()
@@ -0,0 +1,467 @@
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import Counter, defaultdict, deque
+from itertools import islice
+from typing import TYPE_CHECKING, NamedTuple
+
+from seeds.leases import SeedsExhaustedError
+from seeds.readers import MappedSeedsResult
+from seeds.schema.result import SeedsResult, SeedUserResult
+
+if TYPE_CHECKING:
+    from redis import Redis
+
+
+class SeedsPoolKeys(NamedTuple):
+    """
+    Ключи хранилища одного пула сидинга.
+    """
+    # Список свободных пользователей
+    free: str
+    # Множество сроков аренды (score — unix-время окончания аренды)
+    leased: str
+    # Счётчики арендаторов каждого арендованного пользователя (больше одного — при повторной выдаче)
+    holders: str
+    # Список всех пользователей пула, из которого они выдаются повторно по кругу
+    users: str
+    # Курсор повторной выдачи
+    recycle_cursor: str
+
+
+def build_seeds_pool_keys(scenario: str) -> SeedsPoolKeys:
+    """
+    Строит ключи пула сидинга вида seeds:{scenario}:{name}.
+
+    :param scenario: Название сценария сидинга.
+    :return: Ключи пула.
+    """
+    return SeedsPoolKeys(*(f"seeds:{scenario}:{name}" for name in SeedsPoolKeys._fields))
+
+
+class SeedsPoolBackend(ABC):
+    """
+    Хранилище общего пула сидинга. Набор операций повторяет списки Redis (RPUSH, LLEN, DEL)
+    и упорядоченные множества для сроков аренды (ZADD); аренда, возврат и перенос истёкших аренд
+    выполняются одной атомарной операцией над всеми ключами пула.
+    """
+
+    @abstractmethod
+    def push(self, key: str, values: list[str]) -> None:
+        """
+        Добавляет значения в конец списка.
+        """
+        ...
+
+    @abstractmethod
+    def length(self, key: str) -> int:
+        """
+        Возвращает длину списка.
+        """
+        ...
+
+    @abstractmethod
+    def delete(self, key: str) -> None:
+        """
+        Удаляет список, множество сроков аренды или счётчики.
+        """
+        ...
+
+    @abstractmethod
+    def set_deadlines(self, key: str, deadlines: dict[str, float], existing_only: bool = False) -> None:
+        """
+        Задаёт сроки аренды (unix-время) значениям в множестве key.
+
+        :param existing_only: Обновлять только значения, которые уже есть в множестве (продление аренды).
+        """
+        ...
+
+    @abstractmethod
+    def lease(
+            self,
+            keys: SeedsPoolKeys,
+            deadline: float | None,
+            recycle: bool,
+            timeout: float | None = None
+    ) -> str | bytes | None:
+        """
+        Атомарно забирает значение из начала списка свободных, увеличивает счётчик его арендаторов
+        и, если задан deadline, записывает срок аренды. Если свободных нет, ждёт не дольше timeout,
+        а затем при recycle выдаёт по кругу уже арендованное значение.
+
+        :return: Значение или None, если выдать нечего.
+        """
+        ...
+
+    @abstractmethod
+    def release(self, keys: SeedsPoolKeys, value: str) -> bool:
+        """
+        Атомарно уменьшает счётчик арендаторов значения; когда арендаторов не осталось, удаляет
+        срок аренды и возвращает значение в конец списка свободных.
+
+        :return: True, если значение вернулось в список свободных.
+        """
+        ...
+
+    @abstractmethod
+    def reclaim(self, keys: SeedsPoolKeys, now: float) -> int:
+        """
+        Атомарно переносит значения с истёкшим сроком аренды в конец списка свободных.
+        :return: Количество возвращённых значений.
+        """
+        ...
+
+
+class InMemorySeedsPoolBackend(SeedsPoolBackend):
+    """
+    Хранилище пула в памяти текущего процесса. Заменяет Redis при локальных запусках и отладке,
+    но не разделяется между процессами.
+    """
+
+    def __init__(self):
+        self.lists: defaultdict[str, deque[str]] = defaultdict(deque)
+        self.deadlines: defaultdict[str, dict[str, float]] = defaultdict(dict)
+        self.counters: defaultdict[str, Counter[str]] = defaultdict(Counter)
+        self.cursors: defaultdict[str, int] = defaultdict(int)
+        self.condition = threading.Condition()
+
+    def push(self, key: str, values: list[str]) -> None:
+        with self.condition:
+            self.lists[key].extend(values)
+            self.condition.notify(len(values))
+
+    def length(self, key: str) -> int:
+        with self.condition:
+            return len(self.lists[key])
+
+    def delete(self, key: str) -> None:
+        with self.condition:
+            self.lists.pop(key, None)
+            self.deadlines.pop(key, None)
+            self.counters.pop(key, None)
+            self.cursors.pop(key, None)
+
+    def set_deadlines(self, key: str, deadlines: dict[str, float], existing_only: bool = False) -> None:
+        with self.condition:
+            for value, deadline in deadlines.items():
+                if (not existing_only) or (value in self.deadlines[key]):
+                    self.deadlines[key][value] = deadline
+
+    def lease(
+            self,
+            keys: SeedsPoolKeys,
+            deadline: float | None,
+            recycle: bool,
+            timeout: float | None = None
+    ) -> str | None:
+        with self.condition:
+            stop = time.monotonic() + (timeout or 0)
+            while (not self.lists[keys.free]) and (remaining := stop - time.monotonic()) > 0:
+                self.condition.wait(remaining)
+
+            if self.lists[keys.free]:
+                value = self.lists[keys.free].popleft()
+            elif recycle and self.lists[keys.users]:
+                users = self.lists[keys.users]
+                value = users[self.cursors[keys.recycle_cursor] % len(users)]
+                self.cursors[keys.recycle_cursor] += 1
+            else:
+                return None
+
+            self.counters[keys.holders][value] += 1
+            if deadline is not None:
+                self.deadlines[keys.leased][value] = deadline
+            return value
+
+    def release(self, keys: SeedsPoolKeys, value: str) -> bool:
+        with self.condition:
+            holders = self.counters[keys.holders]
+            if value not in holders:
+                return False
+
+            holders[value] -= 1
+            if holders[value] > 0:
+                return False
+
+            del holders[value]
+            self.deadlines[keys.leased].pop(value, None)
+            self.lists[keys.free].append(value)
+            self.condition.notify()
+            return True
+
+    def reclaim(self, keys: SeedsPoolKeys, now: float) -> int:
+        with self.condition:
+            expired = [value for value, deadline in self.deadlines[keys.leased].items() if deadline <= now]
+            for value in expired:
+                del self.deadlines[keys.leased][value]
+                self.counters[keys.holders].pop(value, None)
+            self.lists[keys.free].extend(expired)
+            self.condition.notify(len(expired))
+            return len(expired)
+
+
+class RedisSeedsPoolBackend(SeedsPoolBackend):
+    """
+    Хранилище пула в Redis (или совместимом сервисе). Один пул разделяют любые процессы,
+    воркеры и контейнеры, подключённые к тому же серверу.
+
+    Аренда, возврат и перенос истёкших аренд выполняются Lua-скриптами: каждая операция — одна команда,
+    поэтому между выдачей пользователя и записью срока его аренды процесс не может упасть, а значение —
+    продлиться или вернуться в пул. Скрипт аренды не блокируется, поэтому при timeout аренда
+    повторяется каждые LEASE_POLL_INTERVAL секунд.
+    """
+
+    # Ключи скриптов — поля SeedsPoolKeys по порядку: free, leased, holders, users, recycle_cursor
+    LEASE_SCRIPT = """
+    local value = redis.call('LPOP', KEYS[1])
+    if (not value) and ARGV[2] == '1' then
+        local count = redis.call('LLEN', KEYS[4])
+        if count > 0 then
+            value = redis.call('LINDEX', KEYS[4], (redis.call('INCR', KEYS[5]) - 1) % count)
+        end
+    end
+    if not value then
+        return false
+    end
+    redis.call('HINCRBY', KEYS[3], value, 1)
+    if ARGV[1] ~= '' then
+        redis.call('ZADD', KEYS[2], ARGV[1], value)
+    end
+    return value
+    """
+    RELEASE_SCRIPT = """
+    if redis.call('HEXISTS', KEYS[3], ARGV[1]) == 0 then
+        return 0
+    end
+    if redis.call('HINCRBY', KEYS[3], ARGV[1], -1) > 0 then
+        return 0
+    end
+    redis.call('HDEL', KEYS[3], ARGV[1])
+    redis.call('ZREM', KEYS[2], ARGV[1])
+    redis.call('RPUSH', KEYS[1], ARGV[1])
+    return 1
+    """
+    RECLAIM_SCRIPT = """
+    local values = redis.call('ZRANGEBYSCORE', KEYS[2], '-inf', ARGV[1])
+    for _, value in ipairs(values) do
+        redis.call('ZREM', KEYS[2], value)
+        redis.call('HDEL', KEYS[3], value)
+        redis.call('RPUSH', KEYS[1], value)
+    end
+    return #values
+    """
+    LEASE_POLL_INTERVAL = 0.1
+
+    def __init__(self, client: "Redis"):
+        """
+        :param client: Клиент redis.Redis.
+        """
+        self.client = client
+        self.lease_script = client.register_script(self.LEASE_SCRIPT)
+        self.release_script = client.register_script(self.RELEASE_SCRIPT)
+        self.reclaim_script = client.register_script(self.RECLAIM_SCRIPT)
+
+    def push(self, key: str, values: list[str]) -> None:
+        if values:
+            self.client.rpush(key, *values)
+
+    def length(self, key: str) -> int:
+        return self.client.llen(key)
+
+    def delete(self, key: str) -> None:
+        self.client.delete(key)
+
+    def set_deadlines(self, key: str, deadlines: dict[str, float], existing_only: bool = False) -> None:
+        if deadlines:
+            self.client.zadd(key, deadlines, xx=existing_only)
+
+    def lease(
+            self,
+            keys: SeedsPoolKeys,
+            deadline: float | None,
+            recycle: bool,
+            timeout: float | None = None
+    ) -> bytes | None:
+        stop = time.monotonic() + (timeout or 0)
+        while True:
+            remaining = stop - time.monotonic()
+            # Повторная выдача — только когда ожидание свободного пользователя закончилось
+            args = ["" if deadline is None else deadline, int(recycle and remaining <= 0)]
+            value = self.lease_script(keys=list(keys), args=args)
+            if (value is not None) or (remaining <= 0):
+                return value
+
+            time.sleep(min(self.LEASE_POLL_INTERVAL, remaining))
+
+    def release(self, keys: SeedsPoolKeys, value: str) -> bool:
+        return self.release_script(keys=list(keys), args=[value]) == 1
+
+    def reclaim(self, keys: SeedsPoolKeys, now: float) -> int:
+        return self.reclaim_script(keys=list(keys), args=[now])
+
+
+class SharedSeedsPool:
+    """
+    Общий пул пользователей сидинга поверх хранилища SeedsPoolBackend.
+
+    Свободные пользователи лежат в списке seeds:{scenario}:free в виде JSON. lease() атомарно
+    забирает пользователя из списка, поэтому каждый пользователь выдаётся ровно одному арендатору,
+    сколько бы процессов ни работало с пулом, а release() возвращает его в конец списка.
+    Интерфейс и поведение аренды совпадают с SeedsLeasePool: когда свободных нет, lease() ждёт
+    не дольше timeout, а затем выдаёт уже арендованного пользователя повторно по кругу (recycle=True)
+    либо выбрасывает SeedsExhaustedError. Повторно выданный пользователь возвращается в пул,
+    когда его вернут все арендаторы.
+
+    При заданном lease_ttl аренда ограничена сроком: срок окончания аренды записывается в множество
+    seeds:{scenario}:leased той же операцией, что и выдача пользователя. Процесс-арендатор продлевает
+    свои аренды через renew(), а reclaim() возвращает в пул пользователей с истёкшим сроком — так
+    пользователи воркера, упавшего или остановленного без release(), не теряются до конца прогона.
+    """
+
+    def __init__(
+            self,
+            backend: SeedsPoolBackend,
+            scenario: str,
+            batch_size: int = 1000,
+            lease_ttl: float | None = None,
+            recycle: bool = False
+    ):
+        """
+        :param backend: Хранилище пула.
+        :param scenario: Название сценария сидинга, используется в именах ключей.
+        :param batch_size: Сколько пользователей отправлять в хранилище за одну команду при заполнении.
+        :param lease_ttl: Срок аренды в секундах (None — аренда бессрочна, до release()).
+        :param recycle: Выдавать уже арендованных пользователей повторно, когда свободные закончились.
+        """
+        self.backend = backend
+        self.keys = build_seeds_pool_keys(scenario)
+        self.batch_size = batch_size
+        self.lease_ttl = lease_ttl
+        self.recycle = recycle
+        # Аренды этого процесса (со счётчиком арендаторов), которые продлевает renew()
+        self.held: Counter[str] = Counter()
+
+    def fill(self, result: SeedsResult | MappedSeedsResult) -> None:
+        """
+        Заменяет содержимое пула пользователями из результата сидинга.
+        Вызывается один раз — локально или на мастере Locust, до старта нагрузки.
+
+        :param result: Результат сидинга.
+        """
+        for key in self.keys:
+            self.backend.delete(key)
+
+        users = (result.get_user(index) for index in range(result.get_users_count()))
+        while batch := [user.model_dump_json() for user in islice(users, self.batch_size)]:
+            self.backend.push(self.keys.free, batch)
+            self.backend.push(self.keys.users, batch)
+
+    def get_free_count(self) -> int:
+        """
+        Возвращает количество свободных пользователей в пуле.
+        """
+        return self.backend.length(self.keys.free)
+
+    def lease(self, timeout: float | None = None) -> SeedUserResult:
+        """
+        Арендует пользователя.
+
+        :param timeout: Сколько секунд ждать возврата пользователя, если свободных нет (None — не ждать).
+        :return: Арендованный пользователь.
+        :raises SeedsExhaustedError: Свободных пользователей нет, ожидание не помогло и recycle выключен.
+        """
+        deadline = None if self.lease_ttl is None else time.time() + self.lease_ttl
+        value = self.backend.lease(self.keys, deadline, self.recycle, timeout=timeout)
+        if value is None:
+            raise SeedsExhaustedError(f"Shared seeds pool {self.keys.free} has no free users")
+
+        user = SeedUserResult.model_validate_json(value)
+        if self.lease_ttl is not None:
+            self.held[user.model_dump_json()] += 1
+
+        return user
+
+    def release(self, user: SeedUserResult) -> None:
+        """
+        Возвращает арендованного пользователя в пул. Если аренда уже истекла и пользователь
+        возвращён в пул через reclaim(), повторно он не добавляется.
+
+        :param user: Пользователь, полученный через lease().
+        """
+        value = user.model_dump_json()
+        if self.held[value] > 1:
+            self.held[value] -= 1
+        else:
+            self.held.pop(value, None)
+
+        self.backend.release(self.keys, value)
+
+    def renew(self) -> None:
+        """
+        Продлевает на lease_ttl аренды, которые держит этот процесс. Аренды, уже возвращённые
+        в пул через reclaim(), не восстанавливаются.
+        """
+        if (self.lease_ttl is None) or (not self.held):
+            return
+
+        deadline = time.time() + self.lease_ttl
+        self.backend.set_deadlines(self.keys.leased, dict.fromkeys(self.held, deadline), existing_only=True)
+
+    def reclaim(self) -> int:
+        """
+        Возвращает в пул пользователей, срок аренды которых истёк.
+
+        :return: Количество возвращённых пользователей.
+        """
+        if self.lease_ttl is None:
+            return 0
+
+        return self.backend.reclaim(self.keys, time.time())
+
+
+def build_in_memory_seeds_pool(
+        scenario: str,
+        lease_ttl: float | None = None,
+        recycle: bool = False
+) -> SharedSeedsPool:
+    """
+    Создаёт пул поверх хранилища в памяти процесса (для локальных запусков без Redis).
+
+    :param scenario: Название сценария сидинга.
+    :param lease_ttl: Срок аренды в секундах (None — аренда бессрочна).
+    :param recycle: Выдавать уже арендованных пользователей повторно, когда свободные закончились.
+    :return: Экземпляр SharedSeedsPool.
+    """
+    return SharedSeedsPool(
+        backend=InMemorySeedsPoolBackend(),
+        scenario=scenario,
+        lease_ttl=lease_ttl,
+        recycle=recycle
+    )
+
+
+def build_redis_seeds_pool(
+        scenario: str,
+        host: str = "localhost",
+        port: int = 6379,
+        lease_ttl: float | None = 60,
+        recycle: bool = False
+) -> SharedSeedsPool:
+    """
+    Создаёт пул поверх Redis. Пакет redis нужен только для этого пула и импортируется при вызове.
+
+    :param scenario: Название сценария сидинга.
+    :param host: Хост Redis (в docker-compose — "redis").
+    :param port: Порт Redis.
+    :param lease_ttl: Срок аренды в секундах: пользователи упавших воркеров возвращаются в пул через это время.
+    :param recycle: Выдавать уже арендованных пользователей повторно, когда свободные закончились.
+    :return: Экземпляр SharedSeedsPool.
+    """
+    from redis import Redis
+
+    return SharedSeedsPool(
+        backend=RedisSeedsPoolBackend(client=Redis(host=host, port=port)),
+        scenario=scenario,
+        lease_ttl=lease_ttl,
+        recycle=recycle
+    )
@@ -0,0 +1,207 @@
+import mmap
+import random
+import struct
+from abc import ABC, abstractmethod
+from typing import Iterator
+
+from seeds.schema.result import (
+    SeedsResult, SeedUserResult, SeedAccountResult, SeedCardResult, SeedOperationResult
+)
+
+# Заголовок бинарного дампа: сигнатура, версия формата, резерв, количество пользователей,
+# количество строк в таблице идентификаторов и количество слов в записях пользователей.
+BINARY_SEEDS_HEADER = struct.Struct("<4sHHIIQ")
+BINARY_SEEDS_MAGIC = b"SEED"
+BINARY_SEEDS_VERSION = 1
+
+# Порядок списков, в котором они записываются в бинарный дамп
+USER_ACCOUNTS_FIELDS = ("deposit_accounts", "savings_accounts", "debit_card_accounts", "credit_card_accounts")
+ACCOUNT_CARDS_FIELDS = ("physical_cards", "virtual_cards")
+ACCOUNT_OPERATIONS_FIELDS = (
+    "top_up_operations", "purchase_operations", "transfer_operations", "cash_withdrawal_operations"
+)
+
+
+def map_seeds_file(path: str) -> mmap.mmap | bytes:
+    """
+    Отображает файл дампа в память только для чтения (пустой файл отобразить нельзя, для него возвращается b"").
+
+    :param path: Путь к файлу.
+    :return: Отображение файла, которое разделяется между процессами через страничный кэш ОС.
+    """
+    with open(path, "rb") as file:
+        if file.seek(0, 2) == 0:
+            return b""
+
+        return mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+class MappedSeedsResult(ABC):
+    """
+    Базовый класс ленивых результатов сидинга поверх отображённых в память файлов.
+
+    Интерфейс совпадает с SeedsResult: get_user, get_users_count, get_next_user, get_random_user.
+    Дочерние классы реализуют чтение пользователя по порядковому номеру.
+    """
+    cursor: int = 0
+
+    @abstractmethod
+    def get_users_count(self) -> int:
+        """
+        Возвращает количество пользователей в дампе, не читая сами записи.
+        """
+        ...
+
+    @abstractmethod
+    def read_user(self, index: int) -> SeedUserResult:
+        """
+        Читает пользователя с заведомо корректным порядковым номером.
+        """
+        ...
+
+    def get_user(self, index: int) -> SeedUserResult:
+        """
+        Читает одного пользователя из дампа.
+
+        :param index: Порядковый номер пользователя.
+        :return: Пользователь с указанным номером.
+        """
+        if not 0 <= index < self.get_users_count():
+            raise IndexError(f"Seed user index {index} is out of range")
+
+        return self.read_user(index)
+
+    def get_next_user(self) -> SeedUserResult:
+        """
+        Возвращает следующего ещё не выданного пользователя (аналог SeedsResult.get_next_user).
+
+        :return: Следующий пользователь из дампа.
+        :raises IndexError: Все пользователи уже выданы; чтобы раздавать пользователей повторно, используйте
+            SeedsLeasePool(recycle=True).
+        """
+        user = self.get_user(self.cursor)
+        self.cursor += 1
+        return user
+
+    def get_random_user(self) -> SeedUserResult:
+        """
+        Возвращает случайного пользователя без удаления за O(1).
+
+        :return: Случайный пользователь.
+        """
+        if self.get_users_count() == 0:
+            raise IndexError("Cannot choose from an empty seeds result")
+
+        return self.get_user(random.randrange(self.get_users_count()))
+
+    def get_shard(self, index: int, count: int) -> SeedsResult:
+        """
+        Возвращает часть пользователей для одного из count исполнителей (аналог SeedsResult.get_shard).
+        Читаются только пользователи этого шарда.
+
+        :param index: Номер шарда (от 0 до count - 1).
+        :param count: Общее количество шардов.
+        :return: Результат сидинга только с пользователями этого шарда.
+        """
+        return SeedsResult(users=[self.get_user(i) for i in range(index, self.get_users_count(), count)])
+
+
+class JSONLinesSeedsResult(MappedSeedsResult):
+    """
+    Ленивый результат сидинга поверх JSONL-дампа.
+
+    Дамп и индекс смещений строк отображаются в память (mmap), поэтому загрузка не зависит
+    от размера дампа, а процессы Locust разделяют одни и те же страницы файла.
+    Пользователь валидируется в SeedUserResult только в момент, когда его берут из результата.
+    """
+
+    def __init__(self, path: str, index_path: str):
+        """
+        :param path: Путь к файлу {scenario}_seeds.jsonl (один пользователь на строку).
+        :param index_path: Путь к индексу {scenario}_seeds.jsonl.idx — массиву смещений начала строк
+                           (uint64) с завершающим смещением конца файла.
+        """
+        self.data = map_seeds_file(path)
+        self.offsets = memoryview(map_seeds_file(index_path)).cast("Q")
+
+    def get_users_count(self) -> int:
+        return len(self.offsets) - 1
+
+    def read_user(self, index: int) -> SeedUserResult:
+        return SeedUserResult.model_validate_json(self.data[self.offsets[index]:self.offsets[index + 1]])
+
+
+class BinarySeedsResult(MappedSeedsResult):
+    """
+    Результат сидинга поверх компактного бинарного дампа {scenario}_seeds.bin.
+
+    Структура файла (little-endian):
+        - заголовок BINARY_SEEDS_HEADER;
+        - смещения строк таблицы идентификаторов (uint64, strings_count + 1);
+        - смещения записей пользователей в массиве слов (uint64, users_count + 1);
+        - записи пользователей — массив слов uint32 (words_count);
+        - таблица идентификаторов — UTF-8 байты всех уникальных идентификаторов подряд.
+
+    Запись пользователя: номер строки user_id, затем для каждого списка из USER_ACCOUNTS_FIELDS —
+    количество счетов и сами счета. Запись счёта: номер строки account_id, затем для каждого списка
+    из ACCOUNT_CARDS_FIELDS и ACCOUNT_OPERATIONS_FIELDS — количество элементов и номера их строк.
+
+    Пользователь собирается через model_construct без валидации: данные записаны из уже
+    провалидированного SeedsResult. Файл не разбирается при загрузке, а все процессы Locust
+    читают одни и те же страницы файла вместо собственных копий графа объектов.
+    """
+
+    def __init__(self, path: str):
+        """
+        :param path: Путь к файлу {scenario}_seeds.bin.
+        """
+        self.data = map_seeds_file(path)
+        magic, version, _, users_count, strings_count, words_count = BINARY_SEEDS_HEADER.unpack_from(self.data)
+        if (magic != BINARY_SEEDS_MAGIC) or (version != BINARY_SEEDS_VERSION):
+            raise ValueError(f"File {path} is not a binary seeds dump of version {BINARY_SEEDS_VERSION}")
+
+        view = memoryview(self.data)
+        position = BINARY_SEEDS_HEADER.size
+        self.string_offsets = view[position:position + (strings_count + 1) * 8].cast("Q")
+        position += (strings_count + 1) * 8
+        self.user_offsets = view[position:position + (users_count + 1) * 8].cast("Q")
+        position += (users_count + 1) * 8
+        self.words = view[position:position + words_count * 4].cast("I")
+        position += words_count * 4
+        self.strings = view[position:]
+
+    def get_users_count(self) -> int:
+        return len(self.user_offsets) - 1
+
+    def get_string(self, index: int) -> str:
+        """
+        Возвращает идентификатор из таблицы строк по его номеру.
+        """
+        return str(self.strings[self.string_offsets[index]:self.string_offsets[index + 1]], "utf-8")
+
+    def read_account(self, words: Iterator[int]) -> SeedAccountResult:
+        """
+        Собирает счёт из очередных слов записи пользователя.
+        """
+        account_id = self.get_string(next(words))
+        cards = {
+            field: [SeedCardResult.model_construct(card_id=self.get_string(next(words))) for _ in range(next(words))]
+            for field in ACCOUNT_CARDS_FIELDS
+        }
+        operations = {
+            field: [
+                SeedOperationResult.model_construct(operation_id=self.get_string(next(words)))
+                for _ in range(next(words))
+            ]
+            for field in ACCOUNT_OPERATIONS_FIELDS
+        }
+        return SeedAccountResult.model_construct(account_id=account_id, **cards, **operations)
+
+    def read_user(self, index: int) -> SeedUserResult:
+        words = iter(self.words[self.user_offsets[index]:self.user_offsets[index + 1]])
+        user_id = self.get_string(next(words))
+        accounts = {
+            field: [self.read_account(words) for _ in range(next(words))]
+            for field in USER_ACCOUNTS_FIELDS
+        }
+        return SeedUserResult.model_construct(user_id=user_id, **accounts)
@@ -1,9 +1,20 @@
+import random
 from abc import ABC, abstractmethod
 
-from seeds.builder import build_grpc_seeds_builder
-from seeds.dumps import save_seeds_result, load_seeds_result
+from grpc import RpcError
+from httpx import HTTPError
+from pydantic import ValidationError
+
+from seeds.builder import build_grpc_seeds_builder, build_services_grpc_seeds_builder
+from seeds.dumps import (
+    save_seeds_result, load_seeds_result, save_seeds_meta, load_seeds_meta, remove_seeds_result,
+    seeds_result_exists, append_seeds_checkpoint, load_seeds_checkpoint, remove_seeds_checkpoint
+)
+from seeds.readers import MappedSeedsResult
+from seeds.schema.meta import SeedsMeta, SeedsDumpFormat
 from seeds.schema.plan import SeedsPlan
 from seeds.schema.result import SeedsResult
+from seeds.schema.services import SeedsServicesAddresses
 
 
 class SeedsScenario(ABC):
@@ -17,7 +28,42 @@ class SeedsScenario(ABC):
         Инициализация класса SeedsScenario.
         Создаёт экземпляр билдера для генерации сидинговых данных через gRPC.
         """
-        self.builder = build_grpc_seeds_builder()
+        self.builder = build_grpc_seeds_builder(workers=self.workers)
+
+    def use_services(self, addresses: SeedsServicesAddresses) -> None:
+        """
+        Переключает сидинг на создание данных напрямую во внутренних сервисах, в обход gateway,
+        который затем измеряется нагрузочным тестом. План и отпечаток не меняются, поэтому
+        сохранённый дамп и контрольная точка переиспользуются независимо от способа сидинга.
+        :param addresses: Адреса внутренних сервисов.
+        """
+        self.builder = build_services_grpc_seeds_builder(**addresses.model_dump(), workers=self.workers)
+
+    @property
+    def workers(self) -> int:
+        """
+        Количество пользователей, создаваемых параллельно во время сидинга.
+        По умолчанию сидинг выполняется последовательно, дочерние классы могут переопределить значение.
+        """
+        return 1
+
+    @property
+    def liveness_probe_size(self) -> int:
+        """
+        Количество случайных пользователей из сохранённого дампа, существование которых проверяется
+        через gateway перед переиспользованием дампа. 0 — проверка отключена (по умолчанию).
+        """
+        return 0
+
+    @property
+    def dump_format(self) -> SeedsDumpFormat:
+        """
+        Формат дампа сидинга. По умолчанию — единый JSON-файл, загружаемый целиком.
+        Для больших наборов данных дочерние классы могут выбрать SeedsDumpFormat.JSONL:
+        дамп пишется построчно, а при загрузке пользователи валидируются лениво, по одному.
+        Для сотен тысяч пользователей — SeedsDumpFormat.BINARY: компактный дамп, отображаемый в память.
+        """
+        return SeedsDumpFormat.JSON
 
     @property
     @abstractmethod
@@ -39,21 +85,97 @@ class SeedsScenario(ABC):
 
     def save(self, result: SeedsResult) -> None:
         """
-        Сохраняет результат сидинга в файл.
+        Сохраняет результат сидинга в файл, а затем метаданные с отпечатком плана.
         :param result: Объект SeedsResult, содержащий сгенерированные данные.
         """
-        save_seeds_result(result=result, scenario=self.scenario)
+        save_seeds_result(result=result, scenario=self.scenario, dump_format=self.dump_format)
+        save_seeds_meta(
+            meta=SeedsMeta(
+                plan_fingerprint=self.plan.get_fingerprint(),
+                users_count=result.get_users_count(),
+                dump_format=self.dump_format
+            ),
+            scenario=self.scenario
+        )
 
-    def load(self) -> SeedsResult:
+    def load(self) -> SeedsResult | MappedSeedsResult:
         """
         Загружает результаты сидинга из файла.
-        :return: Объект SeedsResult, содержащий данные, загруженные из файла.
+        :return: Объект SeedsResult (или ленивый MappedSeedsResult для JSONL- и бинарного дампа),
+                 содержащий данные из файла.
         """
-        return load_seeds_result(scenario=self.scenario)
+        return load_seeds_result(scenario=self.scenario, dump_format=self.dump_format)
 
-    def build(self) -> None:
+    def invalidate(self) -> None:
+        """
+        Помечает сохранённый дамп недействительным, чтобы следующий вызов build() сгенерировал данные заново.
+        Контрольная точка прерванного сидинга также удаляется.
+        """
+        remove_seeds_result(scenario=self.scenario)
+        remove_seeds_checkpoint(scenario=self.scenario)
+
+    def probe(self, result: SeedsResult | MappedSeedsResult) -> bool:
+        """
+        Дешёвая проверка живости дампа: запрашивает через gateway нескольких случайных пользователей.
+        :param result: Загруженный из файла результат сидинга.
+        :return: True, если все проверенные пользователи существуют.
+        """
+        users_count = result.get_users_count()
+        indexes = random.sample(range(users_count), k=min(self.liveness_probe_size, users_count))
+        try:
+            for index in indexes:
+                self.builder.users_gateway_client.get_user(result.get_user(index).user_id)
+        except (RpcError, HTTPError, ValidationError):
+            return False
+
+        return True
+
+    def is_cached(self) -> bool:
+        """
+        Проверяет, можно ли переиспользовать сохранённый дамп вместо повторного сидинга:
+        метаданные должны существовать и содержать отпечаток текущего плана и формат дампа, а при включённой
+        проверке живости — пользователи из дампа должны существовать в gateway.
+        :return: True, если дамп актуален.
+        """
+        meta = load_seeds_meta(scenario=self.scenario)
+        if (meta is None) or (meta.plan_fingerprint != self.plan.get_fingerprint()):
+            return False
+
+        if meta.dump_format != self.dump_format:
+            return False
+
+        if not seeds_result_exists(scenario=self.scenario, dump_format=self.dump_format):
+            return False
+
+        if self.liveness_probe_size > 0:
+            return self.probe(self.load())
+
+        return True
+
+    def build(self, force: bool = False) -> None:
         """
         Генерирует данные с помощью билдера, используя план сидинга, и сохраняет результат.
+        Если дамп для того же плана уже сохранён и актуален, сидинг пропускается.
+
+        Каждый созданный пользователь сразу дописывается в контрольную точку, поэтому после
+        падения повторный запуск продолжает сидинг с того же места, а не начинает заново.
+        :param force: Игнорировать сохранённый дамп и контрольную точку и сгенерировать данные заново.
         """
-        result = self.builder.build(self.plan)
+        if (not force) and self.is_cached():
+            return
+
+        if force:
+            self.invalidate()
+        else:
+            remove_seeds_result(scenario=self.scenario)
+
+        fingerprint = self.plan.get_fingerprint()
+        result = self.builder.build(
+            self.plan,
+            completed=load_seeds_checkpoint(scenario=self.scenario, plan_fingerprint=fingerprint),
+            on_user=lambda user: append_seeds_checkpoint(
+                user=user, scenario=self.scenario, plan_fingerprint=fingerprint
+            )
+        )
         self.save(result)
+        remove_seeds_checkpoint(scenario=self.scenario)
@@ -28,6 +28,13 @@ class ExistingUserGetOperationsSeedsScenario(SeedsScenario):
             ),
         )
 
+    @property
+    def workers(self) -> int:
+        """
+        Количество пользователей, создаваемых параллельно, чтобы сидинг 300 пользователей не растягивался на минуты.
+        """
+        return 10
+
     @property
     def scenario(self) -> str:
         """
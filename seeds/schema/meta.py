@@ -0,0 +1,45 @@
+from datetime import datetime
+from enum import Enum
+
+from pydantic import BaseModel, Field
+
+
+class SeedsDumpFormat(str, Enum):
+    """
+    Формат хранения дампа сидинга.
+
+    JSON — один монолитный JSON-документ, загружается и валидируется целиком.
+    JSONL — по одному пользователю на строку плюс индекс смещений строк; пользователи
+    читаются и валидируются лениво, только когда их берут из результата.
+    BINARY — компактный бинарный дамп с таблицей идентификаторов; отображается в память
+    и читает любого пользователя за O(1) без разбора JSON.
+    """
+    JSON = "json"
+    JSONL = "jsonl"
+    BINARY = "binary"
+
+
+class SeedsMeta(BaseModel):
+    """
+    Метаданные дампа сидинга, сохраняемые рядом с самим дампом.
+
+    Attributes:
+        plan_fingerprint (str): Отпечаток плана (SeedsPlan.get_fingerprint), по которому построен дамп.
+        users_count (int): Количество пользователей в дампе.
+        dump_format (SeedsDumpFormat): Формат, в котором сохранён дамп.
+        created_at (datetime): Момент сохранения дампа.
+    """
+    plan_fingerprint: str
+    users_count: int
+    dump_format: SeedsDumpFormat = SeedsDumpFormat.JSON
+    created_at: datetime = Field(default_factory=datetime.now)
+
+
+class SeedsCheckpointHeader(BaseModel):
+    """
+    Заголовок файла контрольной точки сидинга.
+
+    Attributes:
+        plan_fingerprint (str): Отпечаток плана, по которому создаются пользователи в контрольной точке.
+    """
+    plan_fingerprint: str
@@ -1,3 +1,5 @@
+import hashlib
+
 from pydantic import BaseModel, Field
 
 
@@ -69,3 +71,15 @@ class SeedsPlan(BaseModel):
         users (SeedUsersPlan): План по созданию пользователей и всей связанной структуры.
     """
     users: SeedUsersPlan = Field(default_factory=SeedUsersPlan)
+
+    def get_fingerprint(self) -> str:
+        """
+        Возвращает отпечаток плана — SHA-256 от его канонического JSON-представления.
+
+        Одинаковые планы всегда дают одинаковый отпечаток, поэтому по нему можно понять,
+        подходит ли ранее сохранённый дамп сидинга к текущему плану.
+
+        Returns:
+            str: Отпечаток плана в шестнадцатеричном виде.
+        """
+        return hashlib.sha256(self.model_dump_json().encode("utf-8")).hexdigest()
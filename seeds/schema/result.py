@@ -1,6 +1,6 @@
 import random
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr
 
 
 class SeedCardResult(BaseModel):
@@ -72,18 +72,48 @@ class SeedsResult(BaseModel):
     """
 
     users: list[SeedUserResult] = Field(default_factory=list)
+    _cursor: int = PrivateAttr(default=0)
+
+    def get_users_count(self) -> int:
+        """
+        Возвращает количество пользователей в результате.
+
+        Returns:
+            int: Количество пользователей.
+        """
+        return len(self.users)
+
+    def get_user(self, index: int) -> SeedUserResult:
+        """
+        Возвращает пользователя по его порядковому номеру без удаления.
+
+        Args:
+            index: Порядковый номер пользователя.
+
+        Returns:
+            SeedUserResult: Пользователь с указанным номером.
+        """
+        return self.users[index]
 
     def get_next_user(self) -> SeedUserResult:
         """
-        Возвращает и удаляет первого пользователя из списка.
+        Возвращает следующего ещё не выданного пользователя за O(1) — список при этом не изменяется.
 
         Используется в случае, когда на каждый виртуальный юзер нужен новый тестовый пользователь.
         Удобно при строго последовательной раздаче пользователей в тестовых сценариях.
+        Если пользователей нужно возвращать или раздавать с ожиданием, используйте SeedsLeasePool.
 
         Returns:
             SeedUserResult: Следующий пользователь из списка.
+
+        Raises:
+            IndexError: Все пользователи уже выданы.
         """
-        return self.users.pop(0)
+        if self._cursor >= len(self.users):
+            raise IndexError(f"All {len(self.users)} seeded users have already been handed out")
+
+        self._cursor += 1
+        return self.users[self._cursor - 1]
 
     def get_random_user(self) -> SeedUserResult:
         """
@@ -95,3 +125,19 @@ class SeedsResult(BaseModel):
             SeedUserResult: Случайный пользователь.
         """
         return random.choice(self.users)
+
+    def get_shard(self, index: int, count: int) -> "SeedsResult":
+        """
+        Возвращает часть пользователей для одного из count исполнителей (например, воркеров Locust).
+
+        Пользователи распределяются по кругу, поэтому шарды не пересекаются,
+        а их размеры отличаются не больше чем на одного.
+
+        Args:
+            index: Номер шарда (от 0 до count - 1).
+            count: Общее количество шардов.
+
+        Returns:
+            SeedsResult: Результат сидинга только с пользователями этого шарда.
+        """
+        return SeedsResult(users=self.users[index::count])
@@ -0,0 +1,18 @@
+from pydantic import BaseModel
+
+
+class SeedsServicesAddresses(BaseModel):
+    """
+    Адреса внутренних сервисов (host:port), в которых сидинг создаёт данные напрямую, в обход gateway
+    (см. build_services_grpc_seeds_builder).
+
+    Attributes:
+        users_address (str): Адрес UsersService.
+        accounts_address (str): Адрес AccountsService.
+        cards_address (str): Адрес CardsService.
+        operations_address (str): Адрес OperationsService.
+    """
+    users_address: str
+    accounts_address: str
+    cards_address: str
+    operations_address: str
@@ -0,0 +1,117 @@
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from seeds.async_builder import AsyncSeedsBuilder
+from seeds.schema.plan import SeedsPlan, SeedUsersPlan, SeedAccountsPlan
+
+
+class FakeGatewayClient:
+    """
+    Асинхронный клиент gateway для тестов: каждый вызов длится delay секунд, открытие депозитного счёта
+    для пользователя failed_user_id завершается ошибкой. Считает выполняющиеся вызовы и созданных пользователей.
+    """
+
+    def __init__(self, delay: float = 0.01, failed_user_id: str | None = None):
+        self.delay = delay
+        self.failed_user_id = failed_user_id
+        self.users = 0
+        self.calls_in_flight = 0
+        self.calls_in_flight_on_close: int | None = None
+
+    async def request(self, delay: float | None = None) -> None:
+        self.calls_in_flight += 1
+        try:
+            await asyncio.sleep(self.delay if delay is None else delay)
+        finally:
+            self.calls_in_flight -= 1
+
+    async def create_user(self):
+        await self.request()
+        self.users += 1
+        return SimpleNamespace(user=SimpleNamespace(id=f"user-{self.users}"))
+
+    async def open_deposit_account(self, user_id: str):
+        await self.request()
+        if user_id == self.failed_user_id:
+            raise RuntimeError(f"Failed to open account for {user_id}")
+        return SimpleNamespace(account=SimpleNamespace(id=f"account-{user_id}"))
+
+    async def open_savings_account(self, user_id: str):
+        # Долгий вызов: при ошибке соседнего вызова он должен быть отменён, а не дождаться завершения
+        await self.request(delay=self.delay * 100)
+        return SimpleNamespace(account=SimpleNamespace(id=f"savings-{user_id}"))
+
+    async def close(self) -> None:
+        self.calls_in_flight_on_close = self.calls_in_flight
+
+
+def build_seeds_builder(client: FakeGatewayClient, max_users_in_flight: int) -> AsyncSeedsBuilder:
+    return AsyncSeedsBuilder(
+        users_gateway_client=client,
+        cards_gateway_client=client,
+        accounts_gateway_client=client,
+        operations_gateway_client=client,
+        max_in_flight=100,
+        max_users_in_flight=max_users_in_flight
+    )
+
+
+def build_plan(users_count: int, savings_accounts_count: int = 0) -> SeedsPlan:
+    return SeedsPlan(users=SeedUsersPlan(
+        count=users_count,
+        deposit_accounts=SeedAccountsPlan(count=1),
+        savings_accounts=SeedAccountsPlan(count=savings_accounts_count)
+    ))
+
+
+def test_build_bounds_users_in_flight():
+    """
+    Пользователей одновременно создаётся не больше max_users_in_flight, создаются все пользователи плана.
+    """
+    client = FakeGatewayClient(delay=0)
+
+    async def run():
+        async with build_seeds_builder(client, max_users_in_flight=3) as builder:
+            original_build_user = builder.build_user
+            users_in_flight = max_users_in_flight = 0
+
+            async def build_user(plan: SeedUsersPlan):
+                nonlocal users_in_flight, max_users_in_flight
+                users_in_flight += 1
+                max_users_in_flight = max(max_users_in_flight, users_in_flight)
+                try:
+                    await asyncio.sleep(0.01)
+                    return await original_build_user(plan=plan)
+                finally:
+                    users_in_flight -= 1
+
+            builder.build_user = build_user
+            return await builder.build(build_plan(users_count=10)), max_users_in_flight
+
+    result, max_users_in_flight = asyncio.run(run())
+
+    assert max_users_in_flight == 3
+    assert len(result.users) == 10
+    assert len({user.user_id for user in result.users}) == 10
+
+
+def test_build_failure_cancels_running_calls():
+    """
+    Ошибка одного вызова пробрасывается как есть, остальные вызовы отменяются до закрытия клиентов.
+    """
+    client = FakeGatewayClient(failed_user_id="user-2")
+    created = []
+
+    async def run():
+        async with build_seeds_builder(client, max_users_in_flight=2) as builder:
+            await builder.build(build_plan(users_count=5, savings_accounts_count=1), on_user=created.append)
+
+    with pytest.raises(RuntimeError, match="user-2"):
+        asyncio.run(run())
+
+    assert client.calls_in_flight_on_close == 0
+    # Долгие вызовы отменены: ни один пользователь не был завершён, и новых пользователей после ошибки не создано
+    assert created == []
+    assert client.users == 2
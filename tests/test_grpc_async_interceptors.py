@@ -0,0 +1,117 @@
+import asyncio
+from collections import namedtuple
+
+import grpc
+from grpc.aio import AioRpcError, Metadata
+from locust.env import Environment
+
+from clients.grpc.interceptors.async_locust_interceptor import AsyncLocustInterceptor
+from clients.grpc.interceptors.retry_interceptor import RETRY_ATTEMPT_METADATA_KEY
+
+CallDetails = namedtuple(
+    "CallDetails", ("method", "timeout", "metadata", "credentials", "wait_for_ready", "compression")
+)
+METHOD = b"/accounts.AccountsGatewayService/GetAccounts"
+
+
+class FakeMessage:
+    def __init__(self, size: int):
+        self.size = size
+
+    def ByteSize(self) -> int:  # noqa: N802 — имя метода protobuf-сообщения
+        return self.size
+
+
+class FakeAioCall:
+    """
+    Вызов grpc.aio для тестов: ожидание завершается через delay секунд ответом или ошибкой.
+    """
+
+    def __init__(self, delay: float, response: FakeMessage | None = None, error: AioRpcError | None = None):
+        self.delay = delay
+        self.response = response
+        self.error = error
+
+    def __await__(self):
+        return self.wait().__await__()
+
+    async def wait(self) -> FakeMessage:
+        await asyncio.sleep(self.delay)
+        if self.error is not None:
+            raise self.error
+        return self.response
+
+
+def build_environment() -> tuple[Environment, list[dict]]:
+    environment = Environment()
+    events = []
+    environment.events.request.add_listener(lambda **kwargs: events.append(kwargs))
+    return environment, events
+
+
+def intercept(interceptor: AsyncLocustInterceptor, call: FakeAioCall, metadata=None):
+    async def continuation(client_call_details, request):
+        return call
+
+    details = CallDetails(METHOD, None, metadata, None, None, None)
+    return interceptor.intercept_unary_unary(continuation, details, request=None)
+
+
+def test_async_interceptor_reports_completed_call():
+    environment, events = build_environment()
+    call = FakeAioCall(delay=0.01, response=FakeMessage(42))
+
+    result = asyncio.run(intercept(AsyncLocustInterceptor(environment), call))
+
+    assert result is call
+    assert len(events) == 1
+    assert events[0]["name"] == METHOD.decode()
+    assert events[0]["request_type"] == "gRPC"
+    assert events[0]["response_length"] == 42
+    assert events[0]["exception"] is None
+    assert events[0]["response_time"] >= 10
+
+
+def test_async_interceptor_reports_failed_call():
+    environment, events = build_environment()
+    error = AioRpcError(grpc.StatusCode.UNAVAILABLE, Metadata(), Metadata(), details="unavailable")
+
+    asyncio.run(intercept(AsyncLocustInterceptor(environment), FakeAioCall(delay=0, error=error)))
+
+    assert events[0]["exception"] is error
+    assert events[0]["response_length"] == 0
+
+
+def test_async_interceptor_reports_retries_separately():
+    environment, events = build_environment()
+
+    asyncio.run(intercept(
+        AsyncLocustInterceptor(environment),
+        FakeAioCall(delay=0, response=FakeMessage(1)),
+        metadata=((RETRY_ATTEMPT_METADATA_KEY, "1"),)
+    ))
+
+    assert events[0]["request_type"] == "gRPC retry"
+
+
+def test_async_interceptor_does_not_block_event_loop():
+    """
+    Одновременные вызовы ждут ответов параллельно, и у каждого своё время ответа.
+    """
+    environment, events = build_environment()
+    interceptor = AsyncLocustInterceptor(environment)
+
+    async def run_calls() -> float:
+        loop = asyncio.get_running_loop()
+        start_time = loop.time()
+        await asyncio.gather(
+            intercept(interceptor, FakeAioCall(delay=0.2, response=FakeMessage(1))),
+            intercept(interceptor, FakeAioCall(delay=0.05, response=FakeMessage(2)))
+        )
+        return loop.time() - start_time
+
+    elapsed = asyncio.run(run_calls())
+
+    assert elapsed < 0.25
+    assert [event["response_length"] for event in events] == [2, 1]
+    assert events[0]["response_time"] < events[1]["response_time"]
@@ -0,0 +1,75 @@
+import pytest
+from locust.env import Environment
+
+from clients.grpc.channels import RoundRobinChannel
+from clients.grpc.gateway.client import build_shared_gateway_locust_grpc_client
+from clients.grpc.options import get_grpc_channel_profile
+from clients.retries import RetryPolicy
+from clients.validation import NO_VALIDATION
+
+METHOD = "/accounts.AccountsGatewayService/GetAccounts"
+
+
+class FakeChannel:
+    """
+    Канал пула для тестов: каждый вызов метода записывается с номером канала.
+    """
+
+    def __init__(self, index: int, calls: list[tuple[int, str]]):
+        self.index = index
+        self.calls = calls
+
+    def unary_unary(self, method, request_serializer=None, response_deserializer=None, _registered_method=False):
+        return lambda request, **kwargs: self.calls.append((self.index, request))
+
+    def close(self):
+        self.calls.append((self.index, "closed"))
+
+
+def test_round_robin_channel_distributes_calls_evenly():
+    """
+    Вызовы распределяются по каналам пула по кругу — в том числе когда объект метода запрашивается
+    заново на каждый вызов, как это делают интерцепторы.
+    """
+    calls = []
+    channels = [FakeChannel(index, calls) for index in range(3)]
+    pool = RoundRobinChannel(channels)
+
+    multicallable = pool.unary_unary(METHOD)
+    for request in range(4):
+        multicallable(f"request {request}")
+    for request in range(4, 6):
+        pool.unary_unary(METHOD)(f"request {request}")
+
+    assert [index for index, _ in calls] == [0, 1, 2, 0, 1, 2]
+
+    pool.close()
+    assert calls[-3:] == [(0, "closed"), (1, "closed"), (2, "closed")]
+
+
+def test_round_robin_channel_requires_channels():
+    with pytest.raises(ValueError, match="must not be empty"):
+        RoundRobinChannel([])
+
+
+def test_shared_grpc_channel_is_cached_per_arguments():
+    """
+    Вызовы с теми же параметрами получают общий канал; другой размер пула или профиль получают отдельный пул,
+    другие политики — отдельный канал с интерцепторами поверх того же пула.
+    """
+    environment = Environment()
+    retry = RetryPolicy()
+    options = get_grpc_channel_profile("keepalive")
+
+    channel = build_shared_gateway_locust_grpc_client(environment, pool_size=2)
+
+    assert build_shared_gateway_locust_grpc_client(environment, pool_size=2) is channel
+    assert build_shared_gateway_locust_grpc_client(environment, pool_size=3) is not channel
+    assert build_shared_gateway_locust_grpc_client(environment, pool_size=2, options=options) is not channel
+    assert build_shared_gateway_locust_grpc_client(environment, retry=retry, pool_size=2) is not channel
+    assert build_shared_gateway_locust_grpc_client(environment, validation=NO_VALIDATION, pool_size=2) is not channel
+    assert len(environment.gateway_grpc_channel_pools) == 3
+    assert len(environment.gateway_grpc_channels) == 5
+
+    for pool in environment.gateway_grpc_channel_pools.values():
+        pool.close()
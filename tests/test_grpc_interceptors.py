@@ -0,0 +1,308 @@
+import gc
+from collections import namedtuple
+
+import gevent
+import grpc
+import pytest
+from locust.env import Environment
+
+from clients.grpc.interceptors.locust_interceptor import LocustInterceptor
+from clients.grpc.interceptors.retry_interceptor import RetryInterceptor, get_retry_attempt
+from clients.retries import RetryPolicy
+
+CallDetails = namedtuple(
+    "CallDetails", ("method", "timeout", "metadata", "credentials", "wait_for_ready", "compression")
+)
+METHOD = "/accounts.AccountsGatewayService/GetAccounts"
+
+
+class FakeMessage:
+    def __init__(self, size: int):
+        self.size = size
+
+    def ByteSize(self) -> int:  # noqa: N802 — имя метода protobuf-сообщения
+        return self.size
+
+
+class FakeRpcError(grpc.RpcError):
+    def __init__(self, code: grpc.StatusCode):
+        self.status_code = code
+
+    def code(self) -> grpc.StatusCode:
+        return self.status_code
+
+
+class PendingCall:
+    """
+    Незавершённый вызов, как его возвращает stub.Method.future(...): завершается явно через set_result/set_code.
+    """
+
+    def __init__(self):
+        self.response: FakeMessage | None = None
+        self.error: FakeRpcError | None = None
+        self.is_done = False
+        self.callbacks = []
+
+    def set_result(self, response: FakeMessage) -> None:
+        self.response = response
+        self.finish()
+
+    def set_code(self, code: grpc.StatusCode) -> None:
+        self.error = FakeRpcError(code)
+        self.finish()
+
+    def finish(self) -> None:
+        self.is_done = True
+        for callback in self.callbacks:
+            callback(self)
+
+    def done(self) -> bool:
+        return self.is_done
+
+    def cancelled(self) -> bool:
+        return False
+
+    def code(self) -> grpc.StatusCode:
+        return self.error.code() if self.error else grpc.StatusCode.OK
+
+    def result(self, timeout: float | None = None) -> FakeMessage:
+        if self.error is not None:
+            raise self.error
+        return self.response
+
+    def exception(self, timeout: float | None = None) -> FakeRpcError | None:
+        return self.error
+
+    def add_done_callback(self, fn) -> None:
+        if self.is_done:
+            fn(self)
+        else:
+            self.callbacks.append(fn)
+
+
+def build_environment() -> tuple[Environment, list[dict]]:
+    environment = Environment()
+    events = []
+    environment.events.request.add_listener(lambda **kwargs: events.append(kwargs))
+    return environment, events
+
+
+def test_locust_interceptor_reports_call_when_it_completes():
+    """
+    Интерцептор не ждёт вызов: событие отправляется один раз, когда вызов завершится, с размером ответа.
+    """
+    environment, events = build_environment()
+    call = PendingCall()
+
+    future = LocustInterceptor(environment).intercept_unary_unary(
+        lambda details, request: call, CallDetails(METHOD, None, None, None, None, None), "request"
+    )
+
+    assert future is call
+    assert events == []
+
+    call.set_result(FakeMessage(size=42))
+
+    assert len(events) == 1
+    assert events[0]["name"] == METHOD
+    assert events[0]["request_type"] == "gRPC"
+    assert events[0]["response_length"] == 42
+    assert events[0]["exception"] is None
+
+
+def test_locust_interceptor_reports_failed_call():
+    environment, events = build_environment()
+    call = PendingCall()
+
+    LocustInterceptor(environment).intercept_unary_unary(
+        lambda details, request: call, CallDetails(METHOD, None, None, None, None, None), "request"
+    )
+    call.set_code(grpc.StatusCode.UNAVAILABLE)
+
+    assert len(events) == 1
+    assert isinstance(events[0]["exception"], FakeRpcError)
+    assert events[0]["response_length"] == 0
+
+
+def test_retry_interceptor_does_not_block_future_calls():
+    """
+    С политикой повторов вызов .future() возвращается сразу, а повтор отправляется после завершения попытки.
+    """
+    calls: list[tuple[CallDetails, PendingCall]] = []
+
+    def continuation(client_call_details, request):
+        call = PendingCall()
+        calls.append((client_call_details, call))
+        return call
+
+    interceptor = RetryInterceptor(RetryPolicy(attempts=2, backoff=0))
+    future = interceptor.intercept_unary_unary(
+        continuation, CallDetails(METHOD, None, None, None, None, None), "request"
+    )
+
+    assert not future.done()
+    assert len(calls) == 1
+
+    calls[0][1].set_code(grpc.StatusCode.UNAVAILABLE)
+    gevent.sleep(0.01)
+
+    assert not future.done()
+    assert [get_retry_attempt(details) for details, _ in calls] == [0, 1]
+
+    calls[1][1].set_result(FakeMessage(size=1))
+
+    assert future.done()
+    assert future.result().ByteSize() == 1
+    assert future.code() == grpc.StatusCode.OK
+
+
+def test_retry_future_cancel_between_attempts():
+    calls: list[PendingCall] = []
+
+    def continuation(client_call_details, request):
+        calls.append(PendingCall())
+        return calls[-1]
+
+    interceptor = RetryInterceptor(RetryPolicy(attempts=3, backoff=10, jitter=False))
+    future = interceptor.intercept_unary_unary(
+        continuation, CallDetails(METHOD, None, None, None, None, None), "request"
+    )
+    calls[0].set_code(grpc.StatusCode.UNAVAILABLE)
+
+    assert future.cancel()
+    assert future.done() and future.cancelled()
+    gevent.sleep(0.01)
+    assert len(calls) == 1
+
+
+class StreamCall:
+    """
+    Поток ответов, как его возвращает gRPC для unary-stream и stream-stream вызовов.
+    """
+
+    def __init__(self, messages: list[FakeMessage], error: FakeRpcError | None = None):
+        self.messages = iter(messages)
+        self.error = error
+        self.is_cancelled = False
+
+    def __iter__(self):
+        return self
+
+    def __next__(self) -> FakeMessage:
+        message = next(self.messages, None)
+        if message is not None:
+            return message
+        if self.error is not None:
+            raise self.error
+        raise StopIteration
+
+    def cancel(self) -> bool:
+        self.is_cancelled = True
+        return True
+
+    def code(self) -> grpc.StatusCode:
+        return self.error.code() if self.error else grpc.StatusCode.OK
+
+
+def get_stream_events(events: list[dict]) -> list[dict]:
+    return [event for event in events if event["request_type"] == "gRPC stream"]
+
+
+def test_unary_stream_is_reported_when_read_to_the_end():
+    environment, events = build_environment()
+
+    stream = LocustInterceptor(environment).intercept_unary_stream(
+        lambda details, request: StreamCall([FakeMessage(10), FakeMessage(20)]),
+        CallDetails(METHOD, None, None, None, None, None),
+        "request"
+    )
+    assert [message.ByteSize() for message in stream] == [10, 20]
+
+    assert [event["request_type"] for event in events] == ["gRPC stream first message", "gRPC stream"]
+    assert events[0]["response_length"] == 10
+    assert events[1]["response_length"] == 30
+    assert events[1]["context"]["messages"] == 2
+    assert events[1]["exception"] is None
+    assert stream.code() == grpc.StatusCode.OK
+
+
+def test_unary_stream_error_is_reported_once():
+    environment, events = build_environment()
+
+    stream = LocustInterceptor(environment).intercept_unary_stream(
+        lambda details, request: StreamCall([FakeMessage(10)], FakeRpcError(grpc.StatusCode.INTERNAL)),
+        CallDetails(METHOD, None, None, None, None, None),
+        "request"
+    )
+    with pytest.raises(FakeRpcError):
+        list(stream)
+    stream.cancel()
+
+    assert len(get_stream_events(events)) == 1
+    assert isinstance(get_stream_events(events)[0]["exception"], FakeRpcError)
+
+
+def test_abandoned_stream_is_reported():
+    """
+    Поток, который бросили, не дочитав и не отменив, репортится, когда обёртку удаляет сборщик мусора.
+    """
+    environment, events = build_environment()
+
+    stream = LocustInterceptor(environment).intercept_unary_stream(
+        lambda details, request: StreamCall([FakeMessage(10), FakeMessage(20)]),
+        CallDetails(METHOD, None, None, None, None, None),
+        "request"
+    )
+    next(stream)
+    assert get_stream_events(events) == []
+
+    del stream
+    gc.collect()
+
+    assert len(get_stream_events(events)) == 1
+    assert get_stream_events(events)[0]["response_length"] == 10
+
+
+def test_stream_unary_reports_request_messages():
+    environment, events = build_environment()
+    call = PendingCall()
+
+    def continuation(client_call_details, request_iterator):
+        for _ in request_iterator:
+            pass
+        return call
+
+    LocustInterceptor(environment).intercept_stream_unary(
+        continuation, CallDetails(METHOD, None, None, None, None, None), iter([FakeMessage(3), FakeMessage(4)])
+    )
+    assert events == []
+
+    call.set_result(FakeMessage(size=5))
+
+    assert len(events) == 1
+    assert events[0]["request_type"] == "gRPC stream"
+    assert events[0]["response_length"] == 5
+    assert events[0]["context"] == {"request_messages": 2, "request_length": 7}
+
+
+def test_stream_stream_reports_both_directions_and_cancel():
+    environment, events = build_environment()
+    call = StreamCall([FakeMessage(8), FakeMessage(8), FakeMessage(8)])
+
+    def continuation(client_call_details, request_iterator):
+        for _ in request_iterator:
+            pass
+        return call
+
+    stream = LocustInterceptor(environment).intercept_stream_stream(
+        continuation, CallDetails(METHOD, None, None, None, None, None), iter([FakeMessage(1), FakeMessage(2)])
+    )
+    next(stream)
+    assert stream.cancel()
+
+    assert call.is_cancelled
+    [event] = get_stream_events(events)
+    assert event["exception"] is None
+    assert event["response_length"] == 8
+    assert event["context"]["request_messages"] == 2
+    assert event["context"]["request_length"] == 3
@@ -0,0 +1,61 @@
+import pytest
+from grpc import Compression
+
+from clients.grpc.options import (
+    GRPC_CHANNEL_PROFILES,
+    GRPCChannelOptions,
+    GRPCLoadBalancing,
+    get_grpc_channel_profile
+)
+
+
+@pytest.mark.parametrize(("profile", "channel_options", "compression"), [
+    ("default", [], Compression.NoCompression),
+    (
+        "keepalive",
+        [
+            ("grpc.keepalive_time_ms", 30_000),
+            ("grpc.keepalive_timeout_ms", 10_000),
+            ("grpc.keepalive_permit_without_calls", 1),
+            ("grpc.http2.max_pings_without_data", 0)
+        ],
+        Compression.NoCompression
+    ),
+    (
+        "throughput",
+        [
+            ("grpc.max_receive_message_length", 16 * 1024 * 1024),
+            ("grpc.http2.lookahead_bytes", 4 * 1024 * 1024),
+            ("grpc.http2.bdp_probe", 0)
+        ],
+        Compression.NoCompression
+    ),
+    ("gzip", [], Compression.Gzip)
+])
+def test_profile_channel_options(profile: str, channel_options: list[tuple[str, int]], compression: Compression):
+    """
+    Каждый профиль даёт ровно ожидаемые опции канала gRPC и сжатие.
+    """
+    options = get_grpc_channel_profile(profile)
+
+    assert options.to_channel_options() == channel_options
+    assert options.get_compression() == compression
+
+
+def test_all_profiles_are_covered():
+    assert sorted(GRPC_CHANNEL_PROFILES) == ["default", "gzip", "keepalive", "throughput"]
+
+
+def test_round_robin_target_and_options():
+    options = GRPCChannelOptions(
+        addresses=["10.0.0.1:9003", "10.0.0.2:9003"],
+        load_balancing=GRPCLoadBalancing.ROUND_ROBIN
+    )
+
+    assert options.get_target("localhost:9003") == "ipv4:10.0.0.1:9003,10.0.0.2:9003"
+    assert options.to_channel_options() == [("grpc.lb_policy_name", "round_robin")]
+
+
+def test_unknown_profile_is_rejected():
+    with pytest.raises(ValueError, match="Unknown gRPC channel profile"):
+        get_grpc_channel_profile("fast")
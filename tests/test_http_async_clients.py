@@ -0,0 +1,61 @@
+import asyncio
+
+import httpx
+from locust.env import Environment
+
+from clients.http.event_hooks.async_locust_event_hook import (
+    async_locust_request_event_hook,
+    async_locust_response_event_hook
+)
+from clients.http.gateway.documents.async_client import AsyncDocumentsGatewayHTTPClient
+
+TARIFF = {"tariff": {"url": "http://documents/tariff.pdf", "document": "tariff"}}
+
+
+def build_documents_client(environment: Environment, status_code: int = 200) -> AsyncDocumentsGatewayHTTPClient:
+    async def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(status_code, json=TARIFF)
+
+    return AsyncDocumentsGatewayHTTPClient(
+        client=httpx.AsyncClient(
+            base_url="http://gateway",
+            transport=httpx.MockTransport(handler),
+            event_hooks={
+                "request": [async_locust_request_event_hook],
+                "response": [async_locust_response_event_hook(environment)]
+            }
+        )
+    )
+
+
+def build_environment() -> tuple[Environment, list[dict]]:
+    environment = Environment()
+    events = []
+    environment.events.request.add_listener(lambda **kwargs: events.append(kwargs))
+    return environment, events
+
+
+def test_async_client_reports_request_by_route():
+    """
+    Асинхронные хуки репортят запрос под шаблоном маршрута, как синхронные, и оставляют тело для разбора.
+    """
+    environment, events = build_environment()
+    client = build_documents_client(environment)
+
+    document = asyncio.run(client.get_tariff_document("account-1"))
+
+    assert document.tariff.document == "tariff"
+    assert len(events) == 1
+    assert events[0]["name"] == "GET /api/v1/documents/tariff-document/{account_id}"
+    assert events[0]["request_type"] == "HTTP"
+    assert events[0]["response_length"] > 0
+    assert events[0]["exception"] is None
+
+
+def test_async_client_reports_error_status():
+    environment, events = build_environment()
+    client = build_documents_client(environment, status_code=503)
+
+    asyncio.run(client.get_contract_document_api("account-1"))
+
+    assert isinstance(events[0]["exception"], httpx.HTTPStatusError)
@@ -0,0 +1,90 @@
+import httpx
+import pytest
+from locust.env import Environment
+from pydantic import BaseModel
+
+from clients.http.client import HTTPClient, HTTPBodyMode
+from clients.http.gateway.client import build_gateway_locust_event_hooks
+from clients.validation import ValidationPolicy, ValidationMode, NO_VALIDATION
+
+
+class UserSchema(BaseModel):
+    id: str
+
+
+def build_client() -> httpx.Client:
+    return httpx.Client(
+        base_url="http://gateway",
+        transport=httpx.MockTransport(lambda request: httpx.Response(200, json={"id": "user-1"}))
+    )
+
+
+@pytest.mark.parametrize("validation", [
+    ValidationPolicy(ValidationMode.FULL),
+    ValidationPolicy(ValidationMode.SAMPLED, sample_rate=10)
+])
+def test_discard_with_validation_is_rejected(validation: ValidationPolicy):
+    """
+    Режим DISCARD вместе с полной или выборочной валидацией — ошибка конфигурации клиента.
+    """
+    with pytest.raises(ValueError, match="DISCARD"):
+        HTTPClient(client=build_client(), validation=validation, body_mode=HTTPBodyMode.DISCARD)
+
+
+def test_discard_per_request_with_validation_is_rejected():
+    """
+    Режим DISCARD, заданный для отдельного запроса через extensions, не обходит проверку.
+    """
+    client = HTTPClient(client=build_client())
+    response = client.get("/user", extensions={"body_mode": HTTPBodyMode.DISCARD})
+
+    with pytest.raises(ValueError, match="DISCARD"):
+        client.validate_response(response, UserSchema)
+
+
+def test_discard_without_validation_returns_body_less_response():
+    client = HTTPClient(client=build_client(), validation=NO_VALIDATION, body_mode=HTTPBodyMode.DISCARD)
+    response = client.get("/user")
+
+    result = client.validate_response(response, UserSchema)
+
+    assert result.ByteSize() == 0
+
+
+def test_buffer_mode_validates_response():
+    client = HTTPClient(client=build_client())
+
+    assert client.validate_response(client.get("/user"), UserSchema) == UserSchema(id="user-1")
+
+
+@pytest.mark.parametrize(("body_mode", "body_available"), [
+    (HTTPBodyMode.BUFFER, True),
+    (HTTPBodyMode.DISCARD, False)
+])
+def test_hook_reports_body_length(body_mode: HTTPBodyMode, body_available: bool):
+    """
+    Хук репортит размер тела в обоих режимах, но в режиме DISCARD тело вычитывается потоком и не сохраняется.
+    """
+    environment = Environment()
+    events = []
+    environment.events.request.add_listener(lambda **kwargs: events.append(kwargs))
+    client = HTTPClient(
+        client=httpx.Client(
+            base_url="http://gateway",
+            transport=httpx.MockTransport(
+                lambda request: httpx.Response(200, stream=httpx.ByteStream(b"x" * 1024))
+            ),
+            event_hooks=build_gateway_locust_event_hooks(environment, http2=False, phase_stats=False)
+        ),
+        validation=NO_VALIDATION,
+        body_mode=body_mode
+    )
+
+    response = client.get("/document")
+
+    assert events[0]["response_length"] == 1024
+    if body_available:
+        assert response.content == b"x" * 1024
+    else:
+        with pytest.raises(httpx.ResponseNotRead):
+            _ = response.content
@@ -0,0 +1,59 @@
+import json
+
+import httpx
+import pytest
+
+from clients.http.codecs import JSON_CODECS, build_json_codec
+from clients.http.gateway.users.client import UsersGatewayHTTPClient
+from clients.http.gateway.users.schema import CreateUserRequestSchema, GetUserResponseSchema
+
+USER = {
+    "id": "user-1",
+    "email": "user@example.com",
+    "lastName": "Иванов",
+    "firstName": "Иван",
+    "middleName": "Иванович",
+    "phoneNumber": "+70000000000"
+}
+
+
+@pytest.mark.parametrize("name", sorted(JSON_CODECS))
+def test_codec_encodes_requests_by_alias(name: str):
+    request = CreateUserRequestSchema()
+
+    body = json.loads(build_json_codec(name).encode(request))
+
+    assert body == request.model_dump(mode="json", by_alias=True)
+    assert "lastName" in body
+
+
+@pytest.mark.parametrize("name", sorted(JSON_CODECS))
+def test_codec_decodes_responses_into_schema(name: str):
+    decoder = build_json_codec(name).get_decoder(GetUserResponseSchema)
+
+    assert decoder(json.dumps({"user": USER}).encode("utf-8")) == GetUserResponseSchema.model_validate({"user": USER})
+
+
+@pytest.mark.parametrize("name", sorted(JSON_CODECS))
+def test_client_sends_and_parses_bodies_with_codec(name: str):
+    requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(200, json={"user": USER})
+
+    client = UsersGatewayHTTPClient(
+        client=httpx.Client(base_url="http://gateway", transport=httpx.MockTransport(handler)),
+        codec=build_json_codec(name)
+    )
+
+    response = client.create_user()
+
+    assert response.user.id == "user-1"
+    assert requests[0].headers["Content-Type"] == "application/json"
+    assert set(json.loads(requests[0].content)) == {"email", "lastName", "firstName", "middleName", "phoneNumber"}
+
+
+def test_unknown_codec_is_rejected():
+    with pytest.raises(ValueError, match="Unknown JSON codec"):
+        build_json_codec("yaml")
@@ -0,0 +1,66 @@
+import httpx
+import pytest
+
+from clients.http.gateway.accounts.client import AccountsGatewayHTTPClient
+from clients.http.gateway.operations.client import OperationsGatewayHTTPClient
+from clients.http.gateway.operations.schema import OPERATIONS_ROUTE, GetOperationsQuerySchema
+from clients.validation import NO_VALIDATION
+
+
+@pytest.fixture
+def requests() -> list[httpx.Request]:
+    return []
+
+
+@pytest.fixture
+def client(requests: list[httpx.Request]) -> httpx.Client:
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(200, json={})
+
+    return httpx.Client(base_url="http://gateway", transport=httpx.MockTransport(handler))
+
+
+def test_operations_queries_use_schema_aliases(client: httpx.Client, requests: list[httpx.Request]):
+    """
+    Подготовленные запросы передают query-параметры под именами из алиасов схем запроса.
+    """
+    operations_client = OperationsGatewayHTTPClient(client=client, validation=NO_VALIDATION)
+
+    operations_client.get_operation("operation-1")
+    operations_client.get_operation_receipt("operation-1")
+    operations_client.get_operations("account-1")
+    operations_client.get_operations_summary("account-1")
+
+    assert [str(request.url) for request in requests] == [
+        "http://gateway/api/v1/operations?operationId=operation-1",
+        "http://gateway/api/v1/operations/operation-receipt?operationId=operation-1",
+        "http://gateway/api/v1/operations?accountId=account-1",
+        "http://gateway/api/v1/operations/operations-summary?accountId=account-1",
+    ]
+
+
+def test_accounts_query_uses_schema_alias(client: httpx.Client, requests: list[httpx.Request]):
+    AccountsGatewayHTTPClient(client=client, validation=NO_VALIDATION).get_accounts("user-1")
+
+    assert str(requests[0].url) == "http://gateway/api/v1/accounts?userId=user-1"
+
+
+def test_query_aliases_are_resolved_once_per_endpoint(client: httpx.Client, monkeypatch):
+    """
+    Алиасы query-параметров вычисляются при подготовке запроса: схема запроса на каждый вызов не создаётся.
+    """
+    operations_client = OperationsGatewayHTTPClient(client=client, validation=NO_VALIDATION)
+    operations_client.get_operations("account-1")
+
+    def fail(*args, **kwargs):
+        raise AssertionError("Query schema must not be built per request")
+
+    monkeypatch.setattr(GetOperationsQuerySchema, "__init__", fail)
+    operations_client.get_operations("account-2")
+    operations_client.get_operation("operation-1")
+
+    prepared = operations_client.prepared_requests[("GET", OPERATIONS_ROUTE, GetOperationsQuerySchema)]
+    assert prepared.query_aliases == {"account_id": "accountId"}
+    # Один путь с разными схемами query — разные подготовленные запросы
+    assert len(operations_client.prepared_requests) == 2
@@ -0,0 +1,34 @@
+import httpx
+import pytest
+
+from clients.http.gateway.users.client import UsersGatewayHTTPClient
+from clients.http.gateway.users.schema import GetUserResponseSchema
+
+USER = {
+    "user": {
+        "id": "user-1",
+        "email": "user@example.com",
+        "lastName": "Иванов",
+        "firstName": "Иван",
+        "middleName": "Иванович",
+        "phoneNumber": "+70000000000"
+    }
+}
+
+
+def test_response_is_validated_from_raw_body_bytes(monkeypatch):
+    """
+    Ответ разбирается из байтов тела: декодирование в строку (response.text) не выполняется.
+    """
+    def fail_on_text(response: httpx.Response) -> str:
+        pytest.fail("response.text must not be used to validate responses")
+
+    monkeypatch.setattr(httpx.Response, "text", property(fail_on_text))
+    client = UsersGatewayHTTPClient(
+        client=httpx.Client(
+            base_url="http://gateway",
+            transport=httpx.MockTransport(lambda request: httpx.Response(200, json=USER))
+        )
+    )
+
+    assert client.get_user("user-1") == GetUserResponseSchema.model_validate(USER)
@@ -0,0 +1,38 @@
+import pytest
+from locust import User
+from locust.env import Environment
+
+from clients.http.client import HTTPBodyMode
+from clients.http.gateway.locust import GatewayHTTPTaskSet, GatewayHTTPSequentialTaskSet
+from clients.retries import RetryPolicy
+from clients.validation import NO_VALIDATION
+
+
+@pytest.mark.parametrize("task_set_base", [GatewayHTTPTaskSet, GatewayHTTPSequentialTaskSet])
+def test_task_set_clients_share_http_client_and_policies(task_set_base: type):
+    """
+    Все доменные клиенты таск-сета работают через один httpx.Client и получают настройки таск-сета.
+    """
+    retry_policy = RetryPolicy()
+
+    class TaskSet(task_set_base):
+        validation = NO_VALIDATION
+        retry = retry_policy
+        http_body_mode = HTTPBodyMode.DISCARD
+
+    task_set = TaskSet(User(Environment()))
+    task_set.on_start()
+
+    clients = [
+        task_set.users_gateway_client,
+        task_set.cards_gateway_client,
+        task_set.accounts_gateway_client,
+        task_set.documents_gateway_client,
+        task_set.operations_gateway_client
+    ]
+    assert all(client.client is task_set.http_client for client in clients)
+    assert all(client.retry is retry_policy for client in clients)
+    assert all(client.body_mode is HTTPBodyMode.DISCARD for client in clients)
+
+    task_set.on_stop()
+    assert task_set.http_client.is_closed
@@ -0,0 +1,70 @@
+import httpx
+from locust.env import Environment
+
+from clients.http.event_hooks import phases as phases_module
+from clients.http.event_hooks.phases import HTTPPhaseTimer
+from clients.http.gateway.client import build_gateway_locust_event_hooks
+
+# Шаги, которые httpcore трассирует для запроса по уже открытому HTTP/1.1 соединению
+HTTP11_TRACE = [
+    "http11.send_request_headers",
+    "http11.send_request_body",
+    "http11.receive_response_headers",
+    "http11.receive_response_body"
+]
+
+
+def trace_request(trace, steps: list[str]) -> None:
+    for step in steps:
+        trace(f"{step}.started", {})
+        trace(f"{step}.complete", {})
+
+
+def test_timer_measures_phases(monkeypatch):
+    """
+    Фазы из нескольких шагов (send) считаются от начала первого шага до конца последнего,
+    pool — от создания таймера до первого сетевого события.
+    """
+    clock = iter([0.0, 0.010, 0.011, 0.012, 0.013, 0.013, 0.015, 0.015, 0.115, 0.116, 0.146])
+    monkeypatch.setattr(phases_module.time, "perf_counter", lambda: next(clock))
+    timer = HTTPPhaseTimer()
+
+    trace_request(timer, ["connection.connect_tcp", *HTTP11_TRACE])
+
+    phases = {phase: round(phase_time, 3) for phase, phase_time in timer.get_phases().items()}
+    assert phases == {"pool": 10.0, "connect": 1.0, "send": 3.0, "wait": 100.0, "download": 30.0}
+
+
+def test_timer_ignores_unknown_steps():
+    timer = HTTPPhaseTimer()
+
+    trace_request(timer, ["connection.close", "http11.response_closed"])
+
+    assert timer.get_phases() == {}
+
+
+def test_hooks_report_phases_in_context_and_as_stats():
+    environment = Environment()
+    events = []
+    environment.events.request.add_listener(lambda **kwargs: events.append(kwargs))
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        # MockTransport не вызывает трассировку, поэтому шаги httpcore имитируются обработчиком
+        trace_request(request.extensions["trace"], HTTP11_TRACE)
+        return httpx.Response(200, json={})
+
+    client = httpx.Client(
+        base_url="http://gateway",
+        transport=httpx.MockTransport(handler),
+        event_hooks=build_gateway_locust_event_hooks(environment, http2=False, phase_stats=True)
+    )
+
+    client.get("/user")
+
+    [request_event] = [event for event in events if event["request_type"] == "HTTP"]
+    phase_events = [event for event in events if event is not request_event]
+    assert set(request_event["context"]["phases"]) == {"pool", "send", "wait", "download"}
+    assert {event["name"] for event in phase_events} == {
+        "GET /user [pool]", "GET /user [send]", "GET /user [wait]", "GET /user [download]"
+    }
+    assert {event["request_type"] for event in phase_events} == {"HTTP phase"}
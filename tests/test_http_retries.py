@@ -0,0 +1,155 @@
+import asyncio
+
+import gevent
+import httpx
+import pytest
+from locust.env import Environment
+
+from clients.http.client import HTTPClient, AsyncHTTPClient, HTTPBodyMode
+from clients.http.event_hooks.async_locust_event_hook import (
+    async_locust_request_event_hook,
+    async_locust_response_event_hook,
+    async_locust_transport_error_event_hook
+)
+from clients.http.gateway.client import build_gateway_locust_event_hooks
+from clients.retries import RetryPolicy, HedgingPolicy
+from clients.validation import NO_VALIDATION
+
+SLOW_RESPONSE_DELAY = 0.2
+
+
+def build_environment() -> tuple[Environment, list[dict]]:
+    environment = Environment()
+    events = []
+    environment.events.request.add_listener(lambda **kwargs: events.append(kwargs))
+    return environment, events
+
+
+def build_client(environment: Environment, handler, **kwargs) -> HTTPClient:
+    return HTTPClient(
+        client=httpx.Client(
+            base_url="http://gateway",
+            transport=httpx.MockTransport(handler),
+            event_hooks=build_gateway_locust_event_hooks(environment, http2=False, phase_stats=False)
+        ),
+        **kwargs
+    )
+
+
+def test_transport_error_attempt_is_reported_before_retry():
+    """
+    Попытка, завершившаяся ошибкой соединения, репортится с ошибкой, а повтор — отдельно, с типом "HTTP retry".
+    """
+    environment, events = build_environment()
+    attempts = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        attempts.append(request)
+        if len(attempts) == 1:
+            raise httpx.ConnectError("Connection refused", request=request)
+        return httpx.Response(200)
+
+    client = build_client(environment, handler, retry=RetryPolicy(attempts=2, backoff=0))
+
+    assert client.get("/api/v1/users").status_code == 200
+    assert [(event["request_type"], type(event["exception"])) for event in events] == [
+        ("HTTP", httpx.ConnectError),
+        ("HTTP retry", type(None))
+    ]
+    assert events[0]["name"] == "GET /api/v1/users"
+
+
+def test_last_transport_error_is_reported_and_raised():
+    environment, events = build_environment()
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        raise httpx.ConnectTimeout("Timed out", request=request)
+
+    client = build_client(environment, handler)
+
+    with pytest.raises(httpx.ConnectTimeout):
+        client.get("/api/v1/users")
+
+    assert [(event["request_type"], type(event["exception"])) for event in events] == [
+        ("HTTP", httpx.ConnectTimeout)
+    ]
+
+
+def test_retry_status_is_reported_per_attempt():
+    environment, events = build_environment()
+    statuses = iter([503, 200])
+
+    client = build_client(
+        environment, lambda request: httpx.Response(next(statuses)), retry=RetryPolicy(attempts=2, backoff=0)
+    )
+
+    assert client.get("/api/v1/users").status_code == 200
+    assert [event["request_type"] for event in events] == ["HTTP", "HTTP retry"]
+
+
+def test_send_hedged_returns_hedge_and_stops_slow_request():
+    """
+    Если ответ не пришёл за hedging.delay, используется ответ дублирующего запроса, а медленный запрос
+    прерывается и не держит соединение до конца.
+    """
+    environment, events = build_environment()
+    finished = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        hedged = request.extensions.get("hedged", False)
+        gevent.sleep(0 if hedged else SLOW_RESPONSE_DELAY)
+        finished.append(hedged)
+        return httpx.Response(200, json={"hedged": hedged})
+
+    client = build_client(
+        environment,
+        handler,
+        validation=NO_VALIDATION,
+        hedging=HedgingPolicy(delay=0.05),
+        body_mode=HTTPBodyMode.DISCARD
+    )
+
+    response = client.get_prepared("/api/v1/users/{user_id}", user_id="user-1")
+    # Медленный запрос успел бы завершиться, если бы его не прервали
+    gevent.sleep(SLOW_RESPONSE_DELAY * 2)
+
+    assert response.request.extensions["hedged"]
+    assert finished == [True]
+    assert [event["request_type"] for event in events] == ["HTTP hedge"]
+
+
+def test_async_send_hedged_cancels_slow_request():
+    environment, events = build_environment()
+    finished = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        hedged = request.extensions.get("hedged", False)
+        await asyncio.sleep(0 if hedged else SLOW_RESPONSE_DELAY)
+        finished.append(hedged)
+        return httpx.Response(200)
+
+    async def run() -> httpx.Response:
+        client = AsyncHTTPClient(
+            client=httpx.AsyncClient(
+                base_url="http://gateway",
+                transport=httpx.MockTransport(handler),
+                event_hooks={
+                    "request": [
+                        async_locust_request_event_hook,
+                        async_locust_transport_error_event_hook(environment)
+                    ],
+                    "response": [async_locust_response_event_hook(environment)]
+                }
+            ),
+            hedging=HedgingPolicy(delay=0.05)
+        )
+        async with client.client:
+            response = await client.get_prepared("/api/v1/users/{user_id}", user_id="user-1")
+            await asyncio.sleep(SLOW_RESPONSE_DELAY * 2)
+            return response
+
+    response = asyncio.run(run())
+
+    assert response.request.extensions["hedged"]
+    assert finished == [True]
+    assert [event["request_type"] for event in events] == ["HTTP hedge"]
@@ -0,0 +1,94 @@
+import socket
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import h2.config
+import h2.connection
+import h2.events
+import httpx
+import pytest
+from locust.env import Environment
+
+from clients.http.event_hooks.locust_event_hook import (
+    HTTPStreamsTracker,
+    locust_request_event_hook,
+    locust_response_event_hook
+)
+
+RESPONSE_DELAY = 0.2
+
+
+def serve_h2c_connection(connection_socket: socket.socket) -> None:
+    """
+    Обслуживает одно соединение HTTP/2 без TLS: на каждый поток отвечает с задержкой RESPONSE_DELAY,
+    потоки соединения обрабатываются параллельно.
+    """
+    connection = h2.connection.H2Connection(config=h2.config.H2Configuration(client_side=False))
+    connection.initiate_connection()
+    connection_socket.sendall(connection.data_to_send())
+    lock = threading.Lock()
+
+    def respond(stream_id: int) -> None:
+        time.sleep(RESPONSE_DELAY)
+        with lock:
+            connection.send_headers(stream_id, [(":status", "200"), ("content-length", "2")])
+            connection.send_data(stream_id, b"ok", end_stream=True)
+            connection_socket.sendall(connection.data_to_send())
+
+    while data := connection_socket.recv(65535):
+        with lock:
+            events = connection.receive_data(data)
+            connection_socket.sendall(connection.data_to_send())
+
+        for event in events:
+            if isinstance(event, h2.events.RequestReceived):
+                threading.Thread(target=respond, args=(event.stream_id,), daemon=True).start()
+
+
+@pytest.fixture
+def h2c_server_url():
+    server_socket = socket.create_server(("127.0.0.1", 0))
+
+    def serve() -> None:
+        while True:
+            try:
+                connection_socket, _ = server_socket.accept()
+            except OSError:
+                return
+            threading.Thread(target=serve_h2c_connection, args=(connection_socket,), daemon=True).start()
+
+    threading.Thread(target=serve, daemon=True).start()
+    yield f"http://127.0.0.1:{server_socket.getsockname()[1]}"
+    server_socket.close()
+
+
+def test_concurrent_http2_requests_share_connection_streams(h2c_server_url: str):
+    """
+    Параллельные запросы HTTP/2 учитываются как одновременно открытые потоки одного соединения,
+    а после закрытия ответов счётчик возвращается к нулю.
+    """
+    environment = Environment()
+    tracker = HTTPStreamsTracker()
+    contexts = []
+    environment.events.request.add_listener(lambda context, **kwargs: contexts.append(context))
+
+    with httpx.Client(
+            base_url=h2c_server_url,
+            http1=False,
+            http2=True,
+            event_hooks={
+                "request": [locust_request_event_hook, tracker.request_event_hook],
+                "response": [locust_response_event_hook(environment, tracker)]
+            }
+    ) as client:
+        # Первый запрос устанавливает соединение, остальные мультиплексируются в нём
+        client.get("/")
+        with ThreadPoolExecutor(max_workers=5) as executor:
+            responses = list(executor.map(lambda _: client.get("/"), range(5)))
+
+    assert all(response.http_version == "HTTP/2" for response in responses)
+    assert len(contexts) == 6
+    assert len({context["connection_id"] for context in contexts}) == 1
+    assert max(context["connection_streams"] for context in contexts) > 1
+    assert tracker.streams == 0
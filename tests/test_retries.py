@@ -0,0 +1,217 @@
+import threading
+from collections import namedtuple
+
+import grpc
+import pytest
+
+from clients.grpc.client import GRPCClient
+from clients.grpc.interceptors.retry_interceptor import (
+    HEDGED_METADATA_KEY,
+    RetryInterceptor,
+    get_retry_attempt
+)
+from clients.retries import RetryBudget, RetryPolicy, HedgingPolicy
+
+CallDetails = namedtuple(
+    "CallDetails", ("method", "timeout", "metadata", "credentials", "wait_for_ready", "compression")
+)
+
+
+class FakeRpcError(grpc.RpcError):
+    pass
+
+
+class FakeCall:
+    """
+    Завершённый unary-вызов gRPC, как его возвращает продолжение интерцептора при блокирующем вызове.
+    """
+
+    def __init__(self, code: grpc.StatusCode, response: str | None = None):
+        self.status_code = code
+        self.response = response
+
+    def code(self) -> grpc.StatusCode:
+        return self.status_code
+
+    def done(self) -> bool:
+        return True
+
+    def cancelled(self) -> bool:
+        return False
+
+    def result(self, timeout: float | None = None) -> str | None:
+        if self.status_code != grpc.StatusCode.OK:
+            raise FakeRpcError(self.status_code.name)
+        return self.response
+
+    def exception(self, timeout: float | None = None) -> FakeRpcError | None:
+        return None if self.status_code == grpc.StatusCode.OK else FakeRpcError(self.status_code.name)
+
+    def add_done_callback(self, fn) -> None:
+        fn(self)
+
+
+def build_call_details() -> CallDetails:
+    return CallDetails("/accounts.AccountsGatewayService/GetAccounts", None, (("x-user", "1"),), None, None, None)
+
+
+def test_retry_policy_limits_attempts():
+    policy = RetryPolicy(attempts=3)
+
+    assert [policy.can_retry(attempt) for attempt in range(3)] == [True, True, False]
+
+
+def test_retry_policy_delay_grows_up_to_max_backoff():
+    policy = RetryPolicy(backoff=0.1, multiplier=2, max_backoff=0.3, jitter=False)
+
+    assert [policy.get_delay(attempt) for attempt in range(1, 5)] == pytest.approx([0.1, 0.2, 0.3, 0.3])
+
+
+def test_retry_policy_jitter_stays_within_delay():
+    policy = RetryPolicy(backoff=0.1, multiplier=2, max_backoff=1.0)
+
+    assert all(0 <= policy.get_delay(3) <= 0.4 for _ in range(100))
+
+
+def test_retry_budget_stops_retries_and_recovers():
+    """
+    Бюджет перестаёт разрешать повторы, когда израсходована половина токенов, и восстанавливается успехами.
+    """
+    budget = RetryBudget(max_tokens=10, token_ratio=1)
+    policy = RetryPolicy(attempts=100, budget=budget)
+
+    assert [policy.can_retry(0) for _ in range(5)] == [True, True, True, True, False]
+    assert budget.tokens == 5
+
+    policy.on_success()
+    assert budget.can_retry()
+
+
+def test_retry_interceptor_retries_retryable_codes():
+    """
+    Вызов повторяется после UNAVAILABLE; повторы получают метаданные с номером попытки, остальные метаданные
+    сохраняются.
+    """
+    codes = iter([grpc.StatusCode.UNAVAILABLE, grpc.StatusCode.UNAVAILABLE, grpc.StatusCode.OK])
+    attempts = []
+
+    def continuation(client_call_details, request):
+        attempts.append(client_call_details.metadata)
+        return FakeCall(next(codes), response=f"response to {request}")
+
+    interceptor = RetryInterceptor(RetryPolicy(attempts=3, backoff=0))
+    call = interceptor.intercept_unary_unary(continuation, build_call_details(), "request")
+
+    assert call.code() == grpc.StatusCode.OK
+    assert call.result() == "response to request"
+    retry_attempts = [get_retry_attempt(CallDetails(None, None, metadata, None, None, None)) for metadata in attempts]
+    assert retry_attempts == [0, 1, 2]
+    assert all(("x-user", "1") in metadata for metadata in attempts)
+
+
+@pytest.mark.parametrize(("codes", "expected_calls"), [
+    ([grpc.StatusCode.INVALID_ARGUMENT], 1),
+    ([grpc.StatusCode.UNAVAILABLE] * 3, 2)
+])
+def test_retry_interceptor_returns_last_failure(codes: list[grpc.StatusCode], expected_calls: int):
+    """
+    Неповторяемые коды возвращаются сразу, а после исчерпания попыток возвращается последняя ошибка.
+    """
+    calls = iter(codes)
+    made_calls = []
+
+    def continuation(client_call_details, request):
+        made_calls.append(client_call_details)
+        return FakeCall(next(calls))
+
+    interceptor = RetryInterceptor(RetryPolicy(attempts=2, backoff=0))
+    call = interceptor.intercept_unary_unary(continuation, build_call_details(), "request")
+
+    assert call.code() == codes[0]
+    assert len(made_calls) == expected_calls
+
+
+class FakeFuture:
+    """
+    Вызов .future(), завершающийся через delay секунд в отдельном потоке.
+    """
+
+    def __init__(self, response: str, delay: float):
+        self.response = response
+        self.finished = threading.Event()
+        self.is_cancelled = False
+        self.callbacks = []
+        self.lock = threading.Lock()
+        self.timer = threading.Timer(delay, self.finish)
+        self.timer.start()
+
+    def finish(self) -> None:
+        with self.lock:
+            if self.finished.is_set():
+                return
+            self.finished.set()
+        for callback in self.callbacks:
+            callback(self)
+
+    def cancel(self) -> bool:
+        self.timer.cancel()
+        self.is_cancelled = True
+        self.finish()
+        return True
+
+    def cancelled(self) -> bool:
+        return self.is_cancelled
+
+    def result(self, timeout: float | None = None) -> str:
+        if not self.finished.wait(timeout):
+            raise grpc.FutureTimeoutError()
+        if self.is_cancelled:
+            raise grpc.FutureCancelledError()
+        return self.response
+
+    def exception(self, timeout: float | None = None) -> None:
+        return None
+
+    def add_done_callback(self, fn) -> None:
+        with self.lock:
+            if not self.finished.is_set():
+                self.callbacks.append(fn)
+                return
+        fn(self)
+
+
+class FakeMultiCallable:
+    """
+    Метод стаба: каждый вызов .future() завершается с задержкой из delays.
+    """
+
+    def __init__(self, delays: list[float]):
+        self.delays = iter(delays)
+        self.futures: list[tuple[FakeFuture, tuple]] = []
+
+    def __call__(self, request):
+        return self.future(request).result()
+
+    def future(self, request, metadata=()):
+        future = FakeFuture(f"response {len(self.futures)}", next(self.delays))
+        self.futures.append((future, metadata))
+        return future
+
+
+def test_grpc_hedged_call_returns_first_response_and_cancels_slow_call():
+    multicallable = FakeMultiCallable(delays=[5, 0.01])
+    client = GRPCClient(channel=None, hedging=HedgingPolicy(delay=0.05))
+
+    assert client.call_hedged(multicallable, "request") == "response 1"
+
+    (primary, _), (hedge, metadata) = multicallable.futures
+    assert primary.cancelled()
+    assert metadata == ((HEDGED_METADATA_KEY, "1"),)
+
+
+def test_grpc_hedged_call_is_not_duplicated_when_answered_in_time():
+    multicallable = FakeMultiCallable(delays=[0, 0])
+    client = GRPCClient(channel=None, hedging=HedgingPolicy(delay=1))
+
+    assert client.call_hedged(multicallable, "request") == "response 0"
+    assert len(multicallable.futures) == 1
@@ -0,0 +1,27 @@
+import importlib
+import pathlib
+
+import pytest
+
+SCENARIOS_DIR = pathlib.Path(__file__).parent.parent / "scenarios"
+SCENARIO_MODULES = sorted(
+    ".".join(path.relative_to(SCENARIOS_DIR.parent).with_suffix("").parts)
+    for path in SCENARIOS_DIR.rglob("scenario.py")
+)
+
+
+@pytest.mark.parametrize("module_name", SCENARIO_MODULES)
+def test_scenario_module_imports(module_name: str):
+    """
+    Сценарий импортируется, и в нём объявлен пользователь Locust с задачами.
+    """
+    from locust import User
+
+    module = importlib.import_module(module_name)
+
+    users = [
+        value for value in vars(module).values()
+        if isinstance(value, type) and issubclass(value, User) and value.__module__ == module_name
+    ]
+    assert users, f"{module_name} does not declare a Locust user"
+    assert all(user.tasks for user in users)
@@ -0,0 +1,114 @@
+import itertools
+from types import SimpleNamespace
+
+import gevent
+import pytest
+
+from seeds.builder import SeedsBuilder
+from seeds.schema.plan import SeedsPlan, SeedUsersPlan, SeedAccountsPlan, SeedCardsPlan, SeedOperationsPlan
+
+
+class FakeGatewayClient:
+    """
+    Клиент gateway для тестов: каждый вызов длится delay секунд (под gevent), считает одновременные вызовы.
+    """
+
+    def __init__(self, delay: float = 0.001):
+        self.delay = delay
+        self.ids = itertools.count()
+        self.calls_in_flight = 0
+        self.max_calls_in_flight = 0
+
+    def call(self, **fields) -> SimpleNamespace:
+        self.calls_in_flight += 1
+        self.max_calls_in_flight = max(self.max_calls_in_flight, self.calls_in_flight)
+        try:
+            gevent.sleep(self.delay)
+        finally:
+            self.calls_in_flight -= 1
+
+        return SimpleNamespace(id=str(next(self.ids)), **fields)
+
+    def create_user(self):
+        return SimpleNamespace(user=self.call())
+
+    def open_debit_card_account(self, user_id: str):
+        return SimpleNamespace(account=self.call(cards=[SimpleNamespace(id="card")]))
+
+    def issue_virtual_card(self, user_id: str, account_id: str):
+        return SimpleNamespace(card=self.call())
+
+    def make_top_up_operation(self, card_id: str, account_id: str):
+        return SimpleNamespace(operation=self.call())
+
+
+def build_plan() -> SeedsPlan:
+    return SeedsPlan(users=SeedUsersPlan(
+        count=20,
+        debit_card_accounts=SeedAccountsPlan(
+            count=3,
+            virtual_cards=SeedCardsPlan(count=5),
+            top_up_operations=SeedOperationsPlan(count=10)
+        )
+    ))
+
+
+def build_seeds_builder(client: FakeGatewayClient, workers: int, max_in_flight: int) -> SeedsBuilder:
+    return SeedsBuilder(
+        users_gateway_client=client,
+        cards_gateway_client=client,
+        accounts_gateway_client=client,
+        operations_gateway_client=client,
+        workers=workers,
+        max_in_flight=max_in_flight
+    )
+
+
+def test_nested_fan_out_is_bounded_by_max_in_flight():
+    """
+    Вложенные gather (счета → карты и операции) всех пользователей делят общий предел max_in_flight.
+    """
+    client = FakeGatewayClient()
+
+    result = build_seeds_builder(client, workers=4, max_in_flight=10).build(build_plan())
+
+    assert client.max_calls_in_flight <= 10
+    assert client.max_calls_in_flight > 4
+    assert len(result.users) == 20
+    for user in result.users:
+        assert len(user.debit_card_accounts) == 3
+        assert all(len(account.virtual_cards) == 5 for account in user.debit_card_accounts)
+        assert all(len(account.top_up_operations) == 10 for account in user.debit_card_accounts)
+
+
+def test_fan_out_runs_inline_without_free_slots():
+    """
+    При max_in_flight == workers вложенные вызовы выполняются в greenlet'е пользователя.
+    """
+    client = FakeGatewayClient()
+
+    result = build_seeds_builder(client, workers=3, max_in_flight=3).build(build_plan())
+
+    assert client.max_calls_in_flight == 3
+    assert len(result.users) == 20
+
+
+
+def raise_card_error():
+    raise RuntimeError("Card service is unavailable")
+
+
+def test_failed_gather_releases_slots_of_unstarted_greenlets():
+    """
+    Если вызов, выполняемый в текущем greenlet'е, падает раньше, чем запущенные greenlet'ы успели стартовать,
+    их слоты всё равно освобождаются, а исключение пробрасывается с исходным traceback.
+    """
+    client = FakeGatewayClient()
+    builder = build_seeds_builder(client, workers=2, max_in_flight=4)
+
+    with pytest.raises(RuntimeError, match="Card service is unavailable") as error:
+        builder.gather(cards=[client.create_user, client.create_user, raise_card_error])
+    gevent.sleep(0)
+
+    assert builder.slots.counter == 2
+    assert error.traceback[-1].name == "raise_card_error"
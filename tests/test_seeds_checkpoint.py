@@ -0,0 +1,64 @@
+import pytest
+
+from seeds.dumps import append_seeds_checkpoint, load_seeds_checkpoint
+from seeds.schema.result import SeedUserResult, SeedAccountResult
+
+SCENARIO = "checkpoint_test"
+CHECKPOINT_PATH = f"./dumps/{SCENARIO}_seeds.checkpoint.jsonl"
+
+
+@pytest.fixture(autouse=True)
+def dumps_dir(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+
+
+def build_user(index: int) -> SeedUserResult:
+    return SeedUserResult(
+        user_id=f"user-{index}",
+        debit_card_accounts=[SeedAccountResult(account_id=f"account-{index}")]
+    )
+
+
+def truncate_last_line(size: int) -> None:
+    """
+    Имитирует падение во время записи: обрезает последние size байт файла контрольной точки.
+    """
+    with open(CHECKPOINT_PATH, 'r+b') as file:
+        file.seek(0, 2)
+        file.truncate(file.tell() - size)
+
+
+def test_resume_twice_after_truncated_write():
+    """
+    После недописанной строки сидинг продолжается дважды без потери пользователей.
+    """
+    for index in range(3):
+        append_seeds_checkpoint(build_user(index), SCENARIO, "plan")
+    truncate_last_line(10)
+
+    # Первое продолжение: недописанный третий пользователь отброшен, создаются новые
+    users = load_seeds_checkpoint(SCENARIO, "plan")
+    assert [user.user_id for user in users] == ["user-0", "user-1"]
+    for index in range(2, 5):
+        append_seeds_checkpoint(build_user(index), SCENARIO, "plan")
+    truncate_last_line(1)
+
+    # Второе продолжение: строки, дописанные после обрезки, читаются целиком
+    users = load_seeds_checkpoint(SCENARIO, "plan")
+    assert [user.user_id for user in users] == ["user-0", "user-1", "user-2", "user-3"]
+    append_seeds_checkpoint(build_user(4), SCENARIO, "plan")
+
+    users = load_seeds_checkpoint(SCENARIO, "plan")
+    assert users == [build_user(index) for index in range(5)]
+
+
+def test_checkpoint_of_another_plan_is_discarded():
+    """
+    Контрольная точка другого плана очищается, и новая начинается с заголовка текущего плана.
+    """
+    append_seeds_checkpoint(build_user(0), SCENARIO, "old-plan")
+
+    assert load_seeds_checkpoint(SCENARIO, "plan") == []
+    append_seeds_checkpoint(build_user(1), SCENARIO, "plan")
+
+    assert load_seeds_checkpoint(SCENARIO, "plan") == [build_user(1)]
@@ -0,0 +1,83 @@
+import pytest
+
+from seeds.dumps import load_seeds_result, save_seeds_result, write_seeds_binary
+from seeds.readers import BinarySeedsResult, JSONLinesSeedsResult
+from seeds.schema.meta import SeedsDumpFormat
+from seeds.schema.result import (
+    SeedsResult,
+    SeedUserResult,
+    SeedAccountResult,
+    SeedCardResult,
+    SeedOperationResult
+)
+
+SCENARIO = "dumps_test"
+
+
+def build_account(prefix: str) -> SeedAccountResult:
+    return SeedAccountResult(
+        account_id=f"{prefix}-account",
+        physical_cards=[SeedCardResult(card_id=f"{prefix}-physical-card")],
+        virtual_cards=[SeedCardResult(card_id=f"{prefix}-virtual-card-{index}") for index in range(2)],
+        top_up_operations=[SeedOperationResult(operation_id=f"{prefix}-top-up")],
+        purchase_operations=[SeedOperationResult(operation_id=f"{prefix}-purchase-{index}") for index in range(3)]
+    )
+
+
+def build_result(users_count: int) -> SeedsResult:
+    return SeedsResult(users=[
+        SeedUserResult(
+            user_id=f"user-{index}",
+            credit_card_accounts=[build_account(f"user-{index}-credit")],
+            debit_card_accounts=[build_account(f"user-{index}-debit"), build_account(f"user-{index}-debit-2")],
+            deposit_accounts=[],
+            # Идентификатор, общий для разных пользователей, попадает в таблицу строк бинарного дампа один раз
+            savings_accounts=[build_account("shared")]
+        )
+        for index in range(users_count)
+    ])
+
+
+@pytest.fixture(autouse=True)
+def dumps_dir(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+
+
+@pytest.mark.parametrize("users_count", [0, 1, 5])
+@pytest.mark.parametrize("dump_format", list(SeedsDumpFormat))
+def test_dump_round_trip(dump_format: SeedsDumpFormat, users_count: int):
+    """
+    Пользователи, прочитанные из дампа любого формата, совпадают с записанными — в том числе для пустого дампа.
+    """
+    result = build_result(users_count)
+
+    save_seeds_result(result, SCENARIO, dump_format)
+    loaded = load_seeds_result(SCENARIO, dump_format)
+
+    assert loaded.get_users_count() == users_count
+    users = [loaded.get_user(index).model_dump() for index in range(users_count)]
+    assert users == result.model_dump()["users"]
+
+
+def test_jsonl_dump_reads_users_by_offset_index():
+    result = build_result(3)
+
+    save_seeds_result(result, SCENARIO, SeedsDumpFormat.JSONL)
+    loaded = load_seeds_result(SCENARIO, SeedsDumpFormat.JSONL)
+
+    assert isinstance(loaded, JSONLinesSeedsResult)
+    # Пользователи читаются в произвольном порядке, без последовательного разбора файла
+    assert loaded.get_user(2).model_dump() == result.users[2].model_dump()
+    assert loaded.get_user(0).model_dump() == result.users[0].model_dump()
+    with pytest.raises(IndexError):
+        loaded.get_user(3)
+
+
+def test_binary_dump_is_written_from_generator():
+    result = build_result(4)
+
+    assert write_seeds_binary((user for user in result.users), SCENARIO) == 4
+    loaded = load_seeds_result(SCENARIO, SeedsDumpFormat.BINARY)
+
+    assert isinstance(loaded, BinarySeedsResult)
+    assert [loaded.get_user(index).model_dump() for index in range(4)] == result.model_dump()["users"]
@@ -0,0 +1,128 @@
+import pytest
+
+from seeds import pools
+from seeds.leases import SeedsExhaustedError, SeedsLeasePool
+from seeds.pools import build_in_memory_seeds_pool
+from seeds.schema.result import SeedsResult, SeedUserResult
+
+LEASE_TTL = 60
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1_000_000.0
+
+    def time(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch) -> FakeClock:
+    clock = FakeClock()
+    monkeypatch.setattr(pools.time, "time", clock.time)
+    return clock
+
+
+def build_pool(users_count: int, lease_ttl: float | None = LEASE_TTL):
+    pool = build_in_memory_seeds_pool("pool_test", lease_ttl=lease_ttl)
+    pool.fill(SeedsResult(users=[SeedUserResult(user_id=f"user-{index}") for index in range(users_count)]))
+    return pool
+
+
+def test_expired_lease_is_reclaimed(clock: FakeClock):
+    """
+    Пользователь, аренду которого не продлевают (воркер упал), возвращается в пул после lease_ttl.
+    """
+    pool = build_pool(users_count=1)
+    user = pool.lease()
+    pool.held.clear()  # Арендатор пропал и больше не продлевает аренду
+
+    clock.now += LEASE_TTL - 1
+    pool.renew()
+    assert pool.reclaim() == 0
+    with pytest.raises(SeedsExhaustedError):
+        pool.lease()
+
+    clock.now += 1
+    assert pool.reclaim() == 1
+    assert pool.lease() == user
+
+
+def test_renewed_lease_is_kept(clock: FakeClock):
+    """
+    Аренды, которые процесс продлевает, не возвращаются в пул, сколько бы ни длился прогон.
+    """
+    pool = build_pool(users_count=1)
+    pool.lease()
+
+    for _ in range(5):
+        clock.now += LEASE_TTL / 2
+        pool.renew()
+        assert pool.reclaim() == 0
+
+    assert pool.get_free_count() == 0
+
+
+def test_release_after_reclaim_does_not_duplicate_user(clock: FakeClock):
+    """
+    Возврат пользователя, аренда которого уже истекла и была возвращена в пул, не создаёт дубликат.
+    """
+    pool = build_pool(users_count=1)
+    user = pool.lease()
+
+    clock.now += LEASE_TTL
+    assert pool.reclaim() == 1
+    pool.release(user)
+    assert pool.get_free_count() == 1
+
+    # Продление не восстанавливает аренду, которая уже вернулась в пул
+    pool.renew()
+    assert pool.lease() == user
+    pool.release(user)
+    assert pool.get_free_count() == 1
+
+
+def test_pool_without_ttl_releases_users():
+    pool = build_pool(users_count=2, lease_ttl=None)
+    user = pool.lease()
+
+    assert pool.get_free_count() == 1
+    assert pool.reclaim() == 0
+    pool.release(user)
+    assert pool.get_free_count() == 2
+
+
+def test_lease_records_deadline_in_the_same_operation(clock: FakeClock):
+    """
+    Выдача пользователя и запись срока его аренды — одна операция хранилища.
+    """
+    pool = build_pool(users_count=1)
+
+    def fail(*args, **kwargs):
+        raise AssertionError("Lease deadline must be recorded by the lease operation itself")
+
+    pool.backend.set_deadlines = fail
+    user = pool.lease()
+
+    assert pool.backend.deadlines[pool.keys.leased] == {user.model_dump_json(): clock.now + LEASE_TTL}
+
+
+def test_shared_pool_recycles_like_lease_pool():
+    """
+    С recycle=True общий пул, как и SeedsLeasePool, выдаёт уже арендованных пользователей по кругу,
+    а повторно выданный пользователь возвращается в пул только после возврата всеми арендаторами.
+    """
+    result = SeedsResult(users=[SeedUserResult(user_id=f"user-{index}") for index in range(2)])
+    shared_pool = build_in_memory_seeds_pool("pool_test", recycle=True)
+    shared_pool.fill(result)
+    lease_pool = SeedsLeasePool(result, recycle=True)
+
+    for pool in (shared_pool, lease_pool):
+        users = [pool.lease() for _ in range(3)]
+        assert [user.user_id for user in users] == ["user-0", "user-1", "user-0"]
+
+        pool.release(users[0])
+        assert pool.get_free_count() == 0
+        pool.release(users[2])
+        assert pool.get_free_count() == 1
+        assert pool.lease() == users[0]
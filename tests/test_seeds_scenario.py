@@ -0,0 +1,129 @@
+import pytest
+from grpc import RpcError
+
+from seeds.scenario import SeedsScenario
+from seeds.schema.meta import SeedsDumpFormat
+from seeds.schema.plan import SeedsPlan, SeedUsersPlan
+from seeds.schema.result import SeedsResult, SeedUserResult
+
+
+@pytest.fixture(autouse=True)
+def dumps_dir(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+
+
+class FakeUsersGatewayClient:
+    """
+    Клиент users-gateway для проверки живости: знает только пользователей из множества existing.
+    """
+
+    def __init__(self):
+        self.existing: set[str] = set()
+
+    def get_user(self, user_id: str) -> None:
+        if user_id not in self.existing:
+            raise RpcError(f"User {user_id} not found")
+
+
+class FakeSeedsBuilder:
+    """
+    Билдер для тестов: создаёт пользователей без gateway и считает запуски сидинга.
+    """
+
+    def __init__(self):
+        self.builds = 0
+        self.users_gateway_client = FakeUsersGatewayClient()
+
+    def build(self, plan: SeedsPlan, completed=None, on_user=None) -> SeedsResult:
+        self.builds += 1
+        users = [SeedUserResult(user_id=f"user-{self.builds}-{index}") for index in range(plan.users.count)]
+        self.users_gateway_client.existing.update(user.user_id for user in users)
+        return SeedsResult(users=users)
+
+
+class CachedSeedsScenario(SeedsScenario):
+    def __init__(self, users_count: int = 3, dump_format: SeedsDumpFormat = SeedsDumpFormat.JSON, probe_size: int = 0):
+        super().__init__()
+        self.builder = FakeSeedsBuilder()
+        self.users_count = users_count
+        self.format = dump_format
+        self.probe_size = probe_size
+
+    @property
+    def liveness_probe_size(self) -> int:
+        return self.probe_size
+
+    @property
+    def dump_format(self) -> SeedsDumpFormat:
+        return self.format
+
+    @property
+    def plan(self) -> SeedsPlan:
+        return SeedsPlan(users=SeedUsersPlan(count=self.users_count))
+
+    @property
+    def scenario(self) -> str:
+        return "cached_test"
+
+
+@pytest.mark.parametrize("dump_format", list(SeedsDumpFormat))
+def test_build_reuses_dump_of_the_same_plan(dump_format: SeedsDumpFormat):
+    scenario = CachedSeedsScenario(dump_format=dump_format)
+
+    assert not scenario.is_cached()
+    scenario.build()
+    scenario.build()
+
+    assert scenario.is_cached()
+    assert scenario.builder.builds == 1
+    assert scenario.load().get_users_count() == 3
+
+
+def test_changed_plan_misses_cache():
+    scenario = CachedSeedsScenario()
+    scenario.build()
+
+    scenario.users_count = 5
+
+    assert not scenario.is_cached()
+    scenario.build()
+    assert scenario.builder.builds == 2
+    assert scenario.load().get_users_count() == 5
+
+
+def test_changed_dump_format_misses_cache():
+    scenario = CachedSeedsScenario()
+    scenario.build()
+
+    scenario.format = SeedsDumpFormat.JSONL
+
+    assert not scenario.is_cached()
+
+
+def test_invalidate_and_force_rebuild_dump():
+    scenario = CachedSeedsScenario()
+    scenario.build()
+
+    scenario.invalidate()
+
+    assert not scenario.is_cached()
+    scenario.build()
+    scenario.build(force=True)
+    assert scenario.builder.builds == 3
+
+
+def test_liveness_probe_rejects_dump_with_missing_users():
+    """
+    Дамп того же плана не переиспользуется, если его пользователей больше нет в gateway
+    (например, после очистки стенда).
+    """
+    scenario = CachedSeedsScenario(probe_size=2)
+    scenario.build()
+
+    assert scenario.is_cached()
+
+    scenario.builder.users_gateway_client.existing.clear()
+
+    assert not scenario.is_cached()
+    scenario.build()
+    assert scenario.builder.builds == 2
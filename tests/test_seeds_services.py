@@ -0,0 +1,38 @@
+from types import SimpleNamespace
+
+from clients.grpc.services.accounts.client import AccountsServiceGRPCClient
+from clients.grpc.services.users.client import UsersServiceGRPCClient
+from seeds.scenarios.existing_user_make_purchase_operation import ExistingUserMakePurchaseOperationSeedsScenario
+from tools.locust.seeds import use_locust_seeds_services
+
+
+def build_environment(**options: str) -> SimpleNamespace:
+    return SimpleNamespace(parsed_options=SimpleNamespace(**options))
+
+
+def test_seeding_switches_to_services_when_all_addresses_are_set():
+    """
+    С адресами всех внутренних сервисов сидинг создаёт данные через клиенты сервисов, в обход gateway.
+    """
+    seeds_scenario = ExistingUserMakePurchaseOperationSeedsScenario()
+    environment = build_environment(
+        seeds_users_service="localhost:50061",
+        seeds_accounts_service="localhost:50062",
+        seeds_cards_service="localhost:50063",
+        seeds_operations_service="localhost:50064"
+    )
+
+    use_locust_seeds_services(environment, seeds_scenario)
+
+    assert isinstance(seeds_scenario.builder.users_gateway_client, UsersServiceGRPCClient)
+    assert isinstance(seeds_scenario.builder.accounts_gateway_client, AccountsServiceGRPCClient)
+    assert seeds_scenario.builder.workers == seeds_scenario.workers
+
+
+def test_seeding_stays_on_gateway_without_all_addresses():
+    seeds_scenario = ExistingUserMakePurchaseOperationSeedsScenario()
+    builder = seeds_scenario.builder
+
+    use_locust_seeds_services(build_environment(seeds_users_service="localhost:50061"), seeds_scenario)
+
+    assert seeds_scenario.builder is builder
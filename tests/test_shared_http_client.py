@@ -0,0 +1,17 @@
+from locust.env import Environment
+
+from clients.http.gateway.client import build_shared_gateway_locust_http_client
+
+
+def test_shared_client_is_cached_per_arguments():
+    """
+    Вызовы с теми же параметрами получают общий клиент, с другими параметрами — отдельный.
+    """
+    environment = Environment()
+
+    client = build_shared_gateway_locust_http_client(environment)
+
+    assert build_shared_gateway_locust_http_client(environment) is client
+    assert build_shared_gateway_locust_http_client(environment, http2=True) is not client
+    assert build_shared_gateway_locust_http_client(environment, max_connections=10) is not client
+    assert build_shared_gateway_locust_http_client(environment, phase_stats=True) is not client
@@ -0,0 +1,121 @@
+import httpx
+import pytest
+from pydantic import BaseModel
+
+from clients.grpc.validation import ValidationChannel
+from clients.http.client import HTTPClient
+from clients.validation import ValidationPolicy, ValidationMode, LazyResponse, NO_VALIDATION
+from contracts.services.gateway.users.rpc_get_user_pb2 import GetUserResponse
+
+METHOD = "/users.UsersGatewayService/GetUser"
+RESPONSE = GetUserResponse()
+RESPONSE.user.id = "user-1"
+RESPONSE.user.email = "user@example.com"
+
+
+class FakeChannel:
+    """
+    Канал для тестов: unary-unary вызов разбирает сериализованный RESPONSE переданным десериализатором.
+    """
+
+    def unary_unary(self, method, request_serializer=None, response_deserializer=None, _registered_method=False):
+        return lambda request, **kwargs: response_deserializer(RESPONSE.SerializeToString())
+
+    def unary_stream(self, method, request_serializer=None, response_deserializer=None, _registered_method=False):
+        return lambda request, **kwargs: iter([response_deserializer(RESPONSE.SerializeToString())])
+
+
+class UserSchema(BaseModel):
+    id: str
+
+
+class CountingParser:
+    """
+    Функция разбора, которая считает свои вызовы.
+    """
+
+    def __init__(self):
+        self.calls = 0
+
+    def __call__(self, raw: bytes) -> GetUserResponse:
+        self.calls += 1
+        return GetUserResponse.FromString(raw)
+
+
+def call_get_user(validation: ValidationPolicy) -> GetUserResponse | LazyResponse:
+    channel = ValidationChannel(FakeChannel(), validation)
+    return channel.unary_unary(METHOD, response_deserializer=GetUserResponse.FromString)(None)
+
+
+def test_sampled_policy_validates_every_nth_response():
+    validation = ValidationPolicy(ValidationMode.SAMPLED, sample_rate=3)
+
+    assert [validation.should_validate() for _ in range(7)] == [True, False, False, True, False, False, True]
+
+
+def test_policy_rejects_non_positive_sample_rate():
+    with pytest.raises(ValueError, match="sample rate"):
+        ValidationPolicy(ValidationMode.SAMPLED, sample_rate=0)
+
+
+def test_lazy_response_is_parsed_once_on_first_access():
+    parser = CountingParser()
+    response = LazyResponse(RESPONSE.SerializeToString(), parser)
+
+    assert response.ByteSize() == RESPONSE.ByteSize()
+    assert parser.calls == 0
+
+    assert response.user.id == "user-1"
+    assert response.user.email == "user@example.com"
+    assert parser.calls == 1
+
+
+def test_validation_channel_parses_responses_in_full_mode():
+    response = call_get_user(ValidationPolicy(ValidationMode.FULL))
+
+    assert isinstance(response, GetUserResponse)
+    assert response == RESPONSE
+
+
+def test_validation_channel_returns_lazy_responses_when_off():
+    response = call_get_user(NO_VALIDATION)
+
+    assert isinstance(response, LazyResponse)
+    assert response.ByteSize() == RESPONSE.ByteSize()
+    assert response.user.id == "user-1"
+
+
+def test_validation_channel_samples_responses():
+    validation = ValidationPolicy(ValidationMode.SAMPLED, sample_rate=2)
+
+    responses = [call_get_user(validation) for _ in range(4)]
+
+    assert [isinstance(response, LazyResponse) for response in responses] == [False, True, False, True]
+    assert all(response.user.id == "user-1" for response in responses)
+
+
+def test_validation_channel_passes_streams_through():
+    channel = ValidationChannel(FakeChannel(), NO_VALIDATION)
+
+    responses = list(channel.unary_stream(METHOD, response_deserializer=GetUserResponse.FromString)(None))
+
+    assert responses == [RESPONSE]
+
+
+@pytest.mark.parametrize(("validation", "lazy"), [
+    (ValidationPolicy(ValidationMode.FULL), False),
+    (NO_VALIDATION, True)
+])
+def test_http_client_applies_validation_policy(validation: ValidationPolicy, lazy: bool):
+    client = HTTPClient(
+        client=httpx.Client(
+            base_url="http://gateway",
+            transport=httpx.MockTransport(lambda request: httpx.Response(200, json={"id": "user-1"}))
+        ),
+        validation=validation
+    )
+
+    response = client.validate_response(client.get("/user"), UserSchema)
+
+    assert isinstance(response, LazyResponse) is lazy
+    assert response.id == "user-1"
@@ -113,6 +113,46 @@ class Fake:
         """
         return self.float(1, 1000)
 
+    def card_number(self) -> str:
+        """
+        Генерирует случайный номер банковской карты.
+
+        :return: Номер карты (только цифры).
+        """
+        return self.faker.credit_card_number()
+
+    def card_holder(self) -> str:
+        """
+        Генерирует имя держателя карты в том виде, в каком оно печатается на карте.
+
+        :return: Имя и фамилия латиницей в верхнем регистре.
+        """
+        return f"{self.faker.first_name()} {self.faker.last_name()}".upper()
+
+    def expiry_date(self) -> str:
+        """
+        Генерирует срок действия карты.
+
+        :return: Срок действия в формате MM/YY.
+        """
+        return self.faker.credit_card_expire()
+
+    def pin(self) -> str:
+        """
+        Генерирует случайный PIN-код карты.
+
+        :return: Четыре цифры.
+        """
+        return self.faker.numerify("####")
+
+    def cvv(self) -> str:
+        """
+        Генерирует случайный CVV-код карты.
+
+        :return: Три цифры.
+        """
+        return self.faker.numerify("###")
+
     def proto_enum(self, value: EnumTypeWrapper) -> int:
         """
         Выбирает случайное значение из proto enum-типа.
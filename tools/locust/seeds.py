@@ -0,0 +1,177 @@
+import gevent
+from locust.argument_parser import LocustArgumentParser
+from locust.env import Environment
+from locust.runners import MasterRunner, WorkerRunner
+
+from seeds.leases import SeedsLeasePool
+from seeds.pools import SharedSeedsPool, build_redis_seeds_pool
+from seeds.scenario import SeedsScenario
+from seeds.schema.result import SeedsResult
+from seeds.schema.services import SeedsServicesAddresses
+
+# Тип сообщения, которым мастер передаёт воркеру его часть пользователей
+SEEDS_SHARD_MESSAGE = "seeds_shard"
+# Внутренние сервисы, в которых сидинг может создавать данные в обход gateway
+SEEDS_SERVICES = ("users", "accounts", "cards", "operations")
+
+
+def init_locust_seeds(environment: Environment, seeds_scenario: SeedsScenario, lease: bool = False) -> None:
+    """
+    Готовит данные сидинга для запуска Locust и кладёт их в environment.seeds.
+
+    - Локальный запуск: сидинг выполняется и загружается в этом же процессе.
+    - Мастер: сидинг выполняется один раз, а перед стартом нагрузки каждому подключённому воркеру
+      отправляется его непересекающаяся часть пользователей (шард по индексу воркера).
+    - Воркер: сам сидинг не выполняет, а ждёт от мастера свой шард, поэтому разные воркеры
+      никогда не работают с одними и теми же пользователями и счетами.
+
+    Вызывается из обработчика events.init сценария.
+
+    :param environment: Объект окружения Locust.
+    :param seeds_scenario: Сценарий сидинга, данные которого нужны нагрузочному сценарию.
+    :param lease: Раздавать пользователей виртуальным пользователям в эксклюзивную аренду (SeedsLeasePool).
+    """
+
+    def set_seeds(result) -> None:
+        environment.seeds = SeedsLeasePool(result, recycle=True) if lease else result
+
+    if isinstance(environment.runner, WorkerRunner):
+        # Шард приходит до сообщения spawn, поэтому к старту виртуальных пользователей данные уже на месте
+        environment.runner.register_message(
+            SEEDS_SHARD_MESSAGE,
+            lambda msg, **kwargs: set_seeds(SeedsResult.model_validate(msg.data))
+        )
+        return
+
+    use_locust_seeds_services(environment, seeds_scenario)
+    seeds_scenario.build()
+    result = seeds_scenario.load()
+
+    if isinstance(environment.runner, MasterRunner):
+        runner = environment.runner
+
+        def send_shards(**kwargs) -> None:
+            workers = sorted(
+                runner.clients.ready + runner.clients.running + runner.clients.spawning,
+                key=lambda worker: runner.get_worker_index(worker.id)
+            )
+            for index, worker in enumerate(workers):
+                shard = result.get_shard(index, len(workers))
+                runner.send_message(SEEDS_SHARD_MESSAGE, shard.model_dump(mode="json"), client_id=worker.id)
+
+        environment.events.test_start.add_listener(send_shards)
+
+    set_seeds(result)
+
+
+def init_locust_shared_seeds(environment: Environment, seeds_scenario: SeedsScenario, pool: SharedSeedsPool) -> None:
+    """
+    Готовит общий пул сидинга (например, в Redis) и кладёт его в environment.seeds.
+
+    Сидинг и заполнение пула выполняются один раз — локально или на мастере. Воркеры полный дамп
+    не загружают, а арендуют пользователей напрямую из пула, поэтому каждый пользователь достаётся
+    ровно одному виртуальному пользователю во всех процессах и контейнерах.
+
+    Если у пула задан срок аренды (lease_ttl), каждый процесс в фоне продлевает аренды своих
+    виртуальных пользователей и возвращает в пул пользователей с истёкшим сроком — например,
+    арендованных воркером, который упал, не вызвав release().
+
+    :param environment: Объект окружения Locust.
+    :param seeds_scenario: Сценарий сидинга, данные которого нужны нагрузочному сценарию.
+    :param pool: Общий пул, например build_redis_seeds_pool(seeds_scenario.scenario).
+    """
+    if not isinstance(environment.runner, WorkerRunner):
+        use_locust_seeds_services(environment, seeds_scenario)
+        seeds_scenario.build()
+        pool.fill(seeds_scenario.load())
+
+    if pool.lease_ttl is not None:
+        keeper = gevent.spawn(keep_seeds_pool_leases, pool)
+        environment.events.quitting.add_listener(lambda **kwargs: keeper.kill(block=False))
+
+    environment.seeds = pool
+
+
+def keep_seeds_pool_leases(pool: SharedSeedsPool) -> None:
+    """
+    Фоновый цикл (greenlet) обслуживания аренд общего пула: трижды за срок аренды продлевает аренды
+    этого процесса и возвращает в пул истёкшие аренды всех процессов.
+
+    :param pool: Общий пул с заданным lease_ttl.
+    """
+    while True:
+        gevent.sleep(pool.lease_ttl / 3)
+        pool.renew()
+        pool.reclaim()
+
+
+def add_locust_seeds_arguments(parser: LocustArgumentParser) -> None:
+    """
+    Добавляет параметры командной строки Locust для сидинга: общий пул в Redis и адреса внутренних сервисов.
+    Вызывается из обработчика events.init_command_line_parser сценария.
+
+    :param parser: Парсер аргументов Locust.
+    """
+    parser.add_argument(
+        "--seeds-redis-host",
+        default="",
+        env_var="SEEDS_REDIS_HOST",
+        help="Redis host for the shared seeds pool; without it seeded users are sharded by the master"
+    )
+    parser.add_argument("--seeds-redis-port", type=int, default=6379, env_var="SEEDS_REDIS_PORT")
+    parser.add_argument(
+        "--seeds-lease-ttl",
+        type=float,
+        default=60,
+        env_var="SEEDS_LEASE_TTL",
+        help="Seconds after which users leased by a dead worker return to the shared seeds pool"
+    )
+    # Сидинг напрямую во внутренних сервисах: включается, когда заданы адреса всех четырёх сервисов
+    for service in SEEDS_SERVICES:
+        parser.add_argument(
+            f"--seeds-{service}-service",
+            default="",
+            env_var=f"SEEDS_{service.upper()}_SERVICE",
+            help=f"Internal {service} service host:port to seed directly, bypassing the gateway"
+        )
+
+
+def use_locust_seeds_services(environment: Environment, seeds_scenario: SeedsScenario) -> None:
+    """
+    Переключает сидинг на внутренние сервисы (SeedsScenario.use_services), если в параметрах Locust
+    заданы адреса всех сервисов (см. add_locust_seeds_arguments).
+
+    :param environment: Объект окружения Locust.
+    :param seeds_scenario: Сценарий сидинга.
+    """
+    addresses = {
+        f"{service}_address": getattr(environment.parsed_options, f"seeds_{service}_service", "")
+        for service in SEEDS_SERVICES
+    }
+    if all(addresses.values()):
+        seeds_scenario.use_services(SeedsServicesAddresses(**addresses))
+
+
+def init_locust_leased_seeds(environment: Environment, seeds_scenario: SeedsScenario) -> None:
+    """
+    Раздаёт пользователей сидинга в эксклюзивную аренду: через общий пул в Redis, если задан
+    --seeds-redis-host (см. add_locust_seeds_arguments), иначе через шарды мастера и SeedsLeasePool.
+    В обоих случаях, когда свободных пользователей не осталось, уже арендованные выдаются повторно по кругу.
+
+    :param environment: Объект окружения Locust.
+    :param seeds_scenario: Сценарий сидинга, данные которого нужны нагрузочному сценарию.
+    """
+    options = environment.parsed_options
+    redis_host = getattr(options, "seeds_redis_host", "")
+    if not redis_host:
+        init_locust_seeds(environment, seeds_scenario, lease=True)
+        return
+
+    pool = build_redis_seeds_pool(
+        seeds_scenario.scenario,
+        host=redis_host,
+        port=options.seeds_redis_port,
+        lease_ttl=options.seeds_lease_ttl,
+        recycle=True
+    )
+    init_locust_shared_seeds(environment, seeds_scenario, pool)